@@ -9,7 +9,9 @@ from fastapi import Depends
 from fastapi import Header
 
 from ccp_server.api.v1 import cloud_utils
+from ccp_server.api.v1 import database
 from ccp_server.api.v1 import image
+from ccp_server.api.v1 import job
 from ccp_server.api.v1 import onboarding
 from ccp_server.api.v1 import org
 from ccp_server.api.v1 import project
@@ -76,6 +78,7 @@ api_router.include_router(cluster.router, tags=["Cluster"])
 api_router.include_router(subnet.router,
                           tags=["Subnet"])
 api_router.include_router(network.router, tags=["Network"])
+api_router.include_router(job.router, tags=["Job"])
 
 # this api_router should be in the end only because of similar routing issue.
 api_router.include_router(project.router, tags=["Project"], prefix='/projects')
@@ -91,6 +94,8 @@ base_router.include_router(onboarding.router, tags=[
 base_router.include_router(utils.router, tags=["Utils"], prefix="/utils")
 base_router.include_router(
     org.router, tags=["Organization"], prefix="/admin/orgs")
+base_router.include_router(
+    database.router, tags=["Database"], prefix="/admin/database")
 
 # Org Admin API router for all the CCP APIs where only cloud_id is required
 
@@ -16,8 +16,9 @@ from fastapi import status
 from ccp_server.schema.v1.response_schemas import Page
 from ccp_server.service.compute.hypervisor import HypervisorService
 from ccp_server.util.constants import Constants
+from ccp_server.util.response import CCPRoute
 
-router = APIRouter()
+router = APIRouter(route_class=CCPRoute)
 
 hypervisor_service: HypervisorService = HypervisorService()
 
@@ -11,8 +11,9 @@ from fastapi import status
 from ccp_server.config import auth
 from ccp_server.service.oidc import OIDC
 from ccp_server.service.user import UserService
+from ccp_server.util.response import CCPRoute
 
-router = APIRouter(tags=["Auth"])
+router = APIRouter(tags=["Auth"], route_class=CCPRoute)
 
 oidc: OIDC = OIDC()
 user_service: UserService = UserService()
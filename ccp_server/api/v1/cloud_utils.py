@@ -8,8 +8,9 @@ from fastapi import APIRouter
 from fastapi import status
 
 from ccp_server.service.cloud_utils import CloudUtilService
+from ccp_server.util.response import CCPRoute
 
-router = APIRouter()
+router = APIRouter(route_class=CCPRoute)
 
 cloud_util_service: CloudUtilService = CloudUtilService()
 
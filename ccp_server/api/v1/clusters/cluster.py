@@ -14,11 +14,14 @@ from fastapi import status
 
 from ccp_server.schema.v1 import schemas
 from ccp_server.schema.v1.response_schemas import IDResponse
+from ccp_server.schema.v1.response_schemas import JobResponse
 from ccp_server.schema.v1.response_schemas import Page
 from ccp_server.schema.v1.response_schemas import Pageable
 from ccp_server.service.clusters.cluster import ClusterService
+from ccp_server.util.response import CCPJSONResponse
+from ccp_server.util.response import CCPRoute
 
-router = APIRouter()
+router = APIRouter(route_class=CCPRoute)
 cluster_service: ClusterService = ClusterService()
 
 
@@ -28,14 +31,22 @@ cluster_service: ClusterService = ClusterService()
              response_description="Cluster Creation Response.",
              response_model=None
              )
-async def create_cluster(project_id: str, cluster_template_id: str, request: schemas.Cluster) -> IDResponse:
+async def create_cluster(project_id: str, cluster_template_id: str, request: schemas.Cluster,
+                         background: bool = Query(False, title="Background",
+                                                  description="Create the cluster in a background job, "
+                                                              "the response is 202 with the job ID")
+                         ) -> IDResponse:
     """
     Create cluster.
     :param project_id: Project ID.
     :param cluster_template_id: Cluster template ID.
     :param request: Request body.
-    :return: ID of created cluster.
+    :param background: Create the cluster in a background job.
+    :return: ID of created cluster, or of the queued job.
     """
+    if background:
+        job_id = await cluster_service.queue_create_cluster(project_id, cluster_template_id, request)
+        return CCPJSONResponse(JobResponse(job_id), status_code=status.HTTP_202_ACCEPTED)
     doc_id = await cluster_service.create_cluster(project_id, cluster_template_id, request)
     return IDResponse(doc_id)
 
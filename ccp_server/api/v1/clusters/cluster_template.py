@@ -17,8 +17,9 @@ from ccp_server.schema.v1.response_schemas import IDResponse
 from ccp_server.schema.v1.response_schemas import Page
 from ccp_server.schema.v1.response_schemas import Pageable
 from ccp_server.service.clusters.cluster_template import ClusterTemplateService
+from ccp_server.util.response import CCPRoute
 
-router = APIRouter()
+router = APIRouter(route_class=CCPRoute)
 cluster_template_service: ClusterTemplateService = ClusterTemplateService()
 
 
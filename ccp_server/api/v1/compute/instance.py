@@ -11,15 +11,19 @@ from fastapi import Query
 from fastapi import status
 
 from ccp_server.schema.v1 import schemas
+from ccp_server.schema.v1.response_schemas import BatchResponse
 from ccp_server.schema.v1.response_schemas import IDResponse
+from ccp_server.schema.v1.response_schemas import JobResponse
 from ccp_server.schema.v1.response_schemas import Page
 from ccp_server.schema.v1.response_schemas import Pageable
 from ccp_server.schema.v1.schemas import InstanceActionsSchema
 from ccp_server.service.compute.instance import InstanceService
 from ccp_server.util.constants import Constants
 from ccp_server.util.enums import InstanceActionEnum
+from ccp_server.util.response import CCPJSONResponse
+from ccp_server.util.response import CCPRoute
 
-router = APIRouter()
+router = APIRouter(route_class=CCPRoute)
 
 instance_service: InstanceService = InstanceService()
 
@@ -30,17 +34,41 @@ instance_service: InstanceService = InstanceService()
              response_description="Instance Created Response",
              response_model=None
              )
-async def create_instance(project_id: str, request: schemas.Instance) -> IDResponse:
+async def create_instance(project_id: str, request: schemas.Instance,
+                          background: bool = Query(False, title="Background",
+                                                   description="Create the instance in a background job, "
+                                                               "the response is 202 with the job ID")
+                          ) -> IDResponse:
     """
     Create a new instance with the given name and public key
     :param project_id: Project ID
     :param request: Contains Name of the instance and the public key
-    returns: The created compute ``Server`` object
+    :param background: Create the instance in a background job
+    returns: The created compute ``Server`` object, or the queued job
     """
+    if background:
+        job_id = await instance_service.queue_create_instance(project_id, request)
+        return CCPJSONResponse(JobResponse(job_id), status_code=status.HTTP_202_ACCEPTED)
     doc_id = await instance_service.create_instance(project_id, request)
     return IDResponse(doc_id)
 
 
+@router.post("/projects/{project_id}/instances:batch",
+             description="Create many instances for a project",
+             status_code=status.HTTP_200_OK,
+             response_description="Status of each instance",
+             response_model=None
+             )
+async def create_instances(project_id: str, request: schemas.InstanceBatch) -> BatchResponse:
+    """
+    Create many instances, a failed instance does not stop the others
+    :param project_id: Project ID
+    :param request: Contains the instances to create
+    returns: Status and ID of each instance, in the order of the request
+    """
+    return await instance_service.create_instances(project_id, request.instances)
+
+
 @router.get("/projects/instances",
             description="List all instances for a organization",
             status_code=status.HTTP_200_OK,
@@ -0,0 +1,36 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+from fastapi import APIRouter
+from starlette import status
+
+from ccp_server.service.database import DatabaseService
+from ccp_server.util.response import CCPRoute
+
+router = APIRouter(route_class=CCPRoute)
+
+database_service: DatabaseService = DatabaseService()
+
+
+@router.get("/indexes",
+            description="Report the missing and unused Mongo indexes.",
+            status_code=status.HTTP_200_OK,
+            response_description="Index names by collection and state.",
+            )
+async def get_index_report():
+    """This method is used to compare the indexes of the collections with the registry and $indexStats.
+    :return: missing, unused and unregistered index names of every collection"""
+    return await database_service.get_index_report()
+
+
+@router.post("/indexes",
+             description="Create the missing Mongo indexes.",
+             status_code=status.HTTP_200_OK,
+             response_description="Registered index names by collection.",
+             )
+async def apply_indexes():
+    """This method is used to create the missing indexes of the collections.
+    :return: registered index names of every collection"""
+    return await database_service.apply_indexes()
@@ -0,0 +1,55 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+from typing import List
+
+from fastapi import APIRouter
+from fastapi import Query
+from fastapi import status
+
+from ccp_server.schema.v1.response_schemas import Page
+from ccp_server.schema.v1.response_schemas import Pageable
+from ccp_server.service.job import JobService
+from ccp_server.util.response import CCPRoute
+
+router = APIRouter(route_class=CCPRoute)
+
+job_service: JobService = JobService()
+
+
+@router.get("/jobs/{job_id}",
+            description="Get the status and progress of a background job.",
+            status_code=status.HTTP_200_OK,
+            response_description="Job status Response.",
+            )
+async def get_job(job_id: str):
+    """This API is used to poll a job queued by a create API called with background=true.
+    :param job_id: Job ID.
+    :return: status, progress, message, result or error of the job."""
+    return await job_service.get_job(job_id)
+
+
+@router.get("/jobs",
+            description="List the background jobs of the organization.",
+            status_code=status.HTTP_200_OK,
+            response_description="Jobs Response.",
+            )
+async def list_jobs(
+        project_id: str = Query(None, title="Project ID", description="Only the jobs of the project"),
+        page: int = Query(1, ge=1, title="Page", description="Page number"),
+        size: int = Query(10, ge=1, le=100, title="Limit", description="Number of items to return"),
+        sort_by: List[str] = Query(None, title="Sort by", description="Sort by fields (comma-separated list)"),
+        sort_desc: bool = Query(True, title="Sort descending", description="Sort in descending order")
+):
+    """This API is used to list the background jobs, the latest first.
+    :param project_id: Project ID.
+    :param page: Page number.
+    :param size: Number of items to return.
+    :param sort_by: Sort by fields (comma-separated list).
+    :param sort_desc: Sort in descending order.
+    :return: Jobs list."""
+    pageable = Pageable(None, page, size, sort_by, sort_desc)
+    data, total = await job_service.list_jobs(pageable, project_id)
+    return Page(page, size, total, data, pageable.next_page_token)
@@ -17,8 +17,9 @@ from ccp_server.schema.v1.response_schemas import Page
 from ccp_server.schema.v1.response_schemas import Pageable
 from ccp_server.service.networks.floating_ip import FloatingIPService
 from ccp_server.util.constants import Constants
+from ccp_server.util.response import CCPRoute
 
-router = APIRouter()
+router = APIRouter(route_class=CCPRoute)
 floating_ip_service: FloatingIPService = FloatingIPService()
 
 
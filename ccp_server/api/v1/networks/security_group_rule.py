@@ -18,8 +18,9 @@ from ccp_server.schema.v1.response_schemas import Page
 from ccp_server.schema.v1.response_schemas import Pageable
 from ccp_server.service.networks.security_group_rule import SecurityGroupRuleService
 from ccp_server.util.constants import Constants
+from ccp_server.util.response import CCPRoute
 
-router = APIRouter()
+router = APIRouter(route_class=CCPRoute)
 security_group_rule_service: SecurityGroupRuleService = SecurityGroupRuleService()
 
 
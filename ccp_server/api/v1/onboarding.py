@@ -12,8 +12,9 @@ from fastapi import status
 from ccp_server.schema.v1 import schemas
 from ccp_server.schema.v1.response_schemas import IDResponse
 from ccp_server.service.onboarding import OnboardingService
+from ccp_server.util.response import CCPRoute
 
-router = APIRouter()
+router = APIRouter(route_class=CCPRoute)
 
 onboarding_service: OnboardingService = OnboardingService()
 
@@ -15,8 +15,9 @@ from ccp_server.schema.v1 import schemas
 from ccp_server.schema.v1.response_schemas import IDResponse
 from ccp_server.service.oidc import UserProfile
 from ccp_server.service.self_onboarding import SelfOnboardingService
+from ccp_server.util.response import CCPRoute
 
-router = APIRouter()
+router = APIRouter(route_class=CCPRoute)
 
 onboarding_service: SelfOnboardingService = SelfOnboardingService()
 
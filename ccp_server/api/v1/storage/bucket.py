@@ -18,8 +18,9 @@ from ccp_server.schema.v1.response_schemas import Page
 from ccp_server.schema.v1.response_schemas import Pageable
 from ccp_server.service.storage.bucket import BucketService
 from ccp_server.util.constants import Constants
+from ccp_server.util.response import CCPRoute
 
-router = APIRouter()
+router = APIRouter(route_class=CCPRoute)
 
 bucket_service: BucketService = BucketService()
 
@@ -80,11 +81,17 @@ async def list_buckets(query_str: str = Query(None, title="Search", description=
                                                description="List of key-value pairs to filter the buckets by tags"),
                        use_db: bool = Query(True, title="use database",
                                             description="Fetch the result from database or directly from cloud",
-                                            include_in_schema=False)
+                                            include_in_schema=False),
+                       page_token: str = Query(None, title="Page token",
+                                               description="next_page_token of the previous page, "
+                                                           "it replaces the page number"),
+                       include_total: bool = Query(True, title="Include total",
+                                                   description="Count the matching buckets, "
+                                                               "false is faster on big lists")
                        ):
-    data, total = await bucket_service.list_buckets(
-        Pageable(query_str, page, size, sort_by, sort_desc, tags), use_db=use_db)
-    return Page(page, size, total, data)
+    pageable = Pageable(query_str, page, size, sort_by, sort_desc, tags, page_token, include_total)
+    data, total = await bucket_service.list_buckets(pageable, use_db=use_db)
+    return Page(page, size, total, data, pageable.next_page_token)
 
 
 @router.get("/projects/{project_id}/buckets/{bucket_id}",
@@ -15,8 +15,9 @@ from fastapi.responses import JSONResponse
 from ccp_server.schema.v1 import schemas
 from ccp_server.service.user import UserService
 from ccp_server.util import ccp_context
+from ccp_server.util.response import CCPRoute
 
-router = APIRouter()
+router = APIRouter(route_class=CCPRoute)
 
 user_service: UserService = UserService()
 
@@ -15,9 +15,10 @@ from starlette import status
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPPincodeNotFoundException
 from ccp_server.util.messages import Message
+from ccp_server.util.response import CCPRoute
 from ccp_server.util.utils import Utils
 
-router = APIRouter()
+router = APIRouter(route_class=CCPRoute)
 
 
 @router.get("/supported-clouds",
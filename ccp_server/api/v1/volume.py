@@ -13,14 +13,16 @@ from fastapi import Query
 from fastapi import status
 
 from ccp_server.schema.v1 import schemas
+from ccp_server.schema.v1.response_schemas import BatchResponse
 from ccp_server.schema.v1.response_schemas import IDResponse
 from ccp_server.schema.v1.response_schemas import Page
 from ccp_server.schema.v1.response_schemas import Pageable
 from ccp_server.service.volume import VolumeService
 from ccp_server.util.constants import Constants
 from ccp_server.util.enums import VolumeActionEnum
+from ccp_server.util.response import CCPRoute
 
-router = APIRouter()
+router = APIRouter(route_class=CCPRoute)
 
 volume_service: VolumeService = VolumeService()
 
@@ -40,6 +42,20 @@ async def create_volume(project_id: str, request: schemas.Volume) -> IDResponse:
     return IDResponse(doc_id)
 
 
+@router.post("/projects/{project_id}/volumes:batch",
+             description="Create many ``Volume`` for a project",
+             status_code=status.HTTP_200_OK,
+             response_description="Status of each ``Volume``.",
+             response_model=None
+             )
+async def create_volumes(project_id: str, request: schemas.VolumeBatch) -> BatchResponse:
+    """This API is used to create many volumes, a failed volume does not stop the others.
+    :param project_id: Project ID.
+    :param request: Request body with the volumes.
+    :return: Status and ID of each volume, in the order of the request."""
+    return await volume_service.create_volumes(project_id, request.volumes)
+
+
 @router.get("/projects/{project_id}/volumes",
             description="List Volumes for a project",
             status_code=status.HTTP_200_OK,
@@ -87,7 +103,11 @@ async def list_all_volumes(
             False, title="Sort descending", description="Sort in descending order"),
         tags: List[str] = Query(None,
                                 title="tags",
-                                description="List of key-value pairs to filter the volumes by tags  like team=dev ")
+                                description="List of key-value pairs to filter the volumes by tags  like team=dev "),
+        page_token: str = Query(None, title="Page token",
+                                description="next_page_token of the previous page, it replaces the page number"),
+        include_total: bool = Query(True, title="Include total",
+                                    description="Count the matching volumes, false is faster on big lists")
 ):
     """This API is used to list all Volumes for the organization.
         :param query_str: Search query.
@@ -96,9 +116,12 @@ async def list_all_volumes(
         :param sort_by: Sort by fields (comma-separated list).
         :param sort_desc: Sort in descending order.
         :param tags: List of key-value pairs to filter the volumes by tags
+        :param page_token: Continuation token of the previous page.
+        :param include_total: Count the matching volumes, false is faster on big lists.
         :return: Volumes list. """
-    data, total = await volume_service.list_all_volumes(Pageable(query_str, page, size, sort_by, sort_desc, tags))
-    return Page(page, size, total, data)
+    pageable = Pageable(query_str, page, size, sort_by, sort_desc, tags, page_token, include_total)
+    data, total = await volume_service.list_all_volumes(pageable)
+    return Page(page, size, total, data, pageable.next_page_token)
 
 
 @router.get("/projects/{project_id}/volumes/{volume_id}",
@@ -16,8 +16,9 @@ from ccp_server.schema.v1.response_schemas import Page
 from ccp_server.schema.v1.response_schemas import Pageable
 from ccp_server.service.volume_snapshot import VolumeSnapshotService
 from ccp_server.util.constants import Constants
+from ccp_server.util.response import CCPRoute
 
-router = APIRouter()
+router = APIRouter(route_class=CCPRoute)
 
 volume_snapshot_service: VolumeSnapshotService = VolumeSnapshotService()
 
@@ -3,11 +3,11 @@ from fastapi import Request
 from fastapi.security import OAuth2PasswordBearer
 
 from ccp_server.kc.authentication import KeycloakAuthService
-from ccp_server.kc.user import KeycloakUserService
-from ccp_server.service.oidc import OIDC
-from ccp_server.service.oidc import UserProfile
+from ccp_server.service.membership import MembershipService
 from ccp_server.util.constants import Constants
+from ccp_server.util.exceptions import CCPBadRequestException
 from ccp_server.util.exceptions import CCPNotFoundException
+from ccp_server.util.exceptions import CCPProfileNotCompletedException
 from ccp_server.util.exceptions import CCPUnauthenticatedException
 from ccp_server.util.exceptions import CCPUnauthorizedException
 from ccp_server.util.messages import Message
@@ -18,11 +18,11 @@ oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl=Constants.KEYCLOAK_OPENID_CONNECT_TOKEN_URL)
 
 auth_service: KeycloakAuthService = KeycloakAuthService()
-user_service: KeycloakUserService = KeycloakUserService()
+membership_service: MembershipService = MembershipService()
 
 
 async def authenticate(request: Request, token: str = Depends(oauth2_scheme)) -> None:
-    token_info: TokenInfo = auth_service.tokeninfo(token)
+    token_info: TokenInfo = await auth_service.validate(token)
 
     #  if token not valid the raise Unauthorized exception
     if not token_info.active:
@@ -44,9 +44,17 @@ async def authenticate(request: Request, token: str = Depends(oauth2_scheme)) ->
         raise CCPUnauthenticatedException(
             message=Message.CLOUD_NOT_VALID)
 
+    # Membership and Ceph credentials come from the cached membership profile of the user
+    profile = await membership_service.get_profile(token_info)
+
     if org_id:
-        user_profile: UserProfile = await OIDC().web_sso(token_info=token_info)
-        orgs = [org for org in user_profile.organizations if org_id == org.uuid]
+        if Constants.CCPRole.ORG_ADMIN in token_info.ccp_roles and not token_info.is_profile_completed:
+            raise CCPProfileNotCompletedException()
+
+        if not profile['orgs'] and Constants.CCPRole.SUPER_ADMIN not in token_info.ccp_roles:
+            raise CCPBadRequestException(message=Message.USER_DOESNT_HAVE_ORG)
+
+        orgs = [org for org in profile['orgs'] if org_id == org['uuid']]
         org = orgs[0] if orgs else None
 
         #  if org not valid raise Unauthenticated exception
@@ -54,29 +62,32 @@ async def authenticate(request: Request, token: str = Depends(oauth2_scheme)) ->
             raise CCPNotFoundException(
                 message=Message.ORG_NOT_VALID)
 
+        # Only the projects of the requested cloud are accessible
+        org_projects = [project for project in org['projects']
+                        if not cloud_id or project.get('cloud') == cloud_id.lower()]
+        if not org_projects:
+            raise CCPBadRequestException(message=Message.USER_DOESNT_HAVE_PROJECT)
+
         if project_id:
             projects = [
-                project for project in org.projects if project_id == project.uuid]
+                project for project in org_projects if project_id == project['uuid']]
             project = projects[0] if projects else None
 
             #  if project not valid raise Unauthenticated exception
             if not project:
                 raise CCPNotFoundException(
                     message=Message.PROJECT_NOT_VALID)
-            elif hasattr(project, 'reference_id'):
+            elif project.get('reference_id'):
                 # set the cloud-project-id in ccp_context
                 request.state.__setattr__(
                     Constants.CLOUD_PROJECT_ID, project['reference_id'])
 
     # set the ceph user access key and secret key in ccp_context if user profile is complete
-    if Constants.CCPRole.SUPER_ADMIN not in token_info.ccp_roles:
-        user_attributes = user_service.get_user_attributes(token_info.email)
-        if user_attributes.get(Constants.CEPH_USER_ACCESS_KEY) and\
-                user_attributes.get(Constants.CEPH_USER_SECRET_KEY):
-            request.state.__setattr__(
-                Constants.CEPH_USER_ACCESS_KEY, user_attributes.get(Constants.CEPH_USER_ACCESS_KEY)[0])
-            request.state.__setattr__(
-                Constants.CEPH_USER_SECRET_KEY, user_attributes.get(Constants.CEPH_USER_SECRET_KEY)[0])
+    if profile['ceph']:
+        request.state.__setattr__(
+            Constants.CEPH_USER_ACCESS_KEY, profile['ceph']['access_key'])
+        request.state.__setattr__(
+            Constants.CEPH_USER_SECRET_KEY, profile['ceph']['secret_key'])
 
     # set the logged-in user username in ccp_context
     request.state.__setattr__(Constants.USERNAME, token_info.username)
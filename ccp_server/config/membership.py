@@ -0,0 +1,131 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict
+from typing import Tuple
+
+from ccp_server.config.redis import CacheVersion
+from ccp_server.config.redis import get_redis
+from ccp_server.util.constants import Constants
+from ccp_server.util.logger import KGLogger
+
+LOG = KGLogger(__name__)
+
+
+class MembershipCache:
+    """Two level cache of the user membership profiles: an in-process LRU in front of Redis.
+
+    The profile is a compact dict built by MembershipService:
+    {'orgs': [{'uuid', 'name', 'projects': [{'uuid', 'name', 'cloud', 'reference_id'}]}],
+     'roles': [...], 'ceph': {'access_key', 'secret_key'}}
+
+    The keys carry the versions of the Keycloak membership and of the Organization and Project collections,
+    so every Keycloak group or role change and every org or project write makes the cached profiles
+    unreachable. The Ceph secret key is only kept in the local cache, never in Redis.
+    """
+
+    # Namespaces the profile depends on, read across the orgs
+    NAMESPACES: Tuple[str, ...] = (Constants.CACHE_MEMBERSHIP_NAMESPACE, Constants.MongoCollection.ORGANIZATION,
+                                   Constants.MongoCollection.PROJECT)
+
+    _local: 'OrderedDict[str, Tuple[float, Dict]]' = OrderedDict()
+    _lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def key(username: str, versions: str) -> str:
+        return f'{Constants.MEMBERSHIP_CACHE_PREFIX}v{versions}:{username.lower()}'
+
+    @classmethod
+    async def versions(cls) -> str:
+        return await CacheVersion.get(cls.NAMESPACES, org_id=CacheVersion.ALL)
+
+    @staticmethod
+    def shared(profile: Dict) -> Dict:
+        """Get the profile stored in Redis, without the Ceph secret key."""
+        return {**profile, 'ceph': {name: value for name, value in profile.get('ceph', {}).items()
+                                    if name != 'secret_key'}}
+
+    @classmethod
+    async def get(cls, username: str) -> Dict:
+        """Get the membership profile of the user from the local cache, else from Redis. A profile read from
+        Redis has no Ceph secret key.
+        :param username: Username
+        :return: profile or None if not cached"""
+        try:
+            key = cls.key(username, await cls.versions())
+        except Exception as e:
+            LOG.warn(f'Membership cache versions are not available: {e}')
+            return None
+        with cls._lock:
+            entry = cls._local.get(key)
+            if entry and entry[0] > time.monotonic():
+                cls._local.move_to_end(key)
+                return entry[1]
+
+        try:
+            redis = await get_redis()
+            cached_profile = await redis.get(key)
+        except Exception as e:
+            LOG.warn(f'Membership cache is not available: {e}')
+            return None
+
+        if not cached_profile:
+            return None
+        profile = json.loads(cached_profile)
+        cls._set_local(key, profile)
+        return profile
+
+    @classmethod
+    async def set(cls, username: str, profile: Dict, shared: bool = True) -> None:
+        """Store the membership profile of the user in both the cache levels.
+        :param username: Username
+        :param profile: membership profile
+        :param shared: False to store it in the local cache only"""
+        try:
+            key = cls.key(username, await cls.versions())
+        except Exception as e:
+            LOG.warn(f'Unable to cache the membership of {username}: {e}')
+            return
+        cls._set_local(key, profile)
+        if not shared:
+            return
+        try:
+            redis = await get_redis()
+            await redis.set(key, json.dumps(cls.shared(profile)), expire=Constants.MEMBERSHIP_CACHE_TTL_IN_SECS)
+        except Exception as e:
+            LOG.warn(f'Unable to cache the membership of {username}: {e}')
+
+    @classmethod
+    async def invalidate(cls, username: str) -> None:
+        """Drop the membership profile of the user. The version bumps already cover the Keycloak and the
+        org or project writes, this drops the profile at once for the other changes.
+        :param username: Username"""
+        suffix = f':{username.lower()}'
+        with cls._lock:
+            for local_key in [local_key for local_key in cls._local if local_key.endswith(suffix)]:
+                cls._local.pop(local_key)
+        try:
+            key = cls.key(username, await cls.versions())
+            redis = await get_redis()
+            await redis.delete(key)
+        except Exception as e:
+            LOG.error(f'Unable to invalidate the membership of {username}: {e}')
+
+    @classmethod
+    def clear_local(cls) -> None:
+        with cls._lock:
+            cls._local.clear()
+
+    @classmethod
+    def _set_local(cls, key: str, profile: Dict) -> None:
+        with cls._lock:
+            cls._local[key] = (time.monotonic() + Constants.MEMBERSHIP_LOCAL_CACHE_TTL_IN_SECS, profile)
+            cls._local.move_to_end(key)
+            while len(cls._local) > Constants.MEMBERSHIP_LOCAL_CACHE_SIZE:
+                cls._local.popitem(last=False)
@@ -4,14 +4,29 @@
 # Proprietary and confidential                                                #
 # Written by Vicky Upadhyay <vicky@coredge.io>, Feb 2023                      #
 ###############################################################################
+import asyncio
+import hashlib
+import inspect
 import json
+import threading
+import time
+from collections import OrderedDict
 from functools import wraps
+from typing import Any
+from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 
+import msgpack
 from aioredis import create_redis_pool
 
 from ccp_server.util import ccp_context
 from ccp_server.util.constants import Constants
+from ccp_server.util.logger import KGLogger
+from ccp_server.util.response import encode_default
+
+LOG = KGLogger(__name__)
 
 redis_pool = None
 
@@ -23,25 +38,268 @@ async def get_redis():
     return redis_pool
 
 
-def cache(*, ttl: Optional[int] = Constants.REDIS_TTL_IN_SECONDS):
+class JsonSerializer:
+    """Compact JSON, readable with redis-cli."""
+
+    @staticmethod
+    def dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(',', ':'), default=encode_default).encode()
+
+    @staticmethod
+    def loads(data: bytes) -> Any:
+        return json.loads(data)
+
+
+class MsgpackSerializer:
+    """Binary msgpack, smaller and faster than JSON for the list responses. The datetimes of the documents
+    are cached in the format of the responses."""
+
+    @staticmethod
+    def dumps(value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True, default=encode_default)
+
+    @staticmethod
+    def loads(data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+
+SERIALIZERS = {'json': JsonSerializer, 'msgpack': MsgpackSerializer}
+
+
+class LocalCache:
+    """Bounded in-process LRU in front of Redis, it keeps the serialized value so every hit gets its own copy.
+    The entries live only CACHE_LOCAL_TTL_IN_SECS because the other workers can not invalidate them."""
+
+    _entries: 'OrderedDict[str, Tuple[float, bytes]]' = OrderedDict()
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def get(cls, key: str) -> Optional[bytes]:
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del cls._entries[key]
+                return None
+            cls._entries.move_to_end(key)
+            return entry[1]
+
+    @classmethod
+    def set(cls, key: str, data: bytes, ttl: int) -> None:
+        with cls._lock:
+            cls._entries[key] = (time.monotonic() + min(ttl, Constants.CACHE_LOCAL_TTL_IN_SECS), data)
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > Constants.CACHE_LOCAL_SIZE:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
+
+
+class CacheVersion:
+    """Version counters of the cached data in Redis, per namespace (a Mongo collection or the Keycloak
+    membership) and tenant. The versions are part of the cache keys, so a write makes the older entries
+    unreachable in O(1) and they expire with their TTL.
+
+    A write in an org bumps the org counter and the '*' counter, a write without an org (or a global
+    change such as a membership) bumps the '-' counter and the '*' counter. A read in an org depends on
+    the org and the '-' counters, a read without an org depends on the '*' counter.
+    """
+
+    ALL: str = '*'
+    UNSCOPED: str = '-'
+
+    # Namespaces read across the orgs, their changes are always global
+    GLOBAL_NAMESPACES = {Constants.MongoCollection.ORGANIZATION, Constants.CACHE_MEMBERSHIP_NAMESPACE}
+
+    # Versions read from Redis are kept for CACHE_LOCAL_TTL_IN_SECS, the same staleness as the local cache
+    _local: Dict[str, Tuple[float, int]] = {}
+    _lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def key(namespace: str, tenant: str) -> str:
+        return f'{Constants.CACHE_VERSION_PREFIX}{namespace}:{tenant}'
+
+    @classmethod
+    def read_keys(cls, namespace: str, org_id: str = None) -> List[str]:
+        if org_id:
+            return [cls.key(namespace, org_id), cls.key(namespace, cls.UNSCOPED)]
+        return [cls.key(namespace, cls.ALL)]
+
+    @classmethod
+    def write_keys(cls, namespace: str, org_id: str = None) -> List[str]:
+        if namespace in cls.GLOBAL_NAMESPACES:
+            org_id = cls.UNSCOPED
+        return [cls.key(namespace, org_id or cls.UNSCOPED), cls.key(namespace, cls.ALL)]
+
+    @classmethod
+    async def bump(cls, *namespaces: str, org_id: str = None) -> None:
+        """Bump the versions after a write, a failure is logged and the entries expire with their TTL.
+        :param namespaces: collection names or other namespaces of the changed data
+        :param org_id: org of the change, defaults to the org of the request"""
+        org_id = org_id or ccp_context.get_org()
+        keys = [key for namespace in namespaces for key in cls.write_keys(namespace, org_id)]
+        with cls._lock:
+            for key in keys:
+                cls._local.pop(key, None)
+        try:
+            redis = await get_redis()
+            pipeline = redis.pipeline()
+            for key in keys:
+                pipeline.incr(key)
+            await pipeline.execute()
+        except Exception as e:
+            LOG.warn(f'Unable to bump the cache versions of {namespaces}: {e}')
+
+    @classmethod
+    async def get(cls, namespaces: Tuple[str, ...], org_id: str = None) -> str:
+        """Get the current versions of the namespaces for the org of the request.
+        :param namespaces: collection names or other namespaces the cached data depends on
+        :param org_id: org of the read, defaults to the org of the request
+        :return: versions joined with '.'"""
+        org_id = org_id or ccp_context.get_org()
+        keys = [key for namespace in namespaces for key in cls.read_keys(namespace, org_id)]
+        now = time.monotonic()
+        versions: Dict[str, int] = {}
+        with cls._lock:
+            for key in keys:
+                entry = cls._local.get(key)
+                if entry and entry[0] > now:
+                    versions[key] = entry[1]
+
+        missing = [key for key in keys if key not in versions]
+        if missing:
+            redis = await get_redis()
+            values = await redis.mget(*missing)
+            with cls._lock:
+                for key, value in zip(missing, values):
+                    versions[key] = int(value or 0)
+                    cls._local[key] = (now + Constants.CACHE_LOCAL_TTL_IN_SECS, versions[key])
+        return '.'.join(str(versions[key]) for key in keys)
+
+    @classmethod
+    def clear_local(cls) -> None:
+        with cls._lock:
+            cls._local.clear()
+
+
+# Loads in progress by cache key, concurrent misses of a key in a worker wait for the same load
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+def cache_scope(scope: str) -> str:
+    """Tenant part of the cache key: org and cloud of the request, and the logged-in user for the user scope.
+    :param scope: one of Constants.CacheScope
+    :return: scope string"""
+    if scope == Constants.CacheScope.GLOBAL:
+        return '-'
+    parts = [ccp_context.get_org() or '-', ccp_context.get_cloud() or '-']
+    if scope == Constants.CacheScope.USER:
+        data = ccp_context.get_request_data()
+        user = ccp_context.get_logged_in_user() if data and data.get(Constants.CURRENT_REQUEST) else None
+        parts.append((user or '-').lower())
+    return ':'.join(parts)
+
+
+def call_arguments(func, args: tuple, kwargs: dict) -> Dict[str, Any]:
+    """Bind the call arguments to the signature, so positional and keyword calls are the same,
+    self or cls is left out."""
+    try:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+    except TypeError:
+        arguments = {'args': args, 'kwargs': kwargs}
+    for name in ('self', 'cls'):
+        arguments.pop(name, None)
+    return arguments
+
+
+def cache_key(namespace: str, scope: str, arguments: Dict[str, Any], versions: str = '') -> str:
+    """Build a key which is the same in every worker and across restarts.
+    :return: ccp:cache:<module.function>:<scope>:[v<versions>:]<sha256 of the arguments>"""
+    digest = hashlib.sha256(json.dumps(arguments, sort_keys=True, default=str).encode()).hexdigest()
+    versions = f'v{versions}:' if versions else ''
+    return f'{Constants.CACHE_PREFIX}{namespace}:{cache_scope(scope)}:{versions}{digest}'
+
+
+def cache(*, ttl: int = Constants.REDIS_TTL_IN_SECONDS, scope: str = Constants.CacheScope.USER,
+          serializer=None, local: bool = True, depends_on: Tuple[str, ...] = ()):
+    """Cache the result of an async function in a local LRU and in Redis.
+    :param ttl: Redis TTL in seconds, the local copy lives at most CACHE_LOCAL_TTL_IN_SECS
+    :param scope: tenant scope of the key, the user scope keeps the results of each user apart
+    :param serializer: object with dumps and loads, defaults to the CACHE_SERIALIZER one
+    :param local: keep a short lived copy in the process as well
+    :param depends_on: namespaces of CacheVersion, a write to any of them invalidates the cached results"""
+
     def outer_wrapper(func):
+        namespace = f'{func.__module__}.{func.__qualname__}'
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            redis = await get_redis()
-            user = ccp_context.get_logged_in_user() if ccp_context.get_logged_in_user() else ''
-            hash_value = hash(user + func.__name__ + str(args) + str(kwargs))
-            cache_key = hash_value
-            cached_response = await redis.get(cache_key)
-            if cached_response:
-                return json.loads(cached_response)
+            codec = serializer or SERIALIZERS[Constants.CACHE_SERIALIZER]
+            arguments = call_arguments(func, args, kwargs)
+            versions = ''
+            if depends_on:
+                # An org_id argument is the tenant of the data, None there means all the orgs
+                org_id = (arguments['org_id'] or CacheVersion.ALL) if 'org_id' in arguments else None
+                try:
+                    versions = await CacheVersion.get(depends_on, org_id=org_id)
+                except Exception as e:
+                    # Without the versions a cached result may be stale, so the function is called
+                    LOG.warn(f'Cache versions are not available: {e}')
+                    return await func(*args, **kwargs)
+            key = cache_key(namespace, scope, arguments, versions)
+
+            data = LocalCache.get(key) if local else None
+            if data is not None:
+                return codec.loads(data)
+
+            inflight = _inflight.get(key)
+            if inflight is not None and inflight.get_loop() is asyncio.get_running_loop():
+                return codec.loads(await asyncio.shield(inflight))
+
+            future = asyncio.get_running_loop().create_future()
+            _inflight[key] = future
+            try:
+                data = await load(codec, key, args, kwargs)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+                # Retrieve it so an exception nobody waited for is not reported
+                future.exception()
+                raise
             else:
-                response = await func(*args, **kwargs)
-                res_type = type(response)
-                if isinstance(response, res_type):
-                    await redis.set(cache_key, json.dumps(response), expire=ttl)
-                else:
-                    await redis.set(cache_key, response, expire=ttl)
-                return response
+                future.set_result(data)
+            finally:
+                if _inflight.get(key) is future:
+                    del _inflight[key]
+            return codec.loads(data)
+
+        async def load(codec, key: str, args: tuple, kwargs: dict) -> bytes:
+            redis = None
+            try:
+                redis = await get_redis()
+                data = await redis.get(key)
+            except Exception as e:
+                LOG.warn(f'Cache is not available: {e}')
+                data = None
+
+            if data is None:
+                data = codec.dumps(await func(*args, **kwargs))
+                if redis is not None:
+                    try:
+                        await redis.set(key, data, expire=ttl)
+                    except Exception as e:
+                        LOG.warn(f'Unable to cache {namespace}: {e}')
+            if local:
+                LocalCache.set(key, data, ttl)
+            return data
 
         return wrapper
 
@@ -0,0 +1,184 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import argparse
+import asyncio
+import json
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from pymongo import ASCENDING
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+
+from ccp_server.db.mongo import MongoAPI
+from ccp_server.util.constants import Constants
+from ccp_server.util.enums import Status
+from ccp_server.util.logger import KGLogger
+
+LOG = KGLogger(__name__)
+
+# Filter of the lists and their default sort, so a page of get_document_list_by_ids reads only its documents
+# in either direction. The prefix serves the filters without the project and get_document_by_ids.
+LIST_INDEX: IndexModel = IndexModel([('cloud', ASCENDING), ('org_id', ASCENDING), ('project_id', ASCENDING),
+                                     ('active', ASCENDING), ('created_at', ASCENDING), ('uuid', ASCENDING)],
+                                    name='cloud_org_project_active_created_at')
+
+# Indexes of every resource collection, they follow the filters of MongoAPI and of the syncer
+COMMON_INDEXES: List[IndexModel] = [
+    # get_document_by_uuid, update_document_by_uuid and delete_document_by_uuid
+    IndexModel([('uuid', ASCENDING)], name='uuid', unique=True),
+    LIST_INDEX,
+    # get_document_by_reference_id and the syncer upserts
+    IndexModel([('reference_id', ASCENDING), ('cloud', ASCENDING)], name='reference_id_cloud'),
+    # SyncerService.syncer
+    IndexModel([('cloud', ASCENDING), ('source', ASCENDING), ('active', ASCENDING)], name='cloud_source_active'),
+]
+
+# The names are unique in a project, or in the parent resource of these collections
+NAME_SCOPES: Dict[str, Tuple[str, ...]] = {
+    Constants.MongoCollection.SUBNET: ('network_id',),
+    Constants.MongoCollection.PORT: ('network_id',),
+    Constants.MongoCollection.SECURITY_GROUP_RULE: ('security_group_id',),
+}
+
+
+def name_indexes(scope: Tuple[str, ...] = ()) -> List[IndexModel]:
+    """Case-insensitive name indexes of a collection. The unique one covers the active documents created through
+    the API (created_by is set), the deleted documents and the resources synced from the clouds may repeat names.
+    The other one serves check_document_by_name and the prefix search of the lists, which use the same collation.
+    :param scope: parent id fields of the name
+    :return: index models"""
+    tenant = [('cloud', ASCENDING), ('org_id', ASCENDING), ('project_id', ASCENDING)]
+    return [
+        IndexModel(tenant + [(field, ASCENDING) for field in scope] + [('name', ASCENDING), ('active', ASCENDING)],
+                   name='unique_name', unique=True, collation=MongoAPI.NAME_COLLATION,
+                   partialFilterExpression={'active': Status.ACTIVE.value, 'created_by': {'$type': 'string'}}),
+        IndexModel(tenant + [('active', ASCENDING), ('name', ASCENDING)],
+                   name='name_search', collation=MongoAPI.NAME_COLLATION),
+    ]
+
+
+# Indexes of the background job queue, see JobService
+JOB_INDEXES: List[IndexModel] = [
+    IndexModel([('uuid', ASCENDING)], name='uuid', unique=True),
+    # JobService.claim of the queued jobs
+    IndexModel([('status', ASCENDING), ('run_at', ASCENDING)], name='status_run_at'),
+    # JobService.claim and JobService.reap of the jobs whose worker stopped
+    IndexModel([('status', ASCENDING), ('lease_until', ASCENDING)], name='status_lease_until'),
+    # JobService.list_jobs
+    LIST_INDEX,
+    # The finished jobs are deleted after JOB_RETENTION_IN_SECS
+    IndexModel([('finished_at', ASCENDING)], name='finished_at_ttl',
+               expireAfterSeconds=Constants.JOB_RETENTION_IN_SECS),
+]
+
+# Indexes of the watermarks of the incremental sync, see SyncerService.get_watermark
+SYNC_WATERMARK_INDEXES: List[IndexModel] = [
+    IndexModel([('cloud', ASCENDING), ('collection', ASCENDING)], name='cloud_collection', unique=True),
+]
+
+# Indexes of the filters used by the services of one collection only
+COLLECTION_INDEXES: Dict[str, List[IndexModel]] = {
+    Constants.MongoCollection.ORGANIZATION: [
+        IndexModel([('external_id', ASCENDING)], name='external_id')],
+    Constants.MongoCollection.PROJECT: [
+        IndexModel([('org_id', ASCENDING), ('default', ASCENDING)], name='org_default')],
+    # StatusReconciler.tracked
+    Constants.MongoCollection.INSTANCE: [
+        IndexModel([('active', ASCENDING), ('status', ASCENDING)], name='active_status'),
+        IndexModel([('active', ASCENDING), ('task_state', ASCENDING)], name='active_task_state')],
+    Constants.MongoCollection.VOLUME: [
+        IndexModel([('active', ASCENDING), ('status', ASCENDING)], name='active_status')],
+    Constants.MongoCollection.SUBNET: [
+        IndexModel([('network_id', ASCENDING), ('active', ASCENDING)], name='network_active')],
+    Constants.MongoCollection.PORT: [
+        IndexModel([('network_id', ASCENDING), ('active', ASCENDING)], name='network_active')],
+    Constants.MongoCollection.FLOATING_IP: [
+        IndexModel([('network_id', ASCENDING), ('active', ASCENDING)], name='network_active')],
+    Constants.MongoCollection.SECURITY_GROUP_RULE: [
+        IndexModel([('security_group_id', ASCENDING), ('active', ASCENDING)], name='security_group_active')],
+    Constants.MongoCollection.VOLUME_SNAPSHOT: [
+        IndexModel([('volume_id', ASCENDING), ('active', ASCENDING)], name='volume_active')],
+}
+
+
+class MongoIndexes:
+    """Declarative registry of the indexes of the CCP collections. The indexes are created at startup,
+    creating an existing index is a no-op so it is safe for every worker to apply them."""
+
+    @staticmethod
+    def collections() -> List[str]:
+        """Resource collections of the CCP database, the audit logs live in their own capped collection and
+        database and the jobs and the sync watermarks have their own indexes."""
+        return [name for key, name in vars(Constants.MongoCollection).items()
+                if not key.startswith('_') and isinstance(name, str)
+                and name not in (Constants.MongoCollection.AUDIT_COLLECTION_NAME, Constants.MongoCollection.JOB,
+                                 Constants.MongoCollection.SYNC_WATERMARK)]
+
+    @classmethod
+    def registry(cls) -> Dict[str, List[IndexModel]]:
+        """Get the indexes of every collection.
+        :return: Dict of collection name and its index models"""
+        registry = {collection: COMMON_INDEXES + name_indexes(NAME_SCOPES.get(collection, ()))
+                    + COLLECTION_INDEXES.get(collection, []) for collection in cls.collections()}
+        registry[Constants.MongoCollection.JOB] = JOB_INDEXES
+        registry[Constants.MongoCollection.SYNC_WATERMARK] = SYNC_WATERMARK_INDEXES
+        return registry
+
+    @classmethod
+    async def apply(cls, db) -> Dict[str, List[str]]:
+        """Create the missing indexes of every collection one at a time, an index the server refuses (e.g. a unique
+        index over duplicate uuids or an index of the same name with other options) is logged and the other
+        indexes are still created.
+        :param db: motor database
+        :return: Dict of collection name and the names of its indexes which exist"""
+        created: Dict[str, List[str]] = {}
+        failed = 0
+        for collection, indexes in cls.registry().items():
+            created[collection] = []
+            for index in indexes:
+                name = index.document['name']
+                try:
+                    created[collection] += await db[collection].create_indexes([index])
+                except OperationFailure as e:
+                    failed += 1
+                    LOG.error(f'Unable to create the index {name} of {collection}: {e}')
+        LOG.info(f'Indexes applied on {len(created)} collections, {failed} failed')
+        return created
+
+    @classmethod
+    async def report(cls, db) -> Dict[str, Dict[str, List[str]]]:
+        """Compare the indexes of every collection with the registry and with their usage in $indexStats.
+        The usage counters start again when mongod restarts, so an unused index needs a long enough uptime.
+        :param db: motor database
+        :return: Dict of collection name and its missing, unused and unregistered index names"""
+        report: Dict[str, Dict[str, List[str]]] = {}
+        for collection, indexes in cls.registry().items():
+            registered = [index.document['name'] for index in indexes]
+            stats = await db[collection].aggregate([{'$indexStats': {}}]).to_list(length=None)
+            existing = {stat['name']: stat['accesses']['ops'] for stat in stats if stat['name'] != '_id_'}
+            report[collection] = {
+                'missing': [name for name in registered if name not in existing],
+                'unused': sorted(name for name, ops in existing.items() if not ops),
+                'unregistered': sorted(name for name in existing if name not in registered),
+            }
+        return report
+
+
+async def main(apply: bool) -> None:
+    """Print the index report of the CCP database, after creating the missing indexes if asked."""
+    db = MongoAPI().db
+    if apply:
+        await MongoIndexes.apply(db)
+    print(json.dumps(await MongoIndexes.report(db), indent=2))
+    MongoAPI.close_clients()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Report missing and unused indexes of the CCP collections.')
+    parser.add_argument('--apply', action='store_true', help='create the missing indexes first')
+    asyncio.run(main(parser.parse_args().apply))
@@ -4,15 +4,28 @@
 # Proprietary and confidential                                               #
 # Written by Deepak Pant <deepak.pant@coredge.io>, Feb 2023                  #
 ##############################################################################
-import traceback
+import asyncio
+import base64
+import threading
 import uuid
-from datetime import datetime
+from typing import AsyncIterator
 from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Set
 from typing import Tuple
+from typing import Union
 
 import motor.motor_asyncio
-
+from bson import json_util
+from pymongo import InsertOne
+from pymongo import UpdateOne
+from pymongo.collation import Collation
+from pymongo.collation import CollationStrength
+from pymongo.errors import BulkWriteError
+from pymongo.errors import DuplicateKeyError
+
+from ccp_server.config.redis import CacheVersion
 from ccp_server.schema.v1.response_schemas import Pageable
 from ccp_server.util import ccp_context
 from ccp_server.util import env_variables
@@ -28,7 +41,42 @@ from ccp_server.util.utils import Utils
 LOG = KGLogger(name=__name__)
 
 
+class BulkWriteResult:
+    """Outcome of MongoAPI.bulk_write, the errors are reported with the batch and the index of the document."""
+
+    def __init__(self, uuids: List[str]):
+        self.uuids: List[str] = uuids
+        self.inserted: int = 0
+        self.upserted: int = 0
+        self.matched: int = 0
+        self.modified: int = 0
+        self.errors: List[Dict] = []
+        self.failed: Set[int] = set()
+
+    def add_counts(self, counts: Dict) -> None:
+        self.inserted += counts.get('nInserted', 0)
+        self.upserted += counts.get('nUpserted', 0)
+        self.matched += counts.get('nMatched', 0)
+        self.modified += counts.get('nModified', 0)
+
+    def add_error(self, batch: int, index: int, code: Optional[int], message: str) -> None:
+        self.errors.append({'batch': batch, 'index': index, 'uuid': self.uuids[index], 'code': code,
+                            'message': message})
+        self.failed.add(index)
+
+
 class MongoAPI(object):
+    # Case-insensitive collation of the name indexes, the queries on the names use it to match the indexes
+    NAME_COLLATION: Collation = Collation(locale='en', strength=CollationStrength.SECONDARY)
+    # Sorts after every character in the collation, the end of a prefix range
+    PREFIX_END: str = '\uffff'
+    # Fields an upsert writes only when it inserts the document
+    INSERT_ONLY_FIELDS: Tuple[str, ...] = ('uuid', 'created_at', 'created_by')
+
+    # Motor clients shared by all the MongoAPI objects of the process, one per connection string
+    _clients: Dict[str, motor.motor_asyncio.AsyncIOMotorClient] = {}
+    _lock: threading.Lock = threading.Lock()
+
     def __init__(self, conn_str: str = None, db_name: str = None):
         # Initialize client and DB
 
@@ -36,9 +84,28 @@ class MongoAPI(object):
         db_name = db_name if db_name else Constants.MONGO_DB_NAME
 
         self.conn_str = conn_str
-        self._client = motor.motor_asyncio.AsyncIOMotorClient(self.conn_str)
+        self._client = MongoAPI.get_client(self.conn_str)
         self._db = self._client[db_name]
 
+    @classmethod
+    def get_client(cls, conn_str: str) -> motor.motor_asyncio.AsyncIOMotorClient:
+        """Get the shared motor client of the connection string, it is created on the first call.
+        :param conn_str: Mongo connection string
+        :return: Motor client"""
+        with cls._lock:
+            if conn_str not in cls._clients:
+                cls._clients[conn_str] = motor.motor_asyncio.AsyncIOMotorClient(conn_str)
+            return cls._clients[conn_str]
+
+    @classmethod
+    def close_clients(cls) -> None:
+        """Close all the shared motor clients, used at the shutdown of the process."""
+        with cls._lock:
+            clients = list(cls._clients.values())
+            cls._clients.clear()
+        for client in clients:
+            client.close()
+
     @property
     def db(self):
         if self._db is None:
@@ -48,8 +115,7 @@ class MongoAPI(object):
     @property
     def client(self):
         if not self._client:
-            self._client = motor.motor_asyncio.AsyncIOMotorClient(
-                self._conn_str)
+            self._client = MongoAPI.get_client(self.conn_str)
         return self._client
 
     async def create_capped_collection(self, collection_name, max_size_bytes, max_count):
@@ -168,7 +234,7 @@ class MongoAPI(object):
                                        exclude_project: bool = False,
                                        pageable: Pageable = None,
                                        filter_dict: Dict = None,
-                                       ) -> Tuple[List[Dict], int]:
+                                       ) -> Tuple[Union[List[Dict], AsyncIterator[Dict]], Optional[int]]:
         """
         Get the document list by cloud, org_id and project_id if applicable.
         :param collection_name: Name of the collection
@@ -179,10 +245,12 @@ class MongoAPI(object):
         :param projection_dict: Projection dictionary
         :param exclude_org: True if we want to exclude the org_id from the filter
         :param exclude_project: True if we want to exclude the project_id from the filter
-        :param pageable: Pageable object
+        :param pageable: Pageable object, its next_page_token is set when there is a next page. A streamed pageable
+                gets every document after its page token as an async iterator, the page number and size are ignored
         :param filter_dict: Filter dictionary
         :return: returns list of document as list[dict] or None. The dict will have the keys: uuid, cloud, org_id,
-                project_id, created_at, updated_at, created_by, updated_by
+                project_id, created_at, updated_at, created_by, updated_by. The total is None when the pageable
+                does not include it or the list is streamed
         """
         _filter_dict = self.populate_default_filter_dict(cloud=cloud, org_id=org_id, project_id=project_id,
                                                          exclude_org=exclude_org, exclude_project=exclude_project,
@@ -196,44 +264,135 @@ class MongoAPI(object):
             # TODO as description is not mandatory, removing it from the filter_dict
             # filter_dict["description"] = {"$regex": f".*{query_str}.*", "$options": "i"}
 
-        sort = []
-
-        docs = []
         collection_obj = self.db[collection_name]
 
         projection_dict.update({'reference_id': 0,
                                 'cloud_meta': 0,
                                 '_id': 0})
 
-        if pageable:
-            if pageable.query_str is not None:
-                _filter_dict["name"] = {
-                    "$regex": f".*{pageable.query_str}.*", "$options": "i"}
-            if pageable.sort_by is not None:
-                for field in pageable.sort_by:
-                    sort.append((field, -1 if pageable.sort_desc else 1))
-            else:
-                sort.append(
-                    ('created_by_str', -1 if pageable.sort_desc else 1))
-
-            # skip value will be page-1 * size, means mongo will skip the number of skipped documents
-            skip: int = (pageable.page - 1) * pageable.size
-            if pageable.tags:
-                # TO add the tags in filter creates the syntax like tags.name: "value1" and tags.type: "value2"
-                _filter_dict = {f"tags.{key}": value for key,
-                                value in pageable.tags.items()}
-            cursor = collection_obj.find(_filter_dict, projection_dict).sort(
-                sort).skip(skip).limit(Constants.DOCUMENT_TO_LIST_SIZE)
-            docs = await cursor.to_list(length=Constants.DOCUMENT_TO_LIST_SIZE)
-        else:
+        if not pageable:
             cursor = collection_obj.find(_filter_dict, projection_dict)
             docs = await cursor.to_list(length=Constants.DOCUMENT_TO_LIST_SIZE)
+            # A short list is complete, so it is its own total
+            total = len(docs) if len(docs) < Constants.DOCUMENT_TO_LIST_SIZE else \
+                await collection_obj.count_documents(_filter_dict)
+            return docs, total
+
+        # A search is a case-insensitive prefix range on the name, served by the collated name index
+        collation = None
+        if pageable.query_str:
+            _filter_dict["name"] = {'$gte': pageable.query_str, '$lt': pageable.query_str + self.PREFIX_END}
+            collation = self.NAME_COLLATION
+        if pageable.tags:
+            # TO add the tags in filter creates the syntax like tags.name: "value1" and tags.type: "value2"
+            _filter_dict.update({f"tags.{key}": value for key, value in pageable.tags.items()})
+
+        # The uuid ends the sort so the order, and the position a page token points to, is unique
+        sort = [(field, -1 if pageable.sort_desc else 1) for field in pageable.sort_by or ['created_at']
+                if field != 'uuid']
+        sort.append(('uuid', -1 if pageable.sort_desc else 1))
+
+        # A page token continues after the last document of the previous page, else the page number is skipped
+        page_filter_dict = {}
+        skip = 0
+        if pageable.page_token:
+            values, uid = self.decode_page_token(pageable.page_token, len(sort) - 1)
+            page_filter_dict = self.keyset_filter(sort, values + [uid])
+        else:
+            skip = (pageable.page - 1) * pageable.size
+
+        if pageable.stream:
+            # The whole list after the page token, read in batches as the response is written
+            cursor = collection_obj.find({'$and': [_filter_dict, page_filter_dict]} if page_filter_dict
+                                         else _filter_dict, projection_dict, collation=collation).sort(
+                sort).batch_size(Constants.MONGO_STREAM_BATCH_SIZE)
+            pageable.next_page_token = None
+            return self.stream_documents(cursor), None
+
+        # One extra document tells if there is a next page. The default sort is served by the list index of
+        # the collection, which ends with created_at and uuid
+        cursor = collection_obj.find({'$and': [_filter_dict, page_filter_dict]} if page_filter_dict
+                                     else _filter_dict, projection_dict, collation=collation).sort(
+            sort).skip(skip).limit(pageable.size + 1)
+        if pageable.include_total:
+            # The total counts every matching document, so include_total=false is the fast path of a big list.
+            # The count runs concurrently with the page.
+            docs, total = await asyncio.gather(cursor.to_list(length=pageable.size + 1),
+                                               collection_obj.count_documents(_filter_dict, collation=collation))
+        else:
+            docs = await cursor.to_list(length=pageable.size + 1)
+            total = None
 
-        await self.update_dates(docs)
+        pageable.next_page_token = None
+        if len(docs) > pageable.size:
+            docs = docs[:pageable.size]
+            pageable.next_page_token = self.encode_page_token(docs[-1], sort)
 
-        total = await collection_obj.count_documents(_filter_dict)
         return docs, total
 
+    @staticmethod
+    async def stream_documents(cursor: motor.motor_asyncio.AsyncIOMotorCursor) -> AsyncIterator[Dict]:
+        """Yield the documents of a cursor, only one batch is held in memory. The cursor is closed on the server
+        when the client goes away before the end of the list.
+        :param cursor: motor cursor
+        :return: async iterator of the documents"""
+        try:
+            async for doc in cursor:
+                yield doc
+        finally:
+            await cursor.close()
+
+    @staticmethod
+    def encode_page_token(doc: Dict, sort: List[Tuple[str, int]]) -> str:
+        """Build the opaque token of the position after a document.
+        :param doc: last document of the page
+        :param sort: sort of the list, ending with uuid
+        :return: url safe token"""
+        values = [MongoAPI.field_value(doc, field) for field, _ in sort]
+        return base64.urlsafe_b64encode(json_util.dumps(values).encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decode_page_token(token: str, fields: int) -> Tuple[List, str]:
+        """Read a page token.
+        :param token: token of encode_page_token
+        :param fields: number of sort fields before the uuid
+        :return: values of the sort fields and the uuid"""
+        try:
+            values = json_util.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+            if not isinstance(values, list) or len(values) != fields + 1:
+                raise ValueError(token)
+        except Exception:
+            raise CCPBadRequestException(message=Message.INVALID_PAGE_TOKEN)
+        return values[:-1], values[-1]
+
+    @staticmethod
+    def keyset_filter(sort: List[Tuple[str, int]], values: List) -> Dict:
+        """Filter of the documents after a position in the sort, as (f1 > v1) or (f1 = v1 and f2 > v2) and so on.
+        Null sorts before any value, so in ascending order every value is after a null and in descending order
+        only the other nulls are.
+        :param sort: sort of the list, ending with uuid
+        :param values: values of the sort fields at the position
+        :return: mongo filter"""
+        clauses = []
+        for index, (field, direction) in enumerate(sort):
+            value = values[index]
+            if value is None:
+                after = {field: {'$ne': None}} if direction == 1 else None
+            elif direction == 1:
+                after = {field: {'$gt': value}}
+            else:
+                after = {'$or': [{field: {'$lt': value}}, {field: None}]}
+            if after is not None:
+                clauses.append({**{f: v for (f, _), v in zip(sort[:index], values)}, **after})
+        return {'$or': clauses}
+
+    @staticmethod
+    def field_value(doc: Dict, field: str):
+        """Value of a dotted field of a document, None when it is missing."""
+        for key in field.split('.'):
+            doc = doc.get(key) if isinstance(doc, dict) else None
+        return doc
+
     async def get_document_by_projection_and_filter(self, collection_name, filter_dict={},
                                                     projection_dict={}):
         docs = []
@@ -245,24 +404,13 @@ class MongoAPI(object):
         cursor = collection_obj.find(filter_dict, projection_dict)
         docs = await cursor.to_list(length=Constants.DOCUMENT_TO_LIST_SIZE)
 
-        await self.update_dates(docs)
         return docs
 
-    async def update_dates(self, docs):
-        """Updates the created_by_str and updated_by_str fields in the documents"""
-        for doc in docs:
-            if 'created_at' in doc and doc['created_at'] is not None and isinstance(doc['created_at'], datetime):
-                doc['created_at'] = doc['created_at'].strftime(
-                    Constants.TIMESTAMP_FORMAT)
-            if 'updated_at' in doc and doc['updated_at'] is not None and isinstance(doc['updated_at'], datetime):
-                doc['updated_at'] = doc['updated_at'].strftime(
-                    Constants.TIMESTAMP_FORMAT)
-
     async def check_document_by_name(self, collection_name: str, name: str, project_id: str = None,
                                      cloud: str = None, org_id: str = None, raise_exception: bool = False,
                                      filter_dict: dict = None) -> bool:
         """
-        Check if a document exists by name.
+        Check if an active document exists with the name, ignoring the case.
         :param collection_name: Name of the collection
         :param name: Name of the document
         :param project_id: Project id
@@ -273,12 +421,12 @@ class MongoAPI(object):
 
         _filter_dict = self.populate_default_filter_dict(
             cloud=cloud, org_id=org_id, project_id=project_id)
-        _filter_dict.update(
-            {'name': {"$regex": f".*{name}.*", "$options": "i"}})
+        _filter_dict.update({'name': name, 'active': Status.ACTIVE.value})
         if filter_dict:
             _filter_dict.update(filter_dict)
 
-        doc = await self.get_document_by_projection_and_filter(collection_name, _filter_dict)
+        # An exact match in the case-insensitive collation of the name indexes
+        doc = await self.db[collection_name].find_one(_filter_dict, {'_id': 1}, collation=self.NAME_COLLATION)
 
         if doc:
             if raise_exception:
@@ -287,6 +435,25 @@ class MongoAPI(object):
             return True
         return False
 
+    async def get_existing_names(self, collection_name: str, names: List[str], project_id: str = None,
+                                 cloud: str = None, org_id: str = None) -> Set[str]:
+        """
+        Find which of the names are taken by active documents, ignoring the case, in a single query.
+        :param collection_name: Name of the collection
+        :param names: Names to look for
+        :param project_id: Project id
+        :param cloud: Cloud name to look for, if not provided, it will be fetched from ccp_context.get_cloud()
+        :param org_id: Organization name to look for, if not provided, it will be fetched from ccp_context.get_org()
+        :return: the taken names in lower case"""
+
+        _filter_dict = self.populate_default_filter_dict(
+            cloud=cloud, org_id=org_id, project_id=project_id)
+        _filter_dict.update({'name': {'$in': names}, 'active': Status.ACTIVE.value})
+
+        docs = await self.db[collection_name].find(_filter_dict, {'name': 1, '_id': 0},
+                                                   collation=self.NAME_COLLATION).to_list(length=None)
+        return {doc['name'].lower() for doc in docs}
+
     async def check_document_by_uuid(self, collection_name: str, uid: str, project_id: str = None, cloud: str = None,
                                      org_id: str = None, raise_exception: bool = False) -> bool:
         """
@@ -324,6 +491,21 @@ class MongoAPI(object):
                 reference_id, created_at, updated_at, created_by, updated_by
         """
 
+        document_dict = self.populate_default_details(document_dict, exclude_org=exclude_org,
+                                                      exclude_project=exclude_project)
+        _, doc_id = await self.write_document(collection_name, document_dict)
+        return doc_id
+
+    @staticmethod
+    def populate_default_details(document_dict, exclude_org: bool = False, exclude_project: bool = False) -> Dict:
+        """
+        Add the default details created_by, cloud, org_id and project_id from ccp_context
+        :param document_dict: Document dict or object
+        :param exclude_org: True if we want to exclude the org_id from the filter
+        :param exclude_project: True if we want to exclude the project_id from the filter
+        :return: the document as dict
+        """
+
         # converts object into dict to add default values
         if not isinstance(document_dict, dict):
             document_dict: dict = vars(document_dict)
@@ -346,50 +528,141 @@ class MongoAPI(object):
             """ Added project_id from ccp_context"""
             document_dict.update({'project_id': ccp_context.get_project_id()})
 
-        _, doc_id = await self.write_document(collection_name, document_dict)
-        return doc_id
+        return document_dict
+
+    @staticmethod
+    def prepare_document(document_dict: Dict) -> Dict:
+        """
+        Give the document a uuid if it has none and remove its empty values
+        :param document_dict: Document dict
+        :return: the document to insert, its uuid is a str
+        """
+        if 'uuid' not in document_dict:
+            data_with_uuid = {'uuid': str(uuid.uuid4())}
+            data_with_uuid.update(document_dict)
+        else:
+            data_with_uuid = document_dict
+
+        # Remove empty values from dict
+        return {k: v for k, v in data_with_uuid.items() if v is not None}
 
     async def write_document(self, collection_name, document_dict):
         try:
-            if 'uuid' not in document_dict:
-                doc_id = str(uuid.uuid4())
-                data_with_uuid = {'uuid': doc_id}
-                data_with_uuid.update(document_dict)
-            else:
-                doc_id = str(document_dict['uuid'])
-                data_with_uuid = document_dict
-
-            # Remove empty values from dict
-            data_with_uuid = {k: v for k,
-                              v in data_with_uuid.items() if v is not None}
+            data_with_uuid = self.prepare_document(document_dict)
+            doc_id = str(data_with_uuid['uuid'])
 
             collection_obj = self.db[collection_name]
             result = await collection_obj.insert_one(data_with_uuid)
+            await CacheVersion.bump(collection_name, org_id=data_with_uuid.get('org_id'))
             return repr(result.inserted_id), doc_id
+        except DuplicateKeyError:
+            # The unique name index rejected a name created since the check of the name
+            raise CCPBadRequestException(message=Message.NAME_ALREADY_EXISTS.format(document_dict.get('name')))
         except Exception as e:
             LOG.error('Error occurred while performing database operation.', e)
             return None, None
 
-    async def write_many(self, collection_name, document_list):
+    async def write_many(self, collection_name: str, document_list: List, with_default_details: bool = False,
+                         exclude_org: bool = False, exclude_project: bool = False,
+                         ordered: bool = False) -> 'BulkWriteResult':
+        """
+        Insert many documents in batches of MONGO_BULK_BATCH_SIZE, a failed document does not stop the others
+        unless the write is ordered
+        :param collection_name: Name of the collection
+        :param document_list: List of document dicts or objects
+        :param with_default_details: Add the default details like write_document_with_default_details
+        :param exclude_org: True if we want to exclude the org_id from the filter
+        :param exclude_project: True if we want to exclude the project_id from the filter
+        :param ordered: Stop at the first failed document
+        :return: BulkWriteResult with the uuid of each document and the errors by index in the list
+        """
         if not isinstance(document_list, list):
             raise CCPException(
                 message=Message.DOCUMENT_LIST)
-        try:
-            collection_obj = self.db[collection_name]
 
-            data_list = []
-            for document_dict in document_list:
-                if 'uuid' not in document_dict:
-                    data_with_uuid = {'uuid': uuid.uuid4()}
-                    data_list.append(data_with_uuid.update(document_dict))
-                else:
-                    data_list.append(document_dict)
+        documents = [self.prepare_document(
+            self.populate_default_details(document_dict, exclude_org=exclude_org, exclude_project=exclude_project)
+            if with_default_details else document_dict) for document_dict in document_list]
+        return await self.bulk_write(collection_name, [InsertOne(document) for document in documents],
+                                     [document['uuid'] for document in documents], ordered=ordered,
+                                     org_ids={document.get('org_id') for document in documents})
 
-            result = await collection_obj.insert_many(data_list)
-            return result
-        except Exception as e:
-            LOG.error(e)
-            LOG.error(traceback.print_exc())
+    async def upsert_many(self, collection_name: str, document_list: List, with_default_details: bool = False,
+                          exclude_org: bool = False, exclude_project: bool = False,
+                          ordered: bool = False) -> 'BulkWriteResult':
+        """
+        Insert or update many documents by their cloud and reference_id, in batches of MONGO_BULK_BATCH_SIZE.
+        The uuid, created_at and created_by are only written when the document is inserted.
+        :param collection_name: Name of the collection
+        :param document_list: List of document dicts or objects, each with a cloud and a reference_id
+        :param with_default_details: Add the default details like write_document_with_default_details
+        :param exclude_org: True if we want to exclude the org_id from the filter
+        :param exclude_project: True if we want to exclude the project_id from the filter
+        :param ordered: Stop at the first failed document
+        :return: BulkWriteResult with the uuid each document gets when it is inserted and the errors by index
+        """
+        if not isinstance(document_list, list):
+            raise CCPException(
+                message=Message.DOCUMENT_LIST)
+
+        requests, uuids, org_ids = [], [], set()
+        for document_dict in document_list:
+            document = self.prepare_document(
+                self.populate_default_details(document_dict, exclude_org=exclude_org, exclude_project=exclude_project)
+                if with_default_details else document_dict)
+            if not document.get('cloud') or not document.get('reference_id'):
+                raise CCPException(message=Message.UPSERT_KEY_MISSING)
+            on_insert = {field: document.pop(field) for field in self.INSERT_ONLY_FIELDS if field in document}
+            requests.append(UpdateOne({'cloud': document['cloud'], 'reference_id': document['reference_id']},
+                                      {'$set': document, '$setOnInsert': on_insert}, upsert=True))
+            uuids.append(on_insert['uuid'])
+            org_ids.add(document.get('org_id'))
+        return await self.bulk_write(collection_name, requests, uuids, ordered=ordered, org_ids=org_ids)
+
+    async def bulk_write(self, collection_name: str, requests: List, uuids: List[str], ordered: bool = False,
+                         org_ids: Set[str] = frozenset([None])) -> 'BulkWriteResult':
+        """
+        Run write requests in batches of MONGO_BULK_BATCH_SIZE, one round trip each. The errors of a batch are
+        recorded and the next batches are still written, an ordered write stops at the first failed document.
+        :param collection_name: Name of the collection
+        :param requests: pymongo write requests like InsertOne and UpdateOne
+        :param uuids: uuid of the document of each request
+        :param ordered: Stop at the first failed request
+        :param org_ids: Orgs of the documents, their cached lists are invalidated
+        :return: BulkWriteResult
+        """
+        result = BulkWriteResult(uuids)
+        collection_obj = self.db[collection_name]
+        batch_size = Constants.MONGO_BULK_BATCH_SIZE
+        for start in range(0, len(requests), batch_size):
+            batch_number, batch = start // batch_size, requests[start:start + batch_size]
+            try:
+                counts = (await collection_obj.bulk_write(batch, ordered=ordered)).bulk_api_result
+            except BulkWriteError as e:
+                counts = e.details
+                for error in counts.get('writeErrors', []):
+                    result.add_error(batch_number, start + error['index'], error.get('code'), error.get('errmsg'))
+            except Exception as e:
+                LOG.error(f'Error occurred while writing batch {batch_number} of {collection_name}: {e}')
+                counts = {}
+                for index in range(start, start + len(batch)):
+                    result.add_error(batch_number, index, None, str(e))
+            result.add_counts(counts)
+
+            if ordered and result.errors:
+                # The requests after the failed one were not attempted
+                failed = result.errors[0]['index']
+                for index in range(failed + 1, len(requests)):
+                    if index not in result.failed:
+                        result.add_error(index // batch_size, index, None, Message.DOCUMENT_NOT_WRITTEN)
+                break
+
+        if result.inserted or result.upserted or result.modified:
+            for org_id in org_ids:
+                await CacheVersion.bump(collection_name, org_id=org_id)
+        if result.errors:
+            LOG.warn(f'{len(result.errors)} of {len(requests)} writes to {collection_name} failed')
+        return result
 
     async def update_document_by_uuid(self, collection_name, uid, data_dict):
         try:
@@ -405,9 +678,13 @@ class MongoAPI(object):
 
             update_dict = {"$set": data_dict}
 
-            collection.update_one({'uuid': uid}, update_dict,
-                                  upsert=False)
+            await collection.update_one({'uuid': uid}, update_dict,
+                                        upsert=False)
+            await CacheVersion.bump(collection_name)
             return None
+        except DuplicateKeyError:
+            # The unique name index rejected a rename to a name in use
+            raise CCPBadRequestException(message=Message.NAME_ALREADY_EXISTS.format(data_dict.get('name')))
         except Exception as e:
             LOG.error('Error occurred while performing database operation.', e)
             return False
@@ -428,7 +705,8 @@ class MongoAPI(object):
     async def delete_document_by_uuid(self, collection_name, uid):
         collection = self.db[collection_name]
         query = {"uuid": uid}
-        result = collection.delete_one(query)
+        result = await collection.delete_one(query)
+        await CacheVersion.bump(collection_name)
         var = result.deleted_count == 1
         return bool(var)
 
@@ -45,6 +45,7 @@ def has_role(*roles):
     :param roles: List of roles to check like 'org-admin' or 'super-admin'"""
 
     def decorator(func):
+        @wraps(func)
         async def wrapper(request, *args, **kwargs):
             if not any(role.lower() in ccp_context.get_logged_in_user_roles() for role in roles):
                 LOG.error(
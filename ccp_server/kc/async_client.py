@@ -0,0 +1,235 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import time
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import httpx
+from fastapi import status
+
+from ccp_server.util.constants import Constants
+from ccp_server.util.exceptions import CCPBadRequestException
+from ccp_server.util.exceptions import CCPKeycloakException
+from ccp_server.util.logger import KGLogger
+from ccp_server.util.messages import Message
+
+LOG = KGLogger(__name__)
+
+
+class KeycloakAsyncClient:
+    """Async Keycloak admin and OpenID client, on one pooled httpx.AsyncClient per event loop.
+    The admin token is fetched with the client credentials of the CCP client and refreshed before it expires.
+
+    Usage:
+    user_id = await KeycloakAsyncClient().get_user_id(username)
+    """
+
+    _http: httpx.AsyncClient = None
+    _loop: asyncio.AbstractEventLoop = None
+    _token: str = None
+    _token_expires_at: float = 0
+    _token_lock: asyncio.Lock = None
+    _client_secret_key: str = None
+
+    # Page size used to fetch the complete lists
+    PAGE_SIZE: int = 100
+
+    @classmethod
+    def http(cls) -> httpx.AsyncClient:
+        """Get the pooled HTTP client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        if cls._http is None or cls._loop is not loop:
+            cls._http = httpx.AsyncClient(verify=False, timeout=Constants.KEYCLOAK_HTTP_TIMEOUT_IN_SECS,
+                                          limits=httpx.Limits(
+                                              max_connections=Constants.KEYCLOAK_HTTP_MAX_CONNECTIONS,
+                                              max_keepalive_connections=Constants.KEYCLOAK_HTTP_MAX_CONNECTIONS))
+            cls._loop = loop
+            cls._token = None
+            cls._token_lock = asyncio.Lock()
+        return cls._http
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the HTTP client, used at the shutdown of the process."""
+        if cls._http is not None:
+            await cls._http.aclose()
+        cls._http = None
+        cls._loop = None
+        cls._token = None
+
+    @classmethod
+    async def client_secret_key(cls) -> str:
+        if cls._client_secret_key is None:
+            from ccp_server.kc.connection import KeycloakAdminClient
+
+            # Looked up once per process, the internal Keycloak needs a sync admin call for it
+            cls._client_secret_key = await asyncio.to_thread(lambda: KeycloakAdminClient().client_secret_key)
+        return cls._client_secret_key
+
+    async def admin_token(self, force: bool = False) -> str:
+        cls = KeycloakAsyncClient
+        http = cls.http()
+        async with cls._token_lock:
+            if not force and cls._token and time.monotonic() < cls._token_expires_at:
+                return cls._token
+
+            response = await http.post(Constants.KEYCLOAK_OPENID_CONNECT_TOKEN_URL,
+                                       data={'grant_type': Constants.KEYCLOAK_GRANT_TYPE,
+                                             'client_id': Constants.KEYCLOAK_CLIENT_ID,
+                                             'client_secret': await self.client_secret_key()})
+            token = self.check(response)
+            cls._token = token['access_token']
+            cls._token_expires_at = time.monotonic() + token.get('expires_in', 0) - \
+                Constants.KEYCLOAK_TOKEN_REFRESH_MARGIN_IN_SECS
+            return cls._token
+
+    async def request(self, method: str, path: str, params: Dict = None, json=None) -> httpx.Response:
+        """Call the Keycloak admin API of the realm, a 401 fetches a new admin token and retries once.
+        :param method: HTTP method
+        :param path: path after the realm admin URL
+        :param params: query parameters
+        :param json: request body
+        :return: httpx.Response"""
+        http = KeycloakAsyncClient.http()
+        url = f'{Constants.KEYCLOAK_ADMIN_BASE_URL}{path}'
+        response = None
+        for force in (False, True):
+            headers = {Constants.KEYCLOAK_AUTHORIZATION_HEADER_KEY:
+                       f'{Constants.KEYCLOAK_TOKEN_BEARER}{await self.admin_token(force=force)}'}
+            response = await http.request(method, url, params=params, json=json, headers=headers)
+            if response.status_code != status.HTTP_401_UNAUTHORIZED:
+                break
+        return response
+
+    @staticmethod
+    def check(response: httpx.Response, allowed: tuple = ()):
+        """Raise CCPKeycloakException if the response is not successful.
+        :param response: httpx.Response
+        :param allowed: status codes accepted besides 2xx
+        :return: JSON body if any"""
+        if response.is_success or response.status_code in allowed:
+            if response.content and 'json' in response.headers.get('content-type', ''):
+                return response.json()
+            return None
+        LOG.error(f'Keycloak {response.request.method} {response.request.url.path} failed with '
+                  f'{response.status_code}: {response.text}')
+        raise CCPKeycloakException()
+
+    @staticmethod
+    def created_id(response: httpx.Response) -> Optional[str]:
+        location = response.headers.get('Location')
+        return location.rstrip('/').rsplit('/', 1)[-1] if location else None
+
+    async def fetch_all(self, path: str, params: Dict = None) -> List[Dict]:
+        params = dict(params or {})
+        results: List[Dict] = []
+        first = 0
+        while True:
+            params.update({'first': first, 'max': KeycloakAsyncClient.PAGE_SIZE})
+            page = self.check(await self.request('GET', path, params=params)) or []
+            results.extend(page)
+            if len(page) < KeycloakAsyncClient.PAGE_SIZE:
+                return results
+            first += KeycloakAsyncClient.PAGE_SIZE
+
+    # Users
+    async def get_user_id(self, username: str) -> Optional[str]:
+        users = self.check(await self.request('GET', '/users', params={'username': username, 'exact': 'true'}))
+        return next((user['id'] for user in users or [] if user['username'] == username.lower()), None)
+
+    async def get_user(self, user_id: str) -> Dict:
+        return self.check(await self.request('GET', f'/users/{user_id}'))
+
+    async def create_user(self, payload: Dict, exist_ok: bool = False) -> str:
+        if exist_ok:
+            user_id = await self.get_user_id(payload['username'])
+            if user_id:
+                return user_id
+        response = await self.request('POST', '/users', json=payload)
+        if response.status_code == status.HTTP_409_CONFLICT:
+            raise CCPBadRequestException(message=Message.USER_ALREADY_EXISTS.format(payload['username']))
+        self.check(response)
+        return self.created_id(response)
+
+    async def update_user(self, user_id: str, payload: Dict) -> None:
+        self.check(await self.request('PUT', f'/users/{user_id}', json=payload))
+
+    async def delete_user(self, user_id: str) -> None:
+        self.check(await self.request('DELETE', f'/users/{user_id}'))
+
+    async def send_update_account(self, user_id: str, payload: List[str], client_id: str = None,
+                                  lifespan: int = None, redirect_uri: str = None) -> None:
+        params = {key: value for key, value in
+                  {'client_id': client_id, 'lifespan': lifespan, 'redirect_uri': redirect_uri}.items() if value}
+        self.check(await self.request('PUT', f'/users/{user_id}/execute-actions-email', params=params,
+                                      json=payload))
+
+    async def user_logout(self, user_id: str) -> None:
+        self.check(await self.request('POST', f'/users/{user_id}/logout'))
+
+    async def get_user_groups(self, user_id: str) -> List[Dict]:
+        return self.check(await self.request('GET', f'/users/{user_id}/groups')) or []
+
+    # Groups
+    async def create_group(self, payload: Dict, parent: str = None) -> str:
+        path = f'/groups/{parent}/children' if parent else '/groups'
+        response = await self.request('POST', path, json=payload)
+        self.check(response)
+        return self.created_id(response)
+
+    async def get_group(self, group_id: str) -> Dict:
+        return self.check(await self.request('GET', f'/groups/{group_id}'))
+
+    async def group_user_add(self, user_id: str, group_id: str) -> None:
+        self.check(await self.request('PUT', f'/users/{user_id}/groups/{group_id}'))
+
+    async def group_user_remove(self, user_id: str, group_id: str) -> None:
+        self.check(await self.request('DELETE', f'/users/{user_id}/groups/{group_id}'))
+
+    async def get_group_members(self, group_id: str) -> List[Dict]:
+        return await self.fetch_all(f'/groups/{group_id}/members')
+
+    # Client roles
+    async def get_client_id(self, client_id: str) -> Optional[str]:
+        clients = self.check(await self.request('GET', '/clients', params={'clientId': client_id}))
+        return clients[0]['id'] if clients else None
+
+    async def get_client_roles(self, client_uuid: str) -> List[Dict]:
+        return self.check(await self.request('GET', f'/clients/{client_uuid}/roles')) or []
+
+    async def get_client_role_members(self, client_uuid: str, role_name: str) -> List[Dict]:
+        return await self.fetch_all(f'/clients/{client_uuid}/roles/{role_name}/users')
+
+    async def get_client_roles_of_user(self, user_id: str, client_uuid: str) -> List[Dict]:
+        return self.check(await self.request('GET', f'/users/{user_id}/role-mappings/clients/{client_uuid}')) or []
+
+    async def assign_client_role(self, user_id: str, client_id: str, roles: List[Dict]) -> None:
+        self.check(await self.request('POST', f'/users/{user_id}/role-mappings/clients/{client_id}', json=roles))
+
+    async def delete_client_roles_of_user(self, user_id: str, client_id: str, roles: List[Dict]) -> None:
+        self.check(await self.request('DELETE', f'/users/{user_id}/role-mappings/clients/{client_id}',
+                                      json=roles))
+
+    # OpenID
+    async def introspect(self, token: str) -> Dict:
+        response = await KeycloakAsyncClient.http().post(f'{Constants.KEYCLOAK_OPENID_CONNECT_TOKEN_URL}/introspect',
+                                                         data={'token': token,
+                                                               'client_id': Constants.KEYCLOAK_CLIENT_ID,
+                                                               'client_secret': await self.client_secret_key()})
+        return self.check(response)
+
+    async def certs(self) -> Dict:
+        response = await KeycloakAsyncClient.http().get(Constants.KEYCLOAK_OPENID_CONNECT_CERTS_URL)
+        return self.check(response)
+
+    async def refresh_token(self, refresh_token: str, client_id: str) -> Dict:
+        response = await KeycloakAsyncClient.http().post(Constants.KEYCLOAK_OPENID_CONNECT_TOKEN_URL,
+                                                         data={'client_id': client_id,
+                                                               'grant_type': 'refresh_token',
+                                                               'refresh_token': refresh_token})
+        return self.check(response)
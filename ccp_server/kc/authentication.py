@@ -4,18 +4,41 @@
 # Proprietary and confidential                                                #
 # Written by Deepak Pant <deepak.pant@coredge.io>, Feb 2023                   #
 ###############################################################################
+import asyncio
+import hashlib
+import json
+import time
+from typing import Dict
+
+from jose import jwt
+from jose import JWTError
+
+from ccp_server.config.redis import get_redis
 from ccp_server.kc.connection import KeycloakAdminClient
+from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPBadRequestException
 from ccp_server.util.exceptions import CCPKeycloakException
+from ccp_server.util.logger import KGLogger
 from ccp_server.util.logger import log
 from ccp_server.util.messages import Message
 from ccp_server.util.token import TokenInfo
 
+LOG = KGLogger(__name__)
+
 
 class KeycloakAuthService(KeycloakAdminClient):
+    # Signing keys of the realm by kid, shared by the whole process
+    _jwks: Dict[str, dict] = {}
+    _jwks_fetched_at: float = None
+    _jwks_lock: asyncio.Lock = None
+    _jwks_lock_loop: asyncio.AbstractEventLoop = None
+
+    # Unknown kid refreshes the keys, but not more often than this to protect Keycloak from bad tokens
+    JWKS_MIN_REFRESH_INTERVAL_IN_SECS: int = 30
+    SIGNING_ALGORITHMS = ['RS256', 'RS384', 'RS512', 'PS256', 'PS384', 'PS512', 'ES256', 'ES384', 'ES512']
 
     @log
-    def introspect(self, token: str) -> dict:
+    async def introspect(self, token: str) -> dict:
         """Get token info from the Keycloak server.
         :param token: str
         :return: dict Token information
@@ -24,17 +47,134 @@ class KeycloakAuthService(KeycloakAdminClient):
         if not token:
             raise CCPBadRequestException(message=Message.TOKEN_EMPTY)
 
-        try:
-            return self.oid_connect.introspect(token)
-        except Exception:
-            raise CCPKeycloakException()
+        return await self.aconnect.introspect(token)
 
     @log
-    def tokeninfo(self, token: str) -> TokenInfo:
+    async def tokeninfo(self, token: str) -> TokenInfo:
         """Get the token information from the JWT token.
         :param token: str
         :return: TokenInfo
         """
 
-        token_details = self.introspect(token)
+        token_details = await self.introspect(token)
         return TokenInfo(token_details)
+
+    async def validate(self, token: str) -> TokenInfo:
+        """Validate the access token without the per request Keycloak round trip.
+        In 'local' mode the JWT is verified against the cached realm JWKS, in 'introspect' mode
+        the introspection result is cached in Redis by token hash until the token expires.
+        :param token: str
+        :return: TokenInfo, active is False if the token is invalid or expired
+        """
+
+        if not token:
+            raise CCPBadRequestException(message=Message.TOKEN_EMPTY)
+
+        if Constants.TOKEN_VALIDATION_MODE == Constants.TOKEN_VALIDATION_MODE_INTROSPECT:
+            return TokenInfo(await self.cached_introspect(token))
+        return TokenInfo(await self.verify_locally(token))
+
+    async def verify_locally(self, token: str) -> dict:
+        """Verify the signature, expiry and issuer of the JWT with the realm signing keys.
+        :param token: str
+        :return: dict token claims, with active True when the token is valid
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+        except JWTError as e:
+            LOG.debug(f'Invalid token header: {e}')
+            return {'active': False}
+
+        kid = header.get('kid')
+        key = KeycloakAuthService.cached_signing_key(kid)
+        if key is None:
+            key = await self.signing_key(kid)
+        if key is None:
+            LOG.warn(f'Signing key {kid} not found in the realm keys')
+            return {'active': False}
+
+        try:
+            claims = jwt.decode(token, key, algorithms=KeycloakAuthService.SIGNING_ALGORITHMS,
+                                issuer=Constants.KEYCLOAK_TOKEN_ISSUER, options={'verify_aud': False})
+        except JWTError as e:
+            LOG.debug(f'Token verification failed: {e}')
+            return {'active': False}
+
+        # Refresh and ID tokens are signed with the same keys, only access tokens are accepted
+        if claims.get('typ', Constants.KEYCLOAK_ACCESS_TOKEN_TYPE) != Constants.KEYCLOAK_ACCESS_TOKEN_TYPE:
+            return {'active': False}
+
+        claims['active'] = True
+        return claims
+
+    @classmethod
+    def jwks_lock(cls) -> asyncio.Lock:
+        """Get the lock of the JWKS refresh for the running event loop, so concurrent requests fetch the keys once."""
+        loop = asyncio.get_running_loop()
+        if cls._jwks_lock is None or cls._jwks_lock_loop is not loop:
+            cls._jwks_lock = asyncio.Lock()
+            cls._jwks_lock_loop = loop
+        return cls._jwks_lock
+
+    @staticmethod
+    def cached_signing_key(kid: str) -> dict:
+        """Get the signing key from the cached JWKS if the keys are not due for a refresh.
+        :param kid: key id from the token header
+        :return: dict JWK or None
+        """
+        cls = KeycloakAuthService
+        if cls._jwks_fetched_at is None or \
+                time.monotonic() - cls._jwks_fetched_at > Constants.JWKS_REFRESH_INTERVAL_IN_SECS:
+            return None
+        return cls._jwks.get(kid)
+
+    async def signing_key(self, kid: str) -> dict:
+        """Get the realm signing key from the cached JWKS, the keys are fetched again after
+        JWKS_REFRESH_INTERVAL_IN_SECS or when the kid is unknown because of a key rotation.
+        :param kid: key id from the token header
+        :return: dict JWK or None
+        """
+        cls = KeycloakAuthService
+        async with cls.jwks_lock():
+            age = time.monotonic() - cls._jwks_fetched_at if cls._jwks_fetched_at is not None else None
+            if age is None or age > Constants.JWKS_REFRESH_INTERVAL_IN_SECS or \
+                    (kid not in cls._jwks and age > cls.JWKS_MIN_REFRESH_INTERVAL_IN_SECS):
+                try:
+                    certs = await self.aconnect.certs()
+                except Exception:
+                    # Keep verifying with the previous keys when Keycloak is not reachable
+                    if not cls._jwks:
+                        raise CCPKeycloakException()
+                    LOG.error('Unable to refresh the realm signing keys')
+                else:
+                    cls._jwks = {jwk.get('kid'): jwk for jwk in certs.get('keys', [])
+                                 if jwk.get('use', 'sig') == 'sig'}
+                    LOG.info(f'Fetched {len(cls._jwks)} realm signing keys')
+                cls._jwks_fetched_at = time.monotonic()
+            return cls._jwks.get(kid)
+
+    async def cached_introspect(self, token: str) -> dict:
+        """Introspect the token with Keycloak and cache the active result by token hash.
+        The cache TTL is TOKEN_INTROSPECTION_CACHE_TTL_IN_SECS but never beyond the token exp.
+        :param token: str
+        :return: dict Token information
+        """
+        cache_key = Constants.TOKEN_INTROSPECTION_CACHE_PREFIX + hashlib.sha256(token.encode()).hexdigest()
+        redis = None
+        try:
+            redis = await get_redis()
+            cached_response = await redis.get(cache_key)
+            if cached_response:
+                return json.loads(cached_response)
+        except Exception as e:
+            LOG.warn(f'Token cache is not available: {e}')
+
+        token_details = await self.introspect(token)
+
+        ttl = min(Constants.TOKEN_INTROSPECTION_CACHE_TTL_IN_SECS, int(token_details.get('exp', 0) - time.time()))
+        if redis is not None and token_details.get('active') and ttl > 0:
+            try:
+                await redis.set(cache_key, json.dumps(token_details), expire=ttl)
+            except Exception as e:
+                LOG.warn(f'Unable to cache the token: {e}')
+        return token_details
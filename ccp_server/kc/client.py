@@ -13,28 +13,32 @@ from ccp_server.util.logger import log
 
 
 class KeycloakClientService(KeycloakAdminClient):
+    # Internal id of the default client never changes, so it is looked up once per process
+    __client_uuid: str = None
 
     @log
-    def get_client_uuid(self) -> str:
+    async def get_client_uuid(self) -> str:
         """Get default client internal id
         :return: client uuid"""
 
-        return self.connect.get_client_id(client_id=Constants.KEYCLOAK_CLIENT_ID)
+        if not KeycloakClientService.__client_uuid:
+            KeycloakClientService.__client_uuid = await self.aconnect.get_client_id(Constants.KEYCLOAK_CLIENT_ID)
+        return KeycloakClientService.__client_uuid
 
     @log
-    def get_client_roles(self) -> List[Dict]:
+    async def get_client_roles(self) -> List[Dict]:
         """Get default client roles
         :return: client roles"""
 
-        return self.connect.get_client_roles(self.get_client_uuid())
+        return await self.aconnect.get_client_roles(await self.get_client_uuid())
 
     @log
-    def get_client_role(self, roles: List[str]) -> Dict:
+    async def get_client_role(self, roles: List[str]) -> Dict:
         """Get client role details
          :param roles: role name
          :return: role details"""
         s = set(roles)
-        client_roles = self.get_client_roles()
+        client_roles = await self.get_client_roles()
 
         target_role = [d for d in client_roles if d['name'] in s]
 
@@ -45,9 +49,11 @@ class KeycloakClientService(KeycloakAdminClient):
     @log
     def get_client_roles_name(self) -> List:
         """
-        Get default client roles name
+        Get default client roles name, it stays sync for the pydantic validators
         :return: client roles list
         """
-        roles_meta = self.get_client_roles()
+        if not KeycloakClientService.__client_uuid:
+            KeycloakClientService.__client_uuid = self.connect.get_client_id(client_id=Constants.KEYCLOAK_CLIENT_ID)
+        roles_meta = self.connect.get_client_roles(KeycloakClientService.__client_uuid)
         roles = [role["name"] for role in roles_meta]
         return roles
@@ -4,9 +4,14 @@
 # Proprietary and confidential                                                #
 # Written by Deepak Pant <deepak.pant@coredge.io>, Feb 2023                   #
 ###############################################################################
+import threading
+import time
+
 from keycloak.keycloak_admin import KeycloakAdmin
 from keycloak.keycloak_admin import KeycloakOpenID
 
+from ccp_server.config.redis import CacheVersion
+from ccp_server.kc.async_client import KeycloakAsyncClient
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPKeycloakException
 from ccp_server.util.logger import KGLogger
@@ -18,36 +23,88 @@ LOG = KGLogger(__name__)
 class KeycloakAdminClient:
     __client_secret_key = None
 
+    # Admin and OpenID sessions shared by all the Keycloak services of the process
+    _admin: KeycloakAdmin = None
+    _admin_token_expires_at: float = 0
+    _openid: KeycloakOpenID = None
+    _lock: threading.RLock = threading.RLock()
+
     def __init__(self):
         pass
 
     @property
     @log
     def connect(self) -> KeycloakAdmin:
-        try:
-            return KeycloakAdmin(
-                verify=False,
-                server_url=Constants.KEYCLOAK_URL,
-                client_id=Constants.KEYCLOAK_CLIENT_ID,
-                client_secret_key=self.client_secret_key,
-                user_realm_name=Constants.KEYCLOAK_REALM,
-            )
-        except Exception:
-            raise CCPKeycloakException()
+        """Get the shared admin session, its token is refreshed before it expires. A 401 on any call
+        refreshes the token and retries once, in case the token was revoked on the server.
+        :return: KeycloakAdmin"""
+        cls = KeycloakAdminClient
+        admin = cls._admin
+        if admin is not None and time.monotonic() < cls._admin_token_expires_at:
+            return admin
+
+        with cls._lock:
+            try:
+                if cls._admin is None:
+                    LOG.info('Creating the Keycloak admin session')
+                    cls._admin = KeycloakAdmin(
+                        verify=False,
+                        server_url=Constants.KEYCLOAK_URL,
+                        client_id=Constants.KEYCLOAK_CLIENT_ID,
+                        client_secret_key=self.client_secret_key,
+                        user_realm_name=Constants.KEYCLOAK_REALM,
+                        auto_refresh_token=['get', 'put', 'post', 'delete'],
+                    )
+                elif time.monotonic() >= cls._admin_token_expires_at:
+                    LOG.debug('Refreshing the Keycloak admin token')
+                    cls._admin.refresh_token()
+            except Exception:
+                cls._admin = None
+                raise CCPKeycloakException()
+
+            expires_in = (cls._admin.token or {}).get('expires_in', 0)
+            cls._admin_token_expires_at = time.monotonic() + expires_in - Constants.KEYCLOAK_TOKEN_REFRESH_MARGIN_IN_SECS
+            return cls._admin
+
+    @property
+    def aconnect(self) -> KeycloakAsyncClient:
+        """Get the async admin and OpenID client, it shares one connection pool per event loop.
+        :return: KeycloakAsyncClient"""
+        return KeycloakAsyncClient()
+
+    @staticmethod
+    async def membership_changed() -> None:
+        """Invalidate the cached results which depend on the Keycloak users, groups or roles."""
+        await CacheVersion.bump(Constants.CACHE_MEMBERSHIP_NAMESPACE)
 
     @property
     @log
-    def oid_connect(self):
-        try:
-            return KeycloakOpenID(
-                verify=False,
-                server_url=Constants.KEYCLOAK_URL,
-                client_id=Constants.KEYCLOAK_CLIENT_ID,
-                client_secret_key=self.client_secret_key,
-                realm_name=Constants.KEYCLOAK_REALM,
-            )
-        except Exception:
-            raise CCPKeycloakException()
+    def oid_connect(self) -> KeycloakOpenID:
+        cls = KeycloakAdminClient
+        if cls._openid is not None:
+            return cls._openid
+
+        with cls._lock:
+            if cls._openid is None:
+                try:
+                    cls._openid = KeycloakOpenID(
+                        verify=False,
+                        server_url=Constants.KEYCLOAK_URL,
+                        client_id=Constants.KEYCLOAK_CLIENT_ID,
+                        client_secret_key=self.client_secret_key,
+                        realm_name=Constants.KEYCLOAK_REALM,
+                    )
+                except Exception:
+                    raise CCPKeycloakException()
+            return cls._openid
+
+    @classmethod
+    def close(cls) -> None:
+        """Drop the shared sessions, the next access creates new ones."""
+        with cls._lock:
+            cls._admin = None
+            cls._admin_token_expires_at = 0
+            cls._openid = None
 
     @property
     @log
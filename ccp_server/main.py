@@ -26,15 +26,23 @@ from ccp_server.api.v1 import org_api_router
 from ccp_server.api.v1 import public_router
 from ccp_server.api.v1.auth import router as oidc_router
 from ccp_server.config import auth
+from ccp_server.db.indexes import MongoIndexes
+from ccp_server.kc.async_client import KeycloakAsyncClient
+from ccp_server.provider.executor import ProviderExecutor
+from ccp_server.provider.openstack.mapper.mapper import MapperClass
 from ccp_server.service.audit import AuditService
+from ccp_server.service.providers import Provider
 from ccp_server.util import ccp_context
-from ccp_server.util import logger
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPAuthException
 from ccp_server.util.exceptions import CCPBusinessException
 from ccp_server.util.exceptions import CCPCloudException
 from ccp_server.util.exceptions import CCPIAMException
 from ccp_server.util.logger import KGLogger
+from ccp_server.util.logger import LoggingSetup
+from ccp_server.util.logger import Spans
+from ccp_server.util.response import CCPJSONResponse
+from ccp_server.util.response import CCPRoute
 from ccp_server.util.utils import Utils
 
 LOG = KGLogger(name=__name__)
@@ -57,13 +65,25 @@ async def on_startup() -> None:
     # To disable urllib3 warnings
     os.environ["PYTHONWARNINGS"] = "ignore:Unverified HTTPS request"
     LOG.info("CCP API server startup")
-    global g_audit_service
-    g_audit_service = AuditService()
+    Provider.init()
+    if Constants.MONGO_CREATE_INDEXES:
+        try:
+            await MongoIndexes.apply(Provider.mongo.db)
+        except Exception as e:
+            LOG.error(f'Unable to create the Mongo indexes: {e}')
+    MapperClass.load_plans()
     await g_audit_service.create_audit_collection()
+    g_audit_service.start()
 
 
 async def on_shutdown() -> None:
     LOG.info("CCP API server stop")
+    await g_audit_service.stop()
+    ProviderExecutor.shutdown()
+    Provider.close()
+    MapperClass.shutdown_process_pool()
+    await KeycloakAsyncClient.close()
+    LoggingSetup.shutdown()
 
 
 headers = {
@@ -113,7 +133,9 @@ app = FastAPI(
     openapi_url=f'{BASE_PATH}/openapi.json',
     on_startup=[on_startup],
     on_shutdown=[on_shutdown],
+    default_response_class=CCPJSONResponse,
     debug=True)
+app.router.route_class = CCPRoute
 app.include_router(api_router, prefix=BASE_PATH,
                    dependencies=[Depends(auth.authenticate)])
 app.include_router(base_router, prefix=BASE_PATH,
@@ -158,9 +180,7 @@ async def request_middleware(request: Request, call_next):
     request_id = Utils.generate_unique_str()
     ccp_context.set_request_data(Constants.CCPHeader.AUDIT_ID, request_id)
 
-    log = logger.configure_logger()
-
-    log.debug(f"Entering into {request.method} {request.url}")
+    LOG.debug(f"Entering into {request.method} {request.url}")
     response = None
     status_code = None
     process_time = 0
@@ -171,7 +191,7 @@ async def request_middleware(request: Request, call_next):
         response.headers["X-Audit-ID"] = request_id
         status_code = response.status_code
     finally:
-        log.debug(f"Exiting from {request.method} {request.url}")
+        LOG.debug(f"Exiting from {request.method} {request.url}")
 
         # Set status code to 500 if no status code if found
         status_code = status_code if status_code else status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -183,6 +203,24 @@ async def request_middleware(request: Request, call_next):
     return response
 
 
+@app.get("/metrics/provider-executor", tags=['Actuator'], description="Queue depth of the cloud SDK executors")
+def get_provider_executor_metrics():
+    """Function to get the queue depth and call counters of the cloud SDK executors"""
+    return ProviderExecutor.metrics()
+
+
+@app.get("/metrics/audit", tags=['Actuator'], description="Queue depth and counters of the audit log writer")
+def get_audit_metrics():
+    """Function to get the queue depth and the written, dropped and failed counters of the audit logs"""
+    return g_audit_service.metrics()
+
+
+@app.get("/metrics/spans", tags=['Actuator'], description="Call counters and timings of the traced functions")
+def get_span_metrics():
+    """Function to get the call counters and wall times of the @log decorated functions"""
+    return Spans.metrics()
+
+
 @app.get("/info", tags=['Actuator'], description="CCP API info")
 def get_info():
     """Function to get info about the service"""
@@ -0,0 +1,98 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+from ccp_server.util import ccp_context
+from ccp_server.util.constants import Constants
+from ccp_server.util.logger import KGLogger
+
+LOG = KGLogger(__name__)
+
+
+class ProviderExecutor:
+    """Runs the blocking cloud SDK calls on a bounded thread pool per cloud, so the event loop is never blocked.
+
+    Usage:
+    cloud_res = await ProviderExecutor.run(lambda: self.conn.connect().list_volumes())
+    """
+
+    _executors: Dict[str, ThreadPoolExecutor] = {}
+    _metrics: Dict[str, Dict[str, int]] = {}
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    async def run(cls, func: Callable, *args, **kwargs) -> Any:
+        """Run the function on the thread pool of the cloud of the current request.
+        The request context is copied into the worker thread, so ccp_context works as in the request.
+        :param func: blocking function to call
+        :param args: positional arguments of the function
+        :param kwargs: keyword arguments of the function
+        :return: result of the function"""
+        pool = ccp_context.get_cloud() or Constants.PROVIDER_EXECUTOR_DEFAULT_POOL
+        call = functools.partial(cls._call, pool, ccp_context.get_request_data(), func, *args, **kwargs)
+
+        cls._update_metrics(pool, queued=1)
+        future = cls._get_executor(pool).submit(call)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # The call never started, so it has to be removed from the queue depth here
+            if future.cancelled():
+                cls._update_metrics(pool, queued=-1)
+            raise
+
+    @classmethod
+    def _call(cls, pool: str, request_data: Dict[str, Any], func: Callable, *args, **kwargs) -> Any:
+        cls._update_metrics(pool, queued=-1, running=1)
+        ccp_context.set_request_context(request_data)
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            cls._update_metrics(pool, failed=1)
+            raise
+        finally:
+            ccp_context.clear_context()
+            cls._update_metrics(pool, running=-1, completed=1)
+
+    @classmethod
+    def _get_executor(cls, pool: str) -> ThreadPoolExecutor:
+        with cls._lock:
+            if pool not in cls._executors:
+                LOG.info(f"Creating provider executor for {pool} with "
+                         f"{Constants.PROVIDER_EXECUTOR_WORKERS_PER_CLOUD} workers")
+                cls._executors[pool] = ThreadPoolExecutor(max_workers=Constants.PROVIDER_EXECUTOR_WORKERS_PER_CLOUD,
+                                                          thread_name_prefix=f'provider-{pool}')
+            return cls._executors[pool]
+
+    @classmethod
+    def _update_metrics(cls, pool: str, **deltas: int) -> None:
+        with cls._lock:
+            metrics = cls._metrics.setdefault(pool, {'queued': 0, 'running': 0, 'completed': 0, 'failed': 0})
+            for key, delta in deltas.items():
+                metrics[key] += delta
+
+    @classmethod
+    def metrics(cls) -> Dict[str, Dict[str, int]]:
+        """Get the queue depth and call counters of every cloud pool.
+        :return: Dict of pool name and its counters: queued, running, completed and failed"""
+        with cls._lock:
+            return {pool: dict(metrics) for pool, metrics in cls._metrics.items()}
+
+    @classmethod
+    def shutdown(cls, wait: bool = False) -> None:
+        """Shutdown all the thread pools, queued calls are cancelled.
+        :param wait: wait for the running calls to finish"""
+        with cls._lock:
+            executors = list(cls._executors.values())
+            cls._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=True)
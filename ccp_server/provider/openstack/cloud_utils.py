@@ -5,6 +5,7 @@
 # Written by Pankaj Khanwani <pankaj@coredge.io>, Feb 2023                    #
 ###############################################################################
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.util.logger import log
 
 
@@ -22,4 +23,4 @@ class CloudUtils(services.CloudUtils):
         List all availability zones of a cloud.
         Returns: List of availability zones
         """
-        return self.conn.connect().list_availability_zone_names()
+        return await ProviderExecutor.run(lambda: self.conn.connect().list_availability_zone_names())
@@ -8,6 +8,7 @@ from openstack.exceptions import BadRequestException
 
 from ccp_server.provider import models
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPOpenStackException
@@ -24,8 +25,8 @@ class Cluster(services.Cluster):
     @log
     async def create_cluster(self, project_id: str, cluster: models.Cluster):
         try:
-            cloud_response = self.conn.connect().create_coe_cluster(
-                **cluster.dict(exclude_unset=True))
+            cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().create_coe_cluster(
+                **cluster.dict(exclude_unset=True)))
             return await mapper(data=cloud_response, resource_name=self.collection)
         except BadRequestException as e:
             raise CCPOpenStackException(Message.OPENSTACK_CREATE_ERR_MSG.format(
@@ -33,13 +34,13 @@ class Cluster(services.Cluster):
 
     @log
     async def list_all_clusters(self):
-        cloud_response = self.conn.connect().list_coe_clusters()
+        cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().list_coe_clusters())
         return await mapper(data=cloud_response, resource_name=self.collection)
 
     @log
     async def delete_cluster(self, cluster_id: str):
         try:
-            if not self.conn.connect().delete_coe_cluster(cluster_id):
+            if not await ProviderExecutor.run(lambda: self.conn.connect().delete_coe_cluster(cluster_id)):
                 raise CCPOpenStackException("Failed To Delete Cluster")
         except Exception as e:
             raise CCPOpenStackException(f' {e.details or e.message}',
@@ -8,6 +8,7 @@ from openstack.exceptions import BadRequestException
 
 from ccp_server.provider import models
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPOpenStackException
@@ -24,7 +25,7 @@ class ClusterTemplate(services.ClusterTemplate):
     @log
     async def create_cluster_template(self, project_id: str, cluster_template: models.ClusterTemplate):
         try:
-            cloud_response = self.conn.connect().create_cluster_template(
+            cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().create_cluster_template(
                 name=cluster_template.name,
                 image_id=cluster_template.image_id,
                 keypair_id=cluster_template.keypair_id,
@@ -49,7 +50,7 @@ class ClusterTemplate(services.ClusterTemplate):
                 master_lb_enabled=cluster_template.master_lb_enabled,
                 floating_ip_enabled=cluster_template.floating_ip_enabled,
                 labels=cluster_template.labels
-            )
+            ))
             return await mapper(data=cloud_response, resource_name=self.collection)
         except BadRequestException as e:
             raise CCPOpenStackException(Message.OPENSTACK_CREATE_ERR_MSG.format(
@@ -57,13 +58,13 @@ class ClusterTemplate(services.ClusterTemplate):
 
     @log
     async def list_all_cluster_templates(self):
-        cloud_response = self.conn.connect().list_cluster_templates()
+        cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().list_cluster_templates())
         return await mapper(data=cloud_response, resource_name=self.collection)
 
     @log
     async def delete_cluster_template(self, cluster_template_id: str):
         try:
-            if not self.conn.connect().delete_cluster_template(cluster_template_id):
+            if not await ProviderExecutor.run(lambda: self.conn.connect().delete_cluster_template(cluster_template_id)):
                 raise CCPOpenStackException(
                     "Failed To Delete Cluster Template")
         except Exception as e:
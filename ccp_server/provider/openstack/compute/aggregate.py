@@ -5,6 +5,7 @@
 # Written by Bhaskar Tank <bhaskar@coredge.io>, Feb 2023                      #
 ###############################################################################
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.util.logger import log
 
 
@@ -18,7 +19,7 @@ class Aggregate(services.Aggregate):
         """This method is used to fetch the list all aggregates
         :return: list of aggregates
         """
-        return self.conn.connect().list_aggregates()
+        return await ProviderExecutor.run(lambda: self.conn.connect().list_aggregates())
 
     @log
     async def get_aggregate(self, name_or_id):
@@ -28,4 +29,4 @@ class Aggregate(services.Aggregate):
         :param filters: filters
         :return: aggregate data
         """
-        return self.conn.connect().get_aggregate(name_or_id)
+        return await ProviderExecutor.run(lambda: self.conn.connect().get_aggregate(name_or_id))
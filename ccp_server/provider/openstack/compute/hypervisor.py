@@ -5,6 +5,7 @@
 # Written by Bhaskar Tank <bhaskar@coredge.io>, Feb 2023                      #
 ###############################################################################
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.util.logger import log
 
 
@@ -18,4 +19,4 @@ class Hypervisor(services.Hypervisor):
         """This method is used to fetch the list all hypervisors
                 :return: list of hypervisors
         """
-        return self.conn.connect().list_hypervisors()
+        return await ProviderExecutor.run(lambda: self.conn.connect().list_hypervisors())
@@ -8,6 +8,7 @@ from openstack.exceptions import BadRequestException
 
 from ccp_server.provider import models
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.util.constants import Constants
 from ccp_server.util.enums import InstanceActionEnum
@@ -36,10 +37,9 @@ class Instance:
         returns: The created compute ``Server`` object
         """
         try:
-            cloud_response = self.conn.connect().create_server(**instance.dict(exclude_unset=True, exclude_none=True,
-                                                                               exclude={'instance_username',
-                                                                                        'instance_password', 'tags'}),
-                                                               wait=True)
+            server = instance.dict(exclude_unset=True, exclude_none=True,
+                                   exclude={'instance_username', 'instance_password', 'tags'})
+            cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().create_server(**server, wait=True))
             resp = await mapper(data=cloud_response, resource_name=Constants.MongoCollection.INSTANCE)
             resp.security_groups = resp.cloud_meta['security_groups']
             return resp
@@ -53,7 +53,18 @@ class Instance:
         List all instances
         :return: List of all instances
         """
-        cloud_response = self.conn.connect().list_servers()
+        cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().list_servers())
+        return await mapper(data=cloud_response, resource_name=Constants.MongoCollection.INSTANCE)
+
+    @log
+    async def list_project_instances(self, project_id: str):
+        """
+        List the instances of a project with one call, without the extra calls for their addresses
+        :param project_id: id of the project in the cloud
+        :return: List of instances
+        """
+        cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().list_servers(
+            all_projects=True, bare=True, filters={'project_id': project_id}))
         return await mapper(data=cloud_response, resource_name=Constants.MongoCollection.INSTANCE)
 
     @log
@@ -64,7 +75,7 @@ class Instance:
         :return: None
         """
         try:
-            if not self.conn.connect().delete_server(name_or_id=instance_id):
+            if not await ProviderExecutor.run(lambda: self.conn.connect().delete_server(name_or_id=instance_id)):
                 raise CCPOpenStackException(f'Failed to delete instance ')
         except Exception as e:
             raise CCPOpenStackException(f' {e.message or e}',
@@ -79,24 +90,23 @@ class Instance:
         :return: None
         """
         if action == InstanceActionEnum.STOP:
-            return self.conn.connect().compute.stop_server(server=instance_id)
+            return await ProviderExecutor.run(lambda: self.conn.connect().compute.stop_server(server=instance_id))
         elif action == InstanceActionEnum.START:
-            return self.conn.connect().compute.start_server(server=instance_id)
+            return await ProviderExecutor.run(lambda: self.conn.connect().compute.start_server(server=instance_id))
         elif action == InstanceActionEnum.REBOOT:
-            return self.conn.connect().compute.reboot_server(server=instance_id,
-                                                             reboot_type=action_schema.__dict__[action].reboot)
+            return await ProviderExecutor.run(lambda: self.conn.connect().compute.reboot_server(
+                server=instance_id, reboot_type=action_schema.__dict__[action].reboot))
         elif action == InstanceActionEnum.REBUILD:
-            return self.conn.connect().compute.rebuild_server(server=instance_id,
-                                                              **action_schema.__dict__[action].dict(exclude_unset=True,
-                                                                                                    exclude_none=True))
+            return await ProviderExecutor.run(lambda: self.conn.connect().compute.rebuild_server(
+                server=instance_id, **action_schema.__dict__[action].dict(exclude_unset=True, exclude_none=True)))
         elif action == InstanceActionEnum.RESIZE:
-            return self.conn.connect().compute.resize_server(server=instance_id,
-                                                             flavor=action_schema.__dict__[action].flavorRef)
+            return await ProviderExecutor.run(lambda: self.conn.connect().compute.resize_server(
+                server=instance_id, flavor=action_schema.__dict__[action].flavorRef))
         elif action == InstanceActionEnum.RESUME:
-            return self.conn.connect().compute.resume_server(server=instance_id)
+            return await ProviderExecutor.run(lambda: self.conn.connect().compute.resume_server(server=instance_id))
         elif action == InstanceActionEnum.PAUSE:
-            return self.conn.connect().compute.pause_server(server=instance_id)
+            return await ProviderExecutor.run(lambda: self.conn.connect().compute.pause_server(server=instance_id))
         elif action == InstanceActionEnum.UNPAUSE:
-            return self.conn.connect().compute.unpause_server(server=instance_id)
+            return await ProviderExecutor.run(lambda: self.conn.connect().compute.unpause_server(server=instance_id))
         else:
             raise NotImplementedError
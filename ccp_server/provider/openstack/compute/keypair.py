@@ -7,6 +7,7 @@
 from openstack.exceptions import BadRequestException
 
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPOpenStackException
@@ -31,8 +32,8 @@ class KeyPair:
         :param request: Public key of the keypair
         """
         try:
-            cloud_res = self.conn.connect().create_keypair(
-                name=name, public_key=request.public_key)
+            cloud_res = await ProviderExecutor.run(lambda: self.conn.connect().create_keypair(
+                name=name, public_key=request.public_key))
             return await mapper(data=cloud_res, resource_name=self.collection)
         except BadRequestException as e:
             raise CCPOpenStackException(Message.OPENSTACK_CREATE_ERR_MSG.format(
@@ -45,7 +46,7 @@ class KeyPair:
         :param name: Name of the keypair
         :returns: True if delete succeeded, False otherwise.
         """
-        return self.conn.connect().delete_keypair(name=name)
+        return await ProviderExecutor.run(lambda: self.conn.connect().delete_keypair(name=name))
 
     @log
     async def list_keypairs(self, filters=None) -> list:
@@ -53,7 +54,7 @@ class KeyPair:
         List all keypairs
         :returns: List of keypairs
         """
-        cloud_res = self.conn.connect().list_keypairs(filters=filters)
+        cloud_res = await ProviderExecutor.run(lambda: self.conn.connect().list_keypairs(filters=filters))
         return await mapper(data=cloud_res, resource_name=self.collection)
 
     @log
@@ -4,8 +4,12 @@
 # Proprietary and confidential                                                #
 # Written by Deepak Pant <deepak.pant@coredge.io>, Feb 2023                   #
 ###############################################################################
+import threading
+from collections import OrderedDict
 from typing import Any
 from typing import Dict
+from typing import Optional
+from typing import Tuple
 
 import boto.s3.connection
 import httplib2
@@ -22,68 +26,154 @@ from ccp_server.util import ccp_context
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPCephException
 from ccp_server.util.exceptions import CCPOpenStackException
+from ccp_server.util.logger import KGLogger
 from ccp_server.util.logger import log
 from ccp_server.util.messages import Message
 from ccp_server.util.utils import Utils
 
+LOG = KGLogger(__name__)
+
 
 class OpenstackConnection(services.Connection):
     # Admin roles
     ADMIN_ROLES = [Constants.CCPRole.SUPER_ADMIN, Constants.CCPRole.ORG_ADMIN, Constants.CCPRole.PROJECT_ADMIN,
                    Constants.CCPRole.MEMBER]
-    os_connections: Dict[StrictStr, _Connection] = {}
+    ADMIN_SCOPE = 'admin'
+    MEMBER_SCOPE = 'member'
+
+    # Authenticated connections keyed by (cloud, role scope, project, user), least recently used first
+    os_connections: OrderedDict[Tuple, _Connection] = OrderedDict()
+    _lock: threading.Lock = threading.Lock()
 
     @log
-    def connect(self):
+    def connect(self) -> _Connection:
+        """Get an authenticated openstack connection for the current request.
+        Connections are cached per (cloud, role scope, project) and reused until their token is about to expire,
+        so Keystone is only hit when a new scope is seen or a token needs to be refreshed.
+        :return: openstack Connection object"""
         try:
             cloud_name = ccp_context.get_cloud()
             cloud: Dict[StrictStr, Any] = Utils.load_cloud_details(cloud_name)
-            if any(role.lower() in ccp_context.get_logged_in_user_roles() for role in OpenstackConnection.ADMIN_ROLES):
-                """get openstack Connection object"""
-                os_connection: _Connection = openstack.connect(
-                    auth_url=cloud['auth']['auth_url'],
-                    username=cloud['auth']['username'],
-                    password=cloud['auth']['password'],
-                    project_name=cloud['auth']['project_name'],
-                    project_domain_id=cloud['auth']['project_domain_id'],
-                    user_domain_id=cloud['auth']['user_domain_id'],
-                    region_name=cloud['region_name'],
-                    identity_api_version=cloud.get(
-                        'identity_api_version', '3'),
-                    interface=cloud.get('interface', 'public')
-                )
-
-                return os_connection
-            else:
-                http = httplib2.Http(disable_ssl_certificate_validation=True)
-                auth_url = cloud.get('auth_url')
-                token = ccp_context.get_logged_in_token()
-                project = ccp_context.get_cloud_project_id()
-                endpoint = auth_url + Constants.OPENSTACK_OPENID_AUTH_URL
-
-                headers, _ = http.request(endpoint, "GET", headers={
-                    "Authorization": "Bearer " + token})
-                un_scoped_subject_token = headers.get('x-subject-token')
-
-                auth = v3.Token(auth_url=auth_url, token=un_scoped_subject_token, project_name=project,
-                                project_domain_name=cloud.get(
-                                    'project_domain_id'),
-                                reauthenticate=False)
-
-                sess = Session(auth=auth)
-                os_connection = connection.Connection(
-                    session=sess,
-                    user_domain_name=cloud.get('user_domain_id'),
-                    region_name=cloud.get('region_name'),
-                    compute_api_version='2',
-                    identity_interface='internal'
-                )
-                # TODO: Need to configure connection for all user.
-            return os_connection.list_images()
+            key = self._connection_key(cloud_name)
+
+            os_connection = self._get_cached_connection(key)
+            if os_connection is None:
+                if key[1] == OpenstackConnection.ADMIN_SCOPE:
+                    os_connection = self._admin_connection(cloud)
+                else:
+                    os_connection = self._user_connection(cloud)
+                self._cache_connection(key, os_connection)
+            return os_connection
         except Exception:
             raise CCPOpenStackException(
                 message=Message.OPENSTACK_CONNECTION_ERR_MSG.format(ccp_context.get_cloud()))
 
+    @staticmethod
+    def _connection_key(cloud_name: str) -> Tuple:
+        """Build the cache key of the connection for the current request.
+        Admin connections use the service credentials of the cloud, so they are shared by every user of the cloud.
+        Other connections are scoped with the token of the logged-in user, so the user is part of the key.
+        :param cloud_name: name of the cloud
+        :return: tuple of (cloud, role scope, project, user)"""
+        roles = ccp_context.get_logged_in_user_roles() or []
+        if any(role.lower() in roles for role in OpenstackConnection.ADMIN_ROLES):
+            return cloud_name, OpenstackConnection.ADMIN_SCOPE, None, None
+        return (cloud_name, OpenstackConnection.MEMBER_SCOPE, ccp_context.get_cloud_project_id(),
+                ccp_context.get_logged_in_user())
+
+    @staticmethod
+    def _admin_connection(cloud: Dict[StrictStr, Any]) -> _Connection:
+        """get openstack Connection object with the admin credentials of the cloud"""
+        return openstack.connect(
+            auth_url=cloud['auth']['auth_url'],
+            username=cloud['auth']['username'],
+            password=cloud['auth']['password'],
+            project_name=cloud['auth']['project_name'],
+            project_domain_id=cloud['auth']['project_domain_id'],
+            user_domain_id=cloud['auth']['user_domain_id'],
+            region_name=cloud['region_name'],
+            identity_api_version=cloud.get(
+                'identity_api_version', '3'),
+            interface=cloud.get('interface', 'public')
+        )
+
+    @staticmethod
+    def _user_connection(cloud: Dict[StrictStr, Any]) -> _Connection:
+        """get openstack Connection object scoped to the project of the logged-in user"""
+        http = httplib2.Http(disable_ssl_certificate_validation=True)
+        auth_url = cloud.get('auth_url')
+        token = ccp_context.get_logged_in_token()
+        project = ccp_context.get_cloud_project_id()
+        endpoint = auth_url + Constants.OPENSTACK_OPENID_AUTH_URL
+
+        headers, _ = http.request(endpoint, "GET", headers={
+            "Authorization": "Bearer " + token})
+        un_scoped_subject_token = headers.get('x-subject-token')
+
+        auth = v3.Token(auth_url=auth_url, token=un_scoped_subject_token, project_name=project,
+                        project_domain_name=cloud.get(
+                            'project_domain_id'),
+                        reauthenticate=False)
+
+        sess = Session(auth=auth)
+        return connection.Connection(
+            session=sess,
+            user_domain_name=cloud.get('user_domain_id'),
+            region_name=cloud.get('region_name'),
+            compute_api_version='2',
+            identity_interface='internal'
+        )
+
+    @staticmethod
+    def _is_expired(os_connection: _Connection) -> bool:
+        """Check if the token of the connection is expired or will expire within the configured margin.
+        A connection which has not authenticated yet is not considered as expired.
+        :param os_connection: openstack Connection object
+        :return: True if the connection needs to be re-created"""
+        try:
+            auth_ref = os_connection.session.auth.auth_ref
+        except AttributeError:
+            return False
+        if auth_ref is None:
+            return False
+        return auth_ref.will_expire_soon(stale_duration=Constants.OPENSTACK_TOKEN_EXPIRY_MARGIN_IN_SECS)
+
+    @classmethod
+    def _get_cached_connection(cls, key: Tuple) -> Optional[_Connection]:
+        """Get the cached connection for the key, expired connections are evicted.
+        :param key: connection key
+        :return: openstack Connection object or None"""
+        with cls._lock:
+            os_connection = cls.os_connections.get(key)
+            if os_connection is None:
+                return None
+            if cls._is_expired(os_connection):
+                LOG.debug(f"OpenStack token expired for {key[:2]}, reconnecting")
+                del cls.os_connections[key]
+                return None
+            cls.os_connections.move_to_end(key)
+            return os_connection
+
+    @classmethod
+    def _cache_connection(cls, key: Tuple, os_connection: _Connection) -> None:
+        """Cache the connection and evict the least recently used ones above the configured size.
+        :param key: connection key
+        :param os_connection: openstack Connection object"""
+        with cls._lock:
+            cls.os_connections[key] = os_connection
+            cls.os_connections.move_to_end(key)
+            while len(cls.os_connections) > Constants.OPENSTACK_CONNECTION_CACHE_SIZE:
+                cls.os_connections.popitem(last=False)
+
+    @classmethod
+    def clear_connections(cls, cloud_name: str = None) -> None:
+        """Drop the cached connections of a cloud, or of all the clouds if no cloud is provided.
+        :param cloud_name: name of the cloud"""
+        with cls._lock:
+            for key in list(cls.os_connections):
+                if cloud_name is None or key[0] == cloud_name:
+                    del cls.os_connections[key]
+
     @log
     def botoclient(self):
         """This method is used to get botoclient object for perfrom bucket operation in  storage
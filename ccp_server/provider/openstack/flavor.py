@@ -9,6 +9,7 @@ from openstack.exceptions import BadRequestException
 
 from ccp_server.provider import models
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPOpenStackException
@@ -25,7 +26,7 @@ class Flavor(services.Flavor):
     @log
     async def create_flavor(self, flavor: models.Flavor) -> models.Flavor:
         try:
-            cloud_res = self.conn.connect().create_flavor(**flavor.__dict__)
+            cloud_res = await ProviderExecutor.run(lambda: self.conn.connect().create_flavor(**flavor.__dict__))
             return await mapper(data=cloud_res, resource_name=self.collection)
         except BadRequestException as e:
             raise CCPOpenStackException(Message.OPENSTACK_CREATE_ERR_MSG.format(
@@ -33,10 +34,10 @@ class Flavor(services.Flavor):
 
     @log
     async def delete_flavor(self, name_or_id):
-        return self.conn.connect().delete_flavor(
+        return await ProviderExecutor.run(lambda: self.conn.connect().delete_flavor(
             name_or_id=name_or_id
-        )
+        ))
 
     async def list_flavors(self):
-        flavors = self.conn.connect().list_flavors()
+        flavors = await ProviderExecutor.run(lambda: self.conn.connect().list_flavors())
         return await mapper(data=flavors, resource_name=self.collection)
@@ -6,6 +6,7 @@
 # Modified by Pankaj Khanwani <pankaj@coredge.io>, Feb 2023                   #
 ###############################################################################
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.util.constants import Constants
 from ccp_server.util.logger import log
@@ -23,5 +24,5 @@ class Image(services.Image):
         List all images.
         Converting them to the mongo schema which will same for all the clouds
         """
-        images = self.conn.connect().list_images()
+        images = await ProviderExecutor.run(lambda: self.conn.connect().list_images())
         return await mapper(data=images, resource_name=self.collection)
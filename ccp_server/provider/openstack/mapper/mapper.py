@@ -4,17 +4,29 @@
 # Proprietary and confidential                                                #
 # Written by Pankaj Khanwani <pankaj@coredge.io>, Feb 2023                    #
 ###############################################################################
+import asyncio
+import threading
 import traceback
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import AsyncIterator
+from typing import Dict
+from typing import List
+from typing import Tuple
 
 import yaml
 
 from ccp_server.provider.openstack.mapper.schemas import Schemas
 from ccp_server.util import ccp_context
+from ccp_server.util.constants import Constants
 from ccp_server.util.logger import KGLogger
 from ccp_server.util.logger import log
 from ccp_server.util.utils import Utils
 LOG = KGLogger(__name__)
 
+# Marks a path which is not a leaf of the cloud object
+_MISSING = object()
+
 
 @log
 def populate_cloud_type(cloud_type: str = None, cloud: str = None):
@@ -57,6 +69,125 @@ async def mapper(resource_name: str, data, cloud: str = None, cloud_type: str =
             f"Unable to create Mapper for {resource_name} due to {e}")
 
 
+async def mapper_stream(resource_name: str, data: List, cloud: str = None,
+                        cloud_type: str = None) -> AsyncIterator[List]:
+    """
+    This function is used to map a big list of cloud objects chunk by chunk, the chunks are yielded in order.
+    Lists bigger than MAPPER_PARALLEL_THRESHOLD are translated on the mapper process pool.
+    :param resource_name: name of the resource
+    :param data: list of the cloud objects
+    :param cloud: cloud name
+    :param cloud_type: cloud type
+    :return: async iterator of the translated chunks
+    """
+    if not cloud or not cloud_type:
+        cloud, cloud_type = populate_cloud_type(cloud=cloud)
+    mapobj = MapperClass(data, resource_name, cloud, cloud_type)
+    async for chunk in mapobj.translate_chunks(data):
+        yield chunk
+
+
+def translate_chunk(cloud_type: str, resource_name: str, cloud: str, items: List) -> List:
+    """
+    Translate a chunk of cloud objects, runs in the worker processes of the mapper process pool
+    :param cloud_type: cloud type
+    :param resource_name: name of the resource
+    :param cloud: cloud name
+    :param items: plain dict cloud objects
+    :return: list of the Schema objects
+    """
+    plan = MapperClass(items, resource_name, cloud, cloud_type).fetch_plan()
+    return [plan.translate(item, cloud) for item in items]
+
+
+class MapperPlan:
+    """
+    Extraction plan of a resource, compiled once from the mapper yaml.
+    Every schema field has a precomputed dotted path into the cloud object, the values are resolved
+    the way the flattened cloud object resolved them: only scalars and lists of strings are leaves.
+    """
+    __slots__ = ('resource_name', 'schema', 'paths', 'passthrough')
+
+    # Paths filled by the mapper itself and not read from the cloud object
+    CLOUD_META = 'cloud_meta'
+    CLOUD = 'cloud'
+
+    def __init__(self, resource_name: str, schema, resource_map: Dict[str, str]):
+        self.resource_name = resource_name
+        self.schema = schema
+        self.paths: List[Tuple[str, str, Tuple[str, ...]]] = [(key, path, tuple(path.split('.')))
+                                                              for key, path in resource_map.items()]
+        # Schema fields which are not in the map are still picked from the same top level key of the cloud object
+        self.passthrough: Tuple[str, ...] = tuple(field for field in schema.__fields__
+                                                  if field not in resource_map
+                                                  and field not in (MapperPlan.CLOUD, MapperPlan.CLOUD_META))
+
+    def translate(self, obj, cloud: str):
+        source = dict(obj)
+        converted_obj = {MapperPlan.CLOUD: cloud}
+        for field in self.passthrough:
+            value = MapperPlan.resolve(source, (field,))
+            if value is not _MISSING:
+                converted_obj[field] = value
+        for key, path, segments in self.paths:
+            if path == MapperPlan.CLOUD_META:
+                converted_obj[key] = source
+                continue
+            value = MapperPlan.resolve(source, segments)
+            if value is _MISSING:
+                value = cloud if path == MapperPlan.CLOUD else None
+            converted_obj[key] = value
+        return self.schema(**converted_obj)
+
+    @staticmethod
+    def resolve(source: dict, segments: Tuple[str, ...]):
+        """
+        Resolve the dotted path in the cloud object
+        :param source: cloud object
+        :param segments: keys of the dotted path, list items are addressed by index
+        :return: value of the path, _MISSING if the path is not a leaf of the cloud object
+        """
+        value = source
+        in_list = False
+        for segment in segments:
+            if isinstance(value, dict):
+                try:
+                    value = value[segment]
+                except KeyError:
+                    return _MISSING
+                in_list = False
+            elif isinstance(value, list) and not in_list and not MapperPlan.is_str_list(value):
+                try:
+                    value = value[int(segment)]
+                except (ValueError, IndexError):
+                    return _MISSING
+                in_list = True
+            else:
+                return _MISSING
+        if isinstance(value, dict):
+            return _MISSING
+        if isinstance(value, list) and not in_list and not MapperPlan.is_str_list(value):
+            return _MISSING
+        return value
+
+    @staticmethod
+    def is_str_list(value: list) -> bool:
+        return all(isinstance(item, str) for item in value)
+
+    @staticmethod
+    def to_plain(value):
+        """
+        Convert the cloud SDK objects to plain dicts and lists, so they can be sent to the worker processes
+        :param value: cloud object
+        :return: plain copy of the cloud object
+        """
+        if isinstance(value, dict) or (not isinstance(value, (str, list, tuple)) and hasattr(value, 'keys')):
+            return {key: MapperPlan.to_plain(item) for key, item in dict(value).items()}
+        if isinstance(value, list):
+            return [MapperPlan.to_plain(item) for item in value]
+        return value
+
+
 class MapperClass:
     """
     This class is used to map the data to the mongo schema
@@ -65,6 +196,13 @@ class MapperClass:
     image = None
     network = None
 
+    # Compiled plans of the mapper yaml, key is (cloud_type, resource_name)
+    plans: Dict[Tuple[str, str], MapperPlan] = None
+    _lock: threading.Lock = threading.Lock()
+
+    # Process pool of the bulk translation, created on the first big list
+    process_pool: ProcessPoolExecutor = None
+
     @log
     def __init__(self, data, resource_name: str, cloud: str = None, cloud_type: str = None):
         self.resource_name = resource_name
@@ -72,6 +210,42 @@ class MapperClass:
         self.cloud_type = cloud_type
         self.data = data
 
+    @classmethod
+    def load_plans(cls) -> Dict[Tuple[str, str], MapperPlan]:
+        """
+        Read the mapper yaml once and compile the extraction plan of every resource which has a Schema
+        :return: compiled plans
+        """
+        if cls.plans is not None:
+            return cls.plans
+        with cls._lock:
+            if cls.plans is None:
+                with open(Utils.get_mapper_yaml_path(), "r") as f:
+                    resource_map = yaml.safe_load(f)
+                plans = {}
+                for cloud_type, resources in resource_map.items():
+                    for resource_name, mapping in resources.items():
+                        schema = getattr(Schemas, resource_name.title(), None)
+                        if schema is not None:
+                            plans[(cloud_type, resource_name)] = MapperPlan(resource_name, schema, mapping)
+                LOG.info(f"Compiled {len(plans)} mapper plans")
+                cls.plans = plans
+        return cls.plans
+
+    def fetch_plan(self) -> MapperPlan:
+        """
+        Fetch the compiled plan of the resource
+        :return plan of the cloud_type and resource_name:
+        """
+        plan = MapperClass.load_plans().get((self.cloud_type, self.resource_name.lower()))
+        if plan:
+            return plan
+        error_message = f"Unable to find {self.resource_name} in {self.cloud_type}"
+        LOG.error(error_message)
+        raise Exception(
+            f"{self.cloud_type} Mapper does not have {self.resource_name} variable or "
+            f"Schema: {self.resource_name.title()}: {error_message}")
+
     @log
     async def create(self, data):
         if isinstance(data, list):
@@ -80,28 +254,73 @@ class MapperClass:
             self.data = await self.translate(data)
         return self.data
 
+    @classmethod
+    def get_process_pool(cls) -> ProcessPoolExecutor:
+        with cls._lock:
+            if cls.process_pool is None:
+                LOG.info(f"Creating mapper process pool with {Constants.MAPPER_PROCESS_POOL_WORKERS} workers")
+                # The workers are not forked from this process, which has threads and open connections
+                cls.process_pool = ProcessPoolExecutor(max_workers=Constants.MAPPER_PROCESS_POOL_WORKERS,
+                                                       mp_context=get_context('forkserver'),
+                                                       initializer=MapperClass.load_plans)
+            return cls.process_pool
+
+    @classmethod
+    def shutdown_process_pool(cls) -> None:
+        """Shutdown the mapper process pool, used at the shutdown of the process."""
+        with cls._lock:
+            pool, cls.process_pool = cls.process_pool, None
+        if pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+
     @log
     async def handle_list(self, data):
-        obj_list = []
-        for item in data:
-            obj_list.append(await self.translate(item))
-        return obj_list
+        if len(data) > Constants.MAPPER_PARALLEL_THRESHOLD:
+            obj_list = []
+            async for chunk in self.translate_chunks(data):
+                obj_list.extend(chunk)
+            return obj_list
+
+        plan = self.fetch_plan()
+        cloud = self.cloud
+        try:
+            return [plan.translate(item, cloud) for item in data]
+        except Exception as e:
+            raise Exception(
+                f"Unable to translate {self.resource_name} due to {e}")
 
-    async def fetch_resource_map_yaml(self):
+    async def translate_chunks(self, data: List) -> AsyncIterator[List]:
         """
-        Fetch the resource map from yaml
-        :return cloud_map in dictionary format:
+        Translate the list in chunks of MAPPER_CHUNK_SIZE, on the process pool if the list is bigger than
+        MAPPER_PARALLEL_THRESHOLD. All the chunks are submitted at once and yielded in order.
+        :param data: list of the cloud objects
+        :return: async iterator of the translated chunks
         """
-        with open(Utils.get_mapper_yaml_path(), "r") as f:
-            resource_map = yaml.safe_load(f)
+        plan = self.fetch_plan()
+        size = Constants.MAPPER_CHUNK_SIZE
+        chunks = (data[i:i + size] for i in range(0, len(data), size))
+        try:
+            if len(data) <= Constants.MAPPER_PARALLEL_THRESHOLD:
+                for chunk in chunks:
+                    yield [plan.translate(item, self.cloud) for item in chunk]
+                    # Let the other requests run between the chunks
+                    await asyncio.sleep(0)
+                return
 
-        if self.cloud_type in resource_map and self.resource_name.lower() in resource_map[self.cloud_type]:
-            return resource_map[self.cloud_type][self.resource_name.lower()]
-        else:
-            error_message = f"Unable to find {self.resource_name} in {self.cloud_type}"
-            LOG.error(error_message)
+            loop = asyncio.get_running_loop()
+            pool = MapperClass.get_process_pool()
+            futures = [loop.run_in_executor(pool, translate_chunk, self.cloud_type, self.resource_name.lower(),
+                                            self.cloud, [MapperPlan.to_plain(item) for item in chunk])
+                       for chunk in chunks]
+            try:
+                for future in futures:
+                    yield await future
+            finally:
+                for future in futures:
+                    future.cancel()
+        except Exception as e:
             raise Exception(
-                f"{self.cloud_type} Mapper does not have {self.resource_name} variable: {error_message}")
+                f"Unable to translate {self.resource_name} due to {e}")
 
     @log
     async def fetch_resource_map_from_dictmap(self):
@@ -112,79 +331,9 @@ class MapperClass:
         raise Exception(
             f"{self.cloud_type} Mapper does not have {self.resource_name} variable")
 
-    @log
-    async def flatten_dict(self, obj, parent_key='', sep='.'):
-        try:
-            items = []
-
-            # Check if obj is a dict, otherwise convert it to one
-            try:
-                obj_items = obj.items()
-            except AttributeError:
-                obj = dict(obj)
-                obj_items = obj.items()
-
-            for k, v in obj_items:
-                new_key = f"{parent_key}{sep}{k}" if parent_key else k
-
-                # Recursively flatten nested dictionaries
-                if isinstance(v, dict):
-                    new_dict = await self.flatten_dict(v, new_key, sep=sep)
-                    items.extend(new_dict.items())
-
-                # If value is a list of strings, append to items list
-                elif isinstance(v, list) and all(isinstance(item, str) for item in v):
-                    items.append((new_key, v))
-
-                # Recursively flatten nested dictionaries within a list
-                elif isinstance(v, list):
-                    for i, item in enumerate(v):
-                        if isinstance(item, dict):
-                            new_sub_key = f"{new_key}{sep}{i}"
-                            new_dict = await self.flatten_dict(item, new_sub_key, sep=sep)
-                            items.extend(new_dict.items())
-                        else:
-                            items.append((f"{new_key}{sep}{i}", item))
-
-                # If value is not a list or a dictionary, append to items list
-                else:
-                    items.append((new_key, v))
-
-            # Convert items list to dictionary and return
-            return dict(items)
-
-        # If an exception is raised, log an error message
-        except Exception as e:
-            LOG.error(f"Unable to flatten {obj} due to {e}")
-
-    @log
     async def translate(self, obj: dict):
         try:
-            # Choosing which map to use according to the cloud_type and resource_name
-            mapper = await self.fetch_resource_map_yaml()
-
-            # Flattening the data from the cloud
-            converted_obj = await self.flatten_dict(obj)
-
-            if type(obj) != type(dict):
-                obj = dict(obj)
-            converted_obj['cloud_meta'] = obj
-            converted_obj['cloud'] = self.cloud
-
-            # Convert the OpenStack data to the Pydantic model data
-            for key in mapper.keys():
-                converted_obj[key] = converted_obj.get(mapper[key])
-
-            # Checking if the resource_name has the Schema or not
-            if hasattr(Schemas, self.resource_name.title()):
-                # Returning the converted obj to the Schema according to the resource_name
-                return getattr(Schemas, self.resource_name.title())(**converted_obj)
-            else:
-                LOG.error(
-                    f'Unable to find Schema of {self.resource_name.title()} in {Schemas}')
-                raise Exception(
-                    f"Schema: {self.resource_name.title()} does not exist")
-
+            return self.fetch_plan().translate(obj, self.cloud)
         except Exception as e:
             raise Exception(
                 f"Unable to translate {self.resource_name} due to {e}")
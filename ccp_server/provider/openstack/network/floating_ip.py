@@ -8,6 +8,7 @@
 from openstack.exceptions import BadRequestException
 
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPOpenStackException
@@ -24,8 +25,8 @@ class FloatingIP(services.FloatingIP):
     @log
     async def create_floating_ip(self, network_id: str):
         try:
-            cloud_response = self.conn.connect().create_floating_ip(
-                network=network_id)
+            cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().create_floating_ip(
+                network=network_id))
             return await mapper(data=cloud_response, resource_name=self.collection)
         except BadRequestException as e:
             raise CCPOpenStackException(Message.OPENSTACK_CREATE_ERR_MSG.format(
@@ -33,13 +34,13 @@ class FloatingIP(services.FloatingIP):
 
     @log
     async def list_all_floating_ips(self):
-        cloud_response = self.conn.connect().list_floating_ips()
+        cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().list_floating_ips())
         return await mapper(data=cloud_response, resource_name=self.collection)
 
     @log
     async def delete_floating_ip(self, floating_ip_id: str):
         try:
-            if not self.conn.connect().delete_floating_ip(floating_ip_id):
+            if not await ProviderExecutor.run(lambda: self.conn.connect().delete_floating_ip(floating_ip_id)):
                 raise CCPOpenStackException("Failed To Delete Floating IP")
         except Exception as e:
             raise CCPOpenStackException(f' {e.message or e}',
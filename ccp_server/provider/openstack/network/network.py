@@ -5,10 +5,15 @@
 # Written by Rajkumar Srinivasan <rajkumarsrinivasan@coredge.io>, Feb 2023    #
 # Modified by Saurabh Choudhary <saurabhchoudhary@coredge.io>, March 2023     #
 ###############################################################################
+from datetime import datetime
+
+from openstack import resource
 from openstack.exceptions import BadRequestException
+from openstack.network.v2.network import Network as NetworkResource
 
 from ccp_server.provider import models
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPOpenStackException
@@ -16,6 +21,12 @@ from ccp_server.util.logger import log
 from ccp_server.util.messages import Message
 
 
+class ChangedNetwork(NetworkResource):
+    """Network listed with the changed_since filter of the Neutron timestamp extension, which the SDK does not
+    send to the server."""
+    _query_mapping = resource.QueryParameters(changed_since='changed_since', **NetworkResource._query_mapping._mapping)
+
+
 class Network(services.Network):
 
     def __init__(self, connection: services.Connection):
@@ -25,21 +36,28 @@ class Network(services.Network):
     @log
     async def create_network(self, network: models.Network) -> models.Network:
         try:
-            cloud_response = self.conn.connect().create_network(**network.__dict__)
+            cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().create_network(**network.__dict__))
             return await mapper(data=cloud_response, resource_name=self.collection)
         except BadRequestException as e:
             raise CCPOpenStackException(Message.OPENSTACK_CREATE_ERR_MSG.format(
                 'Network'), e.status_code, e.details)
 
     @log
-    async def list_all_networks(self):
-        cloud_response = self.conn.connect().list_networks()
+    async def list_all_networks(self, changes_since: datetime = None):
+        """List the networks, or only the ones updated since a time
+        :param changes_since: UTC time of the oldest update to list
+        :return: List of networks"""
+        if changes_since:
+            cloud_response = await ProviderExecutor.run(lambda: list(ChangedNetwork.list(
+                self.conn.connect().network, changed_since=changes_since.isoformat(timespec='seconds'))))
+        else:
+            cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().list_networks())
         return await mapper(data=cloud_response, resource_name=self.collection)
 
     @log
     async def delete_network(self, network_id: str):
         try:
-            if not self.conn.connect().delete_network(network_id):
+            if not await ProviderExecutor.run(lambda: self.conn.connect().delete_network(network_id)):
                 raise CCPOpenStackException("Failed To Delete Network")
         except Exception as e:
             raise CCPOpenStackException(f' {e.message or e}',
@@ -8,6 +8,7 @@
 from openstack.exceptions import BadRequestException
 
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.schema.v1 import schemas
 from ccp_server.util.constants import Constants
@@ -29,7 +30,7 @@ class Port(services.Port):
                 "binding:vnic_type": port.binding.vnic_type,
                 "binding:host_id": port.binding.host_id
             }
-            cloud_response = self.conn.connect().create_port(
+            cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().create_port(
                 name=port.name,
                 network_id=network_id,
                 admin_state_up=port.admin_state_up,
@@ -39,7 +40,7 @@ class Port(services.Port):
                 port_security_enabled=port.port_security_enabled,
                 fixed_ips=port.fixed_ips,
                 **binding_dict,
-            )
+            ))
             return await mapper(data=cloud_response, resource_name=self.collection)
         except BadRequestException as e:
             raise CCPOpenStackException(
@@ -47,14 +48,14 @@ class Port(services.Port):
 
     @log
     async def list_ports_by_network_id(self, network_id: str):
-        cloud_res = self.conn.connect().list_ports(
-            filters={"network_id": network_id})
+        cloud_res = await ProviderExecutor.run(lambda: self.conn.connect().list_ports(
+            filters={"network_id": network_id}))
         return await mapper(data=cloud_res, resource_name=self.collection)
 
     @log
     async def delete_port(self, port_id: str):
         try:
-            if not self.conn.connect().delete_port(port_id):
+            if not await ProviderExecutor.run(lambda: self.conn.connect().delete_port(port_id)):
                 raise CCPOpenStackException("Failed To Delete Port")
         except Exception as e:
             raise CCPOpenStackException(f' {e.message or e}',
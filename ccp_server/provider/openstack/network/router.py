@@ -9,6 +9,7 @@ from openstack.exceptions import BadRequestException
 
 from ccp_server.provider import models
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPOpenStackException
@@ -25,7 +26,7 @@ class Router(services.Router):
     @log
     async def create_router(self, router: models.Router) -> models.Router:
         try:
-            cloud_response = self.conn.connect().create_router(
+            cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().create_router(
                 name=router.name,
                 admin_state_up=router.admin_state_up,
                 ext_gateway_net_id=router.ext_gateway_net_id,
@@ -33,7 +34,7 @@ class Router(services.Router):
                 ext_fixed_ips=router.ext_fixed_ips,
                 project_id=router.project_id,
                 availability_zone_hints=router.availability_zone_hints
-            )
+            ))
             return await mapper(data=cloud_response, resource_name=self.collection)
         except BadRequestException as e:
             raise CCPOpenStackException(Message.OPENSTACK_CREATE_ERR_MSG.format(
@@ -41,13 +42,13 @@ class Router(services.Router):
 
     @log
     async def list_all_routers(self):
-        cloud_response = self.conn.connect().list_routers()
+        cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().list_routers())
         return await mapper(data=cloud_response, resource_name=self.collection)
 
     @log
     async def delete_router(self, router_id: str):
         try:
-            if not self.conn.connect().delete_router(router_id):
+            if not await ProviderExecutor.run(lambda: self.conn.connect().delete_router(router_id)):
                 raise CCPOpenStackException("Failed To Delete Router")
         except Exception as e:
             raise CCPOpenStackException(f' {e.message or e}',
@@ -9,6 +9,7 @@ from openstack.exceptions import BadRequestException
 
 from ccp_server.provider import models
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPOpenStackException
@@ -25,8 +26,8 @@ class SecurityGroup(services.SecurityGroup):
     @log
     async def create_security_group(self, security_group: models.SecurityGroup) -> models.SecurityGroup:
         try:
-            cloud_response = self.conn.connect().create_security_group(**
-                                                                       security_group.__dict__)
+            cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().create_security_group(
+                **security_group.__dict__))
             return await mapper(data=cloud_response, resource_name=self.collection)
         except BadRequestException as e:
             raise CCPOpenStackException(Message.OPENSTACK_CREATE_ERR_MSG.format(
@@ -34,13 +35,13 @@ class SecurityGroup(services.SecurityGroup):
 
     @log
     async def list_all_security_groups(self):
-        cloud_res = self.conn.connect().list_security_groups()
+        cloud_res = await ProviderExecutor.run(lambda: self.conn.connect().list_security_groups())
         return await mapper(data=cloud_res, resource_name=self.collection)
 
     @log
     async def delete_security_group(self, security_group_id: str):
         try:
-            if not self.conn.connect().delete_security_group(security_group_id):
+            if not await ProviderExecutor.run(lambda: self.conn.connect().delete_security_group(security_group_id)):
                 raise CCPOpenStackException("Failed To Delete Security Group")
         except Exception as e:
             raise CCPOpenStackException(f' {e.message or e}',
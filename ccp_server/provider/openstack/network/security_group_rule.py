@@ -9,6 +9,7 @@ from openstack.exceptions import BadRequestException
 
 from ccp_server.provider import models
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPOpenStackException
@@ -26,7 +27,7 @@ class SecurityGroupRule(services.SecurityGroupRule):
     async def create_security_group_rule(self,
                                          security_group_rule: models.SecurityGroupRule) -> models.SecurityGroupRule:
         try:
-            cloud_response = self.conn.connect().create_security_group_rule(
+            cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().create_security_group_rule(
                 secgroup_name_or_id=security_group_rule.security_group,
                 port_range_min=security_group_rule.port_range_min,
                 port_range_max=security_group_rule.port_range_max,
@@ -37,7 +38,7 @@ class SecurityGroupRule(services.SecurityGroupRule):
                 remote_group_id=security_group_rule.remote_group_id,
                 project_id=security_group_rule.project_id,
                 description=security_group_rule.description
-            )
+            ))
             return await mapper(data=cloud_response, resource_name=self.collection)
         except BadRequestException as e:
             raise CCPOpenStackException(Message.OPENSTACK_CREATE_ERR_MSG.format(
@@ -45,14 +46,15 @@ class SecurityGroupRule(services.SecurityGroupRule):
 
     @log
     async def list_security_group_rules(self, security_group_id: str):
-        cloud_res = self.conn.connect().get_security_group_by_id(
-            id=security_group_id)
+        cloud_res = await ProviderExecutor.run(lambda: self.conn.connect().get_security_group_by_id(
+            id=security_group_id))
         return await mapper(data=cloud_res.security_group_rules, resource_name=self.collection)
 
     @log
     async def delete_security_group_rule(self, security_group_rule_id: str):
         try:
-            if not self.conn.connect().delete_security_group_rule(rule_id=security_group_rule_id):
+            if not await ProviderExecutor.run(lambda: self.conn.connect().delete_security_group_rule(
+                    rule_id=security_group_rule_id)):
                 raise CCPOpenStackException(
                     "Failed To Delete Security Group Rule")
         except Exception as e:
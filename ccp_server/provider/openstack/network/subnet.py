@@ -9,6 +9,7 @@ from openstack.exceptions import BadRequestException
 
 from ccp_server.provider import models
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPOpenStackException
@@ -25,8 +26,8 @@ class Subnet(services.Subnet):
     @log
     async def create_subnet(self, network_id: str, subnet: models.Subnet) -> models.Subnet:
         try:
-            cloud_response = self.conn.connect().create_subnet(network_name_or_id=network_id,
-                                                               **subnet.dict(exclude_unset=True))
+            cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().create_subnet(
+                network_name_or_id=network_id, **subnet.dict(exclude_unset=True)))
             return await mapper(data=cloud_response, resource_name=self.collection)
         except BadRequestException as e:
             raise CCPOpenStackException(Message.OPENSTACK_CREATE_ERR_MSG.format(
@@ -34,14 +35,14 @@ class Subnet(services.Subnet):
 
     @log
     async def list_subnets_by_network_id(self, network_id: str):
-        cloud_response = self.conn.connect().list_subnets(
-            filters={"network_id": network_id})
+        cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().list_subnets(
+            filters={"network_id": network_id}))
         return await mapper(data=cloud_response, resource_name=self.collection)
 
     @log
     async def delete_subnet(self, subnet_id: str):
         try:
-            if not self.conn.connect().delete_subnet(subnet_id):
+            if not await ProviderExecutor.run(lambda: self.conn.connect().delete_subnet(subnet_id)):
                 raise CCPOpenStackException("Failed To Delete Subnet")
         except Exception as e:
             raise CCPOpenStackException(f' {e.message or e}',
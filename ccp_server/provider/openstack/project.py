@@ -8,6 +8,7 @@ from openstack.exceptions import BadRequestException
 
 from ccp_server.provider import models
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPOpenStackException
@@ -24,7 +25,7 @@ class Project(services.Project):
     @log
     async def create_project(self, project: models.Project) -> models.Project:
         try:
-            cloud_res = self.conn.connect().create_project(**project.__dict__)
+            cloud_res = await ProviderExecutor.run(lambda: self.conn.connect().create_project(**project.__dict__))
             return await mapper(data=cloud_res, resource_name=self.collection)
         except BadRequestException as e:
             raise CCPOpenStackException(Message.OPENSTACK_CREATE_ERR_MSG.format(
@@ -32,21 +33,24 @@ class Project(services.Project):
 
     @log
     async def update_project(self, name_or_id, new_description) -> models.Project:
-        return self.conn.connect().update_project(name_or_id=name_or_id, description=new_description)
+        return await ProviderExecutor.run(lambda: self.conn.connect().update_project(
+            name_or_id=name_or_id, description=new_description))
 
     @log
     async def delete_project(self, project_name):
-        return self.conn.connect().delete_project(name_or_id=project_name)
+        return await ProviderExecutor.run(lambda: self.conn.connect().delete_project(name_or_id=project_name))
 
     @log
     async def add_member(self, cloud_project_id: str, username: str, role: str, ):
-        return self.conn.connect().grant_role(project=cloud_project_id, user=username, name_or_id=role)
+        return await ProviderExecutor.run(lambda: self.conn.connect().grant_role(
+            project=cloud_project_id, user=username, name_or_id=role))
 
     @log
     async def remove_member(self, cloud_project_id: str, username: str, role: str, ):
-        return self.conn.connect().revoke_role(project=cloud_project_id, user=username, name_or_id=role)
+        return await ProviderExecutor.run(lambda: self.conn.connect().revoke_role(
+            project=cloud_project_id, user=username, name_or_id=role))
 
     @log
     async def list_projects(self):
-        cloud_res = self.conn.connect().list_projects()
+        cloud_res = await ProviderExecutor.run(lambda: self.conn.connect().list_projects())
         return await mapper(data=cloud_res, resource_name=self.collection)
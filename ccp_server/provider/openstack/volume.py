@@ -9,6 +9,7 @@ from openstack.exceptions import BadRequestException
 
 from ccp_server.provider import models
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPOpenStackException
@@ -28,7 +29,7 @@ class Volume(services.Volume):
         :param volume: Request body.
         :return: The created volume ``Volume`` object."""
         try:
-            cloud_res = self.conn.connect().create_volume(**volume.__dict__)
+            cloud_res = await ProviderExecutor.run(lambda: self.conn.connect().create_volume(**volume.__dict__))
             return await mapper(data=cloud_res, resource_name=self.collection)
         except BadRequestException as e:
             raise CCPOpenStackException(Message.OPENSTACK_CREATE_ERR_MSG.format(
@@ -39,13 +40,22 @@ class Volume(services.Volume):
         """This method is used to delete a volume.
         :param volume_id: Volume ID.
         :return: True if deletion was successful, else False."""
-        return self.conn.connect().delete_volume(volume_id)
+        return await ProviderExecutor.run(lambda: self.conn.connect().delete_volume(volume_id))
 
     @log
     async def list_all_volumes(self):
         """This method is used to list volumes.
         :return: List of volumes."""
-        cloud_res = self.conn.connect().list_volumes()
+        cloud_res = await ProviderExecutor.run(lambda: self.conn.connect().list_volumes())
+        return await mapper(data=cloud_res, resource_name=self.collection)
+
+    @log
+    async def list_project_volumes(self, project_id: str):
+        """This method is used to list the volumes of a project with one call.
+        :param project_id: id of the project in the cloud
+        :return: List of volumes."""
+        cloud_res = await ProviderExecutor.run(lambda: list(self.conn.connect().block_storage.volumes(
+            details=True, all_projects=True, project_id=project_id)))
         return await mapper(data=cloud_res, resource_name=self.collection)
 
     @log
@@ -53,7 +63,7 @@ class Volume(services.Volume):
         """This method is used to get a volume.
         :param volume_id: Volume ID.
         :return: The volume ``Volume`` object."""
-        cloud_res = self.conn.connect().get_volume(volume_id)
+        cloud_res = await ProviderExecutor.run(lambda: self.conn.connect().get_volume(volume_id))
         return await mapper(data=cloud_res, resource_name=self.collection)
 
     @log
@@ -62,7 +72,7 @@ class Volume(services.Volume):
         :param server: Server object.
         :param volume: Volume object.
         :return: True if attachment was successful, else False."""
-        self.conn.connect().attach_volume(server=server, volume=volume)
+        await ProviderExecutor.run(lambda: self.conn.connect().attach_volume(server=server, volume=volume))
 
     @log
     async def detach_volume(self, server, volume):
@@ -70,4 +80,4 @@ class Volume(services.Volume):
         :param server: Server object.
         :param volume: Volume object.
         :return: None"""
-        self.conn.connect().detach_volume(server=server, volume=volume)
+        await ProviderExecutor.run(lambda: self.conn.connect().detach_volume(server=server, volume=volume))
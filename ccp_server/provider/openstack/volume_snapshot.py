@@ -10,6 +10,7 @@ from openstack.exceptions import BadRequestException
 
 from ccp_server.provider import models
 from ccp_server.provider import services
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.openstack.mapper.mapper import mapper
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPOpenStackException
@@ -29,8 +30,8 @@ class VolumeSnapshot(services.VolumeSnapshot):
         :param volume_id: Volume ID.
         :return: The created volume snapshot ``VolumeSnapshot`` object."""
         try:
-            cloud_response = self.conn.connect().create_volume_snapshot(
-                volume_id=volume_id, force=True, **volume_snapshot.dict())
+            cloud_response = await ProviderExecutor.run(lambda: self.conn.connect().create_volume_snapshot(
+                volume_id=volume_id, force=True, **volume_snapshot.dict()))
             map_res = await mapper(data=cloud_response, resource_name=self.collection)
             return map_res
         except BadRequestException as e:
@@ -40,12 +41,13 @@ class VolumeSnapshot(services.VolumeSnapshot):
     async def list_volume_snapshots(self) -> List[models.VolumeSnapshot]:
         """This method is used to list all volume snapshots.
         :return: List of fetched volume snapshots ``VolumeSnapshot`` objects."""
-        cloud_res = self.conn.connect().list_all_volume_snapshots()
+        cloud_res = await ProviderExecutor.run(lambda: self.conn.connect().list_all_volume_snapshots())
         return await mapper(data=cloud_res, resource_name=self.collection)
 
     async def delete_volume_snapshot(self, snapshot_id: str):
         try:
-            if not await self.conn.connect().delete_volume_snapshot(snapshot_id, wait=True):
+            if not await ProviderExecutor.run(lambda: self.conn.connect().delete_volume_snapshot(snapshot_id,
+                                                                                                  wait=True)):
                 raise CCPOpenStackException("Failed To Delete Volume Snapshot")
         except Exception as e:
             raise CCPOpenStackException(f' {e.message or e}',
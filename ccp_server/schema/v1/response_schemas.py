@@ -12,6 +12,10 @@ from typing import Optional
 from pydantic import BaseModel
 from pydantic import StrictStr
 
+from ccp_server.util import ccp_context
+from ccp_server.util.constants import Constants
+from ccp_server.util.enums import BatchItemStatus
+from ccp_server.util.enums import JobStatus
 from ccp_server.util.enums import Status
 
 
@@ -45,11 +49,13 @@ class Instance(Base):
 
 class Page:
 
-    def __init__(self, page: int, size: int, total: int, data: List[Dict[str, Any]]):
+    def __init__(self, page: int, size: int, total: Optional[int], data: List[Dict[str, Any]],
+                 next_page_token: str = None):
         self.page: int = page
         self.size: int = size
-        self.total: int = total
+        self.total: Optional[int] = total
         self.data: List[Dict[str, Any]] = data
+        self.next_page_token: Optional[str] = next_page_token
 
 
 class IDResponse:
@@ -58,16 +64,56 @@ class IDResponse:
         self.id: str = doc_id
 
 
+class JobResponse:
+
+    def __init__(self, job_id: str, status: JobStatus = JobStatus.QUEUED):
+        self.id: str = job_id
+        self.status: JobStatus = status
+
+
+class BatchItem:
+    """Outcome of one resource of a batch request, the index is its position in the request."""
+
+    def __init__(self, index: int, name: Optional[str]):
+        self.index: int = index
+        self.name: Optional[str] = name
+        self.status: Optional[BatchItemStatus] = None
+        self.id: Optional[str] = None
+        self.error: Optional[str] = None
+
+    def created(self, doc_id: str) -> None:
+        self.status, self.id = BatchItemStatus.CREATED, doc_id
+
+    def failed(self, error: str) -> None:
+        self.status, self.error = BatchItemStatus.FAILED, error
+
+
+class BatchResponse:
+
+    def __init__(self, items: List[BatchItem]):
+        self.created: int = sum(item.status == BatchItemStatus.CREATED for item in items)
+        self.failed: int = len(items) - self.created
+        self.items: List[BatchItem] = items
+
+
 class Pageable:
 
     def __init__(self, query_str: str, page: int, size: int, sort_by: List[str],
-                 sort_desc: bool, tags: List[str] = None):
+                 sort_desc: bool, tags: List[str] = None, page_token: str = None, include_total: bool = True,
+                 stream: bool = None):
         self.page: int = page
         self.size: int = size
         self.query_str: str = query_str
         self.sort_by: List[str] = sort_by
         self.sort_desc: bool = sort_desc
         self.tags: Dict[str, str] = self.populate_tags(tags)
+        # Continuation token of the previous page, it replaces the page number
+        self.page_token: Optional[str] = page_token
+        self.include_total: bool = include_total
+        # Stream the whole list as NDJSON, by default when the request accepts it
+        self.stream: bool = ccp_context.accepts(Constants.NDJSON_MEDIA_TYPE) if stream is None else stream
+        # Set by the list query when there is a next page
+        self.next_page_token: Optional[str] = None
 
     def populate_tags(self, tags):
 
@@ -212,6 +212,11 @@ class Volume(Base):
     size: int = 1
 
 
+class VolumeBatch(BaseModel):
+    volumes: List[Volume] = Field(..., min_items=1, max_items=Constants.BATCH_CREATE_MAX_ITEMS,
+                                  description="Volumes to create")
+
+
 class Instance(Base):
     name: str = Field(..., description="Name of Instance",
                       regex=Constants.USERNAME_REGEX, example='demo')
@@ -238,6 +243,11 @@ class Instance(Base):
     meta: Optional[Dict[str, str]]
 
 
+class InstanceBatch(BaseModel):
+    instances: List[Instance] = Field(..., min_items=1, max_items=Constants.BATCH_CREATE_MAX_ITEMS,
+                                      description="Instances to create")
+
+
 class InstanceActions:
     class StopAction(BaseModel):
         stop: Optional[str] = Field(
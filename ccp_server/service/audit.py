@@ -4,15 +4,26 @@
 # Proprietary and confidential                                                #
 # Written by Vicky Upadhyay <vicky@coredge.io>, Mar 2023                      #
 ###############################################################################
+import asyncio
 import datetime
+import uuid
+from typing import Dict
+from typing import List
 
 from ccp_server.db.mongo import MongoAPI
 from ccp_server.util import ccp_context
 from ccp_server.util import env_variables
 from ccp_server.util.constants import Constants
+from ccp_server.util.logger import KGLogger
+
+LOG = KGLogger(__name__)
 
 
 class AuditService(object):
+    """Audit logs are queued on the request path and written by a background task with insert_many,
+    every AUDIT_BATCH_SIZE records or AUDIT_FLUSH_INTERVAL_IN_MS. When the queue is full the records are
+    dropped and counted, so a slow audit database never slows down the API."""
+
     UNAUDITED_API_URLS = ['/docs']
 
     def __init__(self):
@@ -20,6 +31,62 @@ class AuditService(object):
             conn_str=env_variables.AUDIT_DB_URL,
             db_name=Constants.CCP_AUDIT_DB_NAME
         )
+        self._queue: asyncio.Queue = None
+        self._writer: asyncio.Task = None
+        self._counters: Dict[str, int] = {'queued': 0, 'written': 0, 'dropped': 0, 'failed': 0}
+
+    def start(self) -> None:
+        """Start the background writer in the running event loop, called at the startup."""
+        if self._writer is None:
+            self._queue = asyncio.Queue(maxsize=Constants.AUDIT_QUEUE_SIZE)
+            self._writer = asyncio.create_task(self._drain(), name='audit-writer')
+
+    async def stop(self) -> None:
+        """Write the queued records and stop the background writer, called at the shutdown."""
+        if self._writer is None:
+            return
+        writer, self._writer = self._writer, None
+        await self._queue.put(None)
+        try:
+            await asyncio.wait_for(writer, timeout=Constants.AUDIT_SHUTDOWN_TIMEOUT_IN_SECS)
+        except asyncio.TimeoutError:
+            LOG.error(f'Audit writer did not finish in time, {self._queue.qsize()} records are lost')
+
+    def metrics(self) -> Dict[str, int]:
+        """Counters of the audit records and the current queue depth."""
+        return dict(self._counters, depth=self._queue.qsize() if self._queue else 0)
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = Constants.AUDIT_FLUSH_INTERVAL_IN_MS / 1000
+        stopping = False
+        while not stopping:
+            record = await self._queue.get()
+            if record is None:
+                break
+            batch: List[Dict] = [record]
+            deadline = loop.time() + interval
+            while len(batch) < Constants.AUDIT_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    record = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+                if record is None:
+                    stopping = True
+                    break
+                batch.append(record)
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Dict]) -> None:
+        try:
+            await self.db.db[Constants.MongoCollection.AUDIT_COLLECTION_NAME].insert_many(batch, ordered=False)
+            self._counters['written'] += len(batch)
+        except Exception as e:
+            self._counters['failed'] += len(batch)
+            LOG.error(f'Unable to write {len(batch)} audit logs: {e}')
 
     async def create_audit_collection(self):
         await self.db.create_capped_collection(Constants.MongoCollection.AUDIT_COLLECTION_NAME,
@@ -29,7 +96,7 @@ class AuditService(object):
 
     async def write_audit_log(self, request, status_code, request_id, start_time, process_time):
         """
-        Write audit log to database
+        Queue the audit log for the background writer, it is written directly if the writer is not started
         :param request: HTTPRequest: Request object
         :param status_code: int: Response code
         :param request_id: str: Request ID
@@ -45,6 +112,7 @@ class AuditService(object):
 
         # Openstack CADF audit log model
         audit_log = {
+            "uuid": str(uuid.uuid4()),
             "audit_id": request_id,
             "event": {
                 "time": start_time,
@@ -84,4 +152,15 @@ class AuditService(object):
             ]
         }
 
-        await self.db.write_document(Constants.MongoCollection.AUDIT_COLLECTION_NAME, audit_log)
+        if self._writer is None:
+            await self._flush([audit_log])
+            return
+        try:
+            self._queue.put_nowait(audit_log)
+            self._counters['queued'] += 1
+        except asyncio.QueueFull:
+            self._counters['dropped'] += 1
+            dropped = self._counters['dropped']
+            # Logged at 1, 2, 4, 8... dropped records, so a long outage logs a few lines only
+            if dropped & (dropped - 1) == 0:
+                LOG.warn(f'Audit queue is full, {dropped} records dropped so far')
@@ -12,7 +12,10 @@ from ccp_server.db.mongo import MongoAPI
 from ccp_server.decorators.common import has_role
 from ccp_server.provider import models as provider_models
 from ccp_server.schema.v1 import schemas
+from ccp_server.schema.v1.response_schemas import IDResponse
 from ccp_server.schema.v1.response_schemas import Pageable
+from ccp_server.service.job import Job
+from ccp_server.service.job import JobService
 from ccp_server.service.providers import Provider
 from ccp_server.service.user import UserService
 from ccp_server.util.constants import Constants
@@ -21,6 +24,7 @@ from ccp_server.util.logger import log
 
 
 user_service: UserService = UserService()
+job_service: JobService = JobService()
 
 
 class ClusterService(Provider):
@@ -64,6 +68,18 @@ class ClusterService(Provider):
                                               project_id=project_id)
         return await self.db.write_document_with_default_details(self.collection, db_model)
 
+    @log
+    async def queue_create_cluster(self, project_id: str, cluster_template_id: str, cluster: schemas.Cluster) -> str:
+        """This method is used to check the cluster name and queue a job which creates the cluster."""
+
+        """Check for cluster name if already exist"""
+        await self.db.check_document_by_name(self.collection, cluster.name, raise_exception=True)
+
+        return await job_service.enqueue(Constants.JobType.CREATE_CLUSTER,
+                                         {'project_id': project_id, 'cluster_template_id': cluster_template_id,
+                                          'cluster': cluster.dict()},
+                                         project_id=project_id)
+
     @log
     async def list_clusters_by_project(self, pageable: Pageable = None, project_id: str = None):
         """ Fetch all the clusters in cloud and mongo.
@@ -143,3 +159,12 @@ class ClusterService(Provider):
         await self.connect.cluster.delete_cluster(cluster['reference_id'])
 
         await self.db.soft_delete_document_by_uuid(self.collection, cluster_id)
+
+
+@JobService.handler(Constants.JobType.CREATE_CLUSTER)
+async def create_cluster_job(job: Job) -> IDResponse:
+    """Create the cluster of a job queued by ClusterService.queue_create_cluster"""
+    await job.progress(10, 'Creating the cluster in the cloud')
+    doc_id = await ClusterService().create_cluster(job.payload['project_id'], job.payload['cluster_template_id'],
+                                                   schemas.Cluster(**job.payload['cluster']))
+    return IDResponse(doc_id)
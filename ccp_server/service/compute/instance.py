@@ -12,7 +12,12 @@ from pydantic.types import StrictBool
 
 from ccp_server.db.mongo import MongoAPI
 from ccp_server.decorators.common import has_role
+from ccp_server.schema.v1 import schemas
+from ccp_server.schema.v1.response_schemas import BatchResponse
+from ccp_server.schema.v1.response_schemas import IDResponse
 from ccp_server.schema.v1.response_schemas import Pageable
+from ccp_server.service.job import Job
+from ccp_server.service.job import JobService
 from ccp_server.service.providers import Provider
 from ccp_server.util.constants import Constants
 from ccp_server.util.enums import InstanceActionEnum
@@ -22,6 +27,8 @@ from ccp_server.util.utils import Utils
 
 LOG = KGLogger(__name__)
 
+job_service: JobService = JobService()
+
 
 class InstanceService(Provider):
     collection = Constants.MongoCollection.INSTANCE
@@ -40,11 +47,56 @@ class InstanceService(Provider):
                                              raise_exception=True
                                              )
 
+        db_model = await self.provision_instance(project_id, request)
+
+        """Saving instance in the mongo"""
+        LOG.info(f"Saving the instance {request.name} in the Database")
+        return await self.db.write_document_with_default_details(self.collection,
+                                                                 db_model)
+
+    @log
+    async def queue_create_instance(self, project_id: str, request) -> str:
+        """
+        Check the name and queue a job which creates the instance
+        :param project_id: str
+        :param request: Contains Name of the instance and the public key
+        returns: Job ID
+        """
+        await self.db.check_document_by_name(self.collection,
+                                             name=request.name,
+                                             project_id=project_id,
+                                             raise_exception=True
+                                             )
+        return await job_service.enqueue(Constants.JobType.CREATE_INSTANCE,
+                                         {'project_id': project_id, 'request': request.dict()},
+                                         project_id=project_id)
+
+    @log
+    async def create_instances(self, project_id: str, requests: List[schemas.Instance]) -> BatchResponse:
+        """
+        Create many instances with the given names and server details
+        :param project_id: str
+        :param requests: Instance request bodies
+        returns: Status of each instance
+        """
+        return await self.create_batch(self.collection, project_id, requests,
+                                       lambda request: self.provision_instance(project_id, request),
+                                       lambda db_model: self.connect.compute.instance.delete_instance(
+                                           instance_id=db_model['reference_id']))
+
+    async def provision_instance(self, project_id: str, request) -> Dict:
+        """
+        Create an instance in cloud
+        :param project_id: str
+        :param request: Contains Name of the instance and the public key
+        returns: db model of the instance
+        """
         LOG.info(
             f"Checking that the network exists in the same project: {request.network}")
         network_obj = await self.db.get_document_by_ids(Constants.MongoCollection.NETWORK,
                                                         uid=request.network,
-                                                        project_id=project_id)
+                                                        project_id=project_id,
+                                                        raise_exception=True)
         request.network = network_obj['reference_id']
         if request.instance_username:
             request.userdata = f'''#cloud-config
@@ -60,12 +112,8 @@ class InstanceService(Provider):
             f"Creating the instance {request.name} in cloud with network_id: {request.network}")
         cloud_response = await self.connect.compute.instance.create_instance(request)
 
-        """Saving instance in the mongo"""
-        LOG.info(f"Saving the instance {request.name} in the Database")
-        db_model = MongoAPI.populate_db_model(cloud_response, name=db_instance_name, description=request.description,
-                                              project_id=project_id, tags=request.tags)
-        return await self.db.write_document_with_default_details(self.collection,
-                                                                 db_model)
+        return MongoAPI.populate_db_model(cloud_response, name=db_instance_name, description=request.description,
+                                          project_id=project_id, tags=request.tags)
 
     @log
     async def delete_instance(self, project_id: str, instance_id: str):
@@ -168,3 +216,12 @@ class InstanceService(Provider):
         await self.db.update_document_by_uuid(Constants.MongoCollection.INSTANCE,
                                               uid=instance_id,
                                               data_dict={'status': action, 'vm_state': vm_state_dict[action]})
+
+
+@JobService.handler(Constants.JobType.CREATE_INSTANCE)
+async def create_instance_job(job: Job) -> IDResponse:
+    """Create the instance of a job queued by InstanceService.queue_create_instance"""
+    await job.progress(10, 'Creating the instance in the cloud')
+    doc_id = await InstanceService().create_instance(job.payload['project_id'],
+                                                     schemas.Instance(**job.payload['request']))
+    return IDResponse(doc_id)
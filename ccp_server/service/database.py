@@ -0,0 +1,31 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+from typing import Dict
+from typing import List
+
+from ccp_server.db.indexes import MongoIndexes
+from ccp_server.decorators.common import has_role
+from ccp_server.service.providers import Provider
+from ccp_server.util.constants import Constants
+from ccp_server.util.logger import log
+
+
+class DatabaseService(Provider):
+    """Service for the maintenance of the CCP database."""
+
+    @log
+    @has_role(Constants.CCPRole.SUPER_ADMIN)
+    async def get_index_report(self) -> Dict[str, Dict[str, List[str]]]:
+        """Get the missing, unused and unregistered indexes of every collection.
+        :return: Dict of collection name and its index names by state"""
+        return await MongoIndexes.report(self.db.db)
+
+    @log
+    @has_role(Constants.CCPRole.SUPER_ADMIN)
+    async def apply_indexes(self) -> Dict[str, List[str]]:
+        """Create the missing indexes of every collection.
+        :return: Dict of collection name and the names of its registered indexes"""
+        return await MongoIndexes.apply(self.db.db)
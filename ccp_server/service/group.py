@@ -27,7 +27,7 @@ class GroupService(Provider):
         kc_group_req = KCGroup(name=group_req.name)
 
         """Save the group in Keycloak"""
-        group_id = self.kc_group_service.create_group(kc_group_req)
+        group_id = await self.kc_group_service.create_group(kc_group_req)
 
         """Save the group/Organization in mongo db"""
         mongo_data = Organization(
@@ -51,7 +51,7 @@ class GroupService(Provider):
         :param username: Username
         :return: None"""
 
-        return self.kc_group_service.add_user_to_group(group_id=group_id, username=username)
+        return await self.kc_group_service.add_user_to_group(group_id=group_id, username=username)
 
     @log
     async def remove_user_from_group(self, group_id: str, username: str) -> None:
@@ -60,7 +60,7 @@ class GroupService(Provider):
         :param username: Username
         :return: None"""
 
-        return self.kc_group_service.remove_user_from_group(group_id=group_id, username=username)
+        return await self.kc_group_service.remove_user_from_group(group_id=group_id, username=username)
 
     @log
     async def get_group_members(self, group_id: str, query: dict) -> List[Dict]:
@@ -70,4 +70,4 @@ class GroupService(Provider):
         :return: List of members
         """
 
-        return self.kc_group_service.get_group_members(group_id=group_id, query=query)
+        return await self.kc_group_service.get_group_members(group_id=group_id, query=query)
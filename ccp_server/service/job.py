@@ -0,0 +1,286 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import importlib
+import os
+import signal
+import socket
+import uuid
+from datetime import datetime
+from datetime import timedelta
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import orjson
+from pymongo import ReturnDocument
+
+from ccp_server.provider.executor import ProviderExecutor
+from ccp_server.schema.v1.response_schemas import Pageable
+from ccp_server.service.providers import Provider
+from ccp_server.util import ccp_context
+from ccp_server.util.constants import Constants
+from ccp_server.util.enums import JobStatus
+from ccp_server.util.enums import Status
+from ccp_server.util.exceptions import CCPNotFoundException
+from ccp_server.util.logger import KGLogger
+from ccp_server.util.logger import log
+from ccp_server.util.messages import Message
+from ccp_server.util.response import encode_default
+
+LOG = KGLogger(__name__)
+
+# Modules which register the job handlers, a standalone worker imports them
+HANDLER_MODULES = ('ccp_server.service.compute.instance', 'ccp_server.service.clusters.cluster')
+
+
+class Job:
+    """A job claimed by a worker, given to its handler."""
+
+    def __init__(self, job_service: 'JobService', doc: Dict):
+        self.job_service = job_service
+        self.doc: Dict = doc
+        self.id: str = doc['uuid']
+        self.type: str = doc['type']
+        self.payload: Dict = doc.get('payload') or {}
+
+    async def progress(self, percent: int, message: str = None) -> None:
+        """Report the progress of the job, it is shown by the job status API.
+        :param percent: 0 to 100
+        :param message: what the job is doing"""
+        await self.job_service.progress(self.id, percent, message)
+
+
+class JobService(Provider):
+    """Queue of the background jobs in Mongo. A worker claims the oldest due job with an atomic update and holds a
+    lease on it, a job whose worker died is retried once its lease expires or failed when it has no attempt left.
+    The handlers run with the cloud, org, project and user of the request which queued the job."""
+
+    _handlers: Dict[str, Callable[[Job], Awaitable[Any]]] = {}
+    # Fields of the jobs hidden from the API
+    PROJECTION: Dict[str, int] = {'_id': 0, 'payload': 0, 'roles': 0, 'worker': 0, 'lease_until': 0}
+
+    def __init__(self):
+        self.collection = Constants.MongoCollection.JOB
+
+    @classmethod
+    def handler(cls, job_type: str):
+        """Register the coroutine function which runs the jobs of a type.
+        :param job_type: one of Constants.JobType"""
+
+        def register(func: Callable[[Job], Awaitable[Any]]):
+            cls._handlers[job_type] = func
+            return func
+
+        return register
+
+    @property
+    def jobs(self):
+        return self.db.db[self.collection]
+
+    @log
+    async def enqueue(self, job_type: str, payload: Dict, project_id: str = None, max_attempts: int = 1) -> str:
+        """Queue a job for the workers. A job is only retried when max_attempts is more than one,
+        so the handlers of the jobs which may be retried must be idempotent.
+        :param job_type: one of Constants.JobType
+        :param payload: arguments of the handler, JSON compatible
+        :param project_id: Project ID of the job
+        :param max_attempts: number of runs before the job fails
+        :return: Job ID"""
+        now = datetime.utcnow()
+        job_id = str(uuid.uuid4())
+        await self.jobs.insert_one({
+            'uuid': job_id, 'type': job_type, 'payload': payload, 'status': JobStatus.QUEUED.value,
+            'progress': 0, 'message': None, 'result': None, 'error': None,
+            'attempts': 0, 'max_attempts': max_attempts, 'run_at': now,
+            'cloud': ccp_context.get_cloud(), 'org_id': ccp_context.get_org(),
+            'project_id': project_id or ccp_context.get_project_id(),
+            'created_by': ccp_context.get_logged_in_user(), 'roles': ccp_context.get_logged_in_user_roles(),
+            'active': Status.ACTIVE.value, 'created_at': now, 'updated_at': now})
+        LOG.info(f'Queued the {job_type} job {job_id}')
+        return job_id
+
+    async def claim(self, worker: str) -> Optional[Job]:
+        """Take the oldest due job, or a running job whose lease expired and which has attempts left.
+        :param worker: name of the worker
+        :return: the job or None"""
+        now = datetime.utcnow()
+        doc = await self.jobs.find_one_and_update(
+            {'$or': [{'status': JobStatus.QUEUED.value, 'run_at': {'$lte': now}},
+                     {'status': JobStatus.RUNNING.value, 'lease_until': {'$lt': now},
+                      '$expr': {'$lt': ['$attempts', '$max_attempts']}}]},
+            {'$set': {'status': JobStatus.RUNNING.value, 'worker': worker, 'started_at': now, 'updated_at': now,
+                      'lease_until': now + timedelta(seconds=Constants.JOB_LEASE_IN_SECS)},
+             '$inc': {'attempts': 1}},
+            sort=[('run_at', 1)], return_document=ReturnDocument.AFTER)
+        return Job(self, doc) if doc else None
+
+    async def heartbeat(self, job_id: str, worker: str) -> bool:
+        """Extend the lease of a running job.
+        :return: False if the job is no longer held by the worker"""
+        now = datetime.utcnow()
+        result = await self.jobs.update_one(
+            {'uuid': job_id, 'worker': worker, 'status': JobStatus.RUNNING.value},
+            {'$set': {'lease_until': now + timedelta(seconds=Constants.JOB_LEASE_IN_SECS), 'updated_at': now}})
+        return result.matched_count == 1
+
+    async def progress(self, job_id: str, percent: int, message: str = None) -> None:
+        await self.jobs.update_one({'uuid': job_id},
+                                   {'$set': {'progress': max(0, min(percent, 100)), 'message': message,
+                                             'updated_at': datetime.utcnow()}})
+
+    async def finish(self, job: Job, worker: str, result: Any) -> None:
+        """Mark a job as succeeded, the payload is removed as it may hold secrets."""
+        now = datetime.utcnow()
+        await self.jobs.update_one(
+            {'uuid': job.id, 'worker': worker},
+            {'$set': {'status': JobStatus.SUCCEEDED.value, 'progress': 100, 'error': None,
+                      'result': orjson.loads(orjson.dumps(result, default=encode_default)),
+                      'finished_at': now, 'updated_at': now},
+             '$unset': {'payload': '', 'lease_until': ''}})
+
+    async def fail(self, job: Job, worker: str, error: str) -> None:
+        """Queue a failed job again after JOB_RETRY_DELAY_IN_SECS times its attempts, or mark it as failed."""
+        now = datetime.utcnow()
+        if job.doc['attempts'] < job.doc['max_attempts']:
+            update = {'$set': {'status': JobStatus.QUEUED.value, 'error': error, 'updated_at': now,
+                               'run_at': now + timedelta(
+                                   seconds=Constants.JOB_RETRY_DELAY_IN_SECS * job.doc['attempts'])},
+                      '$unset': {'lease_until': ''}}
+        else:
+            update = {'$set': {'status': JobStatus.FAILED.value, 'error': error, 'finished_at': now,
+                               'updated_at': now},
+                      '$unset': {'payload': '', 'lease_until': ''}}
+        await self.jobs.update_one({'uuid': job.id, 'worker': worker}, update)
+
+    async def reap(self) -> int:
+        """Fail the running jobs whose worker stopped and which have no attempt left.
+        :return: number of failed jobs"""
+        now = datetime.utcnow()
+        result = await self.jobs.update_many(
+            {'status': JobStatus.RUNNING.value, 'lease_until': {'$lt': now},
+             '$expr': {'$gte': ['$attempts', '$max_attempts']}},
+            {'$set': {'status': JobStatus.FAILED.value, 'error': Message.JOB_LEASE_EXPIRED, 'finished_at': now,
+                      'updated_at': now},
+             '$unset': {'payload': '', 'lease_until': ''}})
+        return result.modified_count
+
+    @log
+    async def get_job(self, job_id: str) -> Dict:
+        """Get the status of a job of the org.
+        :param job_id: Job ID
+        :return: job without its payload"""
+        _filter_dict = self.db.populate_default_filter_dict(exclude_project=True)
+        _filter_dict['uuid'] = job_id
+        job = await self.jobs.find_one(_filter_dict, self.PROJECTION)
+        if not job:
+            raise CCPNotFoundException(message=Message.DOCUMENT_WITH_UUID_NOT_FOUND.format(job_id))
+        return job
+
+    @log
+    async def list_jobs(self, pageable: Pageable = None, project_id: str = None) -> Tuple[List[Dict], Optional[int]]:
+        """List the jobs of the org, or of a project.
+        :param pageable: Pageable object.
+        :param project_id: Project ID.
+        :return: jobs without their payload"""
+        return await self.db.get_document_list_by_ids(self.collection, project_id=project_id,
+                                                      exclude_project=project_id is None,
+                                                      projection_dict=dict(self.PROJECTION), pageable=pageable)
+
+
+class JobWorker:
+    """Runs the queued jobs one at a time, as ccp_context is shared by the coroutines of the thread.
+    Start more worker processes for more throughput."""
+
+    def __init__(self, job_service: JobService = None, name: str = None):
+        self.job_service: JobService = job_service or JobService()
+        self.name: str = name or f'{socket.gethostname()}:{os.getpid()}'
+        self.stopping: asyncio.Event = asyncio.Event()
+
+    async def run(self) -> None:
+        """Run jobs until stop is called, the job in progress is finished first."""
+        LOG.info(f'Job worker {self.name} started with the handlers {sorted(JobService._handlers)}')
+        while not self.stopping.is_set():
+            try:
+                if await self.run_once():
+                    continue
+                reaped = await self.job_service.reap()
+                if reaped:
+                    LOG.warn(f'Failed {reaped} jobs whose worker stopped')
+            except Exception as e:
+                LOG.error(f'Job worker {self.name} error: {e}')
+            try:
+                await asyncio.wait_for(self.stopping.wait(), Constants.JOB_POLL_INTERVAL_IN_MS / 1000)
+            except asyncio.TimeoutError:
+                pass
+        LOG.info(f'Job worker {self.name} stopped')
+
+    def stop(self) -> None:
+        self.stopping.set()
+
+    async def run_once(self) -> bool:
+        """Claim and run one job.
+        :return: True if a job was run"""
+        job = await self.job_service.claim(self.name)
+        if job is None:
+            return False
+        await self.execute(job)
+        return True
+
+    async def execute(self, job: Job) -> None:
+        handler = JobService._handlers.get(job.type)
+        # Run as the request which queued the job, the audit id of the logs is the job id
+        ccp_context.set_service_context(job.doc.get('cloud'), org_id=job.doc.get('org_id'),
+                                        project_id=job.doc.get('project_id'), username=job.doc.get('created_by'),
+                                        roles=job.doc.get('roles'), audit_id=job.id)
+        heartbeat = asyncio.create_task(self.keep_lease(job))
+        try:
+            LOG.info(f'Running the {job.type} job {job.id}, attempt {job.doc["attempts"]}')
+            if handler is None:
+                raise CCPNotFoundException(message=Message.JOB_TYPE_NOT_SUPPORTED.format(job.type))
+            result = await handler(job)
+        except Exception as e:
+            LOG.error(f'The {job.type} job {job.id} failed: {e}')
+            await self.job_service.fail(job, self.name, getattr(e, 'message', None) or str(e))
+        else:
+            await self.job_service.finish(job, self.name, result)
+            LOG.info(f'The {job.type} job {job.id} succeeded')
+        finally:
+            heartbeat.cancel()
+            ccp_context.clear_context()
+
+    async def keep_lease(self, job: Job) -> None:
+        while True:
+            await asyncio.sleep(Constants.JOB_LEASE_IN_SECS / 3)
+            try:
+                if not await self.job_service.heartbeat(job.id, self.name):
+                    LOG.warn(f'The lease of the job {job.id} was lost')
+                    return
+            except Exception as e:
+                LOG.warn(f'Unable to extend the lease of the job {job.id}: {e}')
+
+
+async def main() -> None:
+    """Run a standalone job worker until SIGINT or SIGTERM."""
+    for module in HANDLER_MODULES:
+        importlib.import_module(module)
+    worker = JobWorker()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+    try:
+        await worker.run()
+    finally:
+        ProviderExecutor.shutdown()
+        Provider.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
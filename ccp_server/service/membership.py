@@ -0,0 +1,78 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+from typing import Dict
+from typing import List
+
+from ccp_server.config.membership import MembershipCache
+from ccp_server.kc.user import KeycloakUserService
+from ccp_server.service.providers import Provider
+from ccp_server.util.constants import Constants
+from ccp_server.util.enums import Status
+from ccp_server.util.logger import KGLogger
+from ccp_server.util.logger import log
+from ccp_server.util.token import TokenInfo
+
+LOG = KGLogger(__name__)
+
+
+class MembershipService(Provider):
+    def __init__(self):
+        self.kc_user_service: KeycloakUserService = KeycloakUserService()
+
+    @log
+    async def get_profile(self, token_info: TokenInfo) -> Dict:
+        """Get the membership profile of the logged-in user, built from Keycloak and Mongo on a cache miss.
+        :param token_info: TokenInfo of the logged-in user
+        :return: membership profile"""
+        profile = await MembershipCache.get(token_info.email)
+        if profile is None:
+            profile = await self.build_profile(token_info)
+            await MembershipCache.set(token_info.email, profile)
+        elif profile['ceph'].get('access_key') and not profile['ceph'].get('secret_key'):
+            # The secret key is not kept in Redis, it is read again when the profile comes from there
+            attributes = await self.kc_user_service.get_user_attributes(token_info.email)
+            secret_key = attributes.get(Constants.CEPH_USER_SECRET_KEY)
+            profile['ceph'] = {**profile['ceph'], 'secret_key': secret_key[0]} if secret_key else {}
+            await MembershipCache.set(token_info.email, profile, shared=False)
+        return profile
+
+    @log
+    async def build_profile(self, token_info: TokenInfo) -> Dict:
+        """Build the membership profile: orgs with their projects, roles and the Ceph credentials.
+        The orgs are not loaded for the super admin, same as the web sso.
+        :param token_info: TokenInfo of the logged-in user
+        :return: membership profile"""
+        username = token_info.email
+        profile = {'roles': token_info.ccp_roles, 'orgs': [], 'ceph': {}}
+        if Constants.CCPRole.SUPER_ADMIN in token_info.ccp_roles:
+            return profile
+
+        # One Keycloak call gives both the org groups and the project subgroups of the user,
+        # the attributes are fetched concurrently
+        groups, attributes = await asyncio.gather(self.kc_user_service.get_user_groups(username),
+                                                  self.kc_user_service.get_user_attributes(username))
+        group_ids = [group['id'] for group in groups]
+        subgroup_ids = [group['id'] for group in groups if group['path'].count('/') == 2]
+
+        orgs = await self.db.get_document_by_projection_and_filter(Constants.MongoCollection.ORGANIZATION,
+                                                                   filter_dict={'external_id': {'$in': group_ids},
+                                                                                'active': Status.ACTIVE.value},
+                                                                   projection_dict={'_id': 0, 'uuid': 1, 'name': 1})
+        projects: List[Dict] = []
+        if subgroup_ids:
+            projects = await self.db.get_document_by_projection_and_filter(
+                Constants.MongoCollection.PROJECT,
+                filter_dict={'external_id': {'$in': subgroup_ids}, 'active': Status.ACTIVE.value},
+                projection_dict={'_id': 0, 'uuid': 1, 'name': 1, 'cloud': 1, 'org_id': 1, 'reference_id': 1})
+        profile['orgs'] = [{'uuid': org['uuid'], 'name': org['name'],
+                            'projects': [project for project in projects if project.get('org_id') == org['uuid']]}
+                           for org in orgs]
+
+        if attributes.get(Constants.CEPH_USER_ACCESS_KEY) and attributes.get(Constants.CEPH_USER_SECRET_KEY):
+            profile['ceph'] = {'access_key': attributes[Constants.CEPH_USER_ACCESS_KEY][0],
+                               'secret_key': attributes[Constants.CEPH_USER_SECRET_KEY][0]}
+        return profile
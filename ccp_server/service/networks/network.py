@@ -5,6 +5,7 @@
 # Written by Rajkumar Srinivasan <rajkumarsrinivasan@coredge.io>, Feb 2023    #
 # Modified by Saurabh Choudhary <saurabhchoudhary@coredge.io>, March 2023     #
 ###############################################################################
+from datetime import datetime
 from typing import Dict
 
 from pydantic.types import StrictBool
@@ -71,11 +72,13 @@ class NetworkService(Provider):
 
     @log
     @has_role(Constants.CCPRole.SUPER_ADMIN, Constants.CCPRole.ORG_ADMIN)
-    async def list_all_networks(self, pageable: Pageable = None, use_db: StrictBool = True):
+    async def list_all_networks(self, pageable: Pageable = None, use_db: StrictBool = True,
+                                changes_since: datetime = None):
         """
         This method is used to list all the networks in mongo and cloud.
         :param pageable: Pageable object
         :param use_db: If true it will fetch the result from Mongo, else from cloud
+        :param changes_since: List only the networks updated in the cloud since this UTC time
         :return: List of networks.
         """
         if use_db:
@@ -85,7 +88,7 @@ class NetworkService(Provider):
                 exclude_project=True
             )
         else:
-            cloud_response = await self.connect.network.list_all_networks()
+            cloud_response = await self.connect.network.list_all_networks(changes_since=changes_since)
             return cloud_response, len(cloud_response)
 
     @log
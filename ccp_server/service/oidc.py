@@ -57,7 +57,7 @@ class OIDC:
     async def web_sso(self, token: str = None, token_info: TokenInfo = None) -> UserProfile:
 
         if not token_info:
-            token_info: TokenInfo = self.auth_service.tokeninfo(token)
+            token_info: TokenInfo = await self.auth_service.tokeninfo(token)
 
         #  if token not valid the raise Unauthorized exception
         if not token_info.active:
@@ -8,6 +8,7 @@ from typing import Dict
 from typing import List
 from typing import Tuple
 
+from ccp_server.config.membership import MembershipCache
 from ccp_server.db.models import Organization
 from ccp_server.decorators.common import has_role
 from ccp_server.kc.group import KeycloakGroupService
@@ -39,7 +40,7 @@ class OrgService(Provider):
         await self.db.check_document_by_name(Constants.MongoCollection.ORGANIZATION, org_req.name, raise_exception=True)
 
         """Save the group in Keycloak"""
-        group_id = self.kc_group_service.create_group(kc_group_req)
+        group_id = await self.kc_group_service.create_group(kc_group_req)
 
         """Save the group/Organization in mongo db"""
         mongo_data = Organization(
@@ -75,7 +76,7 @@ class OrgService(Provider):
         :param pageable: Pageable object
         :return: Pageable object
         """
-        groups = self.kc_user_service.get_user_groups(
+        groups = await self.kc_user_service.get_user_groups(
             ccp_context.get_logged_in_user())
         group_ids = [group['id'] for group in groups]
         return await self.db.get_document_list_by_ids(Constants.MongoCollection.ORGANIZATION,
@@ -116,8 +117,9 @@ class OrgService(Provider):
         :return: None
         """
         group_id = await self.get_group_id(org_id)
-        self.kc_group_service.add_user_to_group(
+        await self.kc_group_service.add_user_to_group(
             group_id=group_id, username=username)
+        await MembershipCache.invalidate(username)
 
         cloud = await self.db.get_cloud_by_org_id(org_id=org_id)
         ccp_context.set_request_data(Constants.CCPHeader.CLOUD_ID, cloud)
@@ -136,8 +138,9 @@ class OrgService(Provider):
         """
 
         group_id = await self.get_group_id(org_id)
-        self.kc_group_service.remove_user_from_group(
+        await self.kc_group_service.remove_user_from_group(
             group_id=group_id, username=username)
+        await MembershipCache.invalidate(username)
 
     @log
     @has_role(Constants.CCPRole.SUPER_ADMIN, Constants.CCPRole.ORG_ADMIN)
@@ -149,7 +152,8 @@ class OrgService(Provider):
         :return: None
         """
 
-        self.kc_user_service.grant_roles(username, roles)
+        await self.kc_user_service.grant_roles(username, roles)
+        await MembershipCache.invalidate(username)
 
     @log
     @has_role(Constants.CCPRole.SUPER_ADMIN, Constants.CCPRole.ORG_ADMIN)
@@ -162,6 +166,7 @@ class OrgService(Provider):
         """
 
         await self.kc_user_service.revoke_roles(username, role_name)
+        await MembershipCache.invalidate(username)
 
     @log
     @has_role(Constants.CCPRole.SUPER_ADMIN, Constants.CCPRole.ORG_ADMIN)
@@ -181,13 +186,14 @@ class OrgService(Provider):
         :param query: dict
         :return: List of members
         """
-        members = self.kc_group_service.get_group_members(
+        members = await self.kc_group_service.get_group_members(
             group_id=group_id, query=query)
+        # Roles of all the members are resolved together instead of one lookup per member
+        members_roles = await self.kc_user_service.get_users_roles([member['id'] for member in members])
         users: List[Dict] = []
         # Convert Keycloak response into user details
         for member in members:
-            user_roles = self.kc_user_service.get_user_roles(
-                member['username'])
+            user_roles = members_roles.get(member['id'], [])
 
             # Convert the timestamp to seconds then in datetime format
             dt_object = Utils.to_utc_datetime(member['createdTimestamp'])
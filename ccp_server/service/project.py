@@ -12,10 +12,12 @@ from typing import Tuple
 from pydantic.types import StrictBool
 
 import ccp_server.provider.models as models
+from ccp_server.config.membership import MembershipCache
 from ccp_server.decorators.common import duplicate_name
 from ccp_server.decorators.common import has_role
 from ccp_server.kc.group import KeycloakGroupService
 from ccp_server.kc.schemas.schemas import Group as KCGroup
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.schema.v1 import schemas
 from ccp_server.schema.v1.response_schemas import Pageable
 from ccp_server.service.org import OrgService
@@ -49,7 +51,7 @@ class ProjectService(Provider):
         kc_group_id = await self.org_service.get_group_id(ccp_context.get_org())
 
         LOG.debug(f"Creating project in Keycloack with name: {project.name}")
-        sub_group_id = self.kc_group_service.create_sub_group(
+        sub_group_id = await self.kc_group_service.create_sub_group(
             kc_sub_group_req, parent=kc_group_id)
 
         cloud_model: models.Project = models.Project(
@@ -125,17 +127,18 @@ class ProjectService(Provider):
         project = await self.get_project(project_id)
 
         # Add member to Keycloak Subgroup
-        self.kc_group_service.add_user_to_group(
+        await self.kc_group_service.add_user_to_group(
             project['external_id'], username)
+        await MembershipCache.invalidate(username)
 
         # Check user exist in Cloud
         cloud_project_id = project['reference_id']
         cloud_user = await self.user_service.get_user_from_cloud(username=username)
 
         if not cloud_user:
-            self.user_service.connect.user.create_user(user=models.User(email=username, name=username,
-                                                                        default_project=cloud_project_id,
-                                                                        role=role))
+            await ProviderExecutor.run(self.user_service.connect.user.create_user,
+                                       user=models.User(email=username, name=username,
+                                                        default_project=cloud_project_id, role=role))
         else:
             # Add member to Project in Cloud
             await self.connect.project.add_member(cloud_project_id, username, role)
@@ -151,8 +154,9 @@ class ProjectService(Provider):
         project = await self.get_project(project_id)
 
         # Remove member from Keycloak Subgroup
-        self.kc_group_service.remove_user_from_group(
+        await self.kc_group_service.remove_user_from_group(
             project['external_id'], username)
+        await MembershipCache.invalidate(username)
 
         # Remove member from Project in OpenStack
         cloud_project_id = project['reference_id']
@@ -4,7 +4,12 @@
 # Proprietary and confidential                                                #
 # Written by Deepak Pant <deepak.pant@coredge.io>, Feb 2023                   #
 ###############################################################################
+import threading
+from typing import Any
+from typing import Awaitable
+from typing import Callable
 from typing import Dict
+from typing import List
 
 from pydantic.types import StrictStr
 
@@ -12,26 +17,55 @@ from ccp_server.db.mongo import MongoAPI
 from ccp_server.provider.aws.aws import AWS
 from ccp_server.provider.cloud_provider import CloudProvider
 from ccp_server.provider.gcp.gcp import GCP
+from ccp_server.provider.openstack.connection import OpenstackConnection
 from ccp_server.provider.openstack.openstack import Openstack
+from ccp_server.schema.v1.response_schemas import BatchItem
+from ccp_server.schema.v1.response_schemas import BatchResponse
 from ccp_server.util import ccp_context
 from ccp_server.util.constants import Constants
 from ccp_server.util.exceptions import CCPNotFoundException
+from ccp_server.util.logger import KGLogger
+from ccp_server.util.messages import Message
 from ccp_server.util.utils import Utils
 
+LOG = KGLogger(__name__)
+
+# Code of the errors of the unique indexes
+DUPLICATE_KEY_ERROR = 11000
+
 
 class Provider:
-    # Store all the cloud provider data at the time of startup
+    # Cloud providers and the mongo connection shared by all the services of the process
     cloud_connections: Dict[StrictStr, CloudProvider] = {}
     mongo: MongoAPI = None
+    _lock: threading.Lock = threading.Lock()
 
     def __init__(self):
-        Provider.cloud_connections[Constants.CLOUD_TYPE_OPENSTACK] = Openstack(
-        )
-        Provider.cloud_connections[Constants.CLOUD_TYPE_AWS] = AWS()
-        Provider.cloud_connections[Constants.CLOUD_TYPE_GCP] = GCP()
+        Provider.init()
+
+    @classmethod
+    def init(cls) -> None:
+        """Create the cloud providers and the mongo connection, only on the first call of the process."""
+        if cls.cloud_connections and cls.mongo is not None:
+            return
+        with cls._lock:
+            if not cls.cloud_connections:
+                LOG.info("Initializing the cloud providers")
+                cls.cloud_connections = {Constants.CLOUD_TYPE_OPENSTACK: Openstack(),
+                                         Constants.CLOUD_TYPE_AWS: AWS(),
+                                         Constants.CLOUD_TYPE_GCP: GCP()}
+            if cls.mongo is None:
+                # Initialize the mongo connection
+                cls.mongo = MongoAPI()
 
-        # Initialize the mongo connection
-        Provider.mongo = MongoAPI()
+    @classmethod
+    def close(cls) -> None:
+        """Release the cloud connections and the mongo clients, used at the shutdown of the process."""
+        with cls._lock:
+            cls.cloud_connections = {}
+            cls.mongo = None
+        OpenstackConnection.clear_connections()
+        MongoAPI.close_clients()
 
     @property
     def connect(self) -> CloudProvider:
@@ -39,11 +73,79 @@ class Provider:
 
         if cloud in Utils.load_supported_clouds():
             cloud_type: str = Utils.load_cloud_details(cloud).get("type")
-            return Provider().cloud_connections[cloud_type]
+            Provider.init()
+            return Provider.cloud_connections[cloud_type]
         else:
             raise CCPNotFoundException(
                 message=f"'{cloud}' is not a valid cloud or not supported.")
 
     @property
     def db(self) -> MongoAPI:
+        Provider.init()
         return Provider.mongo
+
+    async def create_batch(self, collection_name: str, project_id: str, requests: List[Any],
+                           provision: Callable[[Any], Awaitable[Dict]],
+                           release: Callable[[Dict], Awaitable[Any]]) -> BatchResponse:
+        """Create many resources of a project. The names are checked with one query, the resources are created in
+        the cloud at most CLOUD_CONCURRENCY_LIMIT at a time and saved with one bulk insert. A failed item does
+        not stop the others.
+        :param collection_name: Name of the collection
+        :param project_id: Project ID
+        :param requests: Request bodies, each with a name
+        :param provision: Coroutine function which creates the resource of a request in the cloud and returns
+                its db model
+        :param release: Coroutine function which deletes the cloud resource of a db model, called when the
+                resource was created in the cloud but its document was not saved
+        :return: BatchResponse with the status of each request, in the order of the requests"""
+        items = [BatchItem(index, request.name) for index, request in enumerate(requests)]
+        names = [item.name for item in items if item.name]
+        taken = await self.db.get_existing_names(collection_name, names, project_id=project_id) if names else set()
+
+        pending: List[BatchItem] = []
+        seen = set()
+        for item in items:
+            name = item.name.lower() if item.name else None
+            if name and name in taken:
+                item.failed(Message.NAME_ALREADY_EXISTS.format(item.name))
+            elif name and name in seen:
+                item.failed(Message.NAME_REPEATED_IN_BATCH.format(item.name))
+            else:
+                seen.add(name)
+                pending.append(item)
+
+        async def provision_item(item: BatchItem):
+            try:
+                return await provision(requests[item.index])
+            except Exception as e:
+                LOG.error(f'Unable to create {collection_name} {item.name} in the cloud: {e}')
+                item.failed(getattr(e, 'message', None) or str(e))
+
+        db_models = await Utils.gather_with_limit((provision_item(item) for item in pending),
+                                                  Constants.CLOUD_CONCURRENCY_LIMIT)
+        provisioned = [(item, db_model) for item, db_model in zip(pending, db_models) if item.error is None]
+        if provisioned:
+            result = await self.db.write_many(collection_name, [db_model for _, db_model in provisioned],
+                                              with_default_details=True)
+            for error in result.errors:
+                item, db_model = provisioned[error['index']]
+                LOG.error(f"{collection_name} {db_model.get('reference_id')} was created in the cloud "
+                          f"but not saved: {error['message']}")
+                item.failed(Message.NAME_ALREADY_EXISTS.format(item.name) if error['code'] == DUPLICATE_KEY_ERROR
+                            else error['message'])
+            for index, ((item, _), doc_id) in enumerate(zip(provisioned, result.uuids)):
+                if index not in result.failed:
+                    item.created(doc_id)
+
+            async def release_item(db_model: Dict):
+                try:
+                    await release(db_model)
+                except Exception as e:
+                    # Left in the cloud, the syncer adds it to the db under its generated cloud name
+                    LOG.error(f"Unable to delete {collection_name} {db_model.get('reference_id')} "
+                              f"which was not saved: {e}")
+
+            # The resources which were not saved are deleted, else nobody can see them
+            await Utils.gather_with_limit((release_item(provisioned[index][1]) for index in sorted(result.failed)),
+                                          Constants.CLOUD_CONCURRENCY_LIMIT)
+        return BatchResponse(items)
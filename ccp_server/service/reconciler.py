@@ -0,0 +1,202 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import signal
+import time
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from pymongo import UpdateOne
+
+from ccp_server.provider.executor import ProviderExecutor
+from ccp_server.service.providers import Provider
+from ccp_server.util import ccp_context
+from ccp_server.util.constants import Constants
+from ccp_server.util.enums import InstanceActionEnum
+from ccp_server.util.enums import Status
+from ccp_server.util.logger import KGLogger
+
+LOG = KGLogger(__name__)
+
+# Key of the resources refreshed with one list call: cloud, org, project and collection
+GroupKey = Tuple[str, str, str, str]
+
+
+class ReconcileTarget:
+    """A resource type whose transitional states are refreshed from the cloud."""
+
+    def __init__(self, collection: str, transitional: Dict, fields: Tuple[str, ...],
+                 list_resources: Callable[[Provider, str], Awaitable[List]]):
+        """
+        :param collection: Name of the collection
+        :param transitional: Mongo filter of the documents in a transitional state
+        :param fields: fields copied from the cloud resources
+        :param list_resources: coroutine function which lists the resources of a cloud project
+        """
+        self.collection = collection
+        self.transitional = transitional
+        self.fields = fields
+        self.list_resources = list_resources
+
+
+TARGETS: List[ReconcileTarget] = [
+    # Nova statuses which end by themselves, the actions of InstanceService.instance_action and a pending task
+    ReconcileTarget(Constants.MongoCollection.INSTANCE,
+                    {'$or': [{'status': {'$in': ['BUILD', 'REBOOT', 'HARD_REBOOT', 'REBUILD', 'RESIZE',
+                                                 'REVERT_RESIZE', 'MIGRATING', 'PASSWORD']
+                                         + [action.value for action in InstanceActionEnum]}},
+                             {'task_state': {'$type': 'string'}}]},
+                    ('status', 'vm_state', 'task_state', 'power_state'),
+                    lambda provider, project_id: provider.connect.compute.instance.list_project_instances(project_id)),
+    # Cinder statuses which end by themselves
+    ReconcileTarget(Constants.MongoCollection.VOLUME,
+                    {'status': {'$in': ['creating', 'attaching', 'detaching', 'deleting', 'extending', 'downloading',
+                                        'uploading', 'retyping', 'backing-up', 'restoring-backup', 'reserved']}},
+                    ('status', 'attachments'),
+                    lambda provider, project_id: provider.connect.volume.list_project_volumes(project_id)),
+]
+
+
+class StatusReconciler(Provider):
+    """Keeps the status of the resources in a transitional state (an instance being rebooted, a volume being
+    attached) close to the cloud between the full syncs. Every tick it finds them with one query per collection
+    and refreshes each (cloud, project, resource type) with one list call, the changes are written with one bulk
+    write. A group whose resources did not change is refreshed less and less often, from
+    RECONCILE_MIN_INTERVAL_IN_SECS to RECONCILE_MAX_INTERVAL_IN_SECS. The groups are refreshed one at a time,
+    as ccp_context is shared by the coroutines of the thread."""
+
+    def __init__(self, targets: List[ReconcileTarget] = None):
+        self.targets: List[ReconcileTarget] = TARGETS if targets is None else targets
+        # Refresh interval and time of the next refresh of each group
+        self.intervals: Dict[GroupKey, float] = {}
+        self.due: Dict[GroupKey, float] = {}
+        self.stopping: asyncio.Event = asyncio.Event()
+
+    async def run(self) -> None:
+        """Reconcile until stop is called."""
+        LOG.info(f'Status reconciler started for {[target.collection for target in self.targets]}')
+        while not self.stopping.is_set():
+            try:
+                await self.run_once()
+            except Exception as e:
+                LOG.error(f'Status reconciler error: {e}')
+            try:
+                await asyncio.wait_for(self.stopping.wait(), Constants.RECONCILE_TICK_IN_MS / 1000)
+            except asyncio.TimeoutError:
+                pass
+        LOG.info('Status reconciler stopped')
+
+    def stop(self) -> None:
+        self.stopping.set()
+
+    async def run_once(self) -> int:
+        """Refresh the groups which are due.
+        :return: number of updated documents"""
+        groups: Dict[GroupKey, List[Dict]] = {}
+        for target in self.targets:
+            for key, docs in (await self.tracked(target)).items():
+                groups[key] = docs
+
+        # A group which is no longer tracked starts again at the shortest interval
+        for key in set(self.intervals) - set(groups):
+            self.intervals.pop(key)
+            self.due.pop(key, None)
+
+        now = time.monotonic()
+        due = [key for key in groups if self.due.get(key, 0) <= now]
+        if not due:
+            return 0
+        cloud_projects = await self.cloud_projects({key[2] for key in due})
+        targets = {target.collection: target for target in self.targets}
+        modified = 0
+        for key in due:
+            changed = 0
+            cloud_project_id = cloud_projects.get(key[2])
+            if cloud_project_id:
+                try:
+                    changed = await self.refresh(targets[key[3]], key, cloud_project_id, groups[key])
+                except Exception as e:
+                    LOG.warn(f'Unable to reconcile {key[3]} of the project {key[2]} in {key[0]}: {e}')
+                finally:
+                    ccp_context.clear_context()
+            modified += changed
+            self.schedule(key, changed > 0)
+        return modified
+
+    def schedule(self, key: GroupKey, changed: bool) -> None:
+        """Refresh a group again at the shortest interval after a change, or back off."""
+        interval = self.intervals.get(key)
+        if changed or interval is None:
+            interval = Constants.RECONCILE_MIN_INTERVAL_IN_SECS
+        else:
+            interval = min(interval * Constants.RECONCILE_BACKOFF_FACTOR, Constants.RECONCILE_MAX_INTERVAL_IN_SECS)
+        self.intervals[key] = interval
+        self.due[key] = time.monotonic() + interval
+
+    async def tracked(self, target: ReconcileTarget) -> Dict[GroupKey, List[Dict]]:
+        """Find the active documents of a collection in a transitional state.
+        :return: Dict of group key and its documents"""
+        _filter_dict = {'active': Status.ACTIVE.value, **target.transitional}
+        projection = dict.fromkeys(('uuid', 'reference_id', 'cloud', 'org_id', 'project_id') + target.fields, 1)
+        projection['_id'] = 0
+        groups: Dict[GroupKey, List[Dict]] = {}
+        async for doc in self.db.db[target.collection].find(_filter_dict, projection):
+            if doc.get('cloud') and doc.get('project_id') and doc.get('reference_id'):
+                key = (doc['cloud'], doc.get('org_id'), doc['project_id'], target.collection)
+                groups.setdefault(key, []).append(doc)
+        return groups
+
+    async def cloud_projects(self, project_ids) -> Dict[str, str]:
+        """Get the ids in the cloud of the projects with one query.
+        :return: Dict of project ID and its cloud project ID"""
+        cursor = self.db.db[Constants.MongoCollection.PROJECT].find({'uuid': {'$in': list(project_ids)}},
+                                                                    {'_id': 0, 'uuid': 1, 'reference_id': 1})
+        return {project['uuid']: project.get('reference_id') async for project in cursor}
+
+    async def refresh(self, target: ReconcileTarget, key: GroupKey, cloud_project_id: str,
+                      docs: List[Dict]) -> int:
+        """List the resources of the group in the cloud and save the changed fields of its documents. An update
+        only applies if the document still has the status it was read with, so a newer action is not overwritten.
+        :return: number of updated documents"""
+        # The service credentials of the cloud can list the resources of any project
+        ccp_context.set_service_context(key[0], org_id=key[1], project_id=key[2])
+        resources = {resource['reference_id']: resource for resource in
+                     (dict(resource) for resource in await target.list_resources(self, cloud_project_id))}
+        requests, uuids = [], []
+        for doc in docs:
+            resource = resources.get(doc['reference_id'])
+            if resource is None:
+                # Deleted in the cloud, the syncer marks it as deleted
+                continue
+            changes = {field: resource.get(field) for field in target.fields if resource.get(field) != doc.get(field)}
+            if changes:
+                requests.append(UpdateOne({'uuid': doc['uuid'], 'status': doc.get('status')}, {'$set': changes}))
+                uuids.append(doc['uuid'])
+        if not requests:
+            return 0
+        result = await self.db.bulk_write(target.collection, requests, uuids, org_ids={key[1]})
+        LOG.info(f'Reconciled {result.modified} of {len(docs)} {target.collection} of the project {key[2]}')
+        return result.modified
+
+
+async def main() -> None:
+    """Run a standalone status reconciler until SIGINT or SIGTERM."""
+    reconciler = StatusReconciler()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, reconciler.stop)
+    try:
+        await reconciler.run()
+    finally:
+        ProviderExecutor.shutdown()
+        Provider.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
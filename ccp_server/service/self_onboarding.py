@@ -56,7 +56,7 @@ class SelfOnboardingService(Provider):
                         email=request.email, roles=[Constants.CCPRole.ORG_ADMIN])
         LOG.debug(
             f"Creating user in Keycloak with user {user_obj}")
-        self.kc_user_service.create_user(user=user_obj)
+        await self.kc_user_service.create_user(user=user_obj)
 
         """2. Setting Default cloud and setting it to the header"""
         default_cloud = Utils.get_default_cloud()
@@ -78,7 +78,7 @@ class SelfOnboardingService(Provider):
 
         """ 6. Adding user to the group in Keycloak"""
         LOG.debug(f"Adding user: {request.email} in group")
-        self.kc_group_service.add_user_to_group(
+        await self.kc_group_service.add_user_to_group(
             group_id=group_id, username=request.email)
 
         """7. Adding role Org-Admin of the user"""
@@ -100,7 +100,7 @@ class SelfOnboardingService(Provider):
         :return: org_id.
         """
         token = ccp_context.get_logged_in_token()
-        token_info: TokenInfo = self.auth_service.tokeninfo(token)
+        token_info: TokenInfo = await self.auth_service.tokeninfo(token)
         project_name = Constants.CCPHeader.DEFAULT_PROJECT_NAME
         if token_info.is_profile_completed:
             raise CCPBusinessException(message=Message.PROFILE_COMPLETED)
@@ -129,12 +129,12 @@ class SelfOnboardingService(Provider):
             name=project_name)
         project_id = await self.project_service.create_project(project_req, default=True)
 
-        user_obj = self.kc_user_service.get_user(username)
+        user_obj = await self.kc_user_service.get_user(username)
         user = schemas.User(email=user_obj['username'], first_name=user_obj['firstName'],
                             last_name=user_obj['lastName'], roles=[Constants.CCPRole.ORG_ADMIN])
         await self.user_service.create_user(user, project_id=project_id, exist_ok=True)
 
-        self.kc_user_service.update_user_attributes(
+        await self.kc_user_service.update_user_attributes(
             username=username, attributes={'profile_completed': True})
 
         org = Organization(
@@ -4,6 +4,7 @@
 # Proprietary and confidential                                                #
 # Written by Bhaskar Tank <bhaskar@coredge.io>, March 2023                    #
 ###############################################################################
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.models import StorageUser
 from ccp_server.service.providers import Provider
 
@@ -19,4 +20,5 @@ class StorageUserService(Provider):
         :return: dict: StorageUser access key secret key if user is created else None.'''
         cloud_user_req = StorageUser(
             email=email, name=f'{first_name} {last_name}')
-        return self.connect.storageuser.create_storage_user(cloud_user_req, exist_ok=exist_ok)
+        return await ProviderExecutor.run(self.connect.storageuser.create_storage_user, cloud_user_req,
+                                          exist_ok=exist_ok)
@@ -4,14 +4,17 @@
 # Proprietary and confidential                                                #
 # Written by Deepak Pant <deepak.pant@coredge.io>, Feb 2023                   #
 ###############################################################################
+import asyncio
 from typing import Dict
 from typing import List
 
+from ccp_server.config.membership import MembershipCache
 from ccp_server.config.redis import cache
 from ccp_server.decorators.common import has_role
 from ccp_server.kc.group import KeycloakGroupService
 from ccp_server.kc.schemas.schemas import User as KCUser
 from ccp_server.kc.user import KeycloakUserService
+from ccp_server.provider.executor import ProviderExecutor
 from ccp_server.provider.models import User as CloudUser
 from ccp_server.schema.v1 import schemas
 from ccp_server.service.org import OrgService
@@ -75,7 +78,7 @@ class UserService(Provider):
                              mobile_number=user_req.mobile_number, roles=user_req.roles)
 
         LOG.debug(f"Creating user as {user_req.first_name} in Keycloak")
-        self.kc_user_service.create_user(
+        await self.kc_user_service.create_user(
             kc_user_req, profile_completed=profile_completed, exist_ok=exist_ok)
 
         """2. User creation in Cloud and attached to the Project if provided and """
@@ -83,7 +86,7 @@ class UserService(Provider):
                                    email=user_req.email, default_project=cloud_project_id)
 
         LOG.debug(f"Creating user as {user_req.email} in Cloud")
-        self.connect.user.create_user(cloud_user_req, exist_ok=exist_ok)
+        await ProviderExecutor.run(self.connect.user.create_user, cloud_user_req, exist_ok=exist_ok)
 
         try:
             """3. User creation in Storage """
@@ -97,7 +100,7 @@ class UserService(Provider):
             """4. Update User in Keycloak and add storage user creds"""
             LOG.debug(
                 f"Adding user as {user_req.email} in org {org_id}in Storage")
-            self.kc_user_service.update_user_attributes(
+            await self.kc_user_service.update_user_attributes(
                 username=user_req.email, attributes=storage_user_creds)
         except Exception as e:
             LOG.error(
@@ -111,8 +114,9 @@ class UserService(Provider):
         """6. Add user into the Sub-group in Keycloak"""
         LOG.debug(
             f"Adding user as {user_req.email} into subgroup of org {org_id} in Keycloak")
-        self.kc_group_service.add_user_to_group(
+        await self.kc_group_service.add_user_to_group(
             keycloak_project_id, user_req.email)
+        await MembershipCache.invalidate(user_req.email)
 
         """7. Add role to user"""
         LOG.debug(
@@ -125,10 +129,12 @@ class UserService(Provider):
             await self.update_email_action(user_req.email, email_actions)
 
     @log
-    @cache()
+    @cache(ttl=Constants.CACHE_VERSIONED_TTL_IN_SECS,
+           depends_on=(Constants.CACHE_MEMBERSHIP_NAMESPACE,))
     async def get_user(self, username: str) -> schemas.User:
         """Get a user from Keycloak"""
-        user = self.kc_user_service.get_user(username)
+        user, user_roles = await asyncio.gather(self.kc_user_service.get_user(username),
+                                                self.kc_user_service.get_user_roles(username))
         attributes = user.get('attributes', {})
         dt_object = Utils.to_utc_datetime(user['createdTimestamp'])
         user = {
@@ -139,7 +145,6 @@ class UserService(Provider):
             'email_verified': user['emailVerified'],
             'created_at': dt_object.strftime(Constants.TIMESTAMP_FORMAT),
         }
-        user_roles = self.kc_user_service.get_user_roles(username)
         user['roles'] = user_roles
 
         for key in attributes:
@@ -151,7 +156,7 @@ class UserService(Provider):
     @cache()
     async def get_user_from_cloud(self, username: str) -> schemas.User:
         """Get a user from Cloud"""
-        return self.connect.user.get_user(username)
+        return await ProviderExecutor.run(self.connect.user.get_user, username)
 
     @log
     async def update_user(self, username: str, user: schemas.User) -> None:
@@ -162,7 +167,7 @@ class UserService(Provider):
 
         kc_user_req = KCUser(first_name=user.first_name,
                              last_name=user.last_name, email=user.email)
-        self.kc_user_service.update_user(kc_user_req)
+        await self.kc_user_service.update_user(username, kc_user_req)
 
     @log
     async def delete_user(self, username: str) -> None:
@@ -171,10 +176,11 @@ class UserService(Provider):
         :return: None"""
 
         # Delete user from Keycloak
-        self.kc_user_service.delete_user(username)
+        await self.kc_user_service.delete_user(username)
+        await MembershipCache.invalidate(username)
 
         # Delete user from OpenStack
-        self.connect.user.delete_user(username)
+        await ProviderExecutor.run(self.connect.user.delete_user, username)
 
     @log
     async def grant_roles(self, username: str, roles: List[str]) -> None:
@@ -184,7 +190,8 @@ class UserService(Provider):
         :return: None."""
 
         # assign role in Keycloak
-        self.kc_user_service.grant_roles(username, roles)
+        await self.kc_user_service.grant_roles(username, roles)
+        await MembershipCache.invalidate(username)
 
     @log
     async def revoke_roles(self, username: str, roles: List[str]) -> None:
@@ -194,11 +201,13 @@ class UserService(Provider):
         :return: None."""
 
         # revoke role in Keycloak
-        self.kc_user_service.revoke_roles(username, roles)
+        await self.kc_user_service.revoke_roles(username, roles)
+        await MembershipCache.invalidate(username)
 
     @log
     @has_role(Constants.CCPRole.ORG_ADMIN, Constants.CCPRole.MEMBER)
-    @cache()
+    @cache(ttl=Constants.CACHE_VERSIONED_TTL_IN_SECS,
+           depends_on=(Constants.CACHE_MEMBERSHIP_NAMESPACE, Constants.MongoCollection.ORGANIZATION))
     async def get_users(self, query_str, page, size, sort_by, sort_desc) -> List[Dict]:
         """Get a list of users from Keycloak
         :return: List of users."""
@@ -217,16 +226,17 @@ class UserService(Provider):
         :return: None."""
 
         group_id = await self.org_service.get_group_id(org_id=ccp_context.get_org())
-        self.kc_user_service.is_user_exists_in_group(
+        await self.kc_user_service.is_user_exists_in_group(
             group_id, username, raise_exception=True)
 
-        self.kc_user_service.update_email_action(username, actions)
+        await self.kc_user_service.update_email_action(username, actions)
 
     @log
-    @cache()
+    @cache(ttl=Constants.CACHE_VERSIONED_TTL_IN_SECS,
+           depends_on=(Constants.CACHE_MEMBERSHIP_NAMESPACE, Constants.MongoCollection.ORGANIZATION))
     async def get_user_orgs(self, username: str):
         """Get a list of groups from Keycloak"""
-        groups = self.kc_user_service.get_user_groups(username)
+        groups = await self.kc_user_service.get_user_groups(username)
         group_ids = [group['id'] for group in groups]
 
         return await self.db.get_document_by_projection_and_filter(Constants.MongoCollection.ORGANIZATION,
@@ -241,14 +251,15 @@ class UserService(Provider):
         return await self.get_user_projects(username=ccp_context.get_logged_in_user())
 
     @log
-    @cache()
+    @cache(ttl=Constants.CACHE_VERSIONED_TTL_IN_SECS,
+           depends_on=(Constants.CACHE_MEMBERSHIP_NAMESPACE, Constants.MongoCollection.PROJECT))
     async def get_user_projects(self, username: str, org_id: str = None) -> List[Dict]:
         """Get a list of projects for provided user
         :param username: Username
         :param org_id: Organization id
         :return: List of projects."""
 
-        subgroups = self.kc_user_service.get_user_subgroup(username)
+        subgroups = await self.kc_user_service.get_user_subgroup(username)
         if subgroups:
             external_ids = [subgroup['id'] for subgroup in subgroups]
             projects, _ = await self.db.get_document_list_by_ids(Constants.MongoCollection.PROJECT, org_id=org_id,
@@ -259,9 +270,9 @@ class UserService(Provider):
     @log
     async def logout(self) -> None:
         """Logout from Keycloak"""
-        self.kc_user_service.logout(ccp_context.get_logged_in_user())
+        await self.kc_user_service.logout(ccp_context.get_logged_in_user())
 
     @log
     async def generate_access_token(self, refresh_token: str) -> None:
         """Logout from Keycloak"""
-        return self.kc_user_service.generate_access_token(refresh_token)
+        return await self.kc_user_service.generate_access_token(refresh_token)
@@ -6,9 +6,14 @@
 #  Modified by Vicky Upadhyay <vicky@coredge.io>, Feb 2023                    #
 # Modified by Saurabh Choudhary <saurabhchoudhary@coredge.io>, march 2023     #
 ###############################################################################
+from typing import Dict
+from typing import List
+
 from pydantic.types import StrictBool
 
 from ccp_server.db.mongo import MongoAPI
+from ccp_server.schema.v1 import schemas
+from ccp_server.schema.v1.response_schemas import BatchResponse
 from ccp_server.schema.v1.response_schemas import Pageable
 from ccp_server.service.providers import Provider
 from ccp_server.util.constants import Constants
@@ -36,6 +41,25 @@ class VolumeService(Provider):
                                              project_id=project_id,
                                              raise_exception=True)
 
+        db_model = await self.provision_volume(project_id, request)
+        return await self.db.write_document_with_default_details(Constants.MongoCollection.VOLUME, db_model)
+
+    @log
+    async def create_volumes(self, project_id: str, requests: List[schemas.Volume]) -> BatchResponse:
+        """This method is used to create many volumes in cloud and mongo.
+        :param project_id: Project ID
+        :param requests: Volume request bodies.
+        :return: Status of each volume."""
+        return await self.create_batch(self.collection, project_id, requests,
+                                       lambda request: self.provision_volume(project_id, request),
+                                       lambda db_model: self.connect.volume.delete_volume(db_model['reference_id']))
+
+    async def provision_volume(self, project_id: str, request) -> Dict:
+        """This method is used to create a volume in cloud.
+        :param project_id: Project ID
+        :param request: Volume request body.
+        :return: db model of the volume."""
+
         """generate a random UUID for the cloud volume name"""
         db_volume_name = request.name
         request.name = Utils.generate_unique_str()
@@ -43,10 +67,8 @@ class VolumeService(Provider):
         """Save the volume in the OpenStack"""
         cloud_response = await self.connect.volume.create_volume(request)
 
-        """Save the volume in the mongo db"""
-        db_model = MongoAPI.populate_db_model(cloud_response, name=db_volume_name,
-                                              project_id=project_id, tags=request.tags)
-        return await self.db.write_document_with_default_details(Constants.MongoCollection.VOLUME, db_model)
+        return MongoAPI.populate_db_model(cloud_response, name=db_volume_name,
+                                          project_id=project_id, tags=request.tags)
 
     @log
     async def list_volumes_by_project_id(self, pageable: Pageable = None, project_id: str = None):
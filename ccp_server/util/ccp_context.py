@@ -1,11 +1,19 @@
 import threading
+from types import SimpleNamespace
 from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Sequence
+
+from starlette.datastructures import State
 
 from ccp_server.util.constants import Constants
 
 _request_local = threading.local()
 
+# Roles of the services which use the credentials of the cloud, they act on every project
+SERVICE_ROLES = (Constants.CCPRole.SUPER_ADMIN,)
+
 
 def get_request_data():
     if _request_local.__dict__:
@@ -20,6 +28,32 @@ def set_request_data(key: str, value: any):
     _request_local.data[key] = value
 
 
+def set_request_context(data: Dict[str, any]):
+    """Replace the whole request data of the current thread, used to carry the request context into worker threads."""
+    if data:
+        _request_local.data = dict(data)
+
+
+def set_service_context(cloud: str, org_id: str = None, project_id: str = None, username: str = None,
+                        roles: Optional[Sequence[str]] = SERVICE_ROLES, audit_id: str = None):
+    """Replace the request data of the current thread for the work done outside of a request, like the jobs,
+    the status reconciler and the syncer.
+    :param cloud: Cloud name
+    :param org_id: Organization ID
+    :param project_id: Project ID
+    :param username: Username the work is done for
+    :param roles: Roles of the user, the service roles by default
+    :param audit_id: Audit id of the logs"""
+    state = State({Constants.CCP_ROLES: list(roles) if roles is not None else None})
+    if username:
+        state.__setattr__(Constants.USERNAME, username)
+    set_request_context({Constants.CURRENT_REQUEST: SimpleNamespace(state=state, headers={}),
+                         Constants.CCPHeader.CLOUD_ID: cloud,
+                         Constants.CCPHeader.ORG_ID: org_id,
+                         Constants.CCPHeader.PROJECT_ID: project_id,
+                         Constants.CCPHeader.AUDIT_ID: audit_id})
+
+
 def clear_context():
     if _request_local.__dict__:
         del _request_local.data
@@ -81,6 +115,13 @@ def get_logged_in_user_roles() -> List[str]:
         return data[Constants.CCP_ROLES]
 
 
+def accepts(media_type: str) -> bool:
+    """Returns True if the Accept header of the current request lists the media type."""
+    data = get_request_data()
+    request = data.get(Constants.CURRENT_REQUEST) if data else None
+    return bool(request) and media_type in request.headers.get('accept', '')
+
+
 def request_id():
     """Returns the request id of the current request."""
     data = get_request_data()
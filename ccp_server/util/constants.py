@@ -53,6 +53,8 @@ class Constants(object):
         AUDIT_COLLECTION_NAME: str = 'AuditLog'
         CLUSTER_TEMPLATE: str = 'ClusterTemplate'
         CLUSTER: str = 'Cluster'
+        JOB: str = 'Job'
+        SYNC_WATERMARK: str = 'SyncWatermark'
 
     class Cluster:
         """Class for COE Cluster"""
@@ -78,11 +80,16 @@ class Constants(object):
     # Project constants
     MONGO_DB_NAME: str = 'ccp_db'
     CCP_AUDIT_DB_NAME: str = 'ccp_audit_db'
+    MONGO_CREATE_INDEXES: bool = str(env_variables.MONGO_CREATE_INDEXES).lower() == 'true'
+    MONGO_STREAM_BATCH_SIZE: int = int(env_variables.MONGO_STREAM_BATCH_SIZE)
+    MONGO_BULK_BATCH_SIZE: int = int(env_variables.MONGO_BULK_BATCH_SIZE)
     USERNAME = 'username'
     CLOUD_PROJECT_ID = 'cloud-project-id'
     CCP_ROLES: str = 'ccp_roles'
     LOGGED_IN_USER_TOKEN: str = 'token'
     CURRENT_REQUEST = 'current_request'
+    # Accept header of the lists streamed as one JSON document per line
+    NDJSON_MEDIA_TYPE: str = 'application/x-ndjson'
     PATH_ID_REGEX = '/{}/[a-f0-9-]+/?'
     CEPH_USER_ACCESS_KEY: str = 'access_key'
     CEPH_USER_SECRET_KEY: str = 'secret_key'
@@ -103,17 +110,68 @@ class Constants(object):
     KEYCLOAK_USER_VERIFICATION_MAIL_TTL_IN_SEC: int = 86400
     KEYCLOAK_ADMIN_USERNAME: str = env_variables.KEYCLOAK_ADMIN_USERNAME
     KEYCLOAK_ADMIN_PASSWORD: str = env_variables.KEYCLOAK_ADMIN_PASSWORD
-    KEYCLOAK_OPENID_CONNECT_TOKEN_URL = f'{KEYCLOAK_URL}/realms/cloud/protocol/openid-connect/token'
+    KEYCLOAK_OPENID_CONNECT_TOKEN_URL = f'{KEYCLOAK_BASE_URL}/protocol/openid-connect/token'
+    KEYCLOAK_OPENID_CONNECT_CERTS_URL = f'{KEYCLOAK_BASE_URL}/protocol/openid-connect/certs'
     KEYCLOAK_POST_VERIFICATION_LINK = env_variables.KEYCLOAK_POST_VERIFICATION_LINK
     KEYCLOAK_SUPPORTED_EMAIL_ACTION: List[str] = [
         'VERIFY_EMAIL', 'UPDATE_PASSWORD']
 
     INTERNAL_KEYCLOAK: bool = env_variables.INTERNAL_KEYCLOAK
+    KEYCLOAK_TOKEN_REFRESH_MARGIN_IN_SECS: int = int(env_variables.KEYCLOAK_TOKEN_REFRESH_MARGIN_IN_SECS)
+    KEYCLOAK_HTTP_MAX_CONNECTIONS: int = int(env_variables.KEYCLOAK_HTTP_MAX_CONNECTIONS)
+    KEYCLOAK_HTTP_TIMEOUT_IN_SECS: int = int(env_variables.KEYCLOAK_HTTP_TIMEOUT_IN_SECS)
+    KEYCLOAK_CONCURRENCY_LIMIT: int = int(env_variables.KEYCLOAK_CONCURRENCY_LIMIT)
+
+    # Bulk creation constants
+    BATCH_CREATE_MAX_ITEMS: int = int(env_variables.BATCH_CREATE_MAX_ITEMS)
+    CLOUD_CONCURRENCY_LIMIT: int = int(env_variables.CLOUD_CONCURRENCY_LIMIT)
+
+    # Background job constants
+    JOB_LEASE_IN_SECS: int = int(env_variables.JOB_LEASE_IN_SECS)
+    JOB_POLL_INTERVAL_IN_MS: int = int(env_variables.JOB_POLL_INTERVAL_IN_MS)
+    JOB_RETRY_DELAY_IN_SECS: int = int(env_variables.JOB_RETRY_DELAY_IN_SECS)
+    JOB_RETENTION_IN_SECS: int = int(env_variables.JOB_RETENTION_IN_SECS)
+
+    # Status reconciliation constants
+    RECONCILE_TICK_IN_MS: int = int(env_variables.RECONCILE_TICK_IN_MS)
+    RECONCILE_MIN_INTERVAL_IN_SECS: float = float(env_variables.RECONCILE_MIN_INTERVAL_IN_SECS)
+    RECONCILE_MAX_INTERVAL_IN_SECS: float = float(env_variables.RECONCILE_MAX_INTERVAL_IN_SECS)
+    RECONCILE_BACKOFF_FACTOR: float = float(env_variables.RECONCILE_BACKOFF_FACTOR)
+
+    # Incremental sync constants
+    SYNC_FULL_INTERVAL_IN_SECS: int = int(env_variables.SYNC_FULL_INTERVAL_IN_SECS)
+    SYNC_WATERMARK_OVERLAP_IN_SECS: int = int(env_variables.SYNC_WATERMARK_OVERLAP_IN_SECS)
+
+    class JobType:
+        """Types of the background jobs, each has a handler registered with JobService.handler"""
+        CREATE_INSTANCE: str = 'create_instance'
+        CREATE_CLUSTER: str = 'create_cluster'
+
+    # Token validation constants
+    TOKEN_VALIDATION_MODE_LOCAL: str = 'local'
+    TOKEN_VALIDATION_MODE_INTROSPECT: str = 'introspect'
+    TOKEN_VALIDATION_MODE: str = env_variables.TOKEN_VALIDATION_MODE
+    KEYCLOAK_TOKEN_ISSUER: str = env_variables.KEYCLOAK_TOKEN_ISSUER or KEYCLOAK_BASE_URL
+    KEYCLOAK_ACCESS_TOKEN_TYPE: str = 'Bearer'
+    JWKS_REFRESH_INTERVAL_IN_SECS: int = int(env_variables.JWKS_REFRESH_INTERVAL_IN_SECS)
+    TOKEN_INTROSPECTION_CACHE_TTL_IN_SECS: int = int(env_variables.TOKEN_INTROSPECTION_CACHE_TTL_IN_SECS)
+    TOKEN_INTROSPECTION_CACHE_PREFIX: str = 'ccp:token:'
 
     # OpenStack constants
     OPENSTACK_MEMBER_ROLE_NAME: str = 'member'
     OPENSTACK_READER_ROLE_NAME: str = 'reader'
     OPENSTACK_OPENID_AUTH_URL = 'auth/OS-FEDERATION/identity_providers/keycloak-oidc-idp/protocols/openid/auth'
+    OPENSTACK_CONNECTION_CACHE_SIZE: int = int(env_variables.OPENSTACK_CONNECTION_CACHE_SIZE)
+    OPENSTACK_TOKEN_EXPIRY_MARGIN_IN_SECS: int = int(env_variables.OPENSTACK_TOKEN_EXPIRY_MARGIN_IN_SECS)
+
+    # Provider executor constants
+    PROVIDER_EXECUTOR_WORKERS_PER_CLOUD: int = int(env_variables.PROVIDER_EXECUTOR_WORKERS_PER_CLOUD)
+    PROVIDER_EXECUTOR_DEFAULT_POOL: str = 'default'
+
+    # Bulk mapper constants
+    MAPPER_PARALLEL_THRESHOLD: int = int(env_variables.MAPPER_PARALLEL_THRESHOLD)
+    MAPPER_CHUNK_SIZE: int = int(env_variables.MAPPER_CHUNK_SIZE)
+    MAPPER_PROCESS_POOL_WORKERS: int = int(env_variables.MAPPER_PROCESS_POOL_WORKERS)
 
     TIMESTAMP_FORMAT: str = "%Y-%m-%d %H:%M:%S"
     MAPPER_YAML_PATH = os.path.join('ccp_server', 'provider', 'openstack', 'mapper', 'clouds',
@@ -164,6 +222,24 @@ class Constants(object):
     REDIS_URL = env_variables.REDIS_URL
     REDIS_TTL_IN_MINS: int = int(env_variables.REDIS_TTL_IN_MINS)
     REDIS_TTL_IN_SECONDS: int = int(env_variables.REDIS_TTL_IN_MINS) * 60
+    CACHE_PREFIX: str = 'ccp:cache:'
+    CACHE_SERIALIZER: str = env_variables.CACHE_SERIALIZER
+    CACHE_LOCAL_TTL_IN_SECS: int = int(env_variables.CACHE_LOCAL_TTL_IN_SECS)
+    CACHE_LOCAL_SIZE: int = int(env_variables.CACHE_LOCAL_SIZE)
+    CACHE_VERSIONED_TTL_IN_SECS: int = int(env_variables.CACHE_VERSIONED_TTL_IN_SECS)
+    CACHE_VERSION_PREFIX: str = 'ccp:version:'
+    CACHE_MEMBERSHIP_NAMESPACE: str = 'KeycloakMembership'
+
+    class CacheScope:
+        GLOBAL: str = 'global'
+        ORG: str = 'org'
+        USER: str = 'user'
+
+    # Membership profile cache Constants
+    MEMBERSHIP_CACHE_PREFIX: str = 'ccp:membership:'
+    MEMBERSHIP_CACHE_TTL_IN_SECS: int = int(env_variables.MEMBERSHIP_CACHE_TTL_IN_SECS)
+    MEMBERSHIP_LOCAL_CACHE_TTL_IN_SECS: int = int(env_variables.MEMBERSHIP_LOCAL_CACHE_TTL_IN_SECS)
+    MEMBERSHIP_LOCAL_CACHE_SIZE: int = int(env_variables.MEMBERSHIP_LOCAL_CACHE_SIZE)
 
     # MongoDB Constants
     AUDIT_DOCUMENT_SIZE_PER_ROW: int = 700
@@ -177,5 +253,18 @@ class Constants(object):
     CAPPED_COLLECTION_MAX_NUM_ENTRIES: int = CAPPED_COLLECTION_MAX_SIZE_BYTES / \
         AUDIT_DOCUMENT_SIZE_PER_ROW
 
+    # Audit queue constants
+    AUDIT_QUEUE_SIZE: int = int(env_variables.AUDIT_QUEUE_SIZE)
+    AUDIT_BATCH_SIZE: int = int(env_variables.AUDIT_BATCH_SIZE)
+    AUDIT_FLUSH_INTERVAL_IN_MS: int = int(env_variables.AUDIT_FLUSH_INTERVAL_IN_MS)
+    AUDIT_SHUTDOWN_TIMEOUT_IN_SECS: int = int(env_variables.AUDIT_SHUTDOWN_TIMEOUT_IN_SECS)
+
+    # Logging constants
+    LOG_FILE_PATH: str = env_variables.LOG_FILE_PATH
+    LOG_FORMAT: str = env_variables.LOG_FORMAT.lower()
+    LOG_LEVEL: str = env_variables.LOG_LEVEL.upper()
+    LOG_QUEUE_SIZE: int = int(env_variables.LOG_QUEUE_SIZE)
+    SPANS_ENABLED: bool = str(env_variables.SPANS_ENABLED).lower() == 'true'
+
     # Tag Constants
     MAX_TAG_LENGTH: int = env_variables.MAX_TAG_LENGTH
@@ -7,6 +7,18 @@ class Status(int, Enum):
     DELETED = -1
 
 
+class BatchItemStatus(str, Enum):
+    CREATED = 'CREATED'
+    FAILED = 'FAILED'
+
+
+class JobStatus(str, Enum):
+    QUEUED = 'QUEUED'
+    RUNNING = 'RUNNING'
+    SUCCEEDED = 'SUCCEEDED'
+    FAILED = 'FAILED'
+
+
 class Disk_Config(str, Enum):
     MANUAL = 'MANUAL'
     AUTO = 'AUTO'
@@ -15,6 +15,39 @@ KEYCLOAK_ADMIN_PASSWORD = os.environ.get(
 KEYCLOAK_POST_VERIFICATION_LINK = os.environ.get(
     'KEYCLOAK_POST_VERIFICATION_LINK', 'http://192.168.100.127:30140/')
 INTERNAL_KEYCLOAK = os.environ.get('INTERNAL_KEYCLOAK', False)
+KEYCLOAK_TOKEN_REFRESH_MARGIN_IN_SECS = os.environ.get('KEYCLOAK_TOKEN_REFRESH_MARGIN_IN_SECS', 30)
+KEYCLOAK_HTTP_MAX_CONNECTIONS = os.environ.get('KEYCLOAK_HTTP_MAX_CONNECTIONS', 50)
+KEYCLOAK_HTTP_TIMEOUT_IN_SECS = os.environ.get('KEYCLOAK_HTTP_TIMEOUT_IN_SECS', 30)
+KEYCLOAK_CONCURRENCY_LIMIT = os.environ.get('KEYCLOAK_CONCURRENCY_LIMIT', 10)
+
+# Bulk creation, the resources of a batch request are created in the cloud at most CLOUD_CONCURRENCY_LIMIT at a time
+BATCH_CREATE_MAX_ITEMS = os.environ.get('BATCH_CREATE_MAX_ITEMS', 50)
+CLOUD_CONCURRENCY_LIMIT = os.environ.get('CLOUD_CONCURRENCY_LIMIT', 5)
+
+# Background jobs, a worker keeps the lease of its job while it runs and polls for jobs when it is idle
+JOB_LEASE_IN_SECS = os.environ.get('JOB_LEASE_IN_SECS', 60)
+JOB_POLL_INTERVAL_IN_MS = os.environ.get('JOB_POLL_INTERVAL_IN_MS', 1000)
+JOB_RETRY_DELAY_IN_SECS = os.environ.get('JOB_RETRY_DELAY_IN_SECS', 30)
+JOB_RETENTION_IN_SECS = os.environ.get('JOB_RETENTION_IN_SECS', 7 * 24 * 60 * 60)
+
+# Status reconciliation, the resources in a transitional state are refreshed from the cloud every
+# RECONCILE_MIN_INTERVAL_IN_SECS, backing off to RECONCILE_MAX_INTERVAL_IN_SECS while nothing changes
+RECONCILE_TICK_IN_MS = os.environ.get('RECONCILE_TICK_IN_MS', 1000)
+RECONCILE_MIN_INTERVAL_IN_SECS = os.environ.get('RECONCILE_MIN_INTERVAL_IN_SECS', 2)
+RECONCILE_MAX_INTERVAL_IN_SECS = os.environ.get('RECONCILE_MAX_INTERVAL_IN_SECS', 60)
+RECONCILE_BACKOFF_FACTOR = os.environ.get('RECONCILE_BACKOFF_FACTOR', 2)
+
+# Incremental sync, the syncer lists the resources changed since its watermark, moved back by the overlap for the
+# clock skew with the cloud, and lists everything again every SYNC_FULL_INTERVAL_IN_SECS to find the deletions
+SYNC_FULL_INTERVAL_IN_SECS = os.environ.get('SYNC_FULL_INTERVAL_IN_SECS', 6 * 60 * 60)
+SYNC_WATERMARK_OVERLAP_IN_SECS = os.environ.get('SYNC_WATERMARK_OVERLAP_IN_SECS', 60)
+
+# Token validation, 'local' verifies the JWT signature against the realm JWKS,
+# 'introspect' asks Keycloak for every token and caches the result in Redis
+TOKEN_VALIDATION_MODE = os.environ.get('TOKEN_VALIDATION_MODE', 'local')
+KEYCLOAK_TOKEN_ISSUER = os.environ.get('KEYCLOAK_TOKEN_ISSUER', None)
+JWKS_REFRESH_INTERVAL_IN_SECS = os.environ.get('JWKS_REFRESH_INTERVAL_IN_SECS', 300)
+TOKEN_INTROSPECTION_CACHE_TTL_IN_SECS = os.environ.get('TOKEN_INTROSPECTION_CACHE_TTL_IN_SECS', 60)
 
 # MongoDB imports
 MONGO_USERNAME = os.environ.get('MONGO_USERNAME', 'root')
@@ -23,6 +56,13 @@ MONGO_HOST = os.environ.get('MONGO_HOST', 'localhost')
 MONGO_PORT = os.environ.get('MONGO_PORT', '27017')
 MONGO_DB_URL = f'mongodb://{MONGO_USERNAME}:{MONGO_PASSWORD}@{MONGO_HOST}:{MONGO_PORT}'
 
+# Create the missing indexes of the CCP collections at startup
+MONGO_CREATE_INDEXES = os.environ.get('MONGO_CREATE_INDEXES', 'true')
+# Documents fetched per round trip by the streamed (application/x-ndjson) lists
+MONGO_STREAM_BATCH_SIZE = os.environ.get('MONGO_STREAM_BATCH_SIZE', 500)
+# Documents sent per insert_many or bulk_write call by MongoAPI.write_many and MongoAPI.upsert_many
+MONGO_BULK_BATCH_SIZE = os.environ.get('MONGO_BULK_BATCH_SIZE', 500)
+
 # For Configuring the mongodb database for Audit Trails
 AUDIT_DB_URL = MONGO_DB_URL
 
@@ -31,10 +71,37 @@ CAPPED_COLLECTION_MAX_SIZE = os.environ.get('CAPPED_COLLECTION_MAX_SIZE', '7M')
 
 # CAPPED_COLLECTION_MAX_COUNT = int(os.environ.get('CAPPED_COLLECTION_max_count', '10000'))
 
+# Audit logs are queued in memory and written in batches, the records beyond the queue size are dropped
+AUDIT_QUEUE_SIZE = os.environ.get('AUDIT_QUEUE_SIZE', 10000)
+AUDIT_BATCH_SIZE = os.environ.get('AUDIT_BATCH_SIZE', 500)
+AUDIT_FLUSH_INTERVAL_IN_MS = os.environ.get('AUDIT_FLUSH_INTERVAL_IN_MS', 200)
+AUDIT_SHUTDOWN_TIMEOUT_IN_SECS = os.environ.get('AUDIT_SHUTDOWN_TIMEOUT_IN_SECS', 10)
+
+# Logging, the format is 'text' or 'json' (one JSON object per line for the log shippers)
+LOG_FILE_PATH = os.environ.get('LOG_FILE_PATH', '/var/log/ccp.log')
+LOG_FORMAT = os.environ.get('LOG_FORMAT', 'text')
+# Level of the loggers, DEBUG also logs the entry and exit of every @log decorated function
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
+LOG_QUEUE_SIZE = os.environ.get('LOG_QUEUE_SIZE', 10000)
+# Call timings of the @log decorated functions, served on /metrics/spans
+SPANS_ENABLED = os.environ.get('SPANS_ENABLED', 'true')
+
 
 # Redis imports
 REDIS_URL = os.environ.get('REDIS_URL', "redis://:password@localhost:6379")
 REDIS_TTL_IN_MINS = os.environ.get('REDIS_TTL_IN_MINS', '30')
+# Function result cache, serializer is 'msgpack' or 'json'
+CACHE_SERIALIZER = os.environ.get('CACHE_SERIALIZER', 'msgpack')
+CACHE_LOCAL_TTL_IN_SECS = os.environ.get('CACHE_LOCAL_TTL_IN_SECS', 5)
+CACHE_LOCAL_SIZE = os.environ.get('CACHE_LOCAL_SIZE', 2048)
+# TTL of the cached functions invalidated by the version counters of their data
+CACHE_VERSIONED_TTL_IN_SECS = os.environ.get('CACHE_VERSIONED_TTL_IN_SECS', 21600)
+
+# Membership profile cache of the logged-in users, the in-process copy is kept only for a short time
+# because the other API server processes can not invalidate it
+MEMBERSHIP_CACHE_TTL_IN_SECS = os.environ.get('MEMBERSHIP_CACHE_TTL_IN_SECS', 300)
+MEMBERSHIP_LOCAL_CACHE_TTL_IN_SECS = os.environ.get('MEMBERSHIP_LOCAL_CACHE_TTL_IN_SECS', 15)
+MEMBERSHIP_LOCAL_CACHE_SIZE = os.environ.get('MEMBERSHIP_LOCAL_CACHE_SIZE', 1024)
 
 # Ceph imports
 CEPH_OBJECT_GATEWAY_PORT = os.environ.get('CEPH_CLUSTER_PORT', 8081)
@@ -51,6 +118,18 @@ CEPH_SECRET_ACCESS_KEY = os.environ.get(
     'CEPH_SECRET_ACCESS_KEY', 'mJiG8A6rLhcgHBmTQMLXDeMMAHaqEOfBDsMCdAVC')
 MAX_BUCKETS = os.environ.get('MAX_BUCKETS', 1000)
 
+# OpenStack connection cache
+OPENSTACK_CONNECTION_CACHE_SIZE = os.environ.get('OPENSTACK_CONNECTION_CACHE_SIZE', 128)
+OPENSTACK_TOKEN_EXPIRY_MARGIN_IN_SECS = os.environ.get('OPENSTACK_TOKEN_EXPIRY_MARGIN_IN_SECS', 120)
+
+# Number of threads per cloud used to run the blocking cloud SDK calls
+PROVIDER_EXECUTOR_WORKERS_PER_CLOUD = os.environ.get('PROVIDER_EXECUTOR_WORKERS_PER_CLOUD', 16)
+
+# Bulk mapper, lists bigger than the threshold are translated in chunks on a process pool
+MAPPER_PARALLEL_THRESHOLD = os.environ.get('MAPPER_PARALLEL_THRESHOLD', 5000)
+MAPPER_CHUNK_SIZE = os.environ.get('MAPPER_CHUNK_SIZE', 1000)
+MAPPER_PROCESS_POOL_WORKERS = os.environ.get('MAPPER_PROCESS_POOL_WORKERS', os.cpu_count() or 1)
+
 # Cluster
 CLUSTER_IMAGE = os.environ.get('CLUSTER_IMAGE', 'ubuntu_20.04')
 CLUSTER_FLAVOR = os.environ.get('CLUSTER_FLAVOR', 'm1.small')
@@ -4,18 +4,117 @@
 # Proprietary and confidential                                                #
 # Written by Manik Sidana <manik@coredge.io>, June 2021                       #
 ###############################################################################
+import atexit
+import inspect
+import json
 import logging
-import os
+import queue
+import threading
+import time
+from functools import wraps
 from logging import DEBUG
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
 from logging.handlers import RotatingFileHandler
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
 
 from ccp_server.util import ccp_context
+from ccp_server.util.constants import Constants
 
 # TODO: Fetch the project name from app during integration
 PROJECT = 'CCP_MIDDLEWARE'
 
-# log file will be stored inside the current .data folder, so the app can run in local without any setting
-LOG_FILE_PATH = '/var/log/ccp.log'
+TEXT_FORMAT = f'%(asctime)s %(process)d %(audit_id)s %(levelname)s {PROJECT} %(filename)s:%(lineno)d %(message)s'
+
+
+class AuditIdFilter(logging.Filter):
+    """Add the audit id of the current request to the records, it runs in the thread which logs
+    so the id is read before the record is queued."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, 'audit_id'):
+            record.audit_id = ccp_context.request_id() or ''
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, for the log shippers."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {'time': self.formatTime(record), 'process': record.process,
+                 'audit_id': getattr(record, 'audit_id', ''), 'level': record.levelname, 'project': PROJECT,
+                 'logger': record.name, 'file': record.filename, 'line': record.lineno,
+                 'message': record.getMessage()}
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler which drops the records when the queue is full instead of blocking the event loop."""
+
+    dropped: int = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            DroppingQueueHandler.dropped += 1
+
+
+class LoggingSetup:
+    """Logging is configured once per process: the loggers put the records on a queue and a listener
+    thread writes them to the console and the log file, so no file or console I/O happens on the event loop."""
+
+    _handler: Optional[QueueHandler] = None
+    _listener: Optional[QueueListener] = None
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def formatter(cls) -> logging.Formatter:
+        if Constants.LOG_FORMAT == 'json':
+            return JsonFormatter()
+        return logging.Formatter(TEXT_FORMAT)
+
+    @classmethod
+    def configure(cls) -> QueueHandler:
+        """Create the queue handler and start the listener, only the first call does it.
+        :return: the queue handler shared by the loggers"""
+        with cls._lock:
+            if cls._handler is not None:
+                return cls._handler
+
+            formatter = cls.formatter()
+            handlers = [logging.StreamHandler()]
+            try:
+                handlers.append(RotatingFileHandler(Constants.LOG_FILE_PATH, maxBytes=5 * 1024 * 1024,
+                                                    backupCount=10))
+            except OSError as e:
+                logging.getLogger(__name__).warning(f'Unable to log to {Constants.LOG_FILE_PATH}: {e}')
+            for handler in handlers:
+                handler.setFormatter(formatter)
+
+            records: queue.Queue = queue.Queue(Constants.LOG_QUEUE_SIZE)
+            handler = DroppingQueueHandler(records)
+            handler.addFilter(AuditIdFilter())
+            cls._listener = QueueListener(records, *handlers, respect_handler_level=True)
+            cls._listener.start()
+            cls._handler = handler
+            atexit.register(cls.shutdown)
+            return handler
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop the listener after it writes the queued records."""
+        with cls._lock:
+            if cls._listener is not None:
+                cls._listener.stop()
+                for handler in cls._listener.handlers:
+                    handler.close()
+                cls._listener = None
 
 
 class KGLogger:
@@ -25,40 +124,21 @@ class KGLogger:
     LOG.debug('My debug string')
     """
 
-    # TODO: Some of these parameters can be moved to a config file later
-    # TODO: Change log path
-    __LOG_FILE__ = os.environ.get("LOG_FILE_PATH", default=LOG_FILE_PATH)
-
-    def __init__(self, name, level=DEBUG):
+    def __init__(self, name, level=None):
         """
         Method to initialise KGLogger
         :param name: Logger name
-        :param level: Log level
+        :param level: Log level, defaults to LOG_LEVEL
         """
-        audit_id = ccp_context.request_id()
-        audit_id = audit_id if audit_id else ''
-        self.format = f'%(asctime)s %(process)d {audit_id} %(levelname)s {PROJECT} ' \
-                      f'%(filename)s:%(lineno)d %(message)s'
         self.name = name
-        self.level = level
+        self.level = level or Constants.LOG_LEVEL
         self.logger = logging.getLogger(self.name)
-        self.formatter = logging.Formatter(self.format)
-
-        # Remove existing handlers from the logger to prevent duplicates
-        for handler in self.logger.handlers:
-            self.logger.removeHandler(handler)
-
-        # Add a StreamHandler handler to send logs to the console
-        self.console_handler = logging.StreamHandler()
-        self.console_handler.setFormatter(self.formatter)
-        self.logger.addHandler(self.console_handler)
 
-        # Add a RotatingFileHandler to send logs to a file
-        self.file_handler = RotatingFileHandler(
-            self.__LOG_FILE__, maxBytes=5 * 1024 * 1024, backupCount=10
-        )
-        self.file_handler.setFormatter(self.formatter)
-        self.logger.addHandler(self.file_handler)
+        # Every logger shares the one queue handler, the records do not propagate to avoid duplicates
+        handler = LoggingSetup.configure()
+        if handler not in self.logger.handlers:
+            self.logger.addHandler(handler)
+        self.logger.propagate = False
 
         self.logger.setLevel(self.level)
         self.debug = self.logger.debug
@@ -68,37 +148,112 @@ class KGLogger:
         self.critical = self.logger.critical
 
 
-def configure_logger(level=DEBUG):
-    """ Configure the logger so that logger can have the request ID"""
-    LOG = KGLogger(name=__name__, level=level)
-    return LOG
+LOG = KGLogger(__name__)
 
 
-LOG = KGLogger(__name__)
+class Spans:
+    """Registry of the call timings of the @log decorated functions, by module and qualified name.
+    The totals are served as metrics and the subscribers get every finished call, e.g. to export
+    it to a tracer."""
+
+    enabled: bool = Constants.SPANS_ENABLED
+
+    # name -> [count, errors, total seconds, max seconds]
+    _stats: Dict[str, List[float]] = {}
+    _subscribers: List[Callable[[str, float, bool], None]] = []
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def record(cls, name: str, elapsed: float, error: bool) -> None:
+        with cls._lock:
+            stats = cls._stats.get(name)
+            if stats is None:
+                stats = cls._stats[name] = [0, 0, 0.0, 0.0]
+            stats[0] += 1
+            stats[1] += error
+            stats[2] += elapsed
+            if elapsed > stats[3]:
+                stats[3] = elapsed
+        for subscriber in cls._subscribers:
+            try:
+                subscriber(name, elapsed, error)
+            except Exception as e:
+                LOG.warn(f'Span subscriber {subscriber} failed: {e}')
+
+    @classmethod
+    def subscribe(cls, subscriber: Callable[[str, float, bool], None]) -> None:
+        """Call the subscriber with the name, wall time in seconds and error flag of every finished call."""
+        cls._subscribers.append(subscriber)
+
+    @classmethod
+    def metrics(cls) -> Dict[str, Dict[str, float]]:
+        """Get the call counters and timings of every function.
+        :return: Dict of function name and its count, errors, total_ms, avg_ms and max_ms"""
+        with cls._lock:
+            return {name: {'count': count, 'errors': errors, 'total_ms': round(total * 1000, 3),
+                           'avg_ms': round(total * 1000 / count, 3), 'max_ms': round(maximum * 1000, 3)}
+                    for name, (count, errors, total, maximum) in cls._stats.items()}
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._stats.clear()
 
 
 def log(func):
     """
-    Decorator to be added to a function which needs debug logging for entry/exit.
-    Developer to ensure that it's not causing circular dependencies wherever used.
+    Decorator to be added to a function which needs debug logging for entry/exit and its wall time
+    in the Spans registry. Coroutine functions are timed until they return, and nothing is formatted
+    when DEBUG is off. Developer to ensure that it's not causing circular dependencies wherever used.
     """
 
-    def inner(*args, **kwargs):
-        if not callable(func):
-            err = f"{func} is not callable."
-            raise Exception(err)
+    if not callable(func):
+        raise Exception(f"{func} is not callable.")
+
+    name = f'{func.__module__}.{func.__qualname__}'
+    logger = LOG.logger
 
-        # Log a message indicating that the function is being entered with the request ID
-        LOG.debug(
-            f"Entering into {func.__module__}.{func.__qualname__}")
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_inner(*args, **kwargs):
+            debug = logger.isEnabledFor(DEBUG)
+            if not debug and not Spans.enabled:
+                return await func(*args, **kwargs)
 
-        # Call the original function and capture its result
-        res = func(*args, **kwargs)
+            if debug:
+                logger.debug('Entering into %s', name)
+            start, error = time.perf_counter(), True
+            try:
+                res = await func(*args, **kwargs)
+                error = False
+                return res
+            finally:
+                elapsed = time.perf_counter() - start
+                if Spans.enabled:
+                    Spans.record(name, elapsed, error)
+                if debug:
+                    logger.debug('Exiting from %s in %.3f ms', name, elapsed * 1000)
 
-        # Log a message indicating that the function is being exited with the request ID
-        LOG.debug(
-            f"Exiting from {func.__module__}.{func.__qualname__}")
+        return async_inner
+
+    @wraps(func)
+    def inner(*args, **kwargs):
+        debug = logger.isEnabledFor(DEBUG)
+        if not debug and not Spans.enabled:
+            return func(*args, **kwargs)
 
-        return res
+        if debug:
+            logger.debug('Entering into %s', name)
+        start, error = time.perf_counter(), True
+        try:
+            res = func(*args, **kwargs)
+            error = False
+            return res
+        finally:
+            elapsed = time.perf_counter() - start
+            if Spans.enabled:
+                Spans.record(name, elapsed, error)
+            if debug:
+                logger.debug('Exiting from %s in %.3f ms', name, elapsed * 1000)
 
     return inner
@@ -19,11 +19,17 @@ class Message:
     PROJECT_NOT_VALID = 'The project is either invalid or deleted or not belongs to you.'
     DOCUMENT_WITH_UUID_NOT_FOUND = 'Document with UUID {} not found in the database.'
     NAME_ALREADY_EXISTS = 'An entry already exist in the database with the same name {}.'
+    NAME_REPEATED_IN_BATCH = 'The name {} is used by an earlier item of the batch.'
     UUID_ALREADY_EXISTS = 'An entry already exist in the database with the same UUID {}.'
     TOKEN_EMPTY = 'Your access token is empty.'
     USER_EXITS = 'User already exists with the same email id.'
     PROFILE_COMPLETED = 'Your Profile is already completed. Please login to perform any operation'
     DOCUMENT_LIST = 'The document should be in list.'
+    DOCUMENT_NOT_WRITTEN = 'The document was not written as an earlier document of the ordered write failed.'
+    JOB_TYPE_NOT_SUPPORTED = 'No handler is registered for the job type {}.'
+    JOB_LEASE_EXPIRED = 'The worker running the job stopped before it finished.'
+    UPSERT_KEY_MISSING = 'The document has no cloud or reference_id to upsert it by.'
+    INVALID_PAGE_TOKEN = 'The page token is invalid, start again from the first page.'
     VOLUME_ALREADY_ATTACHED = 'Volume ID {} is already attached to the instance ID {}'
     VOLUME_NOT_ATTACHED = 'Volume ID {} is not attached to the instance ID {}'
     TAG_MAX_LENGTH_EXCEEDED = 'Tag length cannot be more than {}'
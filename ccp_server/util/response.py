@@ -0,0 +1,112 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+from datetime import date
+from datetime import datetime
+from functools import wraps
+from typing import Any
+from typing import AsyncIterator
+from typing import Dict
+
+import orjson
+from bson import ObjectId
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+from fastapi.utils import is_body_allowed_for_status_code
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+from starlette.responses import Response
+from starlette.responses import StreamingResponse
+from starlette.routing import request_response
+
+from ccp_server.schema.v1.response_schemas import Page
+from ccp_server.util.constants import Constants
+
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def encode_default(obj: Any) -> Any:
+    """Encode the values orjson does not handle itself, the dates use Constants.TIMESTAMP_FORMAT."""
+    if isinstance(obj, datetime):
+        return obj.strftime(Constants.TIMESTAMP_FORMAT)
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, BaseModel):
+        return obj.dict(by_alias=True)
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, '__dict__'):
+        # Response objects like Page and IDResponse
+        return vars(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class CCPJSONResponse(JSONResponse):
+    """JSON response encoded by orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=encode_default, option=ORJSON_OPTIONS)
+
+
+class NDJSONResponse(StreamingResponse):
+    """Documents written one JSON object per line as they are read, the lines are sent in chunks of about
+    CHUNK_SIZE bytes so a large list is neither held in memory nor sent in many tiny writes."""
+
+    media_type = Constants.NDJSON_MEDIA_TYPE
+    CHUNK_SIZE: int = 64 * 1024
+
+    def __init__(self, documents: AsyncIterator[Dict], status_code: int = 200, headers: Dict[str, str] = None):
+        super().__init__(self.lines(documents), status_code=status_code, headers=headers,
+                         media_type=self.media_type)
+
+    @classmethod
+    async def lines(cls, documents: AsyncIterator[Dict]) -> AsyncIterator[bytes]:
+        chunk = bytearray()
+        async for doc in documents:
+            chunk += orjson.dumps(doc, default=encode_default, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+            if len(chunk) >= cls.CHUNK_SIZE:
+                yield bytes(chunk)
+                chunk.clear()
+        if chunk:
+            yield bytes(chunk)
+
+
+class CCPRoute(APIRoute):
+    """Route which returns the result of the endpoint as a CCPJSONResponse. Without a response model FastAPI would
+    first convert the whole result with jsonable_encoder, which costs more than the encoding itself."""
+
+    def __init__(self, path: str, endpoint, **kwargs) -> None:
+        super().__init__(path, endpoint, **kwargs)
+        status_code = self.status_code or 200
+        response_class = self.response_class.value if isinstance(self.response_class, DefaultPlaceholder) \
+            else self.response_class
+        if self.response_field is not None or not is_body_allowed_for_status_code(status_code) \
+                or not issubclass(response_class, JSONResponse):
+            return
+
+        call = self.dependant.call
+
+        def encode(result: Any) -> Response:
+            if isinstance(result, Response):
+                return result
+            if isinstance(result, Page) and hasattr(result.data, '__aiter__'):
+                # A streamed list, see Pageable.stream
+                return NDJSONResponse(result.data, status_code=status_code)
+            return CCPJSONResponse(result, status_code=status_code)
+
+        if asyncio.iscoroutinefunction(call):
+            @wraps(call)
+            async def encoded_call(**values):
+                return encode(await call(**values))
+        else:
+            @wraps(call)
+            def encoded_call(**values):
+                return encode(call(**values))
+
+        self.dependant.call = encoded_call
+        self.app = request_response(self.get_route_handler())
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import re
@@ -5,7 +6,10 @@ import uuid
 from datetime import datetime
 from datetime import timezone
 from typing import Any
+from typing import Awaitable
 from typing import Dict
+from typing import Iterable
+from typing import List
 from typing import Set
 
 import yaml
@@ -265,3 +269,19 @@ class Utils:
             return True
         except ValueError:
             return False
+
+    @staticmethod
+    async def gather_with_limit(awaitables: Iterable[Awaitable], limit: int) -> List[Any]:
+        """
+        This method is used to await the awaitables concurrently with at most limit of them running at a time.
+        :param awaitables: coroutines to be awaited.
+        :param limit: maximum number of concurrent awaitables.
+        :return: results in the order of the awaitables.
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def bounded(awaitable: Awaitable) -> Any:
+            async with semaphore:
+                return await awaitable
+
+        return await asyncio.gather(*[bounded(awaitable) for awaitable in awaitables])
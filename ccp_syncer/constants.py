@@ -2,9 +2,14 @@ from ccp_server.service.image import ImageService
 from ccp_server.util.constants import Constants
 
 
+# Name of the sync watermark of the heat syncer, the resources of all its collections are listed together
+HEAT_SYNC_WATERMARK = 'Stack'
+
+
 class Scheduler:
     Image = 1000
     Flavor = 500
+    Network = 300
     Heat = 1000
 
 
@@ -6,6 +6,7 @@
 ###############################################################################
 import logging
 import traceback
+from datetime import datetime
 
 log = logging.getLogger()
 logging.basicConfig(level=logging.INFO,
@@ -62,15 +63,35 @@ class StackResources:
             log.error(f"Error while getting cloud resource")
             log.error(traceback.print_exc())
 
-    def list_all_stack_resources(self):
+    @staticmethod
+    def is_changed(stack, changes_since):
+        """
+        This method is used to check if a stack was created or updated since a time
+        :param stack: Stack object
+        :param changes_since: UTC time, None to take every stack
+        :return: True if the resources of the stack have to be fetched
+        """
+        if changes_since is None:
+            return True
+        changed_at = stack.updated_at or stack.created_at
+        # Heat times look like 2023-03-01T10:00:00Z, a stack without a readable time is taken
+        try:
+            return datetime.strptime(changed_at[:19], '%Y-%m-%dT%H:%M:%S') >= changes_since
+        except (TypeError, ValueError):
+            return True
+
+    def list_all_stack_resources(self, changes_since=None):
         """
         This method is used to list all the stack resources
-        :return: Returns a list of all the stack resources
+        :param changes_since: UTC time, only the resources of the stacks created or updated since are listed
+        :return: Returns a list of all the stack resources, None on error
         """
         try:
             total_stack_resources = []
             stacks = self.conn.list_stacks()
             for stack in stacks:
+                if not self.is_changed(stack, changes_since):
+                    continue
                 stack_id = stack.id
                 resources = self.conn.orchestration.resources(stack)
                 for resource in resources:
@@ -4,14 +4,18 @@
 # Proprietary and confidential                                                #
 # Written by Pankaj Khanwani <pankaj@coredge.io>, Feb 2023                    #
 ###############################################################################
+from datetime import datetime
+
 import openstack
 
+from ccp_server.db.mongo import MongoAPI
 from ccp_server.util import ccp_context
 from ccp_server.util import env_variables
 from ccp_server.util import utils
 from ccp_server.util.constants import Constants
 from ccp_server.util.logger import KGLogger
 from ccp_server.util.resource_collection_map import openstack_map
+from ccp_syncer.constants import HEAT_SYNC_WATERMARK
 from ccp_syncer.heatstack_resources import StackResources
 from ccp_syncer.syncer_util import SyncerService
 
@@ -22,7 +26,10 @@ async def heat_sync_and_add_in_db(resource_collection_map: dict, cloud_conn: obj
                                   db_conn_str: str, db_name: str,
                                   cloud: str = None, source: str = None):
     """
-    This method is used to synchronize the stack resources with the mongo db
+    This method is used to synchronize the stack resources with the mongo db.
+    Only the resources of the stacks created or updated since the heat watermark of the cloud are fetched, all of
+    them are fetched when a full sync is due to find the deleted ones. The watermark moves only when the sync
+    succeeds.
     :param resource_collection_map: A Resource Collection Map should have the format below:
                                     {'Flavor': ['Flavor', 'get_flavor'],
                                     'Image': ['Image', 'get_image'],
@@ -39,19 +46,30 @@ async def heat_sync_and_add_in_db(resource_collection_map: dict, cloud_conn: obj
     :return: None
     """
     resource_collection_map = resource_collection_map
+    s = SyncerService(db_conn_str, db_name)
+    started_at = datetime.utcnow()
+    changes_since = await s.get_changes_since(cloud, HEAT_SYNC_WATERMARK, started_at)
+    LOG.info(f"Syncing the stack resources of {cloud} "
+             f"{f'changed since {changes_since}' if changes_since else 'in full'}")
     r = StackResources(cloud_conn, resource_collection_map)
-    stack_resources = r.list_all_stack_resources()
+    stack_resources = r.list_all_stack_resources(changes_since=changes_since)
+    if stack_resources is None:
+        return
     r.fetch_detailed_resource_to_dict_of_dict(stack_resources=stack_resources)
-    s = SyncerService(db_conn_str, db_name)
+    synced = True
     for resource in resource_collection_map:
         collection = resource_collection_map[resource][0]
         new_created_cloud_data = await s.syncer(collection_name=collection,
                                                 cloud_data=r.resource_details.get(
-                                                    collection),
-                                                cloud=cloud, source=source)
-        if new_created_cloud_data:
-            await s.add_in_db(cloud_data=new_created_cloud_data, source=source, collection_name=collection,
-                              unmapped=True)
+                                                    collection) or {},
+                                                cloud=cloud, source=source, partial=changes_since is not None)
+        if new_created_cloud_data is None:
+            synced = False
+        elif new_created_cloud_data:
+            synced = await s.add_in_db(cloud_data=new_created_cloud_data, source=source, collection_name=collection,
+                                       unmapped=True) and synced
+    if synced:
+        await s.save_watermark(cloud, HEAT_SYNC_WATERMARK, started_at, full=changes_since is None)
 
 
 async def heatsyncer():
@@ -78,24 +96,15 @@ async def heatsyncer():
                                           db_conn_str=env_variables.MONGO_DB_URL, db_name=Constants.MONGO_DB_NAME)
 
 
+async def main() -> None:
+    """Sync the stacks of all the clouds in one event loop, the shared motor clients are bound to it."""
+    try:
+        await heatsyncer()
+    finally:
+        MongoAPI.close_clients()
+
+
 if __name__ == '__main__':
     import asyncio
 
-    database_conn = env_variables.MONGO_DB_URL
-    clouds = utils.Utils.load_supported_cloud_details()
-    for cloud in clouds:
-        ccp_context.set_request_data('cloud-id', cloud)
-        if clouds[cloud]['type'] == "openstack":
-            cloud_dict = clouds[cloud]
-            conn = openstack.connection.Connection(
-                auth_url=cloud_dict.get('auth_url'),
-                username=cloud_dict.get('username'),
-                password=cloud_dict.get('password'),
-                project_name=cloud_dict.get('project_name'),
-                project_domain_id=cloud_dict.get('project_domain_id'),
-                user_domain_id=cloud_dict.get('user_domain_id'),
-                region_name=cloud_dict.get('region_name'),
-            )
-            resource_collection_map = openstack_map
-        asyncio.run(heat_sync_and_add_in_db(resource_collection_map, cloud=cloud, source='stack', cloud_conn=conn,
-                                            db_conn_str=env_variables.MONGO_DB_URL, db_name=Constants.MONGO_DB_NAME))
+    asyncio.run(main())
@@ -5,13 +5,17 @@
 # # Written by Pankaj Khanwani <pankaj@coredge.io>, Feb 2023                    #
 # ###############################################################################
 import asyncio
+import inspect
+from datetime import datetime
 
+from ccp_server.db.mongo import MongoAPI
 from ccp_server.service.networks.network import NetworkService
 from ccp_server.util import ccp_context
 from ccp_server.util import env_variables
 from ccp_server.util import utils
 from ccp_server.util.constants import Constants
 from ccp_server.util.logger import KGLogger
+from ccp_syncer.constants import Scheduler
 from ccp_syncer.syncer_util import SyncerService
 
 LOG = KGLogger(__name__)
@@ -27,52 +31,85 @@ class SyncResources:
         This function is used to initialize the SyncResources class
         func_map:-  func_map includes the mapping of the class and its function to be executed
                     The key of the map is the collection name and the value is a list, on which
-                    0 index represents the service module classes and the 1 index represents
-                    the function to be executed.
+                    0 index represents the service module classes, the 1 index represents
+                    the function to be executed and the 2 index represents the sync interval in seconds.
+                    A function with a changes_since argument is used for the incremental sync.
         """
         self.method = None
         self.__func_map__ = {Constants.MongoCollection.NETWORK: [
-            NetworkService, 'list_networks']}
+            NetworkService, 'list_all_networks', Scheduler.Network]}
 
-    async def list_resources(self, class_name, method_name):
+    async def list_resources(self, class_name, method_name, changes_since: datetime = None):
         """
         This function is used to list the resources
         :param class_name: Class name of the resource
         :param method_name: Method name of the resource
-        :return: List of resources
+        :param changes_since: List only the resources changed since this UTC time
+        :return: List of resources, None on error
         """
         try:
             class_obj = class_name()
             if hasattr(class_obj, method_name):
                 self.method = getattr(class_obj, method_name)
-                return await self.method(use_db=False)
+                kwargs = {'changes_since': changes_since} if changes_since else {}
+                resources = await self.method(use_db=False, **kwargs)
+                # The services return the cloud resources with their count
+                return resources[0] if isinstance(resources, tuple) else resources
             else:
                 LOG.error(f"{class_name} does not have {method_name} method")
         except Exception as e:
             LOG.error(f"Exception occurred while listing resources: {e}")
 
+    @staticmethod
+    def supports_changes_since(class_name, method_name) -> bool:
+        """
+        This function is used to check if the list method can list only the changed resources
+        :param class_name: Class name of the resource
+        :param method_name: Method name of the resource
+        :return: True if the method has a changes_since argument
+        """
+        method = getattr(class_name, method_name, None)
+        return method is not None and 'changes_since' in inspect.signature(method).parameters
+
     async def sync_resources(self, collection_name, class_name, method_name, cloud: str = None):
         """
-        This function is used to sync the resources
+        This function is used to sync the resources. Only the resources changed since the watermark of the
+        (cloud, collection) are listed, every resource is listed when a full sync is due to find the deleted ones.
+        The watermark moves only when the sync succeeds.
         :param collection_name: Name of the collection
         :param class_name: Class name of the resource
         :param method_name: Method name of the resource
         :param cloud: Cloud name
         :return: None
         """
-        ccp_context.set_request_data('cloud-id', cloud)
-        resources = await self.list_resources(class_name, method_name)
+        ccp_context.set_service_context(cloud)
+        started_at = datetime.utcnow()
         syncer_obj = SyncerService(
             conn_str=env_variables.MONGO_DB_URL, db=Constants.MONGO_DB_NAME)
-        await syncer_obj.sync_and_add_in_db(collection_name=collection_name,
-                                            cloud_data=resources, cloud=cloud)
+        changes_since = None
+        if self.supports_changes_since(class_name, method_name):
+            changes_since = await syncer_obj.get_changes_since(cloud, collection_name, started_at)
+        LOG.info(f"Syncing {collection_name} of {cloud} "
+                 f"{f'changed since {changes_since}' if changes_since else 'in full'}")
+        resources = await self.list_resources(class_name, method_name, changes_since)
+        if resources is None:
+            return
+        if await syncer_obj.sync_and_add_in_db(collection_name=collection_name, cloud_data=resources, cloud=cloud,
+                                               partial=changes_since is not None):
+            await syncer_obj.save_watermark(cloud, collection_name, started_at, full=changes_since is None)
 
 
-if __name__ == "__main__":
+async def main() -> None:
+    """Sync the resources of all the clouds in one event loop, the shared motor clients are bound to it."""
     sync = SyncResources()
-    all_clouds = utils.Utils.load_supported_cloud_details()
-    for cloud in all_clouds:
-        ccp_context.set_request_data('cloud-id', cloud)
-        for collection_name in sync.__func_map__:
-            asyncio.run(sync.sync_resources(collection_name, sync.__func_map__[collection_name][0],
-                                            sync.__func_map__[collection_name][1], cloud=cloud))
+    try:
+        for cloud in utils.Utils.load_supported_cloud_details():
+            for collection_name in sync.__func_map__:
+                await sync.sync_resources(collection_name, sync.__func_map__[collection_name][0],
+                                          sync.__func_map__[collection_name][1], cloud=cloud)
+    finally:
+        MongoAPI.close_clients()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
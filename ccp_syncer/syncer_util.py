@@ -8,11 +8,14 @@ import logging
 import traceback
 import uuid
 from datetime import datetime
+from datetime import timedelta
+from typing import Optional
 
-import motor.motor_asyncio
 import pymongo
 
-from ccp_server.provider.openstack.mapper.mapper import mapper
+from ccp_server.db.mongo import MongoAPI
+from ccp_server.provider.openstack.mapper.mapper import mapper_stream
+from ccp_server.util.constants import Constants as CCPConstants
 
 log = logging.getLogger()
 logging.basicConfig(level=logging.INFO,
@@ -31,7 +34,6 @@ class SyncerService:
         ACTIVE = 1
         INACTIVE = 0
         DELETED = -1
-        BATCH_SIZE = 100
 
     def __init__(self, conn_str, db):
         """
@@ -40,8 +42,9 @@ class SyncerService:
         :param db: Name of the mongo db
         """
         self.conn_str = conn_str
-        self.client = motor.motor_asyncio.AsyncIOMotorClient(self.conn_str)
-        self.db = self.client[db]
+        self.mongo = MongoAPI(conn_str, db)
+        self.client = self.mongo.client
+        self.db = self.mongo.db
         self.collection_obj = None
 
     async def add_in_db(self, cloud_data, collection_name, source=None, source_id=None,
@@ -54,58 +57,79 @@ class SyncerService:
         :param source_id: Id of the source of the cloud data
         :param cloud: Cloud name
         :param unmapped: True if the cloud data is unmapped else False
-        :return: None
+        :return: True if every resource was added
         """
         # Todo: Org Id and created by needs to be Implemented
         try:
             if not cloud_data:
-                return cloud_data
-            new_data = []
-            for key in cloud_data:
-                document_dict = {'uuid': str(uuid.uuid4())}
-                if unmapped:
-                    map_obj = await mapper(data=cloud_data[key], resource_name=collection_name,
-                                           cloud=cloud)
-                    document_dict.update(dict(map_obj.data))
-                else:
-                    document_dict.update(dict(cloud_data[key]))
-
-                if 'source_id' in document_dict:
-                    source_id = document_dict['source_id']
-                document_dict['source'] = source
-                document_dict['source_id'] = source_id
-                new_data.append(document_dict)
-
-            for i in range(0, len(new_data), SyncerService.Constants.BATCH_SIZE):
-                batch = new_data[i:i + SyncerService.Constants.BATCH_SIZE]
-                try:
-                    await self.collection_obj.insert_many(batch)
-                except Exception as e:
-                    log.error(
-                        f"Error while inserting into mongo db of batch {i} due to {e}")
-                    log.error(traceback.print_exc())
-                log.info(f"Inserted {len(batch)} documents")
+                return True
+            if unmapped:
+                """Translate chunk by chunk, big lists are mapped on the mapper process pool while the
+                   translated chunks are inserted"""
+                chunks = mapper_stream(data=list(cloud_data.values()), resource_name=collection_name,
+                                       cloud=cloud)
+            else:
+                chunks = self.chunks(list(cloud_data.values()))
+            inserted, failed = 0, False
+            async for resources in chunks:
+                new_data = []
+                for resource in resources:
+                    document_dict = {'uuid': str(uuid.uuid4())}
+                    document_dict.update(dict(resource))
+
+                    if 'source_id' in document_dict:
+                        source_id = document_dict['source_id']
+                    document_dict['source'] = source
+                    document_dict['source_id'] = source_id
+                    new_data.append(document_dict)
+
+                """Inserting the new resources in batches, a failed document does not stop the others"""
+                result = await self.mongo.write_many(collection_name, new_data)
+                for error in result.errors:
+                    log.error(f"Error while inserting {error['uuid']} of batch {error['batch']} into mongo db "
+                              f"due to {error['message']}")
+                inserted += result.inserted
+                failed = failed or bool(result.errors)
+            log.info(f"Inserted {inserted} documents")
+            return not failed
 
         except Exception as e:
             log.error(f"Error while adding in db due to {e}")
             log.error(traceback.print_exc())
+            return False
 
-    async def syncer(self, collection_name, cloud_data, cloud=None, source=None):
+    @staticmethod
+    async def chunks(resources):
+        """
+        This method is used to split the mapped resources in chunks of MAPPER_CHUNK_SIZE, like mapper_stream
+        :param resources: List of the resources
+        :return: async iterator of the chunks
+        """
+        size = CCPConstants.MAPPER_CHUNK_SIZE
+        for start in range(0, len(resources), size):
+            yield resources[start:start + size]
+
+    async def syncer(self, collection_name, cloud_data, cloud=None, source=None, partial=False):
         """
         This method is used to synchronize the stack resources with the mongo db
         :param collection_name: Name of the collection
         :param cloud_data: Cloud data
         :param cloud: Cloud name
         :param source: Source of the cloud data whether it is created by stack or any other source
-        :return: None
+        :param partial: True if the cloud data has only the changed resources, then only their documents are
+                        compared and the missing resources are not marked as deleted
+        :return: Cloud data which is not in the db, None on error
         """
         try:
             log.info(f"Syncer started for collection {collection_name}")
             self.collection_obj = self.db[collection_name]
-            cursor = self.collection_obj.find({'active': 1,
-                                               'cloud': cloud,
-                                               'source': source})
-            update_requests = []
+            filter_query = {'active': 1, 'cloud': cloud, 'source': source}
+            if partial:
+                if not cloud_data:
+                    return {}
+                filter_query['reference_id'] = {'$in': list(cloud_data)}
+            cursor = self.collection_obj.find(filter_query)
+            update_requests, update_uuids, org_ids = [], [], set()
             async for document in cursor:
                 resource_id = document['reference_id']
                 if resource_id in cloud_data:
@@ -124,6 +148,8 @@ class SyncerService:
                         update_dict = {"$set": cloud_data[resource_id]}
                         update_requests.append(pymongo.UpdateOne(
                             filter_query, update_dict, upsert=False))
+                        update_uuids.append(document['uuid'])
+                        org_ids.add(document.get('org_id'))
 
                     """Removing the existing data from cloud"""
                     cloud_data.pop(resource_id)
@@ -139,12 +165,18 @@ class SyncerService:
                     update_dict = {"$set": document}
                     update_requests.append(pymongo.UpdateOne(
                         filter_query, update_dict, upsert=False))
+                    update_uuids.append(document['uuid'])
+                    org_ids.add(document.get('org_id'))
 
-            """Updating all the update object at once in mongo db"""
+            """Updating in unordered batches, a failed document does not stop the others"""
             if update_requests:
-                result = await self.collection_obj.bulk_write(update_requests)
-                if result.modified_count:
-                    log.info(f"Updated {result.modified_count} documents")
+                result = await self.mongo.bulk_write(collection_name, update_requests, update_uuids,
+                                                     org_ids=org_ids)
+                for error in result.errors:
+                    log.error(f"Error while updating {error['uuid']} of batch {error['batch']} in mongo db "
+                              f"due to {error['message']}")
+                if result.modified:
+                    log.info(f"Updated {result.modified} documents")
             log.info(
                 f"These are the new resources created in Cloud: {cloud_data}")
 
@@ -172,7 +204,7 @@ class SyncerService:
             log.error(traceback.print_exc())
 
     async def sync_and_add_in_db(self, collection_name, cloud_data, cloud=None, source=None,
-                                 source_id=None, unmapped=False):
+                                 source_id=None, unmapped=False, partial=False):
         """
         This method is used to synchronize the cloud resources with the mongo db
         :param collection_name: Name of the collection
@@ -181,22 +213,61 @@ class SyncerService:
         :param source: Source of the cloud data whether it is created by stack or any other source
         :param source_id: Id of the source of the cloud data
         :param unmapped: True if the cloud data is unmapped else False
-        :return: None
+        :param partial: True if the cloud data has only the changed resources
+        :return: True if the sync succeeded
         """
+        new_resources_cloud = None
         try:
             if isinstance(cloud_data, list):
                 cloud_data = await self.convert_to_dict_of_dict(cloud_data)
             new_resources_cloud = await self.syncer(collection_name=collection_name,
                                                     cloud_data=cloud_data,
                                                     cloud=cloud,
-                                                    source=source)
+                                                    source=source,
+                                                    partial=partial)
         except Exception as e:
             log.error(f"Error while syncing due to {e}")
             log.error(traceback.print_exc())
+        if new_resources_cloud is None:
+            return False
 
         try:
-            await self.add_in_db(cloud_data=new_resources_cloud, collection_name=collection_name,
-                                 source=source, source_id=source_id, cloud=cloud, unmapped=unmapped)
+            return await self.add_in_db(cloud_data=new_resources_cloud, collection_name=collection_name,
+                                        source=source, source_id=source_id, cloud=cloud, unmapped=unmapped)
         except Exception as e:
             log.error(f"Error while adding in DB due to {e}")
             log.error(traceback.print_exc())
+            return False
+
+    async def get_changes_since(self, cloud, collection_name, now) -> Optional[datetime]:
+        """
+        This method is used to get the time from which the changed resources are listed
+        :param cloud: Cloud name
+        :param collection_name: Name of the collection, or of the group of collections synced together
+        :param now: UTC start time of the sync
+        :return: Watermark of the last sync moved back by SYNC_WATERMARK_OVERLAP_IN_SECS, None if a full sync
+                 is due because there was none in the last SYNC_FULL_INTERVAL_IN_SECS
+        """
+        watermark = await self.db[CCPConstants.MongoCollection.SYNC_WATERMARK].find_one(
+            {'cloud': cloud, 'collection': collection_name})
+        if not watermark or not watermark.get('full_sync_at') or \
+                watermark['full_sync_at'] <= now - timedelta(seconds=CCPConstants.SYNC_FULL_INTERVAL_IN_SECS):
+            return None
+        return watermark['watermark'] - timedelta(seconds=CCPConstants.SYNC_WATERMARK_OVERLAP_IN_SECS)
+
+    async def save_watermark(self, cloud, collection_name, started_at, full=False):
+        """
+        This method is used to save the watermark after a successful sync
+        :param cloud: Cloud name
+        :param collection_name: Name of the collection, or of the group of collections synced together
+        :param started_at: UTC start time of the sync, the changes made while it ran are listed again
+        :param full: True if every resource was listed
+        :return: None
+        """
+        update_dict = {'watermark': started_at, 'updated_at': datetime.utcnow()}
+        if full:
+            update_dict['full_sync_at'] = started_at
+        await self.db[CCPConstants.MongoCollection.SYNC_WATERMARK].update_one(
+            {'cloud': cloud, 'collection': collection_name}, {'$set': update_dict}, upsert=True)
+        log.info(f"Saved the {'full' if full else 'incremental'} sync watermark {started_at} of {collection_name} "
+                 f"for {cloud}")
@@ -5,6 +5,7 @@
 # Written by Rajkumar Srinivasan <rajkumarsrinivasan@coredge.io>, Apr 2023    #
 ###############################################################################
 import os
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ccp_server.api.v1.clusters.cluster import ClusterService
@@ -13,7 +14,7 @@ from tests.test_base import TestBase
 
 class TestCluster(TestBase):
 
-    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.create_cluster')
+    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.create_cluster', new_callable=MagicMock)
     def test_create_cluster(self, cluster_mock):
         """Test the call flow for ClusterService.create_cluster()."""
 
@@ -27,7 +28,7 @@ class TestCluster(TestBase):
         assert response is not None
         cluster_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.create_cluster')
+    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.create_cluster', new_callable=MagicMock)
     def test_create_cluster_response(self, cluster_mock):
         """Test the response for ClusterService.create_cluster()."""
 
@@ -45,7 +46,7 @@ class TestCluster(TestBase):
         self.assertDictEqual(cluster_response, response.json())
         cluster_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.delete_cluster')
+    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.delete_cluster', new_callable=MagicMock)
     def test_delete_cluster(self, cluster_mock):
         """Test the call flow for ClusterService.delete_cluster()."""
 
@@ -59,7 +60,7 @@ class TestCluster(TestBase):
         assert response is not None
         cluster_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.get_cluster')
+    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.get_cluster', new_callable=MagicMock)
     def test_get_cluster(self, cluster_mock):
         """Test the call flow for ClusterService.get_cluster()."""
 
@@ -73,7 +74,7 @@ class TestCluster(TestBase):
         assert response is not None
         cluster_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.get_cluster')
+    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.get_cluster', new_callable=MagicMock)
     def test_get_cluster_response(self, cluster_mock):
         """Test the cluster response for ClusterService.get_cluster()."""
 
@@ -96,7 +97,7 @@ class TestCluster(TestBase):
         self.assertListEqual(cluster_keys, list(response.json().keys()))
         cluster_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.list_clusters_by_project')
+    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.list_clusters_by_project', new_callable=MagicMock)
     def test_list_cluster_by_project(self, cluster_mock):
         """Test the call flow for ClusterService.list_clusters_by_project()."""
 
@@ -110,7 +111,7 @@ class TestCluster(TestBase):
         assert response is not None
         cluster_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.list_clusters_by_project')
+    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.list_clusters_by_project', new_callable=MagicMock)
     def test_list_clusters_by_project_response(self, cluster_mock):
         """Test the response for ClusterService.list_clusters_by_project()."""
 
@@ -128,7 +129,7 @@ class TestCluster(TestBase):
         self.assertListEqual(clusters, response.json())
         cluster_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.list_all_clusters')
+    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.list_all_clusters', new_callable=MagicMock)
     def test_list_all_clusters(self, cluster_mock):
         """Test the call flow for ClusterService.list_all_clusters()."""
 
@@ -142,7 +143,7 @@ class TestCluster(TestBase):
         assert response is not None
         cluster_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.list_all_clusters')
+    @patch('ccp_server.api.v1.clusters.cluster.ClusterService.list_all_clusters', new_callable=MagicMock)
     def test_list_all_clusters_response(self, cluster_mock):
         """Test the response for ClusterService.list_all_clusters()."""
 
@@ -5,6 +5,7 @@
 # Written by Rajkumar Srinivasan <rajkumarsrinivasan@coredge.io>, Apr 2023    #
 ###############################################################################
 import os
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ccp_server.api.v1.clusters.cluster_template import ClusterTemplateService
@@ -13,7 +14,8 @@ from tests.test_base import TestBase
 
 class TestClusterTemplate(TestBase):
 
-    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.create_cluster_template')
+    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.create_cluster_template',
+           new_callable=MagicMock)
     def test_create_cluster_template(self, cluster_template_mock):
         """Test the call flow for ClusterTemplateService.create_cluster_template()."""
 
@@ -27,7 +29,8 @@ class TestClusterTemplate(TestBase):
         assert response is not None
         cluster_template_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.create_cluster_template')
+    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.create_cluster_template',
+           new_callable=MagicMock)
     def test_create_cluster_template_response(self, cluster_template_mock):
         """Test the response for ClusterTemplateService.create_cluster_template()."""
 
@@ -45,7 +48,8 @@ class TestClusterTemplate(TestBase):
         self.assertDictEqual(cluster_template_response, response.json())
         cluster_template_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.delete_cluster_template')
+    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.delete_cluster_template',
+           new_callable=MagicMock)
     def test_delete_cluster_template(self, cluster_template_mock):
         """Test the call flow for ClusterTemplateService.delete_cluster_template()."""
 
@@ -60,7 +64,8 @@ class TestClusterTemplate(TestBase):
         assert response is not None
         cluster_template_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.get_cluster_template')
+    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.get_cluster_template',
+           new_callable=MagicMock)
     def test_get_cluster_template(self, cluster_template_mock):
         """Test the call flow for ClusterTemplateService.get_cluster_template()."""
 
@@ -75,7 +80,8 @@ class TestClusterTemplate(TestBase):
         assert response is not None
         cluster_template_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.get_cluster_template')
+    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.get_cluster_template',
+           new_callable=MagicMock)
     def test_get_cluster_template_response(self, cluster_template_mock):
         """Test the cluster template response for ClusterTemplateService.get_cluster_template()."""
 
@@ -102,7 +108,8 @@ class TestClusterTemplate(TestBase):
                              list(response.json().keys()))
         cluster_template_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.list_cluster_templates_by_project')
+    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.list_cluster_templates_by_project',
+           new_callable=MagicMock)
     def test_list_cluster_template_by_project(self, cluster_template_mock):
         """Test the call flow for ClusterTemplateService.list_cluster_templates_by_project()."""
 
@@ -116,7 +123,8 @@ class TestClusterTemplate(TestBase):
         assert response is not None
         cluster_template_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.list_cluster_templates_by_project')
+    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.list_cluster_templates_by_project',
+           new_callable=MagicMock)
     def test_list_cluster_templates_by_project_response(self, cluster_template_mock):
         """Test the response for ClusterTemplateService.list_cluster_templates_by_project()."""
 
@@ -134,7 +142,8 @@ class TestClusterTemplate(TestBase):
         self.assertListEqual(cluster_templates, response.json())
         cluster_template_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.list_all_cluster_templates')
+    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.list_all_cluster_templates',
+           new_callable=MagicMock)
     def test_list_all_cluster_templates(self, cluster_template_mock):
         """Test the call flow for ClusterTemplateService.list_all_cluster_templates()."""
 
@@ -148,7 +157,8 @@ class TestClusterTemplate(TestBase):
         assert response is not None
         cluster_template_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.list_all_cluster_templates')
+    @patch('ccp_server.api.v1.clusters.cluster_template.ClusterTemplateService.list_all_cluster_templates',
+           new_callable=MagicMock)
     def test_list_all_cluster_templates_response(self, cluster_template_mock):
         """Test the response for ClusterTemplateService.list_all_cluster_templates()."""
 
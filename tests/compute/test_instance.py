@@ -5,6 +5,7 @@
 # Written by Rajkumar Srinivasan <rajkumarsrinivasan@coredge.io>, Mar 2023    #
 ###############################################################################
 import os
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ccp_server.api.v1.compute.instance import InstanceService
@@ -15,7 +16,7 @@ from tests.test_base import TestBase
 class TestInstance(TestBase):
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.compute.instance.InstanceService.list_all_instances')
+    @patch('ccp_server.api.v1.compute.instance.InstanceService.list_all_instances', new_callable=MagicMock)
     def test_list_all_instances(self, instance_mock, kc_mock):
         """Test the call flow for InstanceService.list_all_instances()."""
 
@@ -30,7 +31,7 @@ class TestInstance(TestBase):
         instance_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.compute.instance.InstanceService.list_all_instances')
+    @patch('ccp_server.api.v1.compute.instance.InstanceService.list_all_instances', new_callable=MagicMock)
     def test_list_all_instances_response(self, instance_mock, kc_mock):
         """Test the response for InstanceService.list_all_instances()."""
 
@@ -48,7 +49,7 @@ class TestInstance(TestBase):
         instance_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.compute.instance.InstanceService.list_instances_by_project_id')
+    @patch('ccp_server.api.v1.compute.instance.InstanceService.list_instances_by_project_id', new_callable=MagicMock)
     def test_list_instances_by_project_id(self, instance_mock, kc_mock):
         """Test the call flow for InstanceService.list_instances_by_project_id()."""
 
@@ -63,7 +64,7 @@ class TestInstance(TestBase):
         instance_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.compute.instance.InstanceService.list_instances_by_project_id')
+    @patch('ccp_server.api.v1.compute.instance.InstanceService.list_instances_by_project_id', new_callable=MagicMock)
     def test_list_instances_response(self, instance_mock, kc_mock):
         """Test the response for InstanceService.list_instances_by_project_id()."""
 
@@ -81,7 +82,7 @@ class TestInstance(TestBase):
         instance_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.compute.instance.InstanceService.delete_instance')
+    @patch('ccp_server.api.v1.compute.instance.InstanceService.delete_instance', new_callable=MagicMock)
     def test_delete_instance(self, instance_mock, kc_mock):
         """Test the call flow for InstanceService.delete_instance()."""
 
@@ -96,7 +97,7 @@ class TestInstance(TestBase):
         instance_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.compute.instance.InstanceService.create_instance')
+    @patch('ccp_server.api.v1.compute.instance.InstanceService.create_instance', new_callable=MagicMock)
     def test_create_instance(self, instance_mock, kc_mock):
         """Test the call flow for InstanceService.create_instance()."""
         self.skipTest("Instance creation response failed to store in database")
@@ -112,7 +113,7 @@ class TestInstance(TestBase):
         instance_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.compute.instance.InstanceService.create_instance')
+    @patch('ccp_server.api.v1.compute.instance.InstanceService.create_instance', new_callable=MagicMock)
     def test_create_instance_response(self, instance_mock, kc_mock):
         """Test the response for InstanceService.create_instance()."""
         self.skipTest("Instance creation response failed to store in database")
@@ -132,7 +133,7 @@ class TestInstance(TestBase):
         instance_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.compute.instance.InstanceService.update_instance')
+    @patch('ccp_server.api.v1.compute.instance.InstanceService.update_instance', new_callable=MagicMock)
     def test_update_instance(self, instance_mock, kc_mock):
         """Test the call flow for InstanceService.update_instance()."""
         self.skipTest("Instance response failed to store in database")
@@ -148,7 +149,7 @@ class TestInstance(TestBase):
         instance_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.compute.instance.InstanceService.update_instance')
+    @patch('ccp_server.api.v1.compute.instance.InstanceService.update_instance', new_callable=MagicMock)
     def test_update_instance_response(self, instance_mock, kc_mock):
         """Test the response for InstanceService.update_instance()."""
         self.skipTest("Instance response failed to store in database")
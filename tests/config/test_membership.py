@@ -0,0 +1,127 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from ccp_server.config.membership import MembershipCache
+from ccp_server.service.membership import MembershipService
+from ccp_server.util.constants import Constants
+from tests.test_base import TestBase
+
+REDIS_MOCK = 'ccp_server.config.membership.get_redis'
+VERSIONS_MOCK = 'ccp_server.config.membership.CacheVersion.get'
+USERNAME = 'user@coredge.io'
+
+
+class FakeRedis:
+
+    def __init__(self):
+        self.store = {}
+        self.get = AsyncMock(side_effect=lambda key: self.store.get(key))
+        self.set = AsyncMock(side_effect=lambda key, value, expire=None: self.store.__setitem__(key, value))
+        self.delete = AsyncMock(side_effect=lambda key: self.store.pop(key, None))
+
+
+class TestMembershipCache(TestBase):
+
+    def setUp(self) -> None:
+        MembershipCache.clear_local()
+        self.versions = AsyncMock(return_value='1.1.1.1.1.1')
+        patcher = patch(VERSIONS_MOCK, self.versions)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return super().setUp()
+
+    @patch(REDIS_MOCK)
+    def test_profile_built_once_and_invalidated(self, redis_mock):
+        """Test that the profile is built on the first request only and rebuilt after invalidation."""
+
+        # Given
+        redis_mock.return_value = FakeRedis()
+        token_info = MagicMock(email=USERNAME, ccp_roles=[Constants.CCPRole.MEMBER])
+        service = MembershipService()
+        service.build_profile = AsyncMock(return_value={'roles': [], 'orgs': [], 'ceph': {}})
+
+        # When
+        asyncio.run(service.get_profile(token_info))
+        asyncio.run(service.get_profile(token_info))
+        asyncio.run(MembershipCache.invalidate(USERNAME))
+        asyncio.run(service.get_profile(token_info))
+
+        # Then
+        self.assertEqual(service.build_profile.await_count, 2)
+
+    @patch(REDIS_MOCK)
+    def test_local_cache_served_without_redis(self, redis_mock):
+        """Test that a warm local cache does not call Redis and a cold one is filled from Redis."""
+
+        # Given
+        redis = FakeRedis()
+        redis_mock.return_value = redis
+        profile = {'roles': [], 'orgs': [{'uuid': 'org-1', 'name': 'org', 'projects': []}], 'ceph': {}}
+        asyncio.run(MembershipCache.set(USERNAME, profile))
+        MembershipCache.clear_local()
+
+        # When
+        from_redis = asyncio.run(MembershipCache.get(USERNAME))
+        from_local = asyncio.run(MembershipCache.get(USERNAME.upper()))
+
+        # Then
+        self.assertEqual(from_redis, profile)
+        self.assertEqual(from_local, profile)
+        redis.get.assert_awaited_once()
+
+    @patch(REDIS_MOCK)
+    def test_profile_rebuilt_after_version_bump(self, redis_mock):
+        """Test that a membership, org or project write anywhere makes the cached profile unreachable."""
+
+        # Given
+        redis_mock.return_value = FakeRedis()
+        token_info = MagicMock(email=USERNAME, ccp_roles=[Constants.CCPRole.MEMBER])
+        service = MembershipService()
+        service.build_profile = AsyncMock(return_value={'roles': [], 'orgs': [], 'ceph': {}})
+
+        # When
+        asyncio.run(service.get_profile(token_info))
+        self.versions.return_value = '1.1.2.2.1.1'
+        asyncio.run(service.get_profile(token_info))
+
+        # Then
+        self.assertEqual(service.build_profile.await_count, 2)
+        self.assertEqual(self.versions.call_args.args[0], MembershipCache.NAMESPACES)
+
+    @patch(REDIS_MOCK)
+    def test_ceph_secret_key_not_stored_in_redis(self, redis_mock):
+        """Test that Redis never holds the Ceph secret key and a profile read from Redis gets it from Keycloak."""
+
+        # Given
+        redis = FakeRedis()
+        redis_mock.return_value = redis
+        token_info = MagicMock(email=USERNAME, ccp_roles=[Constants.CCPRole.MEMBER])
+        service = MembershipService()
+        service.build_profile = AsyncMock(return_value={'roles': [], 'orgs': [],
+                                                        'ceph': {'access_key': 'access', 'secret_key': 'secret'}})
+        service.kc_user_service = MagicMock(get_user_attributes=AsyncMock(
+            return_value={Constants.CEPH_USER_SECRET_KEY: ['secret']}))
+        asyncio.run(service.get_profile(token_info))
+        MembershipCache.clear_local()
+
+        # When
+        profile = asyncio.run(service.get_profile(token_info))
+        asyncio.run(service.get_profile(token_info))
+
+        # Then
+        self.assertNotIn('secret', ''.join(redis.store.values()))
+        self.assertEqual(profile['ceph'], {'access_key': 'access', 'secret_key': 'secret'})
+        service.kc_user_service.get_user_attributes.assert_awaited_once_with(USERNAME)
+        service.build_profile.assert_awaited_once()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
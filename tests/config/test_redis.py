@@ -0,0 +1,196 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+from ccp_server.config.redis import cache
+from ccp_server.config.redis import CacheVersion
+from ccp_server.config.redis import JsonSerializer
+from ccp_server.config.redis import LocalCache
+from ccp_server.util import ccp_context
+from ccp_server.util.constants import Constants
+from tests.test_base import TestBase
+
+REDIS_MOCK = 'ccp_server.config.redis.get_redis'
+
+
+class FakeRedis:
+
+    def __init__(self):
+        self.store = {}
+        self.get = AsyncMock(side_effect=lambda key: self.store.get(key))
+        self.set = AsyncMock(side_effect=lambda key, value, expire=None: self.store.__setitem__(key, value))
+        self.mget = AsyncMock(side_effect=lambda *keys: [self.store.get(key) for key in keys])
+
+    def pipeline(self):
+        keys = []
+        redis = self
+
+        class Pipeline:
+            def incr(self, key):
+                keys.append(key)
+
+            async def execute(self):
+                for key in keys:
+                    redis.store[key] = int(redis.store.get(key, 0)) + 1
+        return Pipeline()
+
+
+class Service:
+
+    def __init__(self):
+        self.calls = 0
+
+    @cache()
+    async def get_items(self, name: str, page: int = 0):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {'name': name, 'page': page, 'items': [1, 2]}
+
+    @cache(depends_on=(Constants.MongoCollection.PROJECT,))
+    async def get_projects(self, org_id: str = None):
+        self.calls += 1
+        return [org_id]
+
+    @cache(scope=Constants.CacheScope.GLOBAL, serializer=JsonSerializer, local=False)
+    async def get_catalogue(self):
+        self.calls += 1
+        return ['m1.small']
+
+
+class TestCache(TestBase):
+
+    def setUp(self) -> None:
+        LocalCache.clear()
+        CacheVersion.clear_local()
+        ccp_context.set_request_data(Constants.CCPHeader.ORG_ID, 'org-1')
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        LocalCache.clear()
+        ccp_context.clear_context()
+        return super().tearDown()
+
+    @patch(REDIS_MOCK)
+    def test_key_stable_and_namespaced(self, redis_mock):
+        """Test that equal calls from different objects share one key with the function and tenant in it."""
+
+        # Given
+        redis_mock.return_value = redis = FakeRedis()
+        first, second = Service(), Service()
+
+        # When
+        asyncio.run(first.get_items('volumes', 0))
+        LocalCache.clear()
+        result = asyncio.run(second.get_items(name='volumes'))
+
+        # Then
+        self.assertEqual(result, {'name': 'volumes', 'page': 0, 'items': [1, 2]})
+        self.assertEqual((first.calls, second.calls), (1, 0))
+        key, = redis.store
+        self.assertTrue(key.startswith(f'{Constants.CACHE_PREFIX}{__name__}.Service.get_items:org-1:'))
+
+    @patch(REDIS_MOCK)
+    def test_tenants_do_not_share_results(self, redis_mock):
+        """Test that another org gets its own cache entry."""
+
+        # Given
+        redis_mock.return_value = FakeRedis()
+        service = Service()
+
+        # When
+        asyncio.run(service.get_items('volumes'))
+        ccp_context.set_request_data(Constants.CCPHeader.ORG_ID, 'org-2')
+        asyncio.run(service.get_items('volumes'))
+
+        # Then
+        self.assertEqual(service.calls, 2)
+
+    @patch(REDIS_MOCK)
+    def test_concurrent_misses_coalesced_and_local_hit(self, redis_mock):
+        """Test that concurrent misses load once and a warm local cache does not call Redis."""
+
+        # Given
+        redis_mock.return_value = redis = FakeRedis()
+        service = Service()
+
+        async def calls():
+            results = await asyncio.gather(*[service.get_items('volumes') for _ in range(5)])
+            results[0]['items'].append(3)
+            return results, await service.get_items('volumes')
+
+        # When
+        results, cached = asyncio.run(calls())
+
+        # Then
+        self.assertEqual(service.calls, 1)
+        self.assertEqual(redis.get.await_count, 1)
+        self.assertEqual(results[1]['items'], [1, 2])
+        self.assertEqual(cached['items'], [1, 2])
+
+    @patch(REDIS_MOCK)
+    def test_serializer_pluggable_and_redis_failure_tolerated(self, redis_mock):
+        """Test that the chosen serializer is stored in Redis and the function still runs without Redis."""
+
+        # Given
+        redis_mock.return_value = redis = FakeRedis()
+        service = Service()
+
+        # When
+        asyncio.run(service.get_catalogue())
+        redis_mock.side_effect = ConnectionError('redis is down')
+        redis.store.clear()
+        result = asyncio.run(service.get_catalogue())
+
+        # Then
+        self.assertEqual(result, ['m1.small'])
+        self.assertEqual(service.calls, 2)
+        self.assertEqual(redis.set.call_args.args[1], b'["m1.small"]')
+
+    @patch(REDIS_MOCK)
+    def test_writes_invalidate_through_versions(self, redis_mock):
+        """Test that a write in an org invalidates the results of that org and of all the orgs only."""
+
+        # Given
+        redis_mock.return_value = FakeRedis()
+        service = Service()
+
+        async def calls(org_id):
+            ccp_context.set_request_data(Constants.CCPHeader.ORG_ID, org_id)
+            await service.get_projects(org_id='org-1')
+            await service.get_projects(org_id='org-2')
+            await service.get_projects()
+
+        # When
+        asyncio.run(calls('org-1'))
+        asyncio.run(CacheVersion.bump(Constants.MongoCollection.PROJECT))
+        asyncio.run(calls('org-1'))
+
+        # Then
+        self.assertEqual(service.calls, 5)
+
+    @patch(REDIS_MOCK)
+    def test_global_change_invalidates_every_org(self, redis_mock):
+        """Test that a write without an org invalidates the results of every org."""
+
+        # Given
+        redis_mock.return_value = FakeRedis()
+        service = Service()
+
+        # When
+        asyncio.run(service.get_projects(org_id='org-2'))
+        ccp_context.clear_context()
+        asyncio.run(CacheVersion.bump(Constants.MongoCollection.PROJECT))
+        asyncio.run(service.get_projects(org_id='org-2'))
+
+        # Then
+        self.assertEqual(service.calls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
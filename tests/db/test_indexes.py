@@ -0,0 +1,89 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import unittest
+from collections import defaultdict
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+from pymongo.errors import OperationFailure
+
+from ccp_server.db.indexes import LIST_INDEX
+from ccp_server.db.indexes import MongoIndexes
+from ccp_server.util.constants import Constants
+from tests.test_base import TestBase
+
+
+class TestMongoIndexes(TestBase):
+
+    def test_registry_covers_the_collections(self):
+        """Test that every CCP collection has a unique uuid index and the audit logs are left out."""
+
+        # When
+        registry = MongoIndexes.registry()
+
+        # Then
+        self.assertNotIn(Constants.MongoCollection.AUDIT_COLLECTION_NAME, registry)
+        self.assertIn(Constants.MongoCollection.VOLUME, registry)
+        watermark_index = registry.pop(Constants.MongoCollection.SYNC_WATERMARK)[0].document
+        self.assertEqual((watermark_index['key'], watermark_index['unique']), ({'cloud': 1, 'collection': 1}, True))
+        for indexes in registry.values():
+            uuid_index = indexes[0].document
+            self.assertEqual((uuid_index['key'], uuid_index['unique']), ({'uuid': 1}, True))
+            self.assertIn(LIST_INDEX, indexes)
+        self.assertEqual(list(LIST_INDEX.document['key']),
+                         ['cloud', 'org_id', 'project_id', 'active', 'created_at', 'uuid'])
+        subnet_indexes = {index.document['name']: index.document
+                          for index in registry[Constants.MongoCollection.SUBNET]}
+        self.assertIn('network_active', subnet_indexes)
+        self.assertIn('network_id', subnet_indexes['unique_name']['key'])
+        self.assertEqual(subnet_indexes['unique_name']['collation']['strength'], 2)
+
+    def test_apply_continues_after_refused_index(self):
+        """Test that an index the server refuses is skipped and the other indexes are created."""
+
+        # Given
+        def create_indexes(indexes):
+            if indexes[0].document['name'] == 'uuid':
+                raise OperationFailure('E11000')
+            return [indexes[0].document['name']]
+
+        collections = defaultdict(lambda: MagicMock(create_indexes=AsyncMock(return_value=['uuid'])))
+        collections[Constants.MongoCollection.VOLUME].create_indexes.side_effect = create_indexes
+
+        # When
+        with self.assertLogs('ccp_server.db.indexes', level='ERROR') as logs:
+            created = asyncio.run(MongoIndexes.apply(collections))
+
+        # Then
+        registered = [index.document['name'] for index in MongoIndexes.registry()[Constants.MongoCollection.VOLUME]]
+        self.assertEqual(created[Constants.MongoCollection.VOLUME], registered[1:])
+        self.assertEqual(collections[Constants.MongoCollection.VOLUME].create_indexes.await_count, len(registered))
+        self.assertEqual(len(created), len(MongoIndexes.registry()))
+        self.assertIn(f'uuid of {Constants.MongoCollection.VOLUME}', logs.output[0])
+
+    def test_report_missing_unused_and_unregistered(self):
+        """Test that the report compares $indexStats with the registry."""
+
+        # Given
+        registered = [index.document['name'] for index in MongoIndexes.registry()[Constants.MongoCollection.PORT]]
+        stats = [{'name': '_id_', 'accesses': {'ops': 0}}, {'name': 'uuid', 'accesses': {'ops': 12}},
+                 {'name': 'cloud_org_project_active_created_at', 'accesses': {'ops': 0}},
+                 {'name': 'name_1', 'accesses': {'ops': 3}}]
+        db = defaultdict(lambda: MagicMock(aggregate=MagicMock(
+            return_value=MagicMock(to_list=AsyncMock(return_value=stats)))))
+
+        # When
+        report = asyncio.run(MongoIndexes.report(db))[Constants.MongoCollection.PORT]
+
+        # Then
+        self.assertEqual(report['missing'], registered[2:])
+        self.assertEqual(report['unused'], ['cloud_org_project_active_created_at'])
+        self.assertEqual(report['unregistered'], ['name_1'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,280 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import unittest
+from datetime import datetime
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from pymongo.errors import BulkWriteError
+from pymongo.errors import DuplicateKeyError
+
+from ccp_server.db.mongo import MongoAPI
+from ccp_server.schema.v1.response_schemas import Pageable
+from ccp_server.util import ccp_context
+from ccp_server.util.constants import Constants
+from ccp_server.util.exceptions import CCPBadRequestException
+from ccp_server.util.messages import Message
+from tests.test_base import TestBase
+
+CLIENT_MOCK = 'ccp_server.db.mongo.MongoAPI.get_client'
+
+
+class FakeCursor:
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.close = AsyncMock()
+
+    async def __aiter__(self):
+        for doc in self.docs:
+            yield doc
+
+
+class TestMongoPagination(TestBase):
+
+    def setUp(self) -> None:
+        self.collection = MagicMock()
+        with patch(CLIENT_MOCK) as client_mock:
+            client_mock.return_value = MagicMock(__getitem__=lambda _, name: {'Volume': self.collection})
+            self.mongo = MongoAPI()
+        return super().setUp()
+
+    def list_volumes(self, pageable: Pageable):
+        return asyncio.run(self.mongo.get_document_list_by_ids('Volume', cloud='openstack', org_id='org-1',
+                                                               exclude_project=True, pageable=pageable))
+
+    def test_page_token_round_trip(self):
+        """Test that a token keeps the sort values with their types and a broken token is a bad request."""
+
+        # Given
+        sort = [('created_at', 1), ('uuid', 1)]
+        doc = {'uuid': 'u1', 'created_at': datetime(2023, 5, 1, 10, 30)}
+
+        # When
+        token = MongoAPI.encode_page_token(doc, sort)
+
+        # Then
+        self.assertEqual(MongoAPI.decode_page_token(token, 1), ([datetime(2023, 5, 1, 10, 30)], 'u1'))
+        with self.assertRaises(CCPBadRequestException):
+            MongoAPI.decode_page_token(token[:-4], 1)
+        with self.assertRaises(CCPBadRequestException):
+            MongoAPI.decode_page_token(token, 2)
+
+    def test_keyset_filter(self):
+        """Test that the filter selects the documents after the position in both directions."""
+
+        # When
+        ascending = MongoAPI.keyset_filter([('name', 1), ('uuid', 1)], ['web', 'u1'])
+        descending = MongoAPI.keyset_filter([('name', -1), ('uuid', -1)], [None, 'u1'])
+
+        # Then
+        self.assertEqual(ascending, {'$or': [{'name': {'$gt': 'web'}}, {'name': 'web', 'uuid': {'$gt': 'u1'}}]})
+        self.assertEqual(descending, {'$or': [{'name': None, '$or': [{'uuid': {'$lt': 'u1'}}, {'uuid': None}]}]})
+
+    def test_page_and_total_counted_separately(self):
+        """Test that the size is honored, the page is a sorted find, the total a count and a token points to the
+        next page."""
+
+        # Given
+        docs = [{'uuid': f'u{index}', 'created_at': None} for index in range(3)]
+        cursor = self.collection.find.return_value.sort.return_value.skip.return_value.limit.return_value
+        cursor.to_list = AsyncMock(return_value=docs)
+        self.collection.count_documents = AsyncMock(return_value=7)
+        pageable = Pageable(None, 1, 2, None, False)
+
+        # When
+        data, total = self.list_volumes(pageable)
+
+        # Then
+        self.assertEqual((data, total), (docs[:2], 7))
+        self.assertEqual(MongoAPI.decode_page_token(pageable.next_page_token, 1), ([None], 'u1'))
+        filter_dict = {'cloud': 'openstack', 'org_id': 'org-1', 'active': 1}
+        self.assertEqual(self.collection.find.call_args.args[0], filter_dict)
+        self.collection.find.return_value.sort.assert_called_once_with([('created_at', 1), ('uuid', 1)])
+        self.collection.find.return_value.sort.return_value.skip.return_value.limit.assert_called_once_with(3)
+        self.collection.count_documents.assert_awaited_once_with(filter_dict, collation=None)
+        self.collection.aggregate.assert_not_called()
+
+    def test_next_page_without_total(self):
+        """Test that a token continues after the last document, without skip and without counting."""
+
+        # Given
+        token = MongoAPI.encode_page_token({'uuid': 'u1', 'name': 'web'}, [('name', 1), ('uuid', 1)])
+        cursor = self.collection.find.return_value.sort.return_value.skip.return_value.limit.return_value
+        cursor.to_list = AsyncMock(return_value=[{'uuid': 'u2', 'name': 'x'}])
+        pageable = Pageable(None, 1, 2, ['name'], False, page_token=token, include_total=False)
+
+        # When
+        data, total = self.list_volumes(pageable)
+
+        # Then
+        self.assertEqual((data, total, pageable.next_page_token), ([{'uuid': 'u2', 'name': 'x'}], None, None))
+        filter_dict = self.collection.find.call_args.args[0]
+        self.assertEqual(filter_dict['$and'][1]['$or'][0], {'name': {'$gt': 'web'}})
+        self.collection.find.return_value.sort.return_value.skip.assert_called_once_with(0)
+
+    def test_stream_reads_cursor_in_batches(self):
+        """Test that a streamed list is the whole sorted cursor in batches, closed when the reader stops."""
+
+        # Given
+        cursor = FakeCursor([{'uuid': f'u{index}'} for index in range(3)])
+        self.collection.find.return_value.sort.return_value.batch_size.return_value = cursor
+        pageable = Pageable(None, 2, 1, None, True, stream=True)
+
+        async def read_two():
+            documents, total = await self.mongo.get_document_list_by_ids(
+                'Volume', cloud='openstack', org_id='org-1', exclude_project=True, pageable=pageable)
+            read = [await documents.__anext__(), await documents.__anext__()]
+            await documents.aclose()
+            return read, total
+
+        # When
+        data, total = asyncio.run(read_two())
+
+        # Then
+        self.assertEqual((data, total), ([{'uuid': 'u0'}, {'uuid': 'u1'}], None))
+        self.collection.find.return_value.sort.assert_called_once_with([('created_at', -1), ('uuid', -1)])
+        self.collection.find.return_value.sort.return_value.batch_size.assert_called_once_with(
+            Constants.MONGO_STREAM_BATCH_SIZE)
+        self.collection.aggregate.assert_not_called()
+        cursor.close.assert_awaited_once()
+
+
+class TestMongoNames(TestBase):
+
+    def setUp(self) -> None:
+        self.collection = MagicMock()
+        with patch(CLIENT_MOCK) as client_mock:
+            client_mock.return_value = MagicMock(__getitem__=lambda _, name: {'Volume': self.collection})
+            self.mongo = MongoAPI()
+        return super().setUp()
+
+    def test_duplicate_name_is_exact_match(self):
+        """Test that the name check looks for the exact name in the case-insensitive collation."""
+
+        # Given
+        self.collection.find_one = AsyncMock(return_value=None)
+
+        # When
+        exists = asyncio.run(self.mongo.check_document_by_name('Volume', 'web', project_id='p1', cloud='openstack',
+                                                               org_id='org-1'))
+
+        # Then
+        self.assertFalse(exists)
+        self.assertEqual(self.collection.find_one.call_args.args[0],
+                         {'cloud': 'openstack', 'org_id': 'org-1', 'project_id': 'p1', 'name': 'web', 'active': 1})
+        self.assertEqual(self.collection.find_one.call_args.kwargs['collation'], MongoAPI.NAME_COLLATION)
+
+    def test_duplicate_name_rejected_by_index(self):
+        """Test that a name inserted since the check is a bad request."""
+
+        # Given
+        self.collection.insert_one = AsyncMock(side_effect=DuplicateKeyError('E11000'))
+
+        # When / Then
+        with self.assertRaises(CCPBadRequestException):
+            asyncio.run(self.mongo.write_document('Volume', {'name': 'web', 'org_id': 'org-1'}))
+
+    def test_rename_to_name_in_use_rejected_by_index(self):
+        """Test that renaming a document to a name in use is a bad request and not a silent no-op."""
+
+        # Given
+        self.collection.update_one = AsyncMock(side_effect=DuplicateKeyError('E11000'))
+
+        # When / Then
+        with self.assertRaises(CCPBadRequestException):
+            asyncio.run(self.mongo.update_document_by_uuid('Volume', 'v1', {'name': 'web'}))
+
+    def test_search_is_prefix_range(self):
+        """Test that the search filter is a prefix range in the name collation."""
+
+        # Given
+        cursor = self.collection.find.return_value.sort.return_value.skip.return_value.limit.return_value
+        cursor.to_list = AsyncMock(return_value=[])
+        self.collection.count_documents = AsyncMock(return_value=0)
+
+        # When
+        asyncio.run(self.mongo.get_document_list_by_ids('Volume', cloud='openstack', org_id='org-1',
+                                                        exclude_project=True,
+                                                        pageable=Pageable('Web', 1, 10, None, False)))
+
+        # Then
+        filter_dict = self.collection.find.call_args.args[0]
+        self.assertEqual(filter_dict['name'], {'$gte': 'Web', '$lt': 'Web' + MongoAPI.PREFIX_END})
+        self.assertEqual(self.collection.find.call_args.kwargs['collation'], MongoAPI.NAME_COLLATION)
+        self.assertEqual(self.collection.count_documents.call_args.kwargs['collation'], MongoAPI.NAME_COLLATION)
+
+
+class TestMongoBulkWrite(TestBase):
+
+    def setUp(self) -> None:
+        self.collection = MagicMock()
+        self.collection.bulk_write = AsyncMock()
+        with patch(CLIENT_MOCK) as client_mock:
+            client_mock.return_value = MagicMock(__getitem__=lambda _, name: {'Volume': self.collection})
+            self.mongo = MongoAPI()
+        ccp_context.set_request_data(Constants.CURRENT_REQUEST, None)
+        ccp_context.set_request_data(Constants.CCPHeader.CLOUD_ID, 'openstack')
+        ccp_context.set_request_data(Constants.CCPHeader.ORG_ID, 'org-1')
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        ccp_context.clear_context()
+        return super().tearDown()
+
+    @patch('ccp_server.db.mongo.CacheVersion.bump', new_callable=AsyncMock)
+    @patch('ccp_server.util.constants.Constants.MONGO_BULK_BATCH_SIZE', 2)
+    def test_insert_batches_with_errors_per_document(self, bump_mock):
+        """Test that the documents get the default details and a failed batch does not stop the next ones."""
+
+        # Given
+        self.collection.bulk_write.side_effect = [
+            BulkWriteError({'nInserted': 1, 'writeErrors': [{'index': 1, 'code': 11000, 'errmsg': 'duplicate'}]}),
+            MagicMock(bulk_api_result={'nInserted': 1})]
+        documents = [{'name': f'v{index}', 'project_id': 'p1'} for index in range(3)]
+
+        # When
+        result = asyncio.run(self.mongo.write_many('Volume', documents, with_default_details=True))
+
+        # Then
+        self.assertEqual(self.collection.bulk_write.await_count, 2)
+        inserted = [request._doc for request in self.collection.bulk_write.call_args_list[0].args[0]]
+        self.assertEqual([(doc['uuid'], doc['cloud'], doc['org_id']) for doc in inserted],
+                         [(uid, 'openstack', 'org-1') for uid in result.uuids[:2]])
+        self.assertEqual(result.inserted, 2)
+        self.assertEqual(result.errors, [{'batch': 0, 'index': 1, 'uuid': result.uuids[1], 'code': 11000,
+                                          'message': 'duplicate'}])
+        bump_mock.assert_awaited_once_with('Volume', org_id='org-1')
+
+    @patch('ccp_server.db.mongo.CacheVersion.bump', new_callable=AsyncMock)
+    def test_upsert_by_reference_id_ordered(self, bump_mock):
+        """Test that an upsert matches the cloud and reference_id and an ordered write stops at the failure."""
+
+        # Given
+        self.collection.bulk_write.side_effect = BulkWriteError(
+            {'nUpserted': 0, 'writeErrors': [{'index': 0, 'code': 2, 'errmsg': 'bad'}]})
+        documents = [{'uuid': 'u1', 'cloud': 'openstack', 'reference_id': 'r1', 'status': 'available'},
+                     {'cloud': 'openstack', 'reference_id': 'r2', 'status': 'in-use'}]
+
+        # When
+        result = asyncio.run(self.mongo.upsert_many('Volume', documents, ordered=True))
+
+        # Then
+        request = self.collection.bulk_write.call_args.args[0][0]
+        self.assertEqual(request._filter, {'cloud': 'openstack', 'reference_id': 'r1'})
+        self.assertEqual(request._doc, {'$set': {'cloud': 'openstack', 'reference_id': 'r1', 'status': 'available'},
+                                        '$setOnInsert': {'uuid': 'u1'}})
+        self.assertTrue(request._upsert)
+        self.assertEqual(self.collection.bulk_write.call_args.kwargs, {'ordered': True})
+        self.assertEqual([(error['index'], error['message']) for error in result.errors],
+                         [(0, 'bad'), (1, Message.DOCUMENT_NOT_WRITTEN)])
+        bump_mock.assert_not_awaited()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,160 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import functools
+import os
+import subprocess
+import sys
+import unittest
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import httpx
+
+from ccp_server.kc.async_client import KeycloakAsyncClient
+from ccp_server.util.constants import Constants
+from ccp_server.util.exceptions import CCPBadRequestException
+from tests.test_base import TestBase
+
+HTTP_CLIENT_MOCK = 'ccp_server.kc.async_client.httpx.AsyncClient'
+CLIENT_SECRET_MOCK = 'ccp_server.kc.async_client.KeycloakAsyncClient.client_secret_key'
+
+
+class TestKeycloakAsyncClient(TestBase):
+
+    def setUp(self) -> None:
+        self.requests = []
+        self.tokens = 0
+        self.routes = {}
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        KeycloakAsyncClient._http = None
+        KeycloakAsyncClient._loop = None
+        KeycloakAsyncClient._token = None
+        KeycloakAsyncClient._client_secret_key = None
+        return super().tearDown()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if str(request.url) == Constants.KEYCLOAK_OPENID_CONNECT_TOKEN_URL:
+            self.tokens += 1
+            return httpx.Response(200, json={'access_token': f'token-{self.tokens}', 'expires_in': 300})
+        self.requests.append(request)
+        path = request.url.path.replace(httpx.URL(Constants.KEYCLOAK_ADMIN_BASE_URL).path, '')
+        return self.routes[(request.method, path)](request)
+
+    def run_client(self, coroutine_func):
+        transport = httpx.MockTransport(self.handler)
+        with patch(HTTP_CLIENT_MOCK, functools.partial(httpx.AsyncClient, transport=transport)), \
+                patch(CLIENT_SECRET_MOCK, AsyncMock(return_value='secret')):
+            return asyncio.run(coroutine_func(KeycloakAsyncClient()))
+
+    def test_admin_token_shared_and_renewed_on_401(self):
+        """Test that concurrent calls share one admin token and a 401 fetches a new token and retries."""
+
+        # Given
+        def get_user(request):
+            if request.url.path.endswith('revoked') and request.headers['Authorization'] == 'Bearer token-1':
+                return httpx.Response(401)
+            return httpx.Response(200, json={'id': request.url.path.rsplit('/', 1)[-1]})
+        self.routes = {('GET', f'/users/{user_id}'): get_user for user_id in ('a', 'b', 'c', 'revoked')}
+
+        async def calls(client):
+            users = await asyncio.gather(*[client.get_user(user_id) for user_id in ('a', 'b', 'c')])
+            return users, await client.get_user('revoked')
+
+        # When
+        users, revoked = self.run_client(calls)
+
+        # Then
+        self.assertEqual([user['id'] for user in users], ['a', 'b', 'c'])
+        self.assertEqual(revoked, {'id': 'revoked'})
+        self.assertEqual(self.tokens, 2)
+        self.assertEqual(self.requests[-1].headers['Authorization'], 'Bearer token-2')
+
+    def test_group_members_fetched_page_by_page(self):
+        """Test that all the members of a group are fetched with the first and max query parameters."""
+
+        # Given
+        members = [{'id': str(index)} for index in range(KeycloakAsyncClient.PAGE_SIZE + 5)]
+
+        def get_members(request):
+            first, size = int(request.url.params['first']), int(request.url.params['max'])
+            return httpx.Response(200, json=members[first:first + size])
+        self.routes = {('GET', '/groups/g1/members'): get_members}
+
+        # When
+        result = self.run_client(lambda client: client.get_group_members('g1'))
+
+        # Then
+        self.assertEqual(result, members)
+        self.assertEqual(len(self.requests), 2)
+
+    def test_create_user_returns_id_and_rejects_duplicates(self):
+        """Test that the new user id is read from the Location header and a conflict is a bad request."""
+
+        # Given
+        created = iter([httpx.Response(201, headers={'Location': f'{Constants.KEYCLOAK_ADMIN_BASE_URL}/users/u1'}),
+                        httpx.Response(409, json={'errorMessage': 'User exists with same username'})])
+        self.routes = {('POST', '/users'): lambda request: next(created)}
+        payload = {'username': 'user@coredge.io', 'email': 'user@coredge.io'}
+
+        # When
+        user_id = self.run_client(lambda client: client.create_user(payload))
+
+        # Then
+        self.assertEqual(user_id, 'u1')
+        with self.assertRaises(CCPBadRequestException):
+            self.run_client(lambda client: client.create_user(payload))
+
+    def test_token_endpoints_follow_the_realm(self):
+        """Test that the admin token, the introspection and the refresh use the token endpoint of KEYCLOAK_REALM."""
+
+        # Given
+        token_url = subprocess.run(
+            [sys.executable, '-c', 'from ccp_server.util.constants import Constants; '
+                                   'print(Constants.KEYCLOAK_OPENID_CONNECT_TOKEN_URL)'],
+            env={**os.environ, 'KEYCLOAK_REALM': 'acme', 'PYTHONPATH': os.pathsep.join(sys.path)},
+            capture_output=True, text=True, check=True).stdout.strip()
+        self.routes = {('POST', f'{httpx.URL(token_url).path}/introspect'):
+                       lambda request: httpx.Response(200, json={'active': True}),
+                       ('GET', '/users/a'): lambda request: httpx.Response(200, json={'id': 'a'})}
+
+        async def calls(client):
+            return (await client.get_user('a'), await client.introspect('access'),
+                    await client.refresh_token('refresh', Constants.KEYCLOAK_UI_CLIENT_ID))
+
+        # When
+        with patch.object(Constants, 'KEYCLOAK_OPENID_CONNECT_TOKEN_URL', token_url):
+            user, introspection, refreshed = self.run_client(calls)
+
+        # Then
+        self.assertTrue(token_url.endswith('/realms/acme/protocol/openid-connect/token'))
+        self.assertEqual((user, introspection), ({'id': 'a'}, {'active': True}))
+        self.assertEqual(refreshed['access_token'], 'token-2')
+        self.assertEqual(self.tokens, 2)
+
+    @patch('ccp_server.kc.connection.KeycloakAdminClient')
+    def test_client_secret_looked_up_once(self, admin_client_mock):
+        """Test that the client secret is kept after the first lookup."""
+
+        # Given
+        admin_client_mock.return_value = MagicMock(client_secret_key='secret')
+
+        async def lookups():
+            return [await KeycloakAsyncClient.client_secret_key() for _ in range(3)]
+
+        # When
+        secrets = asyncio.run(lookups())
+
+        # Then
+        self.assertEqual(secrets, ['secret'] * 3)
+        admin_client_mock.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,110 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import time
+import unittest
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from unittest.mock import PropertyMock
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk
+from jose import jwt
+
+from ccp_server.kc.authentication import KeycloakAuthService
+from ccp_server.util.constants import Constants
+from tests.test_base import TestBase
+
+ACONNECT_MOCK = 'ccp_server.kc.authentication.KeycloakAuthService.aconnect'
+REDIS_MOCK = 'ccp_server.kc.authentication.get_redis'
+KID = 'test-kid'
+
+
+class TestKeycloakAuthService(TestBase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        cls.private_pem = private_key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                                    serialization.NoEncryption()).decode()
+        public_pem = private_key.public_key().public_bytes(serialization.Encoding.PEM,
+                                                           serialization.PublicFormat.SubjectPublicKeyInfo)
+        cls.jwks = {'keys': [dict(jwk.construct(public_pem, 'RS256').to_dict(), kid=KID, use='sig')]}
+
+    def setUp(self) -> None:
+        KeycloakAuthService._jwks = {}
+        KeycloakAuthService._jwks_fetched_at = None
+        return super().setUp()
+
+    def token(self, **claims) -> str:
+        payload = {'iss': Constants.KEYCLOAK_TOKEN_ISSUER, 'exp': int(time.time()) + 300, 'typ': 'Bearer',
+                   'email': 'user@coredge.io', 'email_verified': True}
+        payload.update(claims)
+        return jwt.encode(payload, self.private_pem, algorithm='RS256', headers={'kid': KID})
+
+    @patch(ACONNECT_MOCK, new_callable=PropertyMock)
+    def test_local_validation_caches_jwks(self, aconnect_mock):
+        """Test that valid tokens are verified locally and the realm keys are fetched once."""
+
+        # Given
+        aconnect_mock.return_value = MagicMock(certs=AsyncMock(return_value=self.jwks), introspect=AsyncMock())
+        auth_service = KeycloakAuthService()
+
+        # When
+        first = asyncio.run(auth_service.validate(self.token()))
+        second = asyncio.run(auth_service.validate(self.token(email='other@coredge.io')))
+
+        # Then
+        self.assertTrue(first.active)
+        self.assertEqual(first.email, 'user@coredge.io')
+        self.assertEqual(second.email, 'other@coredge.io')
+        aconnect_mock.return_value.certs.assert_awaited_once()
+        aconnect_mock.return_value.introspect.assert_not_awaited()
+
+    @patch(ACONNECT_MOCK, new_callable=PropertyMock)
+    def test_local_validation_rejects_invalid_tokens(self, aconnect_mock):
+        """Test that expired, foreign issuer and non access tokens are not active."""
+
+        # Given
+        aconnect_mock.return_value = MagicMock(certs=AsyncMock(return_value=self.jwks), introspect=AsyncMock())
+        auth_service = KeycloakAuthService()
+        tokens = [self.token(exp=int(time.time()) - 10), self.token(iss='https://evil.io/realms/cloud'),
+                  self.token(typ='Refresh'), self.token()[:-4] + 'abcd', 'not-a-token']
+
+        # When
+        results = [asyncio.run(auth_service.validate(token)) for token in tokens]
+
+        # Then
+        self.assertEqual([token_info.active for token_info in results], [False] * len(tokens))
+
+    @patch('ccp_server.kc.authentication.Constants.TOKEN_VALIDATION_MODE', Constants.TOKEN_VALIDATION_MODE_INTROSPECT)
+    @patch(REDIS_MOCK)
+    @patch(ACONNECT_MOCK, new_callable=PropertyMock)
+    def test_introspection_result_cached_until_exp(self, aconnect_mock, redis_mock):
+        """Test that the introspection result is cached by token hash with TTL capped at the token exp."""
+
+        # Given
+        redis = MagicMock(get=AsyncMock(return_value=None), set=AsyncMock())
+        redis_mock.return_value = redis
+        aconnect_mock.return_value = MagicMock(
+            introspect=AsyncMock(return_value={'active': True, 'exp': int(time.time()) + 20}))
+        token = self.token()
+
+        # When
+        token_info = asyncio.run(KeycloakAuthService().validate(token))
+
+        # Then
+        self.assertTrue(token_info.active)
+        cache_key = redis.set.call_args.args[0]
+        self.assertTrue(cache_key.startswith(Constants.TOKEN_INTROSPECTION_CACHE_PREFIX))
+        self.assertNotIn(token, cache_key)
+        self.assertLessEqual(redis.set.call_args.kwargs['expire'], 20)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
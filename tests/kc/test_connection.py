@@ -0,0 +1,65 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import unittest
+from unittest.mock import patch
+
+from ccp_server.kc.client import KeycloakClientService
+from ccp_server.kc.connection import KeycloakAdminClient
+from ccp_server.kc.user import KeycloakUserService
+from tests.test_base import TestBase
+
+KEYCLOAK_ADMIN_MOCK = 'ccp_server.kc.connection.KeycloakAdmin'
+SECRET_MOCK = 'ccp_server.kc.connection.KeycloakAdminClient.client_secret_key'
+
+
+class TestKeycloakAdminClient(TestBase):
+
+    def setUp(self) -> None:
+        KeycloakAdminClient.close()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        KeycloakAdminClient.close()
+        return super().tearDown()
+
+    @patch(SECRET_MOCK, 'secret')
+    @patch(KEYCLOAK_ADMIN_MOCK)
+    def test_admin_session_shared_by_services(self, admin_mock):
+        """Test that all the Keycloak services use one admin session."""
+
+        # Given
+        admin_mock.return_value.token = {'expires_in': 300}
+
+        # When
+        sessions = [KeycloakUserService().connect, KeycloakClientService().connect, KeycloakAdminClient().connect]
+
+        # Then
+        admin_mock.assert_called_once()
+        self.assertTrue(all(session is admin_mock.return_value for session in sessions))
+        admin_mock.return_value.refresh_token.assert_not_called()
+        self.assertEqual(admin_mock.call_args.kwargs['auto_refresh_token'], ['get', 'put', 'post', 'delete'])
+
+    @patch(SECRET_MOCK, 'secret')
+    @patch(KEYCLOAK_ADMIN_MOCK)
+    def test_admin_token_refreshed_before_expiry(self, admin_mock):
+        """Test that a token about to expire is refreshed on the shared session."""
+
+        # Given
+        admin_mock.return_value.token = {'expires_in': 10}
+        client = KeycloakAdminClient()
+        client.connect
+
+        # When
+        session = client.connect
+
+        # Then
+        admin_mock.assert_called_once()
+        admin_mock.return_value.refresh_token.assert_called_once()
+        self.assertIs(session, admin_mock.return_value)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,67 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from unittest.mock import PropertyMock
+
+from ccp_server.kc.user import KeycloakUserService
+from tests.test_base import TestBase
+
+ACONNECT_MOCK = 'ccp_server.kc.user.KeycloakUserService.aconnect'
+CLIENT_ROLES = [{'name': 'org-admin'}, {'name': 'member'}, {'name': 'super-admin'}]
+
+
+class TestKeycloakUserService(TestBase):
+
+    def user_service(self) -> KeycloakUserService:
+        user_service = KeycloakUserService()
+        user_service.client_service = MagicMock(get_client_roles=AsyncMock(return_value=CLIENT_ROLES),
+                                                get_client_uuid=AsyncMock(return_value='client-uuid'))
+        return user_service
+
+    @patch(ACONNECT_MOCK, new_callable=PropertyMock)
+    def test_users_roles_joined_from_role_members(self, aconnect_mock):
+        """Test that the roles of many users come from one members listing per client role."""
+
+        # Given
+        role_members = {'org-admin': [{'id': 'u1'}, {'id': 'outsider'}],
+                        'member': [{'id': 'u1'}, {'id': 'u2'}, {'id': 'u3'}],
+                        'super-admin': []}
+        aconnect_mock.return_value = MagicMock(
+            get_client_role_members=AsyncMock(side_effect=lambda client_id, role: role_members[role]),
+            get_client_roles_of_user=AsyncMock())
+
+        # When
+        users_roles = asyncio.run(self.user_service().get_users_roles(['u1', 'u2', 'u3', 'u4']))
+
+        # Then
+        self.assertEqual(users_roles, {'u1': ['org-admin', 'member'], 'u2': ['member'], 'u3': ['member'], 'u4': []})
+        self.assertEqual(aconnect_mock.return_value.get_client_role_members.await_count, len(CLIENT_ROLES))
+        aconnect_mock.return_value.get_client_roles_of_user.assert_not_awaited()
+
+    @patch(ACONNECT_MOCK, new_callable=PropertyMock)
+    def test_users_roles_fetched_per_user_for_few_users(self, aconnect_mock):
+        """Test that the role mappings are fetched per user when there are fewer users than roles."""
+
+        # Given
+        aconnect_mock.return_value = MagicMock(
+            get_client_role_members=AsyncMock(),
+            get_client_roles_of_user=AsyncMock(return_value=[{'name': 'member'}]))
+
+        # When
+        users_roles = asyncio.run(self.user_service().get_users_roles(['u1']))
+
+        # Then
+        self.assertEqual(users_roles, {'u1': ['member']})
+        aconnect_mock.return_value.get_client_roles_of_user.assert_awaited_once_with('u1', 'client-uuid')
+        aconnect_mock.return_value.get_client_role_members.assert_not_awaited()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -5,6 +5,7 @@
 # Written by Rajkumar Srinivasan <rajkumarsrinivasan@coredge.io>, Mar 2023    #
 ###############################################################################
 import os
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ccp_server.api.v1.networks.floating_ip import FloatingIPService
@@ -15,7 +16,7 @@ from tests.test_base import TestBase
 class TestFloatingIP(TestBase):
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.list_floating_ips')
+    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.list_floating_ips', new_callable=MagicMock)
     def test_list_floating_ips(self, floating_ip_mock, kc_mock):
         """Test the call flow for FloatingIPService.list_floating_ips()."""
 
@@ -30,7 +31,7 @@ class TestFloatingIP(TestBase):
         floating_ip_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.list_floating_ips')
+    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.list_floating_ips', new_callable=MagicMock)
     def test_list_floating_ips_response(self, floating_ip_mock, kc_mock):
         """Test the response for FloatingIPService.list_floating_ips()."""
 
@@ -49,7 +50,7 @@ class TestFloatingIP(TestBase):
         floating_ip_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.list_all_floating_ips')
+    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.list_all_floating_ips', new_callable=MagicMock)
     def test_list_all_floating_ips(self, floating_ip_mock, kc_mock):
         """Test the call flow for FloatingIPService.list_all_floating_ips()."""
 
@@ -64,7 +65,7 @@ class TestFloatingIP(TestBase):
         floating_ip_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.list_all_floating_ips')
+    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.list_all_floating_ips', new_callable=MagicMock)
     def test_list_all_floating_ips_response(self, floating_ip_mock, kc_mock):
         """Test the response for FloatingIPService.list_all_floating_ips()."""
 
@@ -83,7 +84,7 @@ class TestFloatingIP(TestBase):
         floating_ip_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.get_floating_ip')
+    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.get_floating_ip', new_callable=MagicMock)
     def test_get_floating_ip(self, floating_ip_mock, kc_mock):
         """Test the call flow for FloatingIPService.get_floating_ip()."""
 
@@ -98,7 +99,7 @@ class TestFloatingIP(TestBase):
         floating_ip_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.get_floating_ip')
+    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.get_floating_ip', new_callable=MagicMock)
     def test_get_floating_ip_response(self, floating_ip_mock, kc_mock):
         """Test the floating IP response for get_floating_ip()."""
 
@@ -120,7 +121,7 @@ class TestFloatingIP(TestBase):
         floating_ip_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.delete_floating_ip')
+    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.delete_floating_ip', new_callable=MagicMock)
     def test_delete_floating_ip(self, floating_ip_mock, kc_mock):
         """Test the call flow for FloatingIPService.delete_floating_ip()."""
 
@@ -135,7 +136,7 @@ class TestFloatingIP(TestBase):
         floating_ip_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.create_floating_ip')
+    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.create_floating_ip', new_callable=MagicMock)
     def test_create_floating_ip(self, floating_ip_mock, kc_mock):
         """Test the call flow for FloatingIPService.create_floating_ip()."""
 
@@ -150,7 +151,7 @@ class TestFloatingIP(TestBase):
         floating_ip_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.create_floating_ip')
+    @patch('ccp_server.api.v1.networks.floating_ip.FloatingIPService.create_floating_ip', new_callable=MagicMock)
     def test_create_floating_ip_response(self, floating_ip_mock, kc_mock):
         """Test the response for FloatingIPService.create_floating_ip()."""
 
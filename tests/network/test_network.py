@@ -5,6 +5,7 @@
 # Written by Rajkumar Srinivasan <rajkumarsrinivasan@coredge.io>, Mar 2023    #
 ###############################################################################
 import os
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ccp_server.api.v1.networks.network import NetworkService
@@ -15,7 +16,7 @@ from tests.test_base import TestBase
 class TestNetwork(TestBase):
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.network.NetworkService.list_networks_by_project_id')
+    @patch('ccp_server.api.v1.networks.network.NetworkService.list_networks_by_project_id', new_callable=MagicMock)
     def test_list_networks_by_project_id(self, network_mock, kc_mock):
         """Test the call flow for NetworkService.list_networks_by_project_id()."""
 
@@ -30,7 +31,7 @@ class TestNetwork(TestBase):
         network_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.network.NetworkService.list_networks_by_project_id')
+    @patch('ccp_server.api.v1.networks.network.NetworkService.list_networks_by_project_id', new_callable=MagicMock)
     def test_list_networks_by_project_id_response(self, network_mock, kc_mock):
         """Test the response for NetworkService.list_networks_by_project_id()."""
 
@@ -49,7 +50,7 @@ class TestNetwork(TestBase):
         network_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.network.NetworkService.get_network')
+    @patch('ccp_server.api.v1.networks.network.NetworkService.get_network', new_callable=MagicMock)
     def test_get_network(self, network_mock, kc_mock):
         """Test the call flow for get_network()."""
 
@@ -64,7 +65,7 @@ class TestNetwork(TestBase):
         network_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.network.NetworkService.get_network')
+    @patch('ccp_server.api.v1.networks.network.NetworkService.get_network', new_callable=MagicMock)
     def test_get_network_response(self, network_mock, kc_mock):
         """Test the network response for NetworkService.get_network()."""
 
@@ -86,7 +87,7 @@ class TestNetwork(TestBase):
         network_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.network.NetworkService.delete_network')
+    @patch('ccp_server.api.v1.networks.network.NetworkService.delete_network', new_callable=MagicMock)
     def test_delete_network(self, network_mock, kc_mock):
         """Test the call flow for NetworkService.delete_network()."""
 
@@ -101,7 +102,7 @@ class TestNetwork(TestBase):
         network_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.network.NetworkService.create_network')
+    @patch('ccp_server.api.v1.networks.network.NetworkService.create_network', new_callable=MagicMock)
     def test_create_network(self, network_mock, kc_mock):
         """Test the call flow for NetworkService.create_network()."""
 
@@ -116,7 +117,7 @@ class TestNetwork(TestBase):
         network_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.network.NetworkService.create_network')
+    @patch('ccp_server.api.v1.networks.network.NetworkService.create_network', new_callable=MagicMock)
     def test_create_network_response(self, network_mock, kc_mock):
         """Test the response for NetworkService.create_network()."""
 
@@ -134,7 +135,7 @@ class TestNetwork(TestBase):
         self.assertDictEqual(network_response, response.json())
         network_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.network.NetworkService.list_all_networks')
+    @patch('ccp_server.api.v1.networks.network.NetworkService.list_all_networks', new_callable=MagicMock)
     def test_list_all_networks(self, network_mock):
         """Test the call flow for NetworkService.list_all_networks()."""
 
@@ -148,7 +149,7 @@ class TestNetwork(TestBase):
         assert response is not None
         network_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.network.NetworkService.list_all_networks')
+    @patch('ccp_server.api.v1.networks.network.NetworkService.list_all_networks', new_callable=MagicMock)
     def test_list_all_network_response(self, network_mock):
         """Test the response for NetworkService.list_all_networks()."""
 
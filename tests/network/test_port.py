@@ -5,6 +5,7 @@
 # Written by Saurabh Choudhary <saurabhchoudhary@coredge.io>, march 2023      #
 ###############################################################################
 import os
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ccp_server.api.v1.networks.port import PortService
@@ -12,7 +13,7 @@ from tests.test_base import TestBase
 
 
 class TestPort(TestBase):
-    @patch('ccp_server.api.v1.networks.port.PortService.create_port')
+    @patch('ccp_server.api.v1.networks.port.PortService.create_port', new_callable=MagicMock)
     def test_create_port(self, port_mock):
         """Test the call flow for PortService.create_port()."""
 
@@ -26,7 +27,7 @@ class TestPort(TestBase):
         assert response is not None
         port_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.port.PortService.create_port')
+    @patch('ccp_server.api.v1.networks.port.PortService.create_port', new_callable=MagicMock)
     def test_create_port_response(self, port_mock):
         """Test the response for SubnetService.create_port()."""
 
@@ -44,7 +45,7 @@ class TestPort(TestBase):
         self.assertDictEqual(port_response, response.json())
         port_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.port.PortService.delete_port')
+    @patch('ccp_server.api.v1.networks.port.PortService.delete_port', new_callable=MagicMock)
     def test_delete_port(self, port_mock):
         """Test the call flow for PortService.delete_port()."""
 
@@ -58,7 +59,7 @@ class TestPort(TestBase):
         assert response is not None
         port_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.port.PortService.get_port')
+    @patch('ccp_server.api.v1.networks.port.PortService.get_port', new_callable=MagicMock)
     def test_get_port(self, port_mock):
         """Test the call flow for PortService.get_port()."""
 
@@ -72,7 +73,7 @@ class TestPort(TestBase):
         assert response is not None
         port_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.port.PortService.get_port')
+    @patch('ccp_server.api.v1.networks.port.PortService.get_port', new_callable=MagicMock)
     def test_get_port_response(self, port_mock):
         """Test the subnet response for PortService.get_port()."""
 
@@ -93,7 +94,7 @@ class TestPort(TestBase):
         self.assertListEqual(port_keys, list(response.json().keys()))
         port_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.port.PortService.list_ports_by_network_id')
+    @patch('ccp_server.api.v1.networks.port.PortService.list_ports_by_network_id', new_callable=MagicMock)
     def test_list_ports_by_network_id(self, port_mock):
         """Test the call flow for PortService.list_ports_by_network_id()."""
 
@@ -107,7 +108,7 @@ class TestPort(TestBase):
         assert response is not None
         port_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.port.PortService.list_ports_by_network_id')
+    @patch('ccp_server.api.v1.networks.port.PortService.list_ports_by_network_id', new_callable=MagicMock)
     def test_list_ports_by_network_id_response(self, port_mock):
         """Test the response for PortService.list_ports_by_network_id()."""
 
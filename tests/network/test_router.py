@@ -5,6 +5,7 @@
 # Written by Saurabh Choudhary <saurabhchoudhary@coredge.io>, march 2023      #
 ###############################################################################
 import os
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ccp_server.api.v1.networks.router import RouterService
@@ -12,7 +13,7 @@ from tests.test_base import TestBase
 
 
 class TestRouter(TestBase):
-    @patch('ccp_server.api.v1.networks.router.RouterService.create_router')
+    @patch('ccp_server.api.v1.networks.router.RouterService.create_router', new_callable=MagicMock)
     def test_create_router(self, router_mock):
         """Test the call flow for RouterService.create_router()."""
 
@@ -26,7 +27,7 @@ class TestRouter(TestBase):
         assert response is not None
         router_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.router.RouterService.create_router')
+    @patch('ccp_server.api.v1.networks.router.RouterService.create_router', new_callable=MagicMock)
     def test_create_router_response(self, router_mock):
         """Test the response for RouterService.create_router()."""
 
@@ -44,7 +45,7 @@ class TestRouter(TestBase):
         self.assertDictEqual(router_response, response.json())
         router_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.router.RouterService.delete_router')
+    @patch('ccp_server.api.v1.networks.router.RouterService.delete_router', new_callable=MagicMock)
     def test_delete_router(self, router_mock):
         """Test the call flow for RouterService.delete_router()."""
 
@@ -58,7 +59,7 @@ class TestRouter(TestBase):
         assert response is not None
         router_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.router.RouterService.get_router')
+    @patch('ccp_server.api.v1.networks.router.RouterService.get_router', new_callable=MagicMock)
     def test_get_router(self, router_mock):
         """Test the call flow for RouterService.get_router()."""
 
@@ -72,7 +73,7 @@ class TestRouter(TestBase):
         assert response is not None
         router_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.router.RouterService.get_router')
+    @patch('ccp_server.api.v1.networks.router.RouterService.get_router', new_callable=MagicMock)
     def test_get_router_response(self, router_mock):
         """Test the subnet response for RouterService.get_router()."""
 
@@ -93,7 +94,7 @@ class TestRouter(TestBase):
         self.assertListEqual(router_keys, list(response.json().keys()))
         router_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.router.RouterService.list_routers_by_project_id')
+    @patch('ccp_server.api.v1.networks.router.RouterService.list_routers_by_project_id', new_callable=MagicMock)
     def test_list_router(self, router_mock):
         """Test the call flow for RouterService.list_routers_by_project_id()."""
 
@@ -107,7 +108,7 @@ class TestRouter(TestBase):
         assert response is not None
         router_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.router.RouterService.list_routers_by_project_id')
+    @patch('ccp_server.api.v1.networks.router.RouterService.list_routers_by_project_id', new_callable=MagicMock)
     def test_list_routers_by_project_id_response(self, router_mock):
         """Test the response for RouterService.list_routers_by_project_id()."""
 
@@ -125,7 +126,7 @@ class TestRouter(TestBase):
         self.assertListEqual(routers, response.json())
         router_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.router.RouterService.list_all_routers')
+    @patch('ccp_server.api.v1.networks.router.RouterService.list_all_routers', new_callable=MagicMock)
     def test_list_all_router(self, router_mock):
         """Test the call flow for RouterService.list_all_routers()."""
 
@@ -139,7 +140,7 @@ class TestRouter(TestBase):
         assert response is not None
         router_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.router.RouterService.list_all_routers')
+    @patch('ccp_server.api.v1.networks.router.RouterService.list_all_routers', new_callable=MagicMock)
     def test_list_all_routers_response(self, router_mock):
         """Test the response for RouterService.list_all_routers()."""
 
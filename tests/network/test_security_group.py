@@ -5,6 +5,7 @@
 # Written by Saurabh Choudhary <saurabhchoudhary@coredge.io>, march 2023      #
 ###############################################################################
 import os
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ccp_server.api.v1.networks.security_group import SecurityGroupService
@@ -12,7 +13,8 @@ from tests.test_base import TestBase
 
 
 class TestSecurityGroup(TestBase):
-    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.create_security_group')
+    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.create_security_group',
+           new_callable=MagicMock)
     def test_create_security_group(self, security_group_mock):
         """Test the call flow for SecurityGroupService.create_security_group()."""
 
@@ -26,7 +28,8 @@ class TestSecurityGroup(TestBase):
         assert response is not None
         security_group_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.create_security_group')
+    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.create_security_group',
+           new_callable=MagicMock)
     def test_create_security_group_response(self, security_group_mock):
         """Test the response for SecurityGroupService.create_security_group()."""
 
@@ -44,7 +47,8 @@ class TestSecurityGroup(TestBase):
         self.assertDictEqual(security_group_response, response.json())
         security_group_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.delete_security_group')
+    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.delete_security_group',
+           new_callable=MagicMock)
     def test_delete_security_group(self, security_group_mock):
         """Test the call flow for SecurityGroupService.delete_security_group()."""
 
@@ -59,7 +63,7 @@ class TestSecurityGroup(TestBase):
         assert response is not None
         security_group_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.get_security_group')
+    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.get_security_group', new_callable=MagicMock)
     def test_get_security_group(self, security_group_mock):
         """Test the call flow for SecurityGroupService.get_security_group()."""
 
@@ -74,7 +78,7 @@ class TestSecurityGroup(TestBase):
         assert response is not None
         security_group_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.get_security_group')
+    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.get_security_group', new_callable=MagicMock)
     def test_get_security_group_response(self, security_group_mock):
         """Test the security_group response for SecurityGroupService.get_security_group()."""
 
@@ -96,7 +100,8 @@ class TestSecurityGroup(TestBase):
         self.assertListEqual(security_group_keys, list(response.json().keys()))
         security_group_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.list_all_security_groups')
+    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.list_all_security_groups',
+           new_callable=MagicMock)
     def test_list_all_security_group(self, security_group_mock):
         """Test the call flow for SecurityGroupService.list_all_security_groups()."""
 
@@ -110,7 +115,8 @@ class TestSecurityGroup(TestBase):
         assert response is not None
         security_group_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.list_all_security_groups')
+    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.list_all_security_groups',
+           new_callable=MagicMock)
     def test_list_all_security_groups_response(self, security_group_mock):
         """Test the response for SecurityGroupService.list_all_security_groups()."""
 
@@ -128,7 +134,8 @@ class TestSecurityGroup(TestBase):
         self.assertListEqual(security_groups, response.json())
         security_group_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.list_security_groups_by_project_id')
+    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.list_security_groups_by_project_id',
+           new_callable=MagicMock)
     def test_list_security_groups_by_project_id(self, security_group_mock):
         """Test the call flow for SecurityGroupService.list_security_groups_by_project_id()."""
 
@@ -142,7 +149,8 @@ class TestSecurityGroup(TestBase):
         assert response is not None
         security_group_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.list_security_groups_by_project_id')
+    @patch('ccp_server.api.v1.networks.security_group.SecurityGroupService.list_security_groups_by_project_id',
+           new_callable=MagicMock)
     def test_list_security_groups_by_project_id_response(self, security_group_mock):
         """Test the response for SecurityGroupService.list_security_groups_by_project_id()."""
 
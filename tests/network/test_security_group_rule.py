@@ -5,6 +5,7 @@
 # Written by Saurabh Choudhary <saurabhchoudhary@coredge.io>, march 2023      #
 ###############################################################################
 import os
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ccp_server.api.v1.networks.security_group_rule import SecurityGroupRuleService
@@ -12,7 +13,8 @@ from tests.test_base import TestBase
 
 
 class TestSecurityGroupRule(TestBase):
-    @patch('ccp_server.api.v1.networks.security_group_rule.SecurityGroupRuleService.create_security_group_rule')
+    @patch('ccp_server.api.v1.networks.security_group_rule.SecurityGroupRuleService.create_security_group_rule',
+           new_callable=MagicMock)
     def test_create_security_group_rule(self, security_group_rule_mock):
         """Test the call flow for SecurityGroupRuleService.create_security_group_rule()."""
 
@@ -26,7 +28,8 @@ class TestSecurityGroupRule(TestBase):
         assert response is not None
         security_group_rule_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.security_group_rule.SecurityGroupRuleService.create_security_group_rule')
+    @patch('ccp_server.api.v1.networks.security_group_rule.SecurityGroupRuleService.create_security_group_rule',
+           new_callable=MagicMock)
     def test_create_security_group_rule_response(self, security_group_rule_mock):
         """Test the response for SecurityGroupRuleService.create_security_group_rule()."""
 
@@ -44,7 +47,8 @@ class TestSecurityGroupRule(TestBase):
         self.assertDictEqual(security_group_rule_response, response.json())
         security_group_rule_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.security_group_rule.SecurityGroupRuleService.delete_security_group_rule')
+    @patch('ccp_server.api.v1.networks.security_group_rule.SecurityGroupRuleService.delete_security_group_rule',
+           new_callable=MagicMock)
     def test_delete_security_group_rule(self, security_group_rule_mock):
         """Test the call flow for SecurityGroupRuleService.delete_security_group_rule()."""
 
@@ -59,7 +63,8 @@ class TestSecurityGroupRule(TestBase):
         assert response is not None
         security_group_rule_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.security_group_rule.SecurityGroupRuleService.get_security_group_rule')
+    @patch('ccp_server.api.v1.networks.security_group_rule.SecurityGroupRuleService.get_security_group_rule',
+           new_callable=MagicMock)
     def test_get_security_group_rule(self, security_group_rule_mock):
         """Test the call flow for SecurityGroupRuleService.get_security_group_rule()."""
 
@@ -74,7 +79,8 @@ class TestSecurityGroupRule(TestBase):
         assert response is not None
         security_group_rule_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.security_group_rule.SecurityGroupRuleService.get_security_group_rule')
+    @patch('ccp_server.api.v1.networks.security_group_rule.SecurityGroupRuleService.get_security_group_rule',
+           new_callable=MagicMock)
     def test_get_security_group_rule_response(self, security_group_rule_mock):
         """Test the security_group_rule response for SecurityGroupRuleService.get_security_group_rule()."""
 
@@ -98,7 +104,8 @@ class TestSecurityGroupRule(TestBase):
                              list(response.json().keys()))
         security_group_rule_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.security_group_rule.SecurityGroupRuleService.list_security_group_rules')
+    @patch('ccp_server.api.v1.networks.security_group_rule.SecurityGroupRuleService.list_security_group_rules',
+           new_callable=MagicMock)
     def test_list_security_group_rules(self, security_group_rule_mock):
         """Test the call flow for SecurityGroupRuleService.list_security_group_rules()."""
 
@@ -112,7 +119,8 @@ class TestSecurityGroupRule(TestBase):
         assert response is not None
         security_group_rule_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.networks.security_group_rule.SecurityGroupRuleService.list_security_group_rules')
+    @patch('ccp_server.api.v1.networks.security_group_rule.SecurityGroupRuleService.list_security_group_rules',
+           new_callable=MagicMock)
     def test_list_security_group_rules_response(self, security_group_rule_mock):
         """Test the response for SecurityGroupRuleService.list_security_group_rules()."""
 
@@ -5,6 +5,7 @@
 # Written by Rajkumar Srinivasan <rajkumarsrinivasan@coredge.io>, Mar 2023    #
 ###############################################################################
 import os
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ccp_server.api.v1.networks.subnet import SubnetService
@@ -15,7 +16,7 @@ from tests.test_base import TestBase
 class TestSubnet(TestBase):
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.subnet.SubnetService.list_subnets_by_network_id')
+    @patch('ccp_server.api.v1.networks.subnet.SubnetService.list_subnets_by_network_id', new_callable=MagicMock)
     def test_list_subnets_by_network_id(self, subnet_mock, kc_mock):
         """Test the call flow for SubnetService.list_subnets_by_network_id()."""
 
@@ -30,7 +31,7 @@ class TestSubnet(TestBase):
         subnet_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.subnet.SubnetService.list_subnets_by_network_id')
+    @patch('ccp_server.api.v1.networks.subnet.SubnetService.list_subnets_by_network_id', new_callable=MagicMock)
     def test_list_subnets_by_network_id_response(self, subnet_mock, kc_mock):
         """Test the response for SubnetService.list_subnets_by_network_id()."""
 
@@ -49,7 +50,7 @@ class TestSubnet(TestBase):
         subnet_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.subnet.SubnetService.get_subnet')
+    @patch('ccp_server.api.v1.networks.subnet.SubnetService.get_subnet', new_callable=MagicMock)
     def test_get_subnet(self, subnet_mock, kc_mock):
         """Test the call flow for SubnetService.get_subnet()."""
 
@@ -64,7 +65,7 @@ class TestSubnet(TestBase):
         subnet_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.subnet.SubnetService.get_subnet')
+    @patch('ccp_server.api.v1.networks.subnet.SubnetService.get_subnet', new_callable=MagicMock)
     def test_get_subnet_response(self, subnet_mock, kc_mock):
         """Test the subnet response for SubnetService.get_subnet()."""
 
@@ -87,7 +88,7 @@ class TestSubnet(TestBase):
         subnet_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.subnet.SubnetService.delete_subnet')
+    @patch('ccp_server.api.v1.networks.subnet.SubnetService.delete_subnet', new_callable=MagicMock)
     def test_delete_subnet(self, subnet_mock, kc_mock):
         """Test the call flow for SubnetService.delete_subnet()."""
 
@@ -102,7 +103,7 @@ class TestSubnet(TestBase):
         subnet_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.subnet.SubnetService.create_subnet')
+    @patch('ccp_server.api.v1.networks.subnet.SubnetService.create_subnet', new_callable=MagicMock)
     def test_create_subnet(self, subnet_mock, kc_mock):
         """Test the call flow for SubnetService.create_subnet()."""
 
@@ -117,7 +118,7 @@ class TestSubnet(TestBase):
         subnet_mock.assert_called_once()
 
     @patch(KC_MOCK)
-    @patch('ccp_server.api.v1.networks.subnet.SubnetService.create_subnet')
+    @patch('ccp_server.api.v1.networks.subnet.SubnetService.create_subnet', new_callable=MagicMock)
     def test_create_subnet_response(self, subnet_mock, kc_mock):
         """Test the response for SubnetService.create_subnet()."""
 
@@ -0,0 +1,110 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import unittest
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from ccp_server.provider.openstack.connection import OpenstackConnection
+from ccp_server.util.constants import Constants
+from tests.test_base import TestBase
+
+CONTEXT_MOCK = 'ccp_server.provider.openstack.connection.ccp_context'
+OPENSTACK_CONNECT_MOCK = 'ccp_server.provider.openstack.connection.openstack.connect'
+
+
+class TestOpenstackConnection(TestBase):
+
+    def setUp(self) -> None:
+        OpenstackConnection.clear_connections()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        OpenstackConnection.clear_connections()
+        return super().tearDown()
+
+    @staticmethod
+    def mock_context(context_mock, cloud='noida-1', roles=None):
+        context_mock.get_cloud.return_value = cloud
+        context_mock.get_logged_in_user_roles.return_value = roles or [Constants.CCPRole.ORG_ADMIN]
+
+    @patch(OPENSTACK_CONNECT_MOCK)
+    @patch(CONTEXT_MOCK)
+    def test_connect_reuses_admin_connection(self, context_mock, connect_mock):
+        """Test that the admin connection of a cloud is created once and reused."""
+
+        # Given
+        self.mock_context(context_mock)
+        connect_mock.return_value.session.auth.auth_ref = None
+
+        # When
+        first = OpenstackConnection().connect()
+        second = OpenstackConnection().connect()
+
+        # Then
+        self.assertIs(first, second)
+        connect_mock.assert_called_once()
+
+    @patch(OPENSTACK_CONNECT_MOCK)
+    @patch(CONTEXT_MOCK)
+    def test_connect_per_cloud(self, context_mock, connect_mock):
+        """Test that each cloud gets its own connection."""
+
+        # Given
+        connect_mock.side_effect = lambda **kwargs: MagicMock()
+
+        # When
+        self.mock_context(context_mock, cloud='noida-1')
+        first = OpenstackConnection().connect()
+        self.mock_context(context_mock, cloud='noida-2')
+        second = OpenstackConnection().connect()
+
+        # Then
+        self.assertIsNot(first, second)
+        self.assertEqual(2, connect_mock.call_count)
+
+    @patch(OPENSTACK_CONNECT_MOCK)
+    @patch(CONTEXT_MOCK)
+    def test_connect_refreshes_expiring_token(self, context_mock, connect_mock):
+        """Test that a connection whose token is about to expire is re-created."""
+
+        # Given
+        self.mock_context(context_mock)
+        expiring = MagicMock()
+        expiring.session.auth.auth_ref.will_expire_soon.return_value = True
+        fresh = MagicMock()
+        connect_mock.side_effect = [expiring, fresh]
+
+        # When
+        OpenstackConnection().connect()
+        result = OpenstackConnection().connect()
+
+        # Then
+        self.assertIs(fresh, result)
+        expiring.session.auth.auth_ref.will_expire_soon.assert_called_once_with(
+            stale_duration=Constants.OPENSTACK_TOKEN_EXPIRY_MARGIN_IN_SECS)
+
+    @patch('ccp_server.provider.openstack.connection.Constants.OPENSTACK_CONNECTION_CACHE_SIZE', 1)
+    @patch(OPENSTACK_CONNECT_MOCK)
+    @patch(CONTEXT_MOCK)
+    def test_connect_evicts_least_recently_used(self, context_mock, connect_mock):
+        """Test that the least recently used connection is evicted above the cache size."""
+
+        # Given
+        connect_mock.side_effect = lambda **kwargs: MagicMock()
+
+        # When
+        self.mock_context(context_mock, cloud='noida-1')
+        OpenstackConnection().connect()
+        self.mock_context(context_mock, cloud='noida-2')
+        OpenstackConnection().connect()
+
+        # Then
+        self.assertEqual([('noida-2', OpenstackConnection.ADMIN_SCOPE, None, None)],
+                         list(OpenstackConnection.os_connections))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,82 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from ccp_server.provider.executor import ProviderExecutor
+from ccp_server.provider.openstack.storage.bucket import Bucket
+from ccp_server.util import ccp_context
+from ccp_server.util.constants import Constants
+from tests.test_base import TestBase
+
+
+class TestProviderExecutor(TestBase):
+
+    def setUp(self) -> None:
+        ProviderExecutor.shutdown(wait=True)
+        ProviderExecutor._metrics.clear()
+        ccp_context.set_request_data(Constants.CCPHeader.CLOUD_ID, 'noida-1')
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        ProviderExecutor.shutdown(wait=True)
+        ProviderExecutor._metrics.clear()
+        ccp_context.clear_context()
+        return super().tearDown()
+
+    def test_run_propagates_request_context(self):
+        """Test that the call runs off the calling thread with the request context of the caller."""
+
+        # Given
+        def blocking_call():
+            return threading.current_thread().name, ccp_context.get_cloud()
+
+        # When
+        thread_name, cloud = asyncio.run(ProviderExecutor.run(blocking_call))
+
+        # Then
+        self.assertTrue(thread_name.startswith('provider-noida-1'))
+        self.assertEqual(cloud, 'noida-1')
+        self.assertEqual(ProviderExecutor.metrics()['noida-1'],
+                         {'queued': 0, 'running': 0, 'completed': 1, 'failed': 0})
+
+    def test_run_counts_failed_calls(self):
+        """Test that an exception of the call is raised to the caller and counted as failed."""
+
+        # Given
+        def blocking_call(message):
+            raise ValueError(message)
+
+        # When
+        with self.assertRaises(ValueError):
+            asyncio.run(ProviderExecutor.run(blocking_call, 'boom'))
+
+        # Then
+        self.assertEqual(ProviderExecutor.metrics()['noida-1'],
+                         {'queued': 0, 'running': 0, 'completed': 1, 'failed': 1})
+
+    def test_bucket_object_calls_run_in_executor(self):
+        """Test that the boto calls of the bucket objects do not run on the event loop thread."""
+
+        # Given
+        threads = []
+        key = MagicMock()
+        key.get_contents_to_filename.side_effect = lambda path: threads.append(threading.current_thread().name)
+        connection = MagicMock()
+        connection.botoclient.return_value.get_bucket.return_value.get_key.return_value = key
+
+        # When
+        asyncio.run(Bucket(connection).download_object('bucket-1', 'object-1', '/tmp/'))
+
+        # Then
+        key.get_contents_to_filename.assert_called_once_with('/tmp/object-1')
+        self.assertTrue(threads[0].startswith('provider-noida-1'))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,109 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from ccp_server.provider.openstack.mapper.mapper import mapper
+from ccp_server.provider.openstack.mapper.mapper import mapper_stream
+from ccp_server.provider.openstack.mapper.mapper import MapperClass
+from ccp_server.util.utils import Utils
+from tests.test_base import TestBase
+
+CLOUD = 'noida-1'
+
+
+class TestMapper(TestBase):
+
+    def setUp(self) -> None:
+        MapperClass.plans = None
+        return super().setUp()
+
+    @staticmethod
+    def subnet(subnet_id: str) -> dict:
+        return {'id': subnet_id, 'network_id': 'net-1', 'name': 'subnet', 'cidr': '10.0.0.0/24', 'ip_version': 4,
+                'gateway_ip': '10.0.0.1', 'enable_dhcp': True, 'dns_nameservers': ['8.8.8.8'],
+                'allocation_pools': [{'start': '10.0.0.2', 'end': '10.0.0.254'}], 'host_routes': []}
+
+    def test_list_translation_reads_yaml_once(self):
+        """Test that translating a list compiles the mapper yaml once and keeps the order of the items."""
+
+        # Given
+        data = [self.subnet(f'subnet-{i}') for i in range(50)]
+
+        # When
+        with patch.object(Utils, 'get_mapper_yaml_path', wraps=Utils.get_mapper_yaml_path) as path_mock:
+            result = asyncio.run(mapper('subnet', data, cloud=CLOUD, cloud_type='openstack'))
+            asyncio.run(mapper('subnet', data[:1], cloud=CLOUD, cloud_type='openstack'))
+
+        # Then
+        path_mock.assert_called_once()
+        self.assertEqual([subnet.reference_id for subnet in result], [f'subnet-{i}' for i in range(50)])
+
+    def test_dotted_paths_resolve_leaves(self):
+        """Test that dotted paths pick nested values and only scalars or lists of strings are mapped."""
+
+        # Given
+        image = {'id': 'image-1', 'name': 'ubuntu', 'properties': {'description': 'Ubuntu 22.04'},
+                 'location': {'cloud': CLOUD}, 'status': 'active', 'visibility': 'public', 'is_protected': False,
+                 'is_hidden': False, 'disk_format': 'qcow2', 'size': 1024, 'container_format': 'bare',
+                 'tags': ['linux'], 'min_disk': 10}
+
+        # When
+        result = asyncio.run(mapper('image', image, cloud=CLOUD, cloud_type='openstack'))
+
+        # Then
+        self.assertEqual(result.description, 'Ubuntu 22.04')
+        self.assertEqual(result.cloud, CLOUD)
+        self.assertEqual(result.tags, ['linux'])
+        self.assertEqual(result.cloud_meta, image)
+
+    def test_lists_of_objects_are_not_leaves(self):
+        """Test that unmapped schema fields are picked by name and lists of objects are left to cloud_meta."""
+
+        # When
+        result = asyncio.run(mapper('subnet', self.subnet('subnet-1'), cloud=CLOUD, cloud_type='openstack'))
+
+        # Then
+        self.assertEqual(result.dns_nameservers, ['8.8.8.8'])
+        self.assertIsNone(result.allocation_pools)
+        self.assertEqual(result.cloud_meta['allocation_pools'], [{'start': '10.0.0.2', 'end': '10.0.0.254'}])
+
+    @patch('ccp_server.provider.openstack.mapper.mapper.Constants.MAPPER_CHUNK_SIZE', 7)
+    @patch('ccp_server.provider.openstack.mapper.mapper.Constants.MAPPER_PARALLEL_THRESHOLD', 20)
+    def test_big_list_translated_on_process_pool_in_order(self):
+        """Test that a list above the threshold is mapped in chunks on the process pool and keeps its order."""
+
+        # Given
+        data = [self.subnet(f'subnet-{i}') for i in range(30)]
+
+        # When
+        try:
+            result = asyncio.run(mapper('subnet', data, cloud=CLOUD, cloud_type='openstack'))
+            chunks = asyncio.run(self.collect(mapper_stream('subnet', data, cloud=CLOUD, cloud_type='openstack')))
+        finally:
+            MapperClass.shutdown_process_pool()
+
+        # Then
+        self.assertEqual([subnet.reference_id for subnet in result], [f'subnet-{i}' for i in range(30)])
+        self.assertEqual([len(chunk) for chunk in chunks], [7, 7, 7, 7, 2])
+        self.assertEqual([subnet.dict() for chunk in chunks for subnet in chunk],
+                         [subnet.dict() for subnet in result])
+
+    @staticmethod
+    async def collect(stream):
+        return [chunk async for chunk in stream]
+
+    def test_unknown_resource_raises(self):
+        """Test that a resource without a map raises an exception."""
+
+        # When / Then
+        with self.assertRaises(Exception):
+            asyncio.run(mapper('unknown', {'id': '1'}, cloud=CLOUD, cloud_type='openstack'))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
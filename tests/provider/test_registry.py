@@ -0,0 +1,67 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import unittest
+
+from ccp_server.db.mongo import MongoAPI
+from ccp_server.service.providers import Provider
+from ccp_server.service.volume import VolumeService
+from ccp_server.util.constants import Constants
+from tests.test_base import TestBase
+
+
+class TestProviderRegistry(TestBase):
+
+    def setUp(self) -> None:
+        Provider.close()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        Provider.close()
+        return super().tearDown()
+
+    def test_services_share_providers_and_mongo(self):
+        """Test that the cloud providers and the mongo connection are created once for all the services."""
+
+        # Given
+        Provider.init()
+        openstack = Provider.cloud_connections[Constants.CLOUD_TYPE_OPENSTACK]
+        mongo = Provider.mongo
+
+        # When
+        first_service, second_service = VolumeService(), Provider()
+
+        # Then
+        self.assertIs(first_service.db, mongo)
+        self.assertIs(second_service.db, mongo)
+        self.assertIs(Provider.cloud_connections[Constants.CLOUD_TYPE_OPENSTACK], openstack)
+
+    def test_mongo_client_shared_per_connection_string(self):
+        """Test that the MongoAPI objects of the same connection string use one motor client."""
+
+        # When
+        first, second = MongoAPI(), MongoAPI(db_name='other')
+
+        # Then
+        self.assertIs(first.client, second.client)
+
+    def test_close_releases_registry(self):
+        """Test that closing the registry creates new providers and mongo client on the next access."""
+
+        # Given
+        Provider.init()
+        mongo = Provider.mongo
+
+        # When
+        Provider.close()
+
+        # Then
+        self.assertIsNone(Provider.mongo)
+        self.assertIsNot(Provider().db, mongo)
+        self.assertIsNot(Provider.mongo.client, mongo.client)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,98 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import time
+import unittest
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from ccp_server.service.audit import AuditService
+from tests.test_base import TestBase
+
+
+class TestAuditService(TestBase):
+
+    def audit_service(self) -> AuditService:
+        audit_service = AuditService()
+        self.insert_many = AsyncMock()
+        audit_service.db = MagicMock(db={'AuditLog': MagicMock(insert_many=self.insert_many)})
+        return audit_service
+
+    @staticmethod
+    def request(path: str = '/api/v1/projects'):
+        return MagicMock(url=MagicMock(path=path), method='GET', headers={}, client=MagicMock(host='10.0.0.1'))
+
+    def write(self, audit_service: AuditService, count: int):
+        return [audit_service.write_audit_log(self.request(), 200, f'audit-{index}', time.time(), 0.1)
+                for index in range(count)]
+
+    def test_records_written_in_batches_and_flushed_on_stop(self):
+        """Test that the queued records are written with insert_many in batches and the rest on stop."""
+
+        # Given
+        audit_service = self.audit_service()
+
+        async def run():
+            audit_service.start()
+            await asyncio.gather(*self.write(audit_service, 5))
+            await audit_service.stop()
+
+        # When
+        with patch('ccp_server.service.audit.Constants.AUDIT_BATCH_SIZE', 2):
+            asyncio.run(run())
+
+        # Then
+        batches = [call.args[0] for call in self.insert_many.await_args_list]
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual([record['audit_id'] for batch in batches for record in batch],
+                         [f'audit-{index}' for index in range(5)])
+        self.assertEqual(audit_service.metrics(), {'queued': 5, 'written': 5, 'dropped': 0, 'failed': 0, 'depth': 0})
+
+    def test_records_dropped_when_queue_full(self):
+        """Test that the records beyond the queue size are dropped and counted without blocking the request."""
+
+        # Given
+        audit_service = self.audit_service()
+
+        async def run():
+            audit_service.start()
+            # The writer does not run until this coroutine yields, so the queue fills up
+            for write in self.write(audit_service, 8):
+                await write
+            metrics = audit_service.metrics()
+            await audit_service.stop()
+            return metrics
+
+        # When
+        with patch('ccp_server.service.audit.Constants.AUDIT_QUEUE_SIZE', 3), \
+                patch('ccp_server.service.audit.Constants.AUDIT_BATCH_SIZE', 1), \
+                patch('ccp_server.service.audit.LOG') as log_mock:
+            metrics = asyncio.run(run())
+
+        # Then
+        self.assertEqual((metrics['queued'], metrics['dropped'], metrics['depth']), (3, 5, 3))
+        self.assertEqual(audit_service.metrics()['written'], 3)
+        self.assertEqual([call.args[0].split(', ')[1] for call in log_mock.warn.call_args_list],
+                         ['1 records dropped so far', '2 records dropped so far', '4 records dropped so far'])
+
+    def test_unaudited_urls_and_write_without_writer(self):
+        """Test that the unaudited URLs are skipped and the records are written directly without the writer."""
+
+        # Given
+        audit_service = self.audit_service()
+
+        # When
+        asyncio.run(audit_service.write_audit_log(self.request('/docs'), 200, 'audit-0', time.time(), 0.1))
+        asyncio.run(audit_service.write_audit_log(self.request(), 200, 'audit-1', time.time(), 0.1))
+
+        # Then
+        self.insert_many.assert_awaited_once()
+        self.assertEqual(self.insert_many.await_args.args[0][0]['audit_id'], 'audit-1')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,101 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from unittest.mock import PropertyMock
+
+from ccp_server.db.mongo import BulkWriteResult
+from ccp_server.schema.v1 import schemas
+from ccp_server.service.volume import VolumeService
+from ccp_server.util.constants import Constants
+from ccp_server.util.enums import BatchItemStatus
+from ccp_server.util.messages import Message
+from tests.test_base import TestBase
+
+
+class TestCreateBatch(TestBase):
+
+    def setUp(self) -> None:
+        self.db = MagicMock()
+        self.connect = MagicMock()
+        self.running = 0
+        self.max_running = 0
+        patches = [patch('ccp_server.service.providers.Provider.db', new_callable=PropertyMock, return_value=self.db),
+                   patch('ccp_server.service.providers.Provider.connect', new_callable=PropertyMock,
+                         return_value=self.connect),
+                   patch('ccp_server.util.constants.Constants.CLOUD_CONCURRENCY_LIMIT', 2)]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return super().setUp()
+
+    async def create_volume(self, request):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if request.size > 100:
+            raise ValueError('quota exceeded')
+        return {'reference_id': f'ref-{request.size}', 'size': request.size}
+
+    def test_names_checked_once_and_saved_with_one_insert(self):
+        """Test that taken and repeated names fail, the cloud calls are capped and the rest is inserted at once."""
+
+        # Given
+        self.db.get_existing_names = AsyncMock(return_value={'taken'})
+        self.db.write_many = AsyncMock(return_value=BulkWriteResult(['u1', 'u2', 'u3']))
+        self.connect.volume.create_volume = AsyncMock(side_effect=self.create_volume)
+        requests = [schemas.Volume(name=name, size=size) for name, size in
+                    [('Taken', 1), ('web', 2), ('WEB', 3), ('db', 200), ('logs', 4), (None, 5)]]
+
+        # When
+        response = asyncio.run(VolumeService().create_volumes('p1', requests))
+
+        # Then
+        self.db.get_existing_names.assert_awaited_once_with(Constants.MongoCollection.VOLUME,
+                                                            ['Taken', 'web', 'WEB', 'db', 'logs'], project_id='p1')
+        self.assertEqual(self.connect.volume.create_volume.await_count, 4)
+        self.assertEqual(self.max_running, 2)
+        saved = self.db.write_many.call_args.args[1]
+        self.assertEqual([(doc.get('name'), doc['reference_id']) for doc in saved],
+                         [('web', 'ref-2'), ('logs', 'ref-4'), (None, 'ref-5')])
+        self.assertTrue(self.db.write_many.call_args.kwargs['with_default_details'])
+        self.assertEqual([(item.status, item.id, item.error) for item in response.items],
+                         [(BatchItemStatus.FAILED, None, Message.NAME_ALREADY_EXISTS.format('Taken')),
+                          (BatchItemStatus.CREATED, 'u1', None),
+                          (BatchItemStatus.FAILED, None, Message.NAME_REPEATED_IN_BATCH.format('WEB')),
+                          (BatchItemStatus.FAILED, None, 'quota exceeded'),
+                          (BatchItemStatus.CREATED, 'u2', None),
+                          (BatchItemStatus.CREATED, 'u3', None)])
+        self.assertEqual((response.created, response.failed), (3, 3))
+
+    def test_cloud_resource_deleted_when_not_saved(self):
+        """Test that a volume whose document is refused is deleted from the cloud and reported as failed."""
+
+        # Given
+        self.db.get_existing_names = AsyncMock(return_value=set())
+        result = BulkWriteResult(['u1', 'u2'])
+        result.add_error(0, 1, 11000, 'E11000 duplicate key')
+        self.db.write_many = AsyncMock(return_value=result)
+        self.connect.volume.create_volume = AsyncMock(side_effect=self.create_volume)
+        self.connect.volume.delete_volume = AsyncMock()
+        requests = [schemas.Volume(name=name, size=size) for name, size in [('web', 1), ('db', 2)]]
+
+        # When
+        response = asyncio.run(VolumeService().create_volumes('p1', requests))
+
+        # Then
+        self.connect.volume.delete_volume.assert_awaited_once_with('ref-2')
+        self.assertEqual([(item.status, item.error) for item in response.items],
+                         [(BatchItemStatus.CREATED, None),
+                          (BatchItemStatus.FAILED, Message.NAME_ALREADY_EXISTS.format('db'))])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,136 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from unittest.mock import PropertyMock
+
+from starlette.datastructures import State
+
+from ccp_server.schema.v1.response_schemas import IDResponse
+from ccp_server.service.job import Job
+from ccp_server.service.job import JobService
+from ccp_server.service.job import JobWorker
+from ccp_server.util import ccp_context
+from ccp_server.util.constants import Constants
+from ccp_server.util.enums import JobStatus
+from tests.test_base import TestBase
+
+TEST_JOB = 'test_job'
+
+
+class TestJobs(TestBase):
+
+    def setUp(self) -> None:
+        self.jobs = MagicMock(insert_one=AsyncMock(), find_one_and_update=AsyncMock(), update_one=AsyncMock())
+        patcher = patch('ccp_server.service.providers.Provider.db', new_callable=PropertyMock,
+                        return_value=MagicMock(db={Constants.MongoCollection.JOB: self.jobs}))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.calls = []
+
+        @JobService.handler(TEST_JOB)
+        async def run_test_job(job: Job):
+            await job.progress(50, 'half way')
+            self.calls.append((job.payload, ccp_context.get_org(), ccp_context.get_logged_in_user()))
+            if job.payload.get('fail'):
+                raise ValueError('cloud is down')
+            return IDResponse('volume-1')
+
+        self.addCleanup(JobService._handlers.pop, TEST_JOB)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        ccp_context.clear_context()
+        return super().tearDown()
+
+    @staticmethod
+    def job_doc(payload: dict, attempts: int = 1, max_attempts: int = 1) -> dict:
+        return {'uuid': 'job-1', 'type': TEST_JOB, 'payload': payload, 'attempts': attempts,
+                'max_attempts': max_attempts, 'cloud': 'openstack', 'org_id': 'org-1', 'project_id': 'p1',
+                'created_by': 'user@example.com', 'roles': ['member']}
+
+    def test_enqueue_keeps_request_context(self):
+        """Test that a queued job records the cloud, org, project and user of the request."""
+
+        # Given
+        state = State({Constants.USERNAME: 'user@example.com', Constants.CCP_ROLES: ['member']})
+        ccp_context.set_request_data(Constants.CURRENT_REQUEST, SimpleNamespace(state=state))
+        ccp_context.set_request_data(Constants.CCPHeader.CLOUD_ID, 'openstack')
+        ccp_context.set_request_data(Constants.CCPHeader.ORG_ID, 'org-1')
+
+        # When
+        job_id = asyncio.run(JobService().enqueue(TEST_JOB, {'size': 1}, project_id='p1'))
+
+        # Then
+        doc = self.jobs.insert_one.call_args.args[0]
+        self.assertEqual(doc['uuid'], job_id)
+        self.assertEqual((doc['status'], doc['attempts'], doc['payload']), (JobStatus.QUEUED.value, 0, {'size': 1}))
+        self.assertEqual((doc['cloud'], doc['org_id'], doc['project_id'], doc['created_by'], doc['roles']),
+                         ('openstack', 'org-1', 'p1', 'user@example.com', ['member']))
+
+    def test_worker_runs_job_in_its_context(self):
+        """Test that the handler runs with the context of the job and its result is saved without the payload."""
+
+        # Given
+        self.jobs.find_one_and_update.return_value = self.job_doc({'size': 1})
+
+        # When
+        ran = asyncio.run(JobWorker(name='worker-1').run_once())
+
+        # Then
+        self.assertTrue(ran)
+        self.assertEqual(self.calls, [({'size': 1}, 'org-1', 'user@example.com')])
+        progress, finish = self.jobs.update_one.call_args_list
+        self.assertEqual(progress.args[1]['$set']['progress'], 50)
+        self.assertEqual(finish.args[0], {'uuid': 'job-1', 'worker': 'worker-1'})
+        self.assertEqual(finish.args[1]['$set']['status'], JobStatus.SUCCEEDED.value)
+        self.assertEqual(finish.args[1]['$set']['result'], {'id': 'volume-1'})
+        self.assertIn('payload', finish.args[1]['$unset'])
+        self.assertIsNone(ccp_context.get_request_data())
+
+    def test_failed_job_retried_until_no_attempt_left(self):
+        """Test that a failed job is queued again while it has attempts left and then fails."""
+
+        # Given
+        self.jobs.find_one_and_update.side_effect = [self.job_doc({'fail': True}, attempts=1, max_attempts=2),
+                                                     self.job_doc({'fail': True}, attempts=2, max_attempts=2)]
+        worker = JobWorker(name='worker-1')
+
+        # When
+        asyncio.run(worker.run_once())
+        asyncio.run(worker.run_once())
+
+        # Then
+        retried, failed = [call.args[1] for call in self.jobs.update_one.call_args_list[1::2]]
+        self.assertEqual((retried['$set']['status'], retried['$set']['error']), (JobStatus.QUEUED.value,
+                                                                                  'cloud is down'))
+        self.assertNotIn('payload', retried['$unset'])
+        self.assertEqual((failed['$set']['status'], failed['$set']['error']), (JobStatus.FAILED.value,
+                                                                                'cloud is down'))
+        self.assertIn('payload', failed['$unset'])
+
+    def test_idle_worker_claims_nothing(self):
+        """Test that a worker without a due job does not run anything."""
+
+        # Given
+        self.jobs.find_one_and_update.return_value = None
+
+        # When
+        ran = asyncio.run(JobWorker(name='worker-1').run_once())
+
+        # Then
+        self.assertFalse(ran)
+        claim_filter = self.jobs.find_one_and_update.call_args.args[0]
+        self.assertEqual(claim_filter['$or'][0]['status'], JobStatus.QUEUED.value)
+        self.jobs.update_one.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
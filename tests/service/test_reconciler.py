@@ -0,0 +1,127 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from unittest.mock import PropertyMock
+
+from ccp_server.db.mongo import BulkWriteResult
+from ccp_server.service.reconciler import StatusReconciler
+from ccp_server.util import ccp_context
+from ccp_server.util.constants import Constants
+from tests.test_base import TestBase
+
+INSTANCE_KEY = ('openstack', 'org-1', 'p1', Constants.MongoCollection.INSTANCE)
+
+
+class FakeCursor:
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def __aiter__(self):
+        for doc in self.docs:
+            yield doc
+
+
+class TestStatusReconciler(TestBase):
+
+    def setUp(self) -> None:
+        self.collections = {name: MagicMock(find=MagicMock(return_value=FakeCursor([]))) for name in
+                            (Constants.MongoCollection.INSTANCE, Constants.MongoCollection.VOLUME)}
+        self.collections[Constants.MongoCollection.PROJECT] = MagicMock(
+            find=MagicMock(side_effect=lambda *_: FakeCursor([{'uuid': 'p1', 'reference_id': 'os-p1'}])))
+        self.db = MagicMock(db=self.collections, bulk_write=AsyncMock(side_effect=self.bulk_write))
+        self.connect = MagicMock()
+        self.contexts = []
+        patches = [patch('ccp_server.service.providers.Provider.db', new_callable=PropertyMock, return_value=self.db),
+                   patch('ccp_server.service.providers.Provider.connect', new_callable=PropertyMock,
+                         return_value=self.connect)]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return super().setUp()
+
+    async def bulk_write(self, collection_name, requests, uuids, **kwargs):
+        result = BulkWriteResult(uuids)
+        result.modified = len(requests)
+        return result
+
+    def track(self, collection: str, docs) -> None:
+        for doc in docs:
+            doc.update({'cloud': 'openstack', 'org_id': 'org-1', 'project_id': 'p1'})
+        self.collections[collection].find = MagicMock(side_effect=lambda *_: FakeCursor(docs))
+
+    def list_instances(self, statuses):
+        async def list_project_instances(project_id):
+            self.contexts.append((project_id, ccp_context.get_cloud(), ccp_context.get_logged_in_user_roles()))
+            return [{'reference_id': ref, 'status': status, 'vm_state': status.lower(), 'task_state': None,
+                     'power_state': 1} for ref, status in statuses.items()]
+        self.connect.compute.instance.list_project_instances = AsyncMock(side_effect=list_project_instances)
+
+    def test_group_refreshed_with_one_list_call_and_one_bulk_write(self):
+        """Test that the tracked resources of a project are listed once and only their changes are written."""
+
+        # Given
+        self.track(Constants.MongoCollection.INSTANCE, [
+            {'uuid': 'i1', 'reference_id': 'r1', 'status': 'REBOOT', 'vm_state': 'rebooting', 'power_state': 1},
+            {'uuid': 'i2', 'reference_id': 'r2', 'status': 'BUILD', 'vm_state': 'build', 'task_state': None,
+             'power_state': 1},
+            {'uuid': 'i3', 'reference_id': 'gone', 'status': 'STOP', 'vm_state': 'stopped'}])
+        self.track(Constants.MongoCollection.VOLUME, [{'uuid': 'v1', 'reference_id': 'vr1', 'status': 'attaching'}])
+        self.connect.volume.list_project_volumes = AsyncMock(
+            return_value=[{'reference_id': 'vr1', 'status': 'in-use', 'attachments': [{'server_id': 'r1'}]}])
+        self.list_instances({'r1': 'ACTIVE', 'r2': 'BUILD'})
+
+        # When
+        modified = asyncio.run(StatusReconciler().run_once())
+
+        # Then
+        self.assertEqual(modified, 2)
+        self.assertEqual(self.contexts, [('os-p1', 'openstack', [Constants.CCPRole.SUPER_ADMIN])])
+        self.connect.volume.list_project_volumes.assert_awaited_once_with('os-p1')
+        instance_write, volume_write = self.db.bulk_write.call_args_list
+        self.assertEqual(instance_write.args[2], ['i1'])
+        self.assertEqual(instance_write.args[1][0]._filter, {'uuid': 'i1', 'status': 'REBOOT'})
+        self.assertEqual(instance_write.args[1][0]._doc, {'$set': {'status': 'ACTIVE', 'vm_state': 'active'}})
+        self.assertEqual(volume_write.args[1][0]._doc, {'$set': {'status': 'in-use',
+                                                                'attachments': [{'server_id': 'r1'}]}})
+        self.assertIsNone(ccp_context.get_request_data())
+
+    def test_unchanged_group_backs_off(self):
+        """Test that a group without changes is refreshed less often and a change brings it back."""
+
+        # Given
+        self.track(Constants.MongoCollection.INSTANCE, [
+            {'uuid': 'i1', 'reference_id': 'r1', 'status': 'BUILD', 'vm_state': 'build', 'task_state': None,
+             'power_state': 1}])
+        self.list_instances({'r1': 'BUILD'})
+        reconciler = StatusReconciler()
+
+        # When
+        asyncio.run(reconciler.run_once())
+        asyncio.run(reconciler.run_once())
+        first_interval = reconciler.intervals[INSTANCE_KEY]
+        reconciler.due[INSTANCE_KEY] = 0
+        asyncio.run(reconciler.run_once())
+        backed_off_interval = reconciler.intervals[INSTANCE_KEY]
+        self.list_instances({'r1': 'ACTIVE'})
+        reconciler.due[INSTANCE_KEY] = 0
+        asyncio.run(reconciler.run_once())
+
+        # Then
+        self.assertEqual(len(self.contexts), 3)
+        self.assertEqual(first_interval, Constants.RECONCILE_MIN_INTERVAL_IN_SECS)
+        self.assertEqual(backed_off_interval,
+                         Constants.RECONCILE_MIN_INTERVAL_IN_SECS * Constants.RECONCILE_BACKOFF_FACTOR)
+        self.assertEqual(reconciler.intervals[INSTANCE_KEY], Constants.RECONCILE_MIN_INTERVAL_IN_SECS)
+        self.db.bulk_write.assert_awaited_once()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
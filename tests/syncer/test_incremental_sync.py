@@ -0,0 +1,212 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import unittest
+from datetime import datetime
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from ccp_server.util import ccp_context
+from ccp_server.util.constants import Constants
+from ccp_syncer.heatstack_resources import StackResources
+from ccp_syncer.syncer import SyncResources
+from ccp_syncer.syncer_util import SyncerService
+from tests.test_base import TestBase
+
+
+class FakeCursor:
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def __aiter__(self):
+        for doc in self.docs:
+            yield doc
+
+
+class NetworkLister:
+    calls = []
+
+    async def list_all_networks(self, pageable=None, use_db=True, changes_since=None):
+        NetworkLister.calls.append(changes_since)
+        return [{'reference_id': 'n1'}], 1
+
+
+class TestIncrementalSync(TestBase):
+
+    def setUp(self) -> None:
+        NetworkLister.calls = []
+        self.syncer = MagicMock(get_changes_since=AsyncMock(), sync_and_add_in_db=AsyncMock(return_value=True),
+                                save_watermark=AsyncMock())
+        patcher = patch('ccp_syncer.syncer.SyncerService', return_value=self.syncer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        ccp_context.clear_context()
+        return super().tearDown()
+
+    def sync(self) -> None:
+        asyncio.run(SyncResources().sync_resources(Constants.MongoCollection.NETWORK, NetworkLister,
+                                                   'list_all_networks', cloud='openstack'))
+
+    def test_changed_resources_synced_since_watermark(self):
+        """Test that only the changed resources are listed and synced without marking the others deleted."""
+
+        # Given
+        since = datetime(2023, 3, 1, 10, 0)
+        self.syncer.get_changes_since.return_value = since
+
+        # When
+        self.sync()
+
+        # Then
+        self.assertEqual(NetworkLister.calls, [since])
+        kwargs = self.syncer.sync_and_add_in_db.call_args.kwargs
+        self.assertEqual((kwargs['cloud_data'], kwargs['partial']), ([{'reference_id': 'n1'}], True))
+        self.assertEqual(self.syncer.save_watermark.call_args.args[:2],
+                         ('openstack', Constants.MongoCollection.NETWORK))
+        self.assertFalse(self.syncer.save_watermark.call_args.kwargs['full'])
+
+    def test_full_sync_when_due(self):
+        """Test that every resource is listed when a full sync is due and the full sync time is saved."""
+
+        # Given
+        self.syncer.get_changes_since.return_value = None
+
+        # When
+        self.sync()
+
+        # Then
+        self.assertEqual(NetworkLister.calls, [None])
+        self.assertFalse(self.syncer.sync_and_add_in_db.call_args.kwargs['partial'])
+        self.assertTrue(self.syncer.save_watermark.call_args.kwargs['full'])
+
+    def test_failed_sync_keeps_watermark(self):
+        """Test that the watermark does not move when the sync fails."""
+
+        # Given
+        self.syncer.get_changes_since.return_value = None
+        self.syncer.sync_and_add_in_db.return_value = False
+
+        # When
+        self.sync()
+
+        # Then
+        self.syncer.save_watermark.assert_not_awaited()
+
+
+class TestSyncerWatermark(TestBase):
+
+    def setUp(self) -> None:
+        self.watermarks = MagicMock(find_one=AsyncMock())
+        self.networks = MagicMock(bulk_write=AsyncMock(return_value=MagicMock(bulk_api_result={'nModified': 1})))
+        self.service = SyncerService('mongodb://localhost:27017', 'ccp')
+        self.service.db = {Constants.MongoCollection.SYNC_WATERMARK: self.watermarks,
+                           Constants.MongoCollection.NETWORK: self.networks}
+        self.service.mongo._db = self.service.db
+        patcher = patch('ccp_server.db.mongo.CacheVersion.bump', new_callable=AsyncMock)
+        self.bump = patcher.start()
+        self.addCleanup(patcher.stop)
+        return super().setUp()
+
+    def test_changes_since_moved_back_by_overlap(self):
+        """Test that the changes are listed from the watermark minus the overlap until a full sync is due."""
+
+        # Given
+        now = datetime(2023, 3, 1, 12, 0)
+        watermark = now - timedelta(minutes=5)
+        recent = {'watermark': watermark, 'full_sync_at': now - timedelta(hours=1)}
+        stale = {'watermark': watermark, 'full_sync_at': now - timedelta(seconds=Constants.SYNC_FULL_INTERVAL_IN_SECS)}
+
+        # When
+        self.watermarks.find_one.side_effect = [recent, stale, None]
+        results = [asyncio.run(self.service.get_changes_since('openstack', 'Network', now)) for _ in range(3)]
+
+        # Then
+        self.assertEqual(results, [watermark - timedelta(seconds=Constants.SYNC_WATERMARK_OVERLAP_IN_SECS),
+                                   None, None])
+
+    def test_partial_sync_compares_only_changed_documents(self):
+        """Test that a partial sync reads only the documents of the changed resources and deletes none."""
+
+        # Given
+        self.networks.find = MagicMock(return_value=FakeCursor(
+            [{'uuid': 'u1', 'reference_id': 'n1', 'active': 1, 'status': 'BUILD', 'org_id': 'org-1'}]))
+        cloud_data = {'n1': {'reference_id': 'n1', 'status': 'ACTIVE'}, 'n2': {'reference_id': 'n2'}}
+
+        # When
+        new_resources = asyncio.run(self.service.syncer(Constants.MongoCollection.NETWORK, cloud_data,
+                                                        cloud='openstack', partial=True))
+
+        # Then
+        self.assertEqual(self.networks.find.call_args.args[0]['reference_id'], {'$in': ['n1', 'n2']})
+        update, = self.networks.bulk_write.call_args.args[0]
+        self.assertEqual(update._doc, {'$set': {'reference_id': 'n1', 'status': 'ACTIVE'}})
+        self.assertFalse(self.networks.bulk_write.call_args.kwargs['ordered'])
+        self.bump.assert_awaited_once_with(Constants.MongoCollection.NETWORK, org_id='org-1')
+        self.assertEqual(list(new_resources), ['n2'])
+
+    def test_unchanged_stacks_skipped(self):
+        """Test that the resources of a stack are only listed when it changed since the watermark."""
+
+        # Given
+        conn = MagicMock()
+        conn.list_stacks.return_value = [SimpleNamespace(id='s1', created_at='2023-03-01T09:00:00Z', updated_at=None),
+                                         SimpleNamespace(id='s2', created_at='2023-02-01T09:00:00Z',
+                                                         updated_at='2023-03-01T11:00:00Z'),
+                                         SimpleNamespace(id='s3', created_at='2023-02-01T09:00:00Z', updated_at=None)]
+        conn.orchestration.resources.side_effect = lambda stack: [SimpleNamespace()]
+
+        # When
+        resources = StackResources(conn).list_all_stack_resources(changes_since=datetime(2023, 3, 1, 8, 0))
+
+        # Then
+        self.assertEqual([resource.stack_id for resource in resources], ['s1', 's2'])
+
+
+class TestSyncerInsert(TestBase):
+
+    def setUp(self) -> None:
+        self.service = SyncerService('mongodb://localhost:27017', 'ccp')
+        self.service.mongo = MagicMock(write_many=AsyncMock(side_effect=self.write_many))
+        return super().setUp()
+
+    @staticmethod
+    async def write_many(collection_name, documents):
+        return MagicMock(inserted=len(documents), errors=[])
+
+    @staticmethod
+    async def translated(**kwargs):
+        for chunk in ([{'reference_id': 'n1'}, {'reference_id': 'n2'}], [{'reference_id': 'n3'}]):
+            yield chunk
+
+    @patch('ccp_syncer.syncer_util.mapper_stream')
+    def test_new_resources_inserted_chunk_by_chunk(self, stream_mock):
+        """Test that each chunk translated by the mapper stream is inserted before the next one."""
+
+        # Given
+        stream_mock.side_effect = self.translated
+        cloud_data = {ref: {'id': ref} for ref in ('n1', 'n2', 'n3')}
+
+        # When
+        added = asyncio.run(self.service.add_in_db(cloud_data, Constants.MongoCollection.NETWORK, source='stack',
+                                                   cloud='openstack', unmapped=True))
+
+        # Then
+        self.assertTrue(added)
+        self.assertEqual(stream_mock.call_args.kwargs['data'], list(cloud_data.values()))
+        self.assertEqual([[document['reference_id'] for document in call.args[1]]
+                          for call in self.service.mongo.write_many.call_args_list], [['n1', 'n2'], ['n3']])
+        self.assertEqual(self.service.mongo.write_many.call_args.args[1][0]['source'], 'stack')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
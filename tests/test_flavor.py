@@ -6,6 +6,7 @@
 ###############################################################################
 import os
 import unittest
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ccp_server.api.v1.admin.flavor import FlavorService
@@ -14,7 +15,7 @@ from tests.test_base import TestBase
 
 class TestFlavor(TestBase):
 
-    @patch('ccp_server.api.v1.admin.flavor.FlavorService.list_flavors')
+    @patch('ccp_server.api.v1.admin.flavor.FlavorService.list_flavors', new_callable=MagicMock)
     def test_list_flavor(self, flavor_mock):
         """Test the call flow for FlavorService.list_flavor()."""
 
@@ -28,7 +29,7 @@ class TestFlavor(TestBase):
         assert response is not None
         flavor_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.admin.flavor.FlavorService.list_flavors')
+    @patch('ccp_server.api.v1.admin.flavor.FlavorService.list_flavors', new_callable=MagicMock)
     def test_list_flavor_response(self, flavor_mock):
         """Test the response for FlavorService.list_flavor()."""
 
@@ -45,7 +46,7 @@ class TestFlavor(TestBase):
         self.assertListEqual(flavors, response.json())
         flavor_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.admin.flavor.FlavorService.get_flavor')
+    @patch('ccp_server.api.v1.admin.flavor.FlavorService.get_flavor', new_callable=MagicMock)
     def test_get_flavor(self, flavor_mock):
         """Test the call flow for FlavorService.get_flavor()."""
 
@@ -59,7 +60,7 @@ class TestFlavor(TestBase):
         assert response is not None
         flavor_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.admin.flavor.FlavorService.get_flavor')
+    @patch('ccp_server.api.v1.admin.flavor.FlavorService.get_flavor', new_callable=MagicMock)
     def test_get_flavor_response(self, flavor_mock):
         """Test the flavor response for FlavorService.get_flavor()."""
 
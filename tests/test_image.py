@@ -6,6 +6,7 @@
 ###############################################################################
 import os
 import unittest
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ccp_server.api.v1.image import ImageService
@@ -14,7 +15,7 @@ from tests.test_base import TestBase
 
 class TestImage(TestBase):
 
-    @patch('ccp_server.api.v1.image.ImageService.list_images')
+    @patch('ccp_server.api.v1.image.ImageService.list_images', new_callable=MagicMock)
     def test_list_image(self, image_mock):
         """Test the call flow for ImageService.list_images()."""
 
@@ -28,7 +29,7 @@ class TestImage(TestBase):
         assert response is not None
         image_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.image.ImageService.list_images')
+    @patch('ccp_server.api.v1.image.ImageService.list_images', new_callable=MagicMock)
     def test_list_image_response(self, image_mock):
         """Test the response for ImageService.list_images()."""
 
@@ -45,7 +46,7 @@ class TestImage(TestBase):
         self.assertListEqual(images, response.json())
         image_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.image.ImageService.get_image')
+    @patch('ccp_server.api.v1.image.ImageService.get_image', new_callable=MagicMock)
     def test_get_image(self, image_mock):
         """Test the call flow for ImageService.get_image()."""
 
@@ -59,7 +60,7 @@ class TestImage(TestBase):
         assert response is not None
         image_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.image.ImageService.get_image')
+    @patch('ccp_server.api.v1.image.ImageService.get_image', new_callable=MagicMock)
     def test_get_images_response(self, image_mock):
         """Test the response for ImageService.get_image()."""
 
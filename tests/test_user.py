@@ -6,6 +6,7 @@
 ###############################################################################
 import os
 import unittest
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ccp_server.api.v1.user import UserService
@@ -14,7 +15,7 @@ from tests.test_base import TestBase
 
 class TestUser(TestBase):
 
-    @patch('ccp_server.api.v1.user.UserService.create_user')
+    @patch('ccp_server.api.v1.user.UserService.create_user', new_callable=MagicMock)
     def test_create_user(self, user_mock):
         """Test the call flow for UserService.create_user()."""
 
@@ -29,7 +30,7 @@ class TestUser(TestBase):
         self.assertIsNone(response.json())
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.create_user')
+    @patch('ccp_server.api.v1.user.UserService.create_user', new_callable=MagicMock)
     def test_create_user_response(self, user_mock):
         """Test the response for UserService.create_user()."""
 
@@ -44,7 +45,7 @@ class TestUser(TestBase):
         self.assertIsNone(response.json())
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.get_user')
+    @patch('ccp_server.api.v1.user.UserService.get_user', new_callable=MagicMock)
     def test_get_user(self, user_mock):
         """Test the call flow for UserService.get_user() from keycloak."""
 
@@ -58,7 +59,7 @@ class TestUser(TestBase):
         assert response is not None
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.get_user')
+    @patch('ccp_server.api.v1.user.UserService.get_user', new_callable=MagicMock)
     def test_get_user_response(self, user_mock):
         """Test the response for UserService.get_user() from keycloak."""
 
@@ -78,7 +79,7 @@ class TestUser(TestBase):
             response.json().keys()))
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.get_user_from_cloud')
+    @patch('ccp_server.api.v1.user.UserService.get_user_from_cloud', new_callable=MagicMock)
     def test_get_user_from_cloud(self, user_mock):
         """Test the call flow for UserService.get_user_from_cloud()."""
 
@@ -92,7 +93,7 @@ class TestUser(TestBase):
         assert response is not None
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.get_user_from_cloud')
+    @patch('ccp_server.api.v1.user.UserService.get_user_from_cloud', new_callable=MagicMock)
     def test_get_user_from_cloud_response(self, user_mock):
         """Test the call flow for UserService.get_user_from_cloud()."""
 
@@ -112,7 +113,7 @@ class TestUser(TestBase):
             response.json().keys()))
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.update_user')
+    @patch('ccp_server.api.v1.user.UserService.update_user', new_callable=MagicMock)
     def test_update_user(self, user_mock):
         """Test the call flow for UserService.update_user() in keycloak."""
 
@@ -127,7 +128,7 @@ class TestUser(TestBase):
         self.assertIsNone(response.json())
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.delete_user')
+    @patch('ccp_server.api.v1.user.UserService.delete_user', new_callable=MagicMock)
     def test_delete_user(self, user_mock):
         """Test the call flow for UserService.delete_user()."""
 
@@ -141,7 +142,7 @@ class TestUser(TestBase):
         self.assertIsNone(response.json())
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.grant_roles')
+    @patch('ccp_server.api.v1.user.UserService.grant_roles', new_callable=MagicMock)
     def test_grant_roles(self, user_mock):
         """ Test the call flow for UserService.grant_roles() """
 
@@ -155,7 +156,7 @@ class TestUser(TestBase):
         self.assertIsNone(response.json())
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.revoke_roles')
+    @patch('ccp_server.api.v1.user.UserService.revoke_roles', new_callable=MagicMock)
     def test_revoke_roles(self, user_mock):
         """ Test the call flow for UserService.revoke_roles() """
 
@@ -169,7 +170,7 @@ class TestUser(TestBase):
         self.assertIsNone(response.json())
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.get_users')
+    @patch('ccp_server.api.v1.user.UserService.get_users', new_callable=MagicMock)
     def test_get_users(self, user_mock):
         """Test the call flow for UserService.get_users() list of users from Keycloak."""
 
@@ -183,7 +184,7 @@ class TestUser(TestBase):
         assert response is not None
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.get_users')
+    @patch('ccp_server.api.v1.user.UserService.get_users', new_callable=MagicMock)
     def test_get_users_response(self, user_mock):
         """Test the response for UserService.get_user() list of users from Keycloak"""
 
@@ -203,7 +204,7 @@ class TestUser(TestBase):
             response.json().keys()))
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.update_email_action')
+    @patch('ccp_server.api.v1.user.UserService.update_email_action', new_callable=MagicMock)
     def test_update_email_action(self, user_mock):
         """Test the call flow for UserService.update_email_action()."""
 
@@ -219,7 +220,7 @@ class TestUser(TestBase):
         self.assertIsNone(response.json())
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.get_user_orgs')
+    @patch('ccp_server.api.v1.user.UserService.get_user_orgs', new_callable=MagicMock)
     def test_get_user_orgs(self, user_mock):
         """ Test the call flow for UserService.get_user_orgs() list of groups from Keycloak."""
 
@@ -233,7 +234,7 @@ class TestUser(TestBase):
         assert response is not None
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.get_user_orgs')
+    @patch('ccp_server.api.v1.user.UserService.get_user_orgs', new_callable=MagicMock)
     def test_get_user_orgs_response(self, user_mock):
         """" Test the response for UserService.get_user_orgs() list of groups from Keycloak"""
 
@@ -253,7 +254,7 @@ class TestUser(TestBase):
             response.json().keys()))
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.get_user_projects')
+    @patch('ccp_server.api.v1.user.UserService.get_user_projects', new_callable=MagicMock)
     def test_get_user_projects(self, user_mock):
         """Test the call flow for UserService.get_user_projects()."""
 
@@ -267,7 +268,7 @@ class TestUser(TestBase):
         assert response is not None
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.get_user_projects')
+    @patch('ccp_server.api.v1.user.UserService.get_user_projects', new_callable=MagicMock)
     def test_get_user_projects_response(self, user_mock):
         """Test the response for UserService.get_user_projects()."""
 
@@ -287,7 +288,7 @@ class TestUser(TestBase):
             response.json().keys()))
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.get_logged_in_user_projects')
+    @patch('ccp_server.api.v1.user.UserService.get_logged_in_user_projects', new_callable=MagicMock)
     def test_get_logged_in_user_projects(self, user_mock):
         """ Test the call flow for UserService.get_logged_in_user_projects(). """
 
@@ -301,7 +302,7 @@ class TestUser(TestBase):
         assert response is not None
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.get_logged_in_user_projects')
+    @patch('ccp_server.api.v1.user.UserService.get_logged_in_user_projects', new_callable=MagicMock)
     def test_get_logged_in_user_projects_response(self, user_mock):
         """" Test the response for UserService.get_logged_in_user_projects()"""
 
@@ -321,7 +322,7 @@ class TestUser(TestBase):
             response.json().keys()))
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.generate_access_token')
+    @patch('ccp_server.api.v1.user.UserService.generate_access_token', new_callable=MagicMock)
     def test_generate_access_token(self, user_mock):
         """Test the call flow for UserService.generate_access_token()."""
 
@@ -335,7 +336,7 @@ class TestUser(TestBase):
         self.assertIsNone(response.json())
         user_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.user.UserService.logout')
+    @patch('ccp_server.api.v1.user.UserService.logout', new_callable=MagicMock)
     def test_logout(self, user_mock):
         """Test the call flow for UserService.logout()."""
 
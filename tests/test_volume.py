@@ -6,6 +6,7 @@
 ###############################################################################
 import os
 import unittest
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ccp_server.api.v1.volume import VolumeService
@@ -13,7 +14,7 @@ from tests.test_base import TestBase
 
 
 class TestVolume(TestBase):
-    @patch('ccp_server.api.v1.volume.VolumeService.create_volume')
+    @patch('ccp_server.api.v1.volume.VolumeService.create_volume', new_callable=MagicMock)
     def test_create_volume(self, volume_mock):
         """Test the call flow for VolumeService.create_volume()."""
 
@@ -27,7 +28,7 @@ class TestVolume(TestBase):
         assert response is not None
         volume_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume.VolumeService.create_volume')
+    @patch('ccp_server.api.v1.volume.VolumeService.create_volume', new_callable=MagicMock)
     def test_create_volume_response(self, volume_mock):
         """Test the response for VolumeService.create_volume()."""
 
@@ -45,7 +46,7 @@ class TestVolume(TestBase):
         self.assertDictEqual(volume_response, response.json())
         volume_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume.VolumeService.list_volumes_by_project_id')
+    @patch('ccp_server.api.v1.volume.VolumeService.list_volumes_by_project_id', new_callable=MagicMock)
     def test_list_volumes_by_project_id(self, volume_mock):
         """Test the call flow for VolumeService.list_volumes_by_project_id()."""
 
@@ -59,7 +60,7 @@ class TestVolume(TestBase):
         assert response is not None
         volume_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume.VolumeService.list_volumes_by_project_id')
+    @patch('ccp_server.api.v1.volume.VolumeService.list_volumes_by_project_id', new_callable=MagicMock)
     def test_list_volumes_by_project_id_response(self, volume_mock):
         """Test the response for VolumeService.list_volumes_by_project_id()."""
 
@@ -76,7 +77,7 @@ class TestVolume(TestBase):
         self.assertListEqual(volumes, response.json())
         volume_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume.VolumeService.list_all_volumes')
+    @patch('ccp_server.api.v1.volume.VolumeService.list_all_volumes', new_callable=MagicMock)
     def test_list_all_volumes(self, volume_mock):
         """Test the call flow for VolumeService.list_all_volumes()."""
 
@@ -90,7 +91,7 @@ class TestVolume(TestBase):
         assert response is not None
         volume_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume.VolumeService.list_all_volumes')
+    @patch('ccp_server.api.v1.volume.VolumeService.list_all_volumes', new_callable=MagicMock)
     def test_list_all_volumes_response(self, volume_mock):
         """Test the response for VolumeService.list_all_volumes()."""
 
@@ -107,7 +108,7 @@ class TestVolume(TestBase):
         self.assertListEqual(volumes, response.json())
         volume_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume.VolumeService.get_volume')
+    @patch('ccp_server.api.v1.volume.VolumeService.get_volume', new_callable=MagicMock)
     def test_get_volume(self, volume_mock):
         """Test the call flow for VolumeService.get_volume()."""
 
@@ -121,7 +122,7 @@ class TestVolume(TestBase):
         assert response is not None
         volume_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume.VolumeService.get_volume')
+    @patch('ccp_server.api.v1.volume.VolumeService.get_volume', new_callable=MagicMock)
     def test_get_volume_response(self, volume_mock):
         """Test the volume response for VolumeService.get_volume()."""
 
@@ -141,7 +142,7 @@ class TestVolume(TestBase):
         self.assertListEqual(volume_keys, list(response.json().keys()))
         volume_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume.VolumeService.delete_volume')
+    @patch('ccp_server.api.v1.volume.VolumeService.delete_volume', new_callable=MagicMock)
     def test_delete_volume(self, volume_mock):
         """ Test the call flow for VolumeService.delete_volume()."""
 
@@ -155,7 +156,7 @@ class TestVolume(TestBase):
         assert response is not None
         volume_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume.VolumeService.update_volume')
+    @patch('ccp_server.api.v1.volume.VolumeService.update_volume', new_callable=MagicMock)
     def test_volume_update(self, volume_mock):
         """Test the call flow for VolumeService.update_volume()."""
 
@@ -6,6 +6,7 @@
 ###############################################################################
 import os
 import unittest
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from ccp_server.api.v1.volume_snapshot import VolumeSnapshotService
@@ -13,7 +14,7 @@ from tests.test_base import TestBase
 
 
 class TestVolumeSnapshot(TestBase):
-    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.create_volume_snapshot')
+    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.create_volume_snapshot', new_callable=MagicMock)
     def test_create_volume_snapshot(self, volume_snapshot_mock):
         """Test the call flow for VolumeSnapshotService.create_volume_snapshot()."""
 
@@ -27,7 +28,7 @@ class TestVolumeSnapshot(TestBase):
         assert response is not None
         volume_snapshot_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.create_volume_snapshot')
+    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.create_volume_snapshot', new_callable=MagicMock)
     def test_create_volume_response(self, volume_snapshot_mock):
         """Test the response for VolumeSnapshotService.create_volume_snapshot()."""
 
@@ -45,7 +46,7 @@ class TestVolumeSnapshot(TestBase):
         self.assertDictEqual(volume_snapshot_response, response.json())
         volume_snapshot_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.list_all_volume_snapshots')
+    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.list_all_volume_snapshots', new_callable=MagicMock)
     def test_list_all_volume_snapshots(self, volume_snapshot_mock):
         """Test the call flow for VolumeSnapshotService.list_all_volume_snapshots()."""
 
@@ -59,7 +60,7 @@ class TestVolumeSnapshot(TestBase):
         assert response is not None
         volume_snapshot_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.list_all_volume_snapshots')
+    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.list_all_volume_snapshots', new_callable=MagicMock)
     def test_list_all_volume_snapshots_response(self, volume_snapshot_mock):
         """Test the response for VolumeSnapshotService.list_all_volume_snapshots()."""
 
@@ -76,7 +77,8 @@ class TestVolumeSnapshot(TestBase):
         self.assertListEqual(volumes_snapshot, response.json())
         volume_snapshot_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.list_volume_snapshots_from_volume')
+    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.list_volume_snapshots_from_volume',
+           new_callable=MagicMock)
     def test_list_volume_snapshots_from_volume(self, volume_snapshot_mock):
         """Test the call flow for VolumeSnapshotService.list_volume_snapshots_from_volume()."""
 
@@ -90,7 +92,8 @@ class TestVolumeSnapshot(TestBase):
         assert response is not None
         volume_snapshot_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.list_volume_snapshots_from_volume')
+    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.list_volume_snapshots_from_volume',
+           new_callable=MagicMock)
     def test_list_volume_snapshots_from_volume_response(self, volume_snapshot_mock):
         """Test the response for VolumeSnapshotService.list_volume_snapshots_from_volume()."""
 
@@ -107,7 +110,8 @@ class TestVolumeSnapshot(TestBase):
         self.assertListEqual(volumes_snapshot, response.json())
         volume_snapshot_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.list_volume_snapshots_from_project')
+    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.list_volume_snapshots_from_project',
+           new_callable=MagicMock)
     def test_list_volume_snapshots_from_project(self, volume_snapshot_mock):
         """Test the call flow for VolumeSnapshotService.list_volume_snapshots_from_project()."""
 
@@ -121,7 +125,8 @@ class TestVolumeSnapshot(TestBase):
         assert response is not None
         volume_snapshot_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.list_volume_snapshots_from_project')
+    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.list_volume_snapshots_from_project',
+           new_callable=MagicMock)
     def test_list_volume_snapshots_from_project_response(self, volume_snapshot_mock):
         """Test the response for VolumeSnapshotService.list_volume_snapshots_from_project()."""
 
@@ -138,7 +143,7 @@ class TestVolumeSnapshot(TestBase):
         self.assertListEqual(volumes_snapshot, response.json())
         volume_snapshot_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.get_volume_snapshot')
+    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.get_volume_snapshot', new_callable=MagicMock)
     def test_get_volume_snapshot(self, volume_snapshot_mock):
         """Test the call flow for VolumeSnapshotService.get_volume_snapshot()."""
 
@@ -153,7 +158,7 @@ class TestVolumeSnapshot(TestBase):
         assert response is not None
         volume_snapshot_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.get_volume_snapshot')
+    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.get_volume_snapshot', new_callable=MagicMock)
     def test_get_volume_snapshot_response(self, volume_snapshot_mock):
         """Test the volume_snapshot response for VolumeSnapshotService.get_volume_snapshot()."""
 
@@ -175,7 +180,7 @@ class TestVolumeSnapshot(TestBase):
             response.json().keys()))
         volume_snapshot_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.delete_volume_snapshot')
+    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.delete_volume_snapshot', new_callable=MagicMock)
     def test_delete_volume_snapshot(self, volume_snapshot_mock):
         """ Test the call flow for VolumeSnapshotService.delete_volume_snapshot()."""
 
@@ -190,7 +195,7 @@ class TestVolumeSnapshot(TestBase):
         assert response is not None
         volume_snapshot_mock.assert_called_once()
 
-    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.update_volume_snapshot')
+    @patch('ccp_server.api.v1.volume_snapshot.VolumeSnapshotService.update_volume_snapshot', new_callable=MagicMock)
     def test_volume_snapshot_update(self, volume_snapshot_mock):
         """Test the call flow for VolumeSnapshotService.update_volume_snapshot()."""
 
@@ -0,0 +1,50 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import unittest
+
+from ccp_server.util import ccp_context
+from ccp_server.util.constants import Constants
+from tests.test_base import TestBase
+
+
+class TestServiceContext(TestBase):
+
+    def tearDown(self) -> None:
+        ccp_context.clear_context()
+        return super().tearDown()
+
+    def test_service_context_has_service_roles(self):
+        """Test that a service context acts with the service roles and drops the data of the previous work."""
+
+        # Given
+        ccp_context.set_request_data(Constants.CCPHeader.PROJECT_ID, 'p-old')
+
+        # When
+        ccp_context.set_service_context('OpenStack', org_id='org-1')
+
+        # Then
+        self.assertEqual(ccp_context.get_cloud(), 'openstack')
+        self.assertEqual(ccp_context.get_org(), 'org-1')
+        self.assertIsNone(ccp_context.get_project_id())
+        self.assertIsNone(ccp_context.get_logged_in_user())
+        self.assertEqual(ccp_context.get_logged_in_user_roles(), [Constants.CCPRole.SUPER_ADMIN])
+
+    def test_service_context_for_user(self):
+        """Test that work done for a user keeps the user, its roles and the audit id."""
+
+        # When
+        ccp_context.set_service_context('openstack', org_id='org-1', project_id='p1', username='user@coredge.io',
+                                        roles=[Constants.CCPRole.MEMBER], audit_id='job-1')
+
+        # Then
+        self.assertEqual(ccp_context.get_project_id(), 'p1')
+        self.assertEqual(ccp_context.get_logged_in_user(), 'user@coredge.io')
+        self.assertEqual(ccp_context.get_logged_in_user_roles(), [Constants.CCPRole.MEMBER])
+        self.assertEqual(ccp_context.request_id(), 'job-1')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,160 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import asyncio
+import json
+import logging
+import queue
+import unittest
+from unittest.mock import patch
+
+from ccp_server.util import ccp_context
+from ccp_server.util.constants import Constants
+from ccp_server.util.logger import AuditIdFilter
+from ccp_server.util.logger import DroppingQueueHandler
+from ccp_server.util.logger import JsonFormatter
+from ccp_server.util.logger import KGLogger
+from ccp_server.util.logger import log
+from ccp_server.util.logger import LoggingSetup
+from ccp_server.util.logger import Spans
+from tests.test_base import TestBase
+
+
+class TestKGLogger(TestBase):
+
+    def setUp(self) -> None:
+        self.records = queue.Queue(2)
+        self.handler = DroppingQueueHandler(self.records)
+        self.handler.addFilter(AuditIdFilter())
+        self.logger = logging.getLogger(f'{__name__}.{self._testMethodName}')
+        self.logger.addHandler(self.handler)
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.logger.removeHandler(self.handler)
+        ccp_context.clear_context()
+        return super().tearDown()
+
+    def test_loggers_share_one_queue_handler(self):
+        """Test that creating a logger again does not add handlers."""
+
+        # When
+        KGLogger(__name__)
+        logger = KGLogger(__name__)
+
+        # Then
+        self.assertEqual(logger.logger.handlers, [LoggingSetup.configure()])
+
+    def test_level_defaults_to_log_level(self):
+        """Test that the loggers log at LOG_LEVEL, INFO by default, so the @log tracer does not format."""
+
+        # When
+        logger = KGLogger(f'{__name__}.default_level').logger
+
+        # Then
+        self.assertEqual(Constants.LOG_LEVEL, 'INFO')
+        self.assertEqual(logger.level, logging.INFO)
+        self.assertFalse(logger.isEnabledFor(logging.DEBUG))
+
+    def test_audit_id_read_when_logged(self):
+        """Test that each record gets the audit id of the request which logged it, as a JSON line."""
+
+        # Given
+        ccp_context.set_request_data(Constants.CCPHeader.AUDIT_ID, 'audit-1')
+        self.logger.info('first %s', 'request')
+        ccp_context.set_request_data(Constants.CCPHeader.AUDIT_ID, 'audit-2')
+        self.logger.info('second request')
+
+        # When
+        lines = [json.loads(JsonFormatter().format(self.records.get_nowait())) for _ in range(2)]
+
+        # Then
+        self.assertEqual([(line['audit_id'], line['message']) for line in lines],
+                         [('audit-1', 'first request'), ('audit-2', 'second request')])
+
+    def test_records_dropped_when_queue_full(self):
+        """Test that logging does not block when the queue is full."""
+
+        # Given
+        dropped = DroppingQueueHandler.dropped
+
+        # When
+        for index in range(3):
+            self.logger.debug(f'message {index}')
+
+        # Then
+        self.assertEqual(self.records.qsize(), 2)
+        self.assertEqual(DroppingQueueHandler.dropped, dropped + 1)
+
+
+@log
+async def wait(seconds: float) -> float:
+    await asyncio.sleep(seconds)
+    return seconds
+
+
+@log
+def fail():
+    raise ValueError('failed')
+
+
+class TestLogDecorator(TestBase):
+
+    def setUp(self) -> None:
+        Spans.clear()
+        return super().setUp()
+
+    def test_coroutine_timed_until_it_returns(self):
+        """Test that the span of a coroutine covers the awaited work and keeps the function metadata."""
+
+        # When
+        result = asyncio.run(wait(0.05))
+
+        # Then
+        self.assertEqual(result, 0.05)
+        self.assertEqual(wait.__name__, 'wait')
+        span = Spans.metrics()[f'{__name__}.wait']
+        self.assertEqual((span['count'], span['errors']), (1, 0))
+        self.assertGreaterEqual(span['max_ms'], 50)
+
+    def test_errors_counted_and_subscribers_notified(self):
+        """Test that a failed call is recorded as an error and sent to the subscribers."""
+
+        # Given
+        finished = []
+        Spans.subscribe(lambda name, elapsed, error: finished.append((name, error)))
+
+        # When
+        with self.assertRaises(ValueError):
+            fail()
+
+        # Then
+        self.assertEqual(Spans.metrics()[f'{__name__}.fail']['errors'], 1)
+        self.assertEqual(finished, [(f'{__name__}.fail', True)])
+        Spans._subscribers.clear()
+
+    @patch('ccp_server.util.logger.Spans.enabled', False)
+    def test_nothing_recorded_when_disabled(self):
+        """Test that without DEBUG and spans the function is called directly."""
+
+        # Given
+        logger = KGLogger('ccp_server.util.logger').logger
+        level = logger.level
+        logger.setLevel(logging.INFO)
+
+        # When
+        with patch.object(logger, 'debug') as debug_mock:
+            asyncio.run(wait(0))
+        logger.setLevel(level)
+
+        # Then
+        debug_mock.assert_not_called()
+        self.assertEqual(Spans.metrics(), {})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
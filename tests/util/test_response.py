@@ -0,0 +1,103 @@
+###############################################################################
+# Copyright (c) 2023-present CorEdge India Pvt. Ltd - All Rights Reserved     #
+# Unauthorized copying of this file, via any medium is strictly prohibited    #
+# Proprietary and confidential                                                #
+###############################################################################
+import json
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from fastapi import APIRouter
+from fastapi import FastAPI
+from fastapi import Request
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from ccp_server.schema.v1.response_schemas import IDResponse
+from ccp_server.schema.v1.response_schemas import Page
+from ccp_server.schema.v1.response_schemas import Pageable
+from ccp_server.util import ccp_context
+from ccp_server.util.constants import Constants
+from ccp_server.util.response import CCPJSONResponse
+from ccp_server.util.response import CCPRoute
+from tests.test_base import TestBase
+
+router = APIRouter(route_class=CCPRoute)
+
+
+@router.get("/volumes")
+async def list_volumes():
+    return Page(1, 10, 1, [{'uuid': 'u1', 'created_at': datetime(2023, 5, 1, 10, 30, 15)}])
+
+
+@router.get("/volumes/export")
+async def export_volumes(request: Request):
+    ccp_context.set_request_data(Constants.CURRENT_REQUEST, request)
+    pageable = Pageable(None, 1, 10, None, False)
+    ccp_context.clear_context()
+
+    async def volumes():
+        for index in range(3):
+            yield {'uuid': f'u{index}', 'created_at': datetime(2023, 5, 1, 10, 30, 15)}
+    return Page(1, 10, None, volumes() if pageable.stream else [])
+
+
+@router.post("/volumes", status_code=status.HTTP_201_CREATED)
+def create_volume():
+    return IDResponse('u1')
+
+
+@router.delete("/volumes/{volume_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_volume(volume_id: str):
+    pass
+
+
+class TestCCPRoute(TestBase):
+
+    def setUp(self) -> None:
+        app = FastAPI(default_response_class=CCPJSONResponse)
+        app.include_router(router)
+        self.client = TestClient(app)
+        return super().setUp()
+
+    @patch('fastapi.routing.jsonable_encoder')
+    def test_result_encoded_by_orjson(self, encoder_mock):
+        """Test that a list is encoded without jsonable_encoder and the dates use the CCP timestamp format."""
+
+        # When
+        response = self.client.get('/volumes')
+
+        # Then
+        self.assertEqual(response.json(), {'page': 1, 'size': 10, 'total': 1, 'next_page_token': None,
+                                           'data': [{'uuid': 'u1', 'created_at': '2023-05-01 10:30:15'}]})
+        encoder_mock.assert_not_called()
+
+    def test_status_codes_kept(self):
+        """Test that the status code of the route is used and a no content route has no body."""
+
+        # When
+        created = self.client.post('/volumes')
+        deleted = self.client.delete('/volumes/u1')
+
+        # Then
+        self.assertEqual((created.status_code, created.json()), (201, {'id': 'u1'}))
+        self.assertEqual((deleted.status_code, deleted.content), (204, b''))
+
+    @patch('ccp_server.util.response.NDJSONResponse.CHUNK_SIZE', 100)
+    def test_list_streamed_when_ndjson_accepted(self):
+        """Test that a list is streamed as one JSON document per line only when the client accepts NDJSON."""
+
+        # When
+        streamed = self.client.get('/volumes/export', headers={'Accept': Constants.NDJSON_MEDIA_TYPE})
+        paged = self.client.get('/volumes/export')
+
+        # Then
+        self.assertEqual(streamed.headers['content-type'], Constants.NDJSON_MEDIA_TYPE)
+        self.assertEqual([json.loads(line) for line in streamed.text.splitlines()],
+                         [{'uuid': f'u{index}', 'created_at': '2023-05-01 10:30:15'} for index in range(3)])
+        self.assertEqual(paged.json()['data'], [])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)